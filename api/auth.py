@@ -5,11 +5,20 @@ This module provides:
 - API key authentication
 - Role-based access control (RBAC)
 - User authentication dependencies
+
+Hot-path costs are kept off the event loop: bcrypt runs in a bounded
+thread pool, decoded JWT claims are cached per token until expiry, and API
+key verification goes through ``core.security.api_keys`` (hashed keys in
+the database behind an LRU/TTL cache).
 """
 
 from __future__ import annotations
 
+import asyncio
 import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Annotated
 
@@ -22,6 +31,7 @@ from pydantic import BaseModel
 
 from core.config.production_settings import AppSettings, get_settings
 from core.exceptions import InvalidTokenError, TokenExpiredError
+from core.security.api_keys import APIKeyRecord, get_api_key_manager
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -79,6 +89,38 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+_password_executor: ThreadPoolExecutor | None = None
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    """Thread pool for bcrypt; its size caps concurrent hashing CPU."""
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=get_settings().security.password_hash_workers,
+            thread_name_prefix="bcrypt",
+        )
+    return _password_executor
+
+
+async def ahash_password(password: str) -> str:
+    """Hash password using bcrypt without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_executor(), pwd_context.hash, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash without blocking the event loop.
+
+    Use this from request handlers: a bcrypt verify takes tens of
+    milliseconds of CPU and would otherwise stall every other request.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_password_executor(), pwd_context.verify, plain_password, hashed_password
+    )
+
+
 # ============================================================================
 # JWT Token Functions
 # ============================================================================
@@ -153,9 +195,21 @@ def create_refresh_token(user_id: str, settings: AppSettings | None = None) -> s
     return token
 
 
+# Decoded access tokens: (token, secret, algorithm) -> (exp timestamp, claims)
+_token_cache: OrderedDict[tuple[str, str, str], tuple[float, TokenData]] = OrderedDict()
+
+
+def clear_token_cache() -> None:
+    """Forget all cached token verifications."""
+    _token_cache.clear()
+
+
 def verify_token(token: str, settings: AppSettings | None = None) -> TokenData:
     """Verify and decode JWT token.
 
+    Verified claims are cached per token until the token expires, so
+    repeated requests with the same token skip signature verification.
+
     Args:
         token: JWT token string
         settings: App settings
@@ -170,23 +224,39 @@ def verify_token(token: str, settings: AppSettings | None = None) -> TokenData:
     if settings is None:
         settings = get_settings()
 
+    secret = settings.security.jwt_secret_key.get_secret_value()
+    cache_key = (token, secret, settings.security.jwt_algorithm)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        expires_at, token_data = cached
+        if expires_at > time.time():
+            _token_cache.move_to_end(cache_key)
+            return token_data
+        del _token_cache[cache_key]
+        raise TokenExpiredError("Token has expired")
+
     try:
         payload = jwt.decode(
             token,
-            settings.security.jwt_secret_key.get_secret_value(),
+            secret,
             algorithms=[settings.security.jwt_algorithm],
         )
 
         if payload.get("type") != "access":
             raise InvalidTokenError("Invalid token type")
 
-        return TokenData(
+        token_data = TokenData(
             user_id=payload["user_id"],
             email=payload["email"],
             role=payload["role"],
             exp=datetime.fromtimestamp(payload["exp"]),
         )
 
+        _token_cache[cache_key] = (float(payload["exp"]), token_data)
+        if len(_token_cache) > settings.security.auth_cache_size:
+            _token_cache.popitem(last=False)
+        return token_data
+
     except jwt.ExpiredSignatureError:
         raise TokenExpiredError("Token has expired")
     except jwt.InvalidTokenError as e:
@@ -206,6 +276,10 @@ def generate_api_key(settings: AppSettings | None = None) -> str:
 
     Returns:
         API key string
+
+    Note:
+        The key is not registered and will not authenticate; use
+        ``issue_api_key`` to create a usable key.
     """
     if settings is None:
         settings = get_settings()
@@ -214,28 +288,52 @@ def generate_api_key(settings: AppSettings | None = None) -> str:
     return f"{settings.security.api_key_prefix}{key}"
 
 
-def verify_api_key(api_key: str) -> bool:
-    """Verify API key.
+async def issue_api_key(
+    user_id: str,
+    email: str,
+    role: str = "service",
+    name: str | None = None,
+    expires_in: timedelta | None = None,
+) -> tuple[str, APIKeyRecord]:
+    """Issue an API key stored as a salted hash.
 
     Args:
-        api_key: API key to verify
+        user_id: Owner of the key
+        email: Owner email
+        role: Role granted to requests made with the key
+        name: Human-readable label
+        expires_in: Lifetime (keys never expire if None)
 
     Returns:
-        True if valid
+        The plaintext key (only available now) and its record
+    """
+    return await get_api_key_manager().create_key(
+        user_id, email, role, name=name, expires_in=expires_in
+    )
 
-    Note:
-        In production, this should check against a database.
-        For now, we'll use a simple validation.
+
+async def revoke_api_key(key_id: str) -> bool:
+    """Revoke an API key by its public id.
+
+    Args:
+        key_id: ``APIKeyRecord.key_id`` of the key
+
+    Returns:
+        True if an active key was revoked
     """
-    settings = get_settings()
+    return await get_api_key_manager().revoke(key_id)
+
 
-    # Check prefix
-    if not api_key.startswith(settings.security.api_key_prefix):
-        return False
+async def verify_api_key(api_key: str) -> APIKeyRecord | None:
+    """Verify API key against the issued (hashed) keys.
 
-    # In production: check database for valid key
-    # For now: accept any key with correct prefix and length
-    return len(api_key) >= settings.security.api_key_length
+    Args:
+        api_key: API key to verify
+
+    Returns:
+        Key record if the key is valid and active, None otherwise
+    """
+    return await get_api_key_manager().verify(api_key)
 
 
 # ============================================================================
@@ -313,19 +411,18 @@ async def get_current_user_from_api_key(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    if not verify_api_key(api_key):
+    record = await verify_api_key(api_key)
+    if record is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    # In production: fetch user associated with API key from database
-    # For now: create a service user
     return User(
-        user_id="service",
-        email="service@megaagent.com",
-        role="service",
+        user_id=record.user_id,
+        email=record.email,
+        role=record.role,
     )
 
 
@@ -10,7 +10,6 @@ import structlog
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from telegram import Update
 from telegram.error import RetryAfter, TelegramError
 
 from api.middleware import (RateLimitMiddleware, RequestMetricsMiddleware,
@@ -22,15 +21,21 @@ from api.routes import health as health_routes
 from api.routes import memory as memory_routes
 from api.routes import metrics as metrics_routes
 from api.routes import workflows as workflows_routes
-from api.startup import register_builtin_tools
+from api.startup import (register_builtin_tools, start_background_writers,
+                         start_realtime_backplane, stop_background_writers,
+                         stop_realtime_backplane)
 from config.settings import AppSettings, get_settings
 from core.di import get_container
 from core.observability import (TracingConfig, init_logging_from_env,
                                 init_tracing)
 from core.security import configure_security
 from core.security.config import SecurityConfig
-from telegram_interface.bot import (build_application, initialize_application,
-                                    set_webhook, shutdown_application)
+from telegram_interface.bot import (build_application, build_update_queue,
+                                    initialize_application, set_webhook,
+                                    shutdown_application)
+from telegram_interface.notification_service import (NotificationService,
+                                                     configure_notifications,
+                                                     create_outbox)
 
 logger = structlog.get_logger(__name__)
 
@@ -252,6 +257,16 @@ def create_app() -> FastAPI:
     # Define Telegram webhook endpoint BEFORE mounting static files
     # This ensures /telegram/webhook is not intercepted by StaticFiles
 
+    @app.on_event("startup")
+    async def startup_background_writers() -> None:
+        await start_background_writers()
+        await start_realtime_backplane()
+
+    @app.on_event("shutdown")
+    async def shutdown_background_writers() -> None:
+        await stop_background_writers()
+        await stop_realtime_backplane()
+
     @app.on_event("startup")
     async def startup_telegram() -> None:
         # Initialize DI container (singleton - shared across API and Telegram)
@@ -269,6 +284,18 @@ def create_app() -> FastAPI:
         telegram_app = build_application(settings=settings, mega_agent=mega_agent)
         await initialize_application(telegram_app)
 
+        # Webhook requests only persist updates; workers process them per chat
+        update_queue = build_update_queue(telegram_app, settings=settings)
+        await update_queue.start()
+        app.state.telegram_update_queue = update_queue
+
+        # Outbound messages from workflows go through a rate-aware, durable outbox
+        notifications = NotificationService(telegram_app.bot, await create_outbox())
+        await notifications.start()
+        configure_notifications(notifications)
+        telegram_app.bot_data["notifications"] = notifications
+        app.state.telegram_notifications = notifications
+
         webhook_url = _build_webhook_url(settings)
         lock_owned = await _acquire_webhook_lock(_WEBHOOK_LOCK_TIMEOUT)
         set_success = False
@@ -318,13 +345,20 @@ def create_app() -> FastAPI:
             else:
                 logger.debug("telegram.webhook.delete.skipped", reason="not_lock_owner")
         finally:
+            update_queue = getattr(app.state, "telegram_update_queue", None)
+            if update_queue is not None:
+                await update_queue.stop()
+            notifications = getattr(app.state, "telegram_notifications", None)
+            if notifications is not None:
+                configure_notifications(None)
+                await notifications.stop()
             await shutdown_application(telegram_app)
             logger.info("telegram.webhook.stopped")
 
     @app.post("/telegram/webhook")
     async def telegram_webhook(request: Request) -> dict[str, str]:
-        telegram_app = getattr(request.app.state, "telegram_application", None)
-        if telegram_app is None:
+        update_queue = getattr(request.app.state, "telegram_update_queue", None)
+        if update_queue is None:
             raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "Telegram bot not initialized")
 
         header_secret = request.headers.get("X-Telegram-Bot-Api-Secret-Token")
@@ -332,10 +366,13 @@ def create_app() -> FastAPI:
             raise HTTPException(status.HTTP_403_FORBIDDEN, "Invalid secret token")
 
         payload = await request.json()
-        update = Update.de_json(payload, telegram_app.bot)
-        await telegram_app.process_update(update)
+        try:
+            accepted = await update_queue.enqueue(payload)
+        except ValueError as exc:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, str(exc)) from exc
 
-        return {"status": "ok"}
+        # Acknowledge at once so Telegram never redelivers because a handler is slow
+        return {"status": "ok" if accepted else "duplicate"}
 
     # Mount static files LAST to avoid intercepting API routes
     # StaticFiles on "/" will catch all unmatched routes
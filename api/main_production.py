@@ -18,15 +18,20 @@ from pathlib import Path
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from api.middleware_production import (EnhancedRateLimitMiddleware,
+from api.middleware_production import (CompressionMiddleware,
+                                       EnhancedRateLimitMiddleware,
                                        ErrorHandlingMiddleware,
                                        PerformanceMiddleware,
                                        RequestIDMiddleware,
-                                       SecurityHeadersMiddleware)
+                                       SecurityHeadersMiddleware,
+                                       default_route_tiers)
+from api.routes.health_production import (start_health_monitor,
+                                          stop_health_monitor)
+from api.startup import (start_background_writers, start_realtime_backplane,
+                         stop_background_writers, stop_realtime_backplane)
 from core.config.production_settings import get_settings
 from core.logging_utils import get_logger, setup_logging
 from core.security import configure_security
@@ -61,6 +66,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Security primitives (RBAC, prompt detector)
     configure_security(SecurityConfig())
 
+    # Write-behind audit buffer (drained on shutdown)
+    await start_background_writers()
+
+    # Cross-worker WebSocket fan-out
+    await start_realtime_backplane()
+
+    # Background dependency probes (served cached by /readiness)
+    if settings.observability.health_check_enabled:
+        await start_health_monitor()
+
     # Additional startup tasks
     # - Database connections
     # - Cache connections
@@ -74,6 +89,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down MegaAgent Pro API")
 
+    # Flush buffered audit events before connections go away
+    await stop_background_writers()
+    await stop_realtime_backplane()
+    await stop_health_monitor()
+
     # Cleanup tasks
     # - Close database connections
     # - Close cache connections
@@ -118,8 +138,17 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
-    # 3. Compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # 3. Compression (negotiated zstd/br/gzip, streams StreamingResponse bodies)
+    if settings.compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression.minimum_size,
+            levels={
+                "gzip": settings.compression.gzip_level,
+                "br": settings.compression.brotli_quality,
+                "zstd": settings.compression.zstd_level,
+            },
+        )
 
     # 4. Request ID tracking
     app.add_middleware(RequestIDMiddleware)
@@ -133,6 +162,7 @@ def create_app() -> FastAPI:
             EnhancedRateLimitMiddleware,
             requests_per_minute=settings.security.rate_limit_per_minute,
             requests_per_hour=settings.security.rate_limit_per_hour,
+            route_tiers=default_route_tiers(settings.api_prefix),
         )
 
     # 7. Error handling (innermost - catches all errors)
@@ -170,8 +200,11 @@ def create_app() -> FastAPI:
     # ========================================================================
 
     # Health check endpoints
-    from api.routes import health
+    from api.routes import health, health_production
 
+    # First match wins: the cached-probe /health must shadow the legacy one,
+    # which stays only for its /ready route
+    app.include_router(health_production.router, tags=["Health"])
     app.include_router(health.router, tags=["Health"])
 
     # Authentication endpoints (if enabled)
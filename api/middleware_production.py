@@ -6,20 +6,43 @@ This module provides:
 - Performance monitoring
 - Error handling
 - Request validation
+- Response compression (gzip, brotli, zstd)
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+import math
 import time
+from typing import Any
 import uuid
-from collections.abc import Callable
+import zlib
 
 from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.exceptions import MegaAgentError, RateLimitExceededError
 from core.logging_utils import get_logger, set_request_id
+from core.security.rate_limiter import (
+    LocalRateLimiter,
+    RateLimitRule,
+    RedisRateLimiter,
+    RouteTier,
+    resolve_tier,
+)
+
+try:  # Optional codings: pip install brotli zstandard
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logger = get_logger(__name__)
 
@@ -142,74 +165,77 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             )
 
 
-class TokenBucketRateLimiter:
-    """Token bucket rate limiter implementation."""
-
-    def __init__(self, rate: int, per: float = 60.0):
-        """Initialize rate limiter.
-
-        Args:
-            rate: Number of requests per time period
-            per: Time period in seconds
-        """
-        self.rate = rate
-        self.per = per
-        self.buckets: dict[str, dict[str, float]] = {}
-
-    def is_allowed(self, key: str) -> tuple[bool, float]:
-        """Check if request is allowed.
-
-        Args:
-            key: Rate limit key (e.g., user ID, IP address)
-
-        Returns:
-            Tuple of (is_allowed, retry_after_seconds)
-        """
-        current = time.time()
-
-        if key not in self.buckets:
-            self.buckets[key] = {
-                "allowance": float(self.rate),
-                "last_check": current,
-            }
-
-        bucket = self.buckets[key]
-        time_passed = current - bucket["last_check"]
-        bucket["last_check"] = current
-
-        # Add new tokens based on time passed
-        bucket["allowance"] += time_passed * (self.rate / self.per)
-        if bucket["allowance"] > self.rate:
-            bucket["allowance"] = float(self.rate)
-
-        # Check if we have tokens available
-        if bucket["allowance"] < 1.0:
-            # Calculate retry after time
-            retry_after = (1.0 - bucket["allowance"]) * (self.per / self.rate)
-            return False, retry_after
-        bucket["allowance"] -= 1.0
-        return True, 0.0
+def default_route_tiers(api_prefix: str = "/api/v1") -> list[RouteTier]:
+    """Stricter limits for credential checks and LLM-heavy endpoints."""
+    return [
+        RouteTier(
+            name="auth",
+            prefixes=(f"{api_prefix}/auth",),
+            rules=(RateLimitRule(10, 60.0, algorithm="sliding_window"),),
+        ),
+        RouteTier(
+            name="generation",
+            prefixes=(f"{api_prefix}/agent", "/api/generate-petition"),
+            rules=(RateLimitRule(20, 60.0), RateLimitRule(200, 3600.0)),
+        ),
+    ]
 
 
 class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
-    """Enhanced rate limiting middleware with per-user limits."""
+    """Enhanced rate limiting middleware with per-user limits.
+
+    Limits are shared by all workers through Redis when it is configured
+    (``USE_REDIS``), and enforced per process otherwise or while Redis is
+    unreachable. Requests are matched to a ``RouteTier`` by path prefix;
+    unmatched paths use the per-minute/per-hour default tier.
+    """
 
     def __init__(
         self,
         app: ASGIApp,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
+        route_tiers: list[RouteTier] | None = None,
+        limiter: RedisRateLimiter | LocalRateLimiter | None = None,
     ):
         """Initialize rate limiter.
 
         Args:
             app: ASGI application
-            requests_per_minute: Requests allowed per minute
-            requests_per_hour: Requests allowed per hour
+            requests_per_minute: Requests allowed per minute (default tier)
+            requests_per_hour: Requests allowed per hour (default tier)
+            route_tiers: Per-route tiers (defaults to ``default_route_tiers()``)
+            limiter: Limiter to use (defaults to Redis if available, else local)
         """
         super().__init__(app)
-        self.minute_limiter = TokenBucketRateLimiter(requests_per_minute, per=60.0)
-        self.hour_limiter = TokenBucketRateLimiter(requests_per_hour, per=3600.0)
+        self.default_tier = RouteTier(
+            name="default",
+            prefixes=(),
+            rules=(
+                RateLimitRule(requests_per_minute, 60.0),
+                RateLimitRule(requests_per_hour, 3600.0),
+            ),
+        )
+        self.route_tiers = default_route_tiers() if route_tiers is None else route_tiers
+        self.limiter = limiter
+        self._limiter_lock = asyncio.Lock()
+
+    async def get_limiter(self) -> RedisRateLimiter | LocalRateLimiter:
+        """Create the limiter on first use (Redis connects inside the event loop)."""
+        if self.limiter is None:
+            async with self._limiter_lock:
+                if self.limiter is None:
+                    from core.storage.redis_client import get_redis_client
+
+                    redis = await get_redis_client()
+                    self.limiter = (
+                        RedisRateLimiter(redis) if redis is not None else LocalRateLimiter()
+                    )
+                    logger.info(
+                        "Rate limiter initialized",
+                        backend="redis" if redis is not None else "local",
+                    )
+        return self.limiter
 
     def get_rate_limit_key(self, request: Request) -> str:
         """Get rate limit key for request.
@@ -241,71 +267,53 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         key = self.get_rate_limit_key(request)
-
-        # Check minute limit
-        allowed, retry_after = self.minute_limiter.is_allowed(key)
-        if not allowed:
-            logger.warning(
-                "Rate limit exceeded (per minute)",
-                key=key,
-                retry_after=retry_after,
-                request_id=getattr(request.state, "request_id", None),
-            )
-
-            from fastapi.responses import JSONResponse
-
-            error = RateLimitExceededError(
-                message="Rate limit exceeded (per minute)",
-                retry_after=int(retry_after) + 1,
-                limit=self.minute_limiter.rate,
-            )
-
-            return JSONResponse(
-                status_code=429,
-                content=error.to_dict(),
-                headers={
-                    "Retry-After": str(int(retry_after) + 1),
-                    "X-RateLimit-Limit": str(self.minute_limiter.rate),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time() + retry_after)),
-                },
-            )
-
-        # Check hour limit
-        allowed, retry_after = self.hour_limiter.is_allowed(key)
-        if not allowed:
-            logger.warning(
-                "Rate limit exceeded (per hour)",
-                key=key,
-                retry_after=retry_after,
-                request_id=getattr(request.state, "request_id", None),
-            )
-
-            from fastapi.responses import JSONResponse
-
-            error = RateLimitExceededError(
-                message="Rate limit exceeded (per hour)",
-                retry_after=int(retry_after) + 1,
-                limit=self.hour_limiter.rate,
-            )
-
-            return JSONResponse(
-                status_code=429,
-                content=error.to_dict(),
-                headers={
-                    "Retry-After": str(int(retry_after) + 1),
-                    "X-RateLimit-Limit": str(self.hour_limiter.rate),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time() + retry_after)),
-                },
-            )
+        tier = resolve_tier(request.url.path, self.route_tiers, self.default_tier)
+        limiter = await self.get_limiter()
+
+        # Every rule is checked before any is charged: a request rejected by
+        # the hourly rule must not also spend the per-minute budget
+        results = await limiter.hit_all(f"{tier.name}:{key}", tier.rules)
+        for rule, result in zip(tier.rules, results, strict=True):
+            if not result.allowed:
+                logger.warning(
+                    "Rate limit exceeded",
+                    key=key,
+                    tier=tier.name,
+                    window_seconds=rule.window_seconds,
+                    retry_after=result.retry_after,
+                    backend=result.backend,
+                    request_id=getattr(request.state, "request_id", None),
+                )
+
+                from fastapi.responses import JSONResponse
+
+                retry_after = math.ceil(result.retry_after) or 1
+                error = RateLimitExceededError(
+                    message=f"Rate limit exceeded ({rule.limit} per {rule.window_seconds:g}s)",
+                    retry_after=retry_after,
+                    limit=rule.limit,
+                )
+
+                return JSONResponse(
+                    status_code=429,
+                    content=error.to_dict(),
+                    headers={
+                        "Retry-After": str(retry_after),
+                        "X-RateLimit-Limit": str(rule.limit),
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": str(int(time.time() + result.reset_after)),
+                    },
+                )
+        tightest = min(results, key=lambda result: result.remaining, default=None)
 
         # Process request
         response = await call_next(request)
 
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit-Minute"] = str(self.minute_limiter.rate)
-        response.headers["X-RateLimit-Limit-Hour"] = str(self.hour_limiter.rate)
+        if tightest is not None:
+            response.headers["X-RateLimit-Limit"] = str(tightest.limit)
+            response.headers["X-RateLimit-Remaining"] = str(tightest.remaining)
+        response.headers["X-RateLimit-Tier"] = tier.name
 
         return response
 
@@ -329,14 +337,229 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-class CompressionMiddleware(BaseHTTPMiddleware):
-    """Add compression hint headers."""
+COMPRESSION_PREFERENCE = ("zstd", "br", "gzip")
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and enable compression."""
-        response = await call_next(request)
+# Media that is already compressed gains nothing but CPU cost
+INCOMPRESSIBLE_TYPE_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+INCOMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/pdf",
+        "application/vnd.rar",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-gzip",
+        "application/x-rar-compressed",
+        "application/zip",
+        "application/zstd",
+    }
+)
 
-        # Add vary header for proper caching
-        response.headers["Vary"] = "Accept-Encoding"
 
-        return response
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """Pick the coding from ``available`` the client weights highest.
+
+    Ties go to the earlier entry of ``available``; ``q=0`` excludes a coding
+    and ``*`` covers codings the header does not name.
+
+    Example:
+        >>> negotiate_encoding("gzip;q=0.8, br", ("zstd", "br", "gzip"))
+        'br'
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+
+    best, best_q = None, 0.0
+    for name in available:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of ``content_type`` is worth compressing."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in INCOMPRESSIBLE_TYPES:
+        return False
+    return not media_type.startswith(INCOMPRESSIBLE_TYPE_PREFIXES)
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._z.compress(data)
+
+    def flush(self) -> bytes:
+        return self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._z.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int) -> None:
+        self._c = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._c = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._c.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+_ENCODERS: dict[str, Callable[[int], Any]] = {"gzip": _GzipEncoder}
+if brotli is not None:
+    _ENCODERS["br"] = _BrotliEncoder
+if zstandard is not None:
+    _ENCODERS["zstd"] = _ZstdEncoder
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings usable here, in server preference order."""
+    return tuple(name for name in COMPRESSION_PREFERENCE if name in _ENCODERS)
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli/zstd response compression (pure ASGI).
+
+    Bodies sent in one message are compressed whole once they reach
+    ``minimum_size``. Streamed bodies (``StreamingResponse``) are compressed
+    chunk by chunk with a flush after each chunk, so clients receive data as
+    soon as the app produces it and the body is never buffered. Brotli and
+    zstd are offered only when their packages are installed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        levels: dict[str, int] | None = None,
+        encodings: tuple[str, ...] | None = None,
+    ):
+        """Initialize compression middleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Smallest non-streamed body (bytes) that is compressed
+            levels: Compression level per coding (``gzip``, ``br``, ``zstd``)
+            encodings: Codings to offer, in preference order
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_COMPRESSION_LEVELS, **(levels or {})}
+        offered = encodings or COMPRESSION_PREFERENCE
+        self.encodings = tuple(name for name in offered if name in _ENCODERS)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept, self.encodings)
+        responder = _CompressionResponder(
+            send,
+            encoding,
+            self.levels.get(encoding, 0) if encoding else 0,
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-response ``send`` wrapper holding the start message until the first body."""
+
+    def __init__(self, send: Send, encoding: str | None, level: int, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self._start: Message | None = None
+        self._encoder: Any = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._begin(start, body, more_body)
+        elif self._passthrough:
+            await self._send(message)
+        elif more_body:
+            data = self._encoder.compress(body) + self._encoder.flush()
+            await self._send({"type": "http.response.body", "body": data, "more_body": True})
+        else:
+            data = self._encoder.compress(body) + self._encoder.finish()
+            await self._send({"type": "http.response.body", "body": data})
+
+    async def _begin(self, start: Message, body: bytes, more_body: bool) -> None:
+        headers = MutableHeaders(raw=start.setdefault("headers", []))
+        compressible = (
+            start["status"] not in (204, 206, 304)
+            and "content-encoding" not in headers
+            and is_compressible(headers.get("content-type", ""))
+        )
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+
+        if (
+            not compressible
+            or self.encoding is None
+            or (not more_body and len(body) < self.minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        self._encoder = _ENCODERS[self.encoding](self.level)
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            del headers["Content-Length"]
+            data = self._encoder.compress(body) + self._encoder.flush()
+        else:
+            data = self._encoder.compress(body) + self._encoder.finish()
+            headers["Content-Length"] = str(len(data))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -8,6 +8,9 @@ supporting the frontend monitoring dashboard (index.html).
 from __future__ import annotations
 
 import asyncio
+import json
+import os
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -17,10 +20,14 @@ import aiofiles
 import structlog
 from fastapi import (APIRouter, File, Form, HTTPException, UploadFile,
                      WebSocket, WebSocketDisconnect)
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, RedirectResponse
 from pydantic import BaseModel, Field
 
+from core.rendering import (DEFAULT_STYLESHEET, RenderQueueFullError,
+                            get_pdf_renderer)
+from core.storage.blob_store import BlobTooLargeError, get_blob_store
 from core.storage.document_workflow_store import get_document_workflow_store
+from core.websocket_deltas import delta_streamer
 from core.websocket_manager import manager as ws_manager
 
 # Optional: Import for authentication
@@ -32,6 +39,13 @@ router = APIRouter(prefix="/api", tags=["document-monitor"])
 # Get workflow store instance
 workflow_store = get_document_workflow_store()
 
+# Content-addressed store for exhibit files (deduplicated by SHA-256)
+blob_store = get_blob_store()
+
+# Upload limits: files are streamed in fixed-size chunks, never read whole
+EXHIBIT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_EXHIBIT_BYTES = int(os.getenv("EXHIBIT_MAX_UPLOAD_MB", "100")) * 1024 * 1024
+
 # Store background tasks to prevent garbage collection
 background_tasks: set[asyncio.Task] = set()
 
@@ -65,6 +79,7 @@ class ExhibitSchema(BaseModel):
     file_size: int = Field(..., description="File size in bytes")
     mime_type: str = Field(..., description="MIME type")
     uploaded_at: datetime = Field(default_factory=datetime.now)
+    sha256: str | None = Field(None, description="Content hash of the stored blob")
 
 
 class MetadataSchema(BaseModel):
@@ -124,6 +139,9 @@ class UploadExhibitResponse(BaseModel):
     exhibit_id: str
     filename: str
     file_path: str
+    file_size: int = 0
+    sha256: str | None = None
+    deduplicated: bool = Field(False, description="Identical content was already stored")
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -266,6 +284,7 @@ async def get_document_preview(
                     file_size=ex_data["file_size"],
                     mime_type=ex_data["mime_type"],
                     uploaded_at=datetime.fromisoformat(ex_data["uploaded_at"]),
+                    sha256=ex_data.get("sha256"),
                 )
             )
 
@@ -334,27 +353,22 @@ async def upload_exhibit(
         if not state:
             raise HTTPException(status_code=404, detail=f"Workflow thread {thread_id} not found")
 
-        # Create upload directory
-        upload_dir = Path("uploads") / thread_id
-        upload_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save file with exhibit_id prefix
-        safe_filename = f"{exhibit_id}_{file.filename}".replace(" ", "_")
-        file_path = upload_dir / safe_filename
-
-        # Read and save file content
-        content = await file.read()
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
+        # Stream the upload into the content-addressed store (constant memory)
+        try:
+            blob = await blob_store.put_stream(_iter_upload(file), max_bytes=MAX_EXHIBIT_BYTES)
+        except BlobTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
-        # Prepare exhibit metadata
+        # Prepare exhibit metadata (linked to the blob by hash)
         exhibit_data = {
             "exhibit_id": exhibit_id,
             "filename": file.filename,
-            "file_path": f"/api/exhibits/{thread_id}/{safe_filename}",
-            "file_size": len(content),
+            "file_path": f"/api/exhibits/{thread_id}/{exhibit_id}",
+            "file_size": blob.size,
             "mime_type": file.content_type or "application/octet-stream",
             "uploaded_at": datetime.now().isoformat(),
+            "sha256": blob.sha256,
+            "blob_location": blob.location,
         }
 
         # Add exhibit to state
@@ -366,7 +380,10 @@ async def upload_exhibit(
             {
                 "timestamp": datetime.now().isoformat(),
                 "level": "success",
-                "message": f"Uploaded exhibit {exhibit_id}: {file.filename} ({len(content)} bytes)",
+                "message": (
+                    f"Uploaded exhibit {exhibit_id}: {file.filename} ({blob.size} bytes"
+                    f"{', duplicate content reused' if blob.deduplicated else ''})"
+                ),
                 "agent": "System",
             },
         )
@@ -376,7 +393,9 @@ async def upload_exhibit(
             thread_id=thread_id,
             exhibit_id=exhibit_id,
             filename=file.filename,
-            file_size=len(content),
+            file_size=blob.size,
+            sha256=blob.sha256,
+            deduplicated=blob.deduplicated,
         )
 
         return UploadExhibitResponse(
@@ -384,6 +403,9 @@ async def upload_exhibit(
             exhibit_id=exhibit_id,
             filename=file.filename,
             file_path=exhibit_data["file_path"],
+            file_size=blob.size,
+            sha256=blob.sha256,
+            deduplicated=blob.deduplicated,
         )
 
     except HTTPException:
@@ -398,6 +420,50 @@ async def upload_exhibit(
         )
 
 
+@router.get("/exhibits/{thread_id}/{exhibit_id}")
+async def download_exhibit(
+    thread_id: str,
+    exhibit_id: str,
+    # user = Depends(get_current_user),  # Uncomment for auth
+):
+    """
+    Download an uploaded exhibit by resolving it to its content-addressed blob.
+
+    Args:
+        thread_id: Workflow thread ID
+        exhibit_id: Exhibit identifier (e.g., "2.1.A")
+
+    Returns:
+        File response (local blobs) or redirect to a presigned URL (R2 blobs)
+
+    Raises:
+        HTTPException: If thread, exhibit or blob not found
+    """
+    state = await workflow_store.load_state(thread_id)
+    if not state:
+        raise HTTPException(status_code=404, detail=f"Workflow thread {thread_id} not found")
+
+    exhibit = next(
+        (ex for ex in state.get("exhibits", []) if ex.get("exhibit_id") == exhibit_id), None
+    )
+    if not exhibit or not exhibit.get("sha256"):
+        raise HTTPException(status_code=404, detail=f"Exhibit {exhibit_id} not found")
+
+    local_path = await blob_store.local_path(exhibit["sha256"])
+    if local_path is not None:
+        return FileResponse(
+            path=local_path,
+            media_type=exhibit.get("mime_type") or "application/octet-stream",
+            filename=exhibit.get("filename") or exhibit_id,
+        )
+
+    url = await blob_store.presigned_url(exhibit["sha256"])
+    if url is not None:
+        return RedirectResponse(url)
+
+    raise HTTPException(status_code=404, detail=f"Exhibit {exhibit_id} content is missing")
+
+
 @router.get("/download-petition-pdf/{thread_id}")
 async def download_petition_pdf(
     thread_id: str,
@@ -429,14 +495,15 @@ async def download_petition_pdf(
                 detail=f"Document generation not completed yet. Current status: {state.get('status')}",
             )
 
-        # Check if PDF exists or generate it
-        pdf_dir = Path("pdfs")
-        pdf_dir.mkdir(parents=True, exist_ok=True)
-        pdf_path = pdf_dir / f"{thread_id}.pdf"
-
-        if not pdf_path.exists():
-            # Generate PDF from sections
+        # Rendered off the event loop; unchanged sections hit the render cache
+        try:
             pdf_path = await generate_pdf(state, thread_id)
+        except RenderQueueFullError as e:
+            raise HTTPException(
+                status_code=503,
+                detail="PDF renderer is busy, please retry shortly",
+                headers={"Retry-After": str(e.retry_after)},
+            )
 
         if not pdf_path.exists():
             raise HTTPException(status_code=500, detail="PDF generation failed")
@@ -498,6 +565,14 @@ async def pause_generation(
         if not success:
             raise HTTPException(status_code=500, detail="Failed to pause workflow")
 
+        # Signal in-flight sections of the LangGraph workflow (cooperative)
+        try:
+            from core.orchestration.document_generation_workflow import request_pause
+
+            request_pause(thread_id)
+        except ImportError:
+            pass
+
         # Log pause event
         await workflow_store.add_log(
             thread_id,
@@ -604,6 +679,12 @@ async def resume_generation(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in fixed-size chunks."""
+    while chunk := await file.read(EXHIBIT_UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
 def calculate_metadata(state: dict[str, Any]) -> MetadataSchema:
     """
     Calculate metadata from workflow state.
@@ -877,48 +958,41 @@ async def generate_pdf(state: dict[str, Any], thread_id: str) -> Path:
     """
     Generate PDF from document HTML sections.
 
-    Simple implementation using ReportLab or HTML to PDF conversion.
+    Rendering runs in the ``PDFRenderer`` process pool, so the event loop keeps
+    serving other requests; identical content is served from its render cache.
 
     Args:
         state: Workflow state with sections
         thread_id: Workflow thread ID
 
     Returns:
-        Path to generated PDF file
+        Path to generated PDF file (or an HTML file if WeasyPrint is missing)
+
+    Raises:
+        RenderQueueFullError: If the renderer's queue is full
     """
     try:
-        pdf_dir = Path("pdfs")
-        pdf_dir.mkdir(parents=True, exist_ok=True)
-        pdf_path = pdf_dir / f"{thread_id}.pdf"
-
         # Combine all section HTML
         sections = state.get("sections", [])
-        html_parts = []
-
-        html_parts.append("<html><head><style>")
-        html_parts.append("body { font-family: Arial, sans-serif; margin: 40px; }")
-        html_parts.append(
-            "h2 { color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }"
+        body = "\n".join(
+            section.get("content_html", "")
+            for section in sections
+            if section.get("status") == "completed"
         )
-        html_parts.append("</style></head><body>")
-
-        for section in sections:
-            if section.get("status") == "completed":
-                html_parts.append(section.get("content_html", ""))
-
-        html_parts.append("</body></html>")
-        html_content = "\n".join(html_parts)
 
-        # Simple PDF generation using weasyprint (if available) or fallback
         try:
-            from weasyprint import HTML
-
-            HTML(string=html_content).write_pdf(pdf_path)
+            pdf_path = await get_pdf_renderer().render(body, DEFAULT_STYLESHEET)
             logger.info("pdf_generated_weasyprint", thread_id=thread_id, path=str(pdf_path))
 
         except ImportError:
             # Fallback: Write HTML to file instead
+            pdf_dir = Path("pdfs")
+            pdf_dir.mkdir(parents=True, exist_ok=True)
             html_path = pdf_dir / f"{thread_id}.html"
+            html_content = (
+                f"<html><head><style>\n{DEFAULT_STYLESHEET}\n</style></head>"
+                f"<body>\n{body}\n</body></html>"
+            )
             async with aiofiles.open(html_path, "w", encoding="utf-8") as f:
                 await f.write(html_content)
 
@@ -943,15 +1017,45 @@ async def generate_pdf(state: dict[str, Any], thread_id: str) -> Path:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+async def _send_state_or_catch_up(
+    websocket: WebSocket, thread_id: str, since: int | None
+) -> None:
+    """Bring a (re)connecting client up to date.
+
+    A client that knows its last-seen version gets only the deltas after it;
+    otherwise, or if the delta journal no longer reaches back that far, it
+    gets the full ``initial_state``.
+    """
+    if since is not None:
+        frame = await delta_streamer.catch_up(thread_id, since)
+        if frame is not None:
+            await ws_manager.send_personal_message(frame, websocket)
+            delta_streamer.track(thread_id, frame["version"])
+            return
+
+    state = await workflow_store.load_state(thread_id)
+    if state:
+        await ws_manager.send_personal_message(
+            {
+                "type": "initial_state",
+                "thread_id": thread_id,
+                "version": state["_version"],
+                "state": state,
+            },
+            websocket,
+        )
+        delta_streamer.track(thread_id, state["_version"])
+
+
 @router.websocket("/ws/document/{thread_id}")
-async def websocket_endpoint(websocket: WebSocket, thread_id: str):
+async def websocket_endpoint(websocket: WebSocket, thread_id: str, since: int | None = None):
     """
     WebSocket endpoint for real-time document generation updates.
 
     Replaces polling with push-based updates for better performance.
 
     Usage:
-        const ws = new WebSocket('ws://localhost:8000/api/ws/document/{thread_id}');
+        const ws = new WebSocket('ws://localhost:8000/api/ws/document/{thread_id}?since=42');
 
         ws.onmessage = (event) => {
             const data = JSON.parse(event.data);
@@ -959,6 +1063,10 @@ async def websocket_endpoint(websocket: WebSocket, thread_id: str):
         };
 
     Message types:
+        - initial_state: Full state snapshot with its ``version``
+        - delta: Patch operations since ``from_version``, one frame per tick
+          (apply entries whose ``v`` is newer than the local version)
+        - resync_required: Updates were dropped; send ``{"type": "resume", "since": N}``
         - workflow_update: General workflow state changes
         - section_update: Section-specific updates
         - log_entry: New log entries
@@ -969,41 +1077,49 @@ async def websocket_endpoint(websocket: WebSocket, thread_id: str):
     Args:
         websocket: WebSocket connection
         thread_id: Workflow thread ID to subscribe to
+        since: Last state version the client has seen (resume instead of full state)
     """
     await ws_manager.connect(websocket, thread_id)
+    delta_streamer.ensure_started()
 
     try:
-        logger.info("websocket_connected", thread_id=thread_id)
+        logger.info("websocket_connected", thread_id=thread_id, since=since)
 
-        # Send initial connection confirmation
-        await websocket.send_json(
+        # Send initial connection confirmation (queued ahead of any broadcast)
+        await ws_manager.send_personal_message(
             {
                 "type": "connected",
                 "thread_id": thread_id,
                 "message": "WebSocket connected successfully",
-            }
+            },
+            websocket,
         )
 
-        # Send current state immediately
-        state = await workflow_store.load_state(thread_id)
-        if state:
-            await websocket.send_json(
-                {
-                    "type": "initial_state",
-                    "thread_id": thread_id,
-                    "state": state,
-                }
-            )
+        # Send current state (or just what changed since the client's version)
+        await _send_state_or_catch_up(websocket, thread_id, since)
 
         # Keep connection alive and handle incoming messages
         while True:
             try:
-                # Receive messages from client (e.g., ping/pong for keep-alive)
+                # Receive messages from client (ping/pong keep-alive, resume)
                 data = await websocket.receive_text()
 
                 # Handle client messages
                 if data == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await ws_manager.send_personal_message({"type": "pong"}, websocket)
+                    continue
+
+                try:
+                    message = json.loads(data)
+                except ValueError:
+                    continue
+                if isinstance(message, dict) and message.get("type") == "resume":
+                    resume_since = message.get("since")
+                    await _send_state_or_catch_up(
+                        websocket,
+                        thread_id,
+                        resume_since if isinstance(resume_since, int) else None,
+                    )
 
             except WebSocketDisconnect:
                 logger.info("websocket_client_disconnect", thread_id=thread_id)
@@ -5,21 +5,32 @@ This module provides:
 - Readiness probe (is service ready to accept requests)
 - Detailed health status
 - Dependency health checks
+
+Dependency probes run on a background refresher with per-dependency
+timeouts; the endpoints only read the cached results, so probe traffic
+from load balancers never reaches the backends.
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from core.config.production_settings import AppSettings, get_settings
 from core.logging_utils import get_logger
+from core.resilience import CircuitBreakers, CircuitState
+from core.storage.redis_client import get_redis_client
+
+if TYPE_CHECKING:
+    from core.storage.connection import DatabaseManager
 
 logger = get_logger(__name__)
 
@@ -47,6 +58,8 @@ class DependencyHealth(BaseModel):
     response_time_ms: float | None = None
     message: str | None = None
     details: dict[str, Any] = {}
+    critical: bool = False
+    checked_at: datetime | None = None
 
 
 class HealthResponse(BaseModel):
@@ -69,9 +82,32 @@ class HealthResponse(BaseModel):
 # Track service start time
 SERVICE_START_TIME = time.time()
 
+# Dependencies whose failure takes the replica out of rotation
+CRITICAL_DEPENDENCIES = frozenset({"database", "redis"})
+
 
-async def check_database_health() -> DependencyHealth:
-    """Check database connectivity and health.
+def _elapsed_ms(start_time: float) -> float:
+    return (time.perf_counter() - start_time) * 1000
+
+
+def _pool_details(db: Any) -> dict[str, Any]:
+    """Connection pool usage, when the pool exposes it (QueuePool does)."""
+    try:
+        pool = db.get_engine().pool
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    except Exception:
+        return {}
+
+
+async def check_database_health(db: DatabaseManager | None = None) -> DependencyHealth:
+    """Check database connectivity with a ``SELECT 1`` through the pool.
+
+    Args:
+        db: Database manager to probe (defaults to the shared one)
 
     Returns:
         Database health status
@@ -79,154 +115,347 @@ async def check_database_health() -> DependencyHealth:
     start_time = time.perf_counter()
 
     try:
-        # TODO: Implement actual database check
-        # For now, simulate check
-        await asyncio.sleep(0.01)  # Simulate DB query
+        from sqlalchemy import text
 
-        # In production:
-        # async with get_db_connection() as conn:
-        #     await conn.execute("SELECT 1")
+        if db is None:
+            from core.storage.connection import get_db_manager
 
-        response_time = (time.perf_counter() - start_time) * 1000
+            db = get_db_manager()
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
 
         return DependencyHealth(
             name="database",
             status=HealthStatus.HEALTHY,
-            response_time_ms=response_time,
+            response_time_ms=_elapsed_ms(start_time),
             message="Database connection successful",
+            details=_pool_details(db),
         )
 
     except Exception as e:
-        response_time = (time.perf_counter() - start_time) * 1000
         logger.error("Database health check failed", error=str(e))
 
         return DependencyHealth(
             name="database",
             status=HealthStatus.UNHEALTHY,
-            response_time_ms=response_time,
+            response_time_ms=_elapsed_ms(start_time),
             message=f"Database check failed: {e!s}",
         )
 
 
-async def check_redis_health() -> DependencyHealth:
-    """Check Redis connectivity and health.
+async def check_redis_health(client: Any | None = None) -> DependencyHealth:
+    """Check Redis connectivity with ``PING``.
+
+    Redis is optional: when ``USE_REDIS`` is off and no client is given the
+    dependency is reported healthy but disabled.
+
+    Args:
+        client: ``redis.asyncio`` client to probe (defaults to the shared one)
 
     Returns:
         Redis health status
     """
     start_time = time.perf_counter()
 
-    try:
-        # TODO: Implement actual Redis check
-        # For now, simulate check
-        await asyncio.sleep(0.005)  # Simulate Redis ping
-
-        # In production:
-        # redis_client = await get_redis_client()
-        # await redis_client.ping()
+    if client is None and os.getenv("USE_REDIS", "false").lower() != "true":
+        return DependencyHealth(
+            name="redis",
+            status=HealthStatus.HEALTHY,
+            response_time_ms=_elapsed_ms(start_time),
+            message="Redis disabled",
+            details={"enabled": False},
+        )
 
-        response_time = (time.perf_counter() - start_time) * 1000
+    try:
+        if client is None:
+            client = await get_redis_client()
+            if client is None:
+                raise ConnectionError("Redis client unavailable")
+        await client.ping()
 
         return DependencyHealth(
             name="redis",
             status=HealthStatus.HEALTHY,
-            response_time_ms=response_time,
+            response_time_ms=_elapsed_ms(start_time),
             message="Redis connection successful",
         )
 
     except Exception as e:
-        response_time = (time.perf_counter() - start_time) * 1000
         logger.error("Redis health check failed", error=str(e))
 
         return DependencyHealth(
             name="redis",
             status=HealthStatus.UNHEALTHY,
-            response_time_ms=response_time,
+            response_time_ms=_elapsed_ms(start_time),
             message=f"Redis check failed: {e!s}",
         )
 
 
-async def check_llm_health(settings: AppSettings) -> DependencyHealth:
-    """Check LLM provider availability.
+_vector_store: Any | None = None
+
+
+async def check_vector_store_health(
+    settings: AppSettings, store: Any | None = None
+) -> DependencyHealth:
+    """Check the vector store (Pinecone) index is reachable.
 
     Args:
         settings: Application settings
+        store: Store with an async ``health_check()`` (defaults to Pinecone)
 
     Returns:
-        LLM health status
+        Vector store health status
     """
+    global _vector_store
     start_time = time.perf_counter()
 
-    try:
-        # TODO: Implement actual LLM check
-        # For now, check if API keys are configured
-        await asyncio.sleep(0.002)
-
-        has_api_key = (
-            settings.llm.openai_api_key is not None
-            or settings.llm.anthropic_api_key is not None
-            or settings.llm.gemini_api_key is not None
+    if store is None and settings.pinecone.api_key is None:
+        return DependencyHealth(
+            name="vector_store",
+            status=HealthStatus.DEGRADED,
+            response_time_ms=_elapsed_ms(start_time),
+            message="Vector store not configured",
         )
 
-        response_time = (time.perf_counter() - start_time) * 1000
+    try:
+        if store is None:
+            if _vector_store is None:
+                from core.storage.pinecone_store import create_pinecone_store
+
+                _vector_store = create_pinecone_store(namespace=settings.pinecone.namespace)
+            store = _vector_store
+        if not await store.health_check():
+            raise ConnectionError("index did not respond")
 
-        if has_api_key:
-            return DependencyHealth(
-                name="llm_provider",
-                status=HealthStatus.HEALTHY,
-                response_time_ms=response_time,
-                message="LLM provider configured",
-            )
         return DependencyHealth(
-            name="llm_provider",
-            status=HealthStatus.DEGRADED,
-            response_time_ms=response_time,
-            message="No LLM API keys configured",
+            name="vector_store",
+            status=HealthStatus.HEALTHY,
+            response_time_ms=_elapsed_ms(start_time),
+            message="Vector store reachable",
         )
 
     except Exception as e:
-        response_time = (time.perf_counter() - start_time) * 1000
-        logger.error("LLM health check failed", error=str(e))
+        logger.error("Vector store health check failed", error=str(e))
 
         return DependencyHealth(
-            name="llm_provider",
+            name="vector_store",
             status=HealthStatus.UNHEALTHY,
-            response_time_ms=response_time,
-            message=f"LLM check failed: {e!s}",
+            response_time_ms=_elapsed_ms(start_time),
+            message=f"Vector store check failed: {e!s}",
         )
 
 
-async def check_memory_health() -> DependencyHealth:
-    """Check memory manager health.
+async def check_llm_health(settings: AppSettings) -> DependencyHealth:
+    """Check LLM provider availability.
+
+    Looks at configured API keys and the registered circuit breakers; an
+    open breaker means calls are currently being short-circuited.
+
+    Args:
+        settings: Application settings
 
     Returns:
-        Memory health status
+        LLM health status
     """
     start_time = time.perf_counter()
 
-    try:
-        # TODO: Implement actual memory check
-        await asyncio.sleep(0.001)
+    has_api_key = (
+        settings.llm.openai_api_key is not None
+        or settings.llm.anthropic_api_key is not None
+        or settings.llm.gemini_api_key is not None
+    )
+    breakers = {name: state.value for name, state in CircuitBreakers.states().items()}
+    tripped = sorted(name for name, state in breakers.items() if state != CircuitState.CLOSED)
 
-        response_time = (time.perf_counter() - start_time) * 1000
+    if not has_api_key:
+        health_status, message = HealthStatus.DEGRADED, "No LLM API keys configured"
+    elif tripped:
+        health_status, message = HealthStatus.DEGRADED, f"Circuit open: {', '.join(tripped)}"
+    else:
+        health_status, message = HealthStatus.HEALTHY, "LLM provider configured"
+
+    return DependencyHealth(
+        name="llm_provider",
+        status=health_status,
+        response_time_ms=_elapsed_ms(start_time),
+        message=message,
+        details={"circuit_breakers": breakers},
+    )
 
-        return DependencyHealth(
-            name="memory_manager",
-            status=HealthStatus.HEALTHY,
-            response_time_ms=response_time,
-            message="Memory manager operational",
-        )
 
-    except Exception as e:
-        response_time = (time.perf_counter() - start_time) * 1000
-        logger.error("Memory health check failed", error=str(e))
+# ============================================================================
+# Background Health Monitor
+# ============================================================================
 
-        return DependencyHealth(
-            name="memory_manager",
-            status=HealthStatus.UNHEALTHY,
-            response_time_ms=response_time,
-            message=f"Memory check failed: {e!s}",
+
+HealthProbe = Callable[[], Awaitable[DependencyHealth]]
+
+
+class HealthMonitor:
+    """Runs dependency probes in the background and caches their results.
+
+    Endpoints read the cache instead of probing, so any number of health
+    requests costs the backends one probe per dependency per ``interval``.
+    Without a running refresher, stale results are refreshed on demand by a
+    single shared refresh.
+
+    Example:
+        >>> monitor = HealthMonitor({"redis": check_redis_health}, interval=10)
+        >>> await monitor.start()
+        >>> [d.status for d in await monitor.get_results()]
+        [<HealthStatus.HEALTHY: 'healthy'>]
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, HealthProbe],
+        *,
+        interval: float = 30.0,
+        timeout: float = 5.0,
+        timeouts: dict[str, float] | None = None,
+        critical: frozenset[str] | set[str] = CRITICAL_DEPENDENCIES,
+    ) -> None:
+        """
+        Args:
+            probes: Probe coroutine per dependency name
+            interval: Seconds between background refreshes
+            timeout: Default per-probe timeout in seconds
+            timeouts: Per-dependency timeout overrides
+            critical: Dependencies that must be healthy for readiness
+        """
+        self.probes = probes
+        self.interval = interval
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.critical = frozenset(critical)
+
+        self._results: dict[str, DependencyHealth] = {}
+        self._refreshed_at: float | None = None
+        self._refreshing: asyncio.Task[list[DependencyHealth]] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background refresher is alive."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last completed refresh (None if never)."""
+        return None if self._refreshed_at is None else time.monotonic() - self._refreshed_at
+
+    async def _run_probe(self, name: str, probe: HealthProbe) -> DependencyHealth:
+        timeout = self.timeouts.get(name, self.timeout)
+        start_time = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(probe(), timeout)
+        except TimeoutError:
+            result = DependencyHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                response_time_ms=_elapsed_ms(start_time),
+                message=f"Health check timed out after {timeout:g}s",
+            )
+        except Exception as e:
+            result = DependencyHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                response_time_ms=_elapsed_ms(start_time),
+                message=f"Health check failed: {e!s}",
+            )
+        result.critical = name in self.critical
+        result.checked_at = datetime.utcnow()
+        return result
+
+    async def _refresh(self) -> list[DependencyHealth]:
+        results = await asyncio.gather(
+            *(self._run_probe(name, probe) for name, probe in self.probes.items())
         )
+        self._results = {result.name: result for result in results}
+        self._refreshed_at = time.monotonic()
+        for result in results:
+            if result.status == HealthStatus.UNHEALTHY:
+                logger.warning(
+                    "Dependency unhealthy", dependency=result.name, message=result.message
+                )
+        return results
+
+    async def refresh(self) -> list[DependencyHealth]:
+        """Probe every dependency now; concurrent callers share one refresh."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._refresh())
+        return await asyncio.shield(self._refreshing)
+
+    async def get_results(self) -> list[DependencyHealth]:
+        """Cached results, refreshed first only if older than ``interval``."""
+        age = self.age
+        if age is None or (age > self.interval and not self.running):
+            await self.refresh()
+        return list(self._results.values())
+
+    def is_stale(self) -> bool:
+        """True if the refresher has not completed a refresh for too long."""
+        age = self.age
+        return age is None or age > 3 * self.interval + self.timeout
+
+    async def start(self) -> None:
+        """Probe once, then keep refreshing in the background."""
+        if self.running:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._loop(), name="health-monitor")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:  # pragma: no cover - probes already catch
+                logger.error("Health refresh failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def create_health_monitor(settings: AppSettings) -> HealthMonitor:
+    """Build a monitor probing the database, Redis, vector store and LLMs."""
+    return HealthMonitor(
+        {
+            "database": check_database_health,
+            "redis": check_redis_health,
+            "vector_store": lambda: check_vector_store_health(settings),
+            "llm_provider": lambda: check_llm_health(settings),
+        },
+        interval=settings.observability.health_check_interval,
+        timeout=settings.observability.health_check_timeout,
+    )
+
+
+# Global instance
+_health_monitor: HealthMonitor | None = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Get or create the global health monitor."""
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = create_health_monitor(get_settings())
+    return _health_monitor
+
+
+async def start_health_monitor() -> None:
+    """Start background dependency probing (call from application startup)."""
+    await get_health_monitor().start()
+
+
+async def stop_health_monitor() -> None:
+    """Stop background dependency probing."""
+    if _health_monitor is not None:
+        await _health_monitor.stop()
 
 
 # ============================================================================
@@ -237,36 +466,22 @@ async def check_memory_health() -> DependencyHealth:
 @router.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check(
     settings: AppSettings = Depends(get_settings),
+    monitor: HealthMonitor = Depends(get_health_monitor),
 ) -> HealthResponse:
     """Comprehensive health check endpoint.
 
-    Checks all dependencies and returns detailed status.
+    Reports the cached status of all dependencies.
 
     Returns:
         Detailed health status
     """
-    # Run all health checks in parallel
-    checks = await asyncio.gather(
-        check_database_health(),
-        check_redis_health(),
-        check_llm_health(settings),
-        check_memory_health(),
-        return_exceptions=True,
-    )
-
-    # Filter out exceptions and collect results
-    dependencies: list[DependencyHealth] = []
-    for check in checks:
-        if isinstance(check, DependencyHealth):
-            dependencies.append(check)
-        elif isinstance(check, Exception):
-            logger.error("Health check failed", error=str(check))
+    dependencies = await monitor.get_results()
 
     # Determine overall status
     if all(d.status == HealthStatus.HEALTHY for d in dependencies):
         overall_status = HealthStatus.HEALTHY
-    elif any(d.status == HealthStatus.UNHEALTHY for d in dependencies):
-        overall_status = HealthStatus.DEGRADED
+    elif any(d.status == HealthStatus.UNHEALTHY and d.critical for d in dependencies):
+        overall_status = HealthStatus.UNHEALTHY
     else:
         overall_status = HealthStatus.DEGRADED
 
@@ -280,16 +495,21 @@ async def health_check(
         environment=settings.env.value,
         dependencies=dependencies,
         details={
-            "uptime_human": f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m {int(uptime % 60)}s"
+            "uptime_human": f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m {int(uptime % 60)}s",
+            "checked_seconds_ago": monitor.age,
         },
     )
 
 
 @router.get("/liveness", tags=["Health"])
-async def liveness_probe() -> dict[str, Any]:
+async def liveness_probe(
+    monitor: HealthMonitor = Depends(get_health_monitor),
+) -> dict[str, Any]:
     """Kubernetes liveness probe.
 
-    Returns 200 if service is running.
+    Returns 200 if the process is serving requests. Dependencies are
+    deliberately not checked: a dead database should take the replica out
+    of rotation (readiness), not restart it.
 
     Returns:
         Simple liveness status
@@ -297,17 +517,18 @@ async def liveness_probe() -> dict[str, Any]:
     return {
         "status": "alive",
         "timestamp": datetime.utcnow().isoformat(),
+        "health_monitor": "running" if monitor.running else "stopped",
     }
 
 
 @router.get("/readiness", tags=["Health"])
 async def readiness_probe(
-    settings: AppSettings = Depends(get_settings),
+    monitor: HealthMonitor = Depends(get_health_monitor),
 ) -> dict[str, Any]:
     """Kubernetes readiness probe.
 
-    Returns 200 if service is ready to accept requests.
-    Checks critical dependencies.
+    Returns 200 if service is ready to accept requests, judged from the
+    cached status of critical dependencies.
 
     Returns:
         Readiness status
@@ -315,27 +536,26 @@ async def readiness_probe(
     Raises:
         HTTPException: If service is not ready (status 503)
     """
-    from fastapi import HTTPException
+    dependencies = await monitor.get_results()
 
-    # Check critical dependencies
-    critical_checks = await asyncio.gather(
-        check_database_health(),
-        check_redis_health(),
-        return_exceptions=True,
-    )
+    if monitor.running and monitor.is_stale():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service not ready: dependency status is stale",
+        )
 
     # Check if any critical dependency is unhealthy
-    for check in critical_checks:
-        if isinstance(check, DependencyHealth):
-            if check.status == HealthStatus.UNHEALTHY:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Service not ready: {check.name} is unhealthy",
-                )
+    for check in dependencies:
+        if check.critical and check.status == HealthStatus.UNHEALTHY:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Service not ready: {check.name} is unhealthy",
+            )
 
     return {
         "status": "ready",
         "timestamp": datetime.utcnow().isoformat(),
+        "dependencies": {check.name: check.status.value for check in dependencies},
     }
 
 
@@ -352,8 +572,6 @@ async def startup_probe() -> dict[str, Any]:
 
     # Consider service started after 5 seconds
     if uptime < 5:
-        from fastapi import HTTPException
-
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service still starting up",
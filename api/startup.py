@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from core.di import get_container
 from core.tools.tool_registry import ToolMetadata, get_tool_registry
+from core.validation.quality_metrics import start_quality_flush, stop_quality_flush
 
 
 def register_builtin_tools() -> None:
@@ -24,3 +26,49 @@ def register_builtin_tools() -> None:
             tags={"network", "builtin"},
         ),
     )
+
+
+async def start_background_writers() -> None:
+    """Start write-behind buffers so audit I/O stays off the request path.
+
+    Also starts the periodic flush of quality aggregates to the shared store.
+    """
+    container = get_container()
+    if container.has("audit_buffer"):
+        await container.get("audit_buffer").start()
+    await start_quality_flush()
+
+
+async def stop_background_writers() -> None:
+    """Drain write-behind buffers; pending events are flushed or spilled to disk."""
+    container = get_container()
+    if container.has("audit_buffer"):
+        await container.get("audit_buffer").stop()
+    await stop_quality_flush()
+
+
+async def start_realtime_backplane() -> None:
+    """Subscribe the WebSocket manager to the cross-worker event backplane.
+
+    Uses Redis Streams when Redis is configured so workflow events published by
+    any worker reach every connected client; otherwise falls back to in-process.
+    Also starts the per-tick delta streamer for the document monitor.
+    """
+    from core.storage.redis_client import get_redis_client
+    from core.websocket_backplane import InMemoryBackplane, RedisStreamsBackplane
+    from core.websocket_deltas import delta_streamer
+    from core.websocket_manager import manager
+
+    redis = await get_redis_client()
+    backplane = RedisStreamsBackplane(redis) if redis is not None else InMemoryBackplane()
+    await manager.start(backplane)
+    delta_streamer.ensure_started()
+
+
+async def stop_realtime_backplane() -> None:
+    """Stop delta pushes and detach the WebSocket manager from the backplane."""
+    from core.websocket_deltas import delta_streamer
+    from core.websocket_manager import manager
+
+    await delta_streamer.stop()
+    await manager.stop()
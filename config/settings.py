@@ -27,6 +27,10 @@ class AppSettings(BaseSettings):
     telegram_bot_token_legacy: str = Field(default="", alias="TELEGRAM_BOT_TOKEN")
     telegram_allowed_users: str | None = Field(default=None, alias="TELEGRAM_ALLOWED_USERS")
     telegram_webhook_secret: str = Field(default="", alias="TELEGRAM_WEBHOOK_SECRET")
+    telegram_update_queue_path: Path | None = Field(
+        default=Path("tmp/telegram_updates.sqlite3"), alias="TELEGRAM_UPDATE_QUEUE_PATH"
+    )
+    telegram_update_workers: int = Field(default=8, alias="TELEGRAM_UPDATE_WORKERS")
 
     public_base_url: str | None = Field(default=None, alias="PUBLIC_BASE_URL")
     railway_public_domain: str | None = Field(default=None, alias="RAILWAY_PUBLIC_DOMAIN")
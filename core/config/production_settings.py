@@ -187,6 +187,11 @@ class SecuritySettings(BaseSettings):
     # API Keys
     api_key_length: int = Field(default=32, ge=16, le=64)
     api_key_prefix: str = Field(default="sk_")
+    api_key_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+
+    # Authentication hot path
+    password_hash_workers: int = Field(default=4, ge=1)
+    auth_cache_size: int = Field(default=10_000, ge=1)
 
     # Rate limiting
     rate_limit_enabled: bool = Field(default=True)
@@ -294,6 +299,27 @@ class ObservabilitySettings(BaseSettings):
     # Health checks
     health_check_enabled: bool = Field(default=True)
     health_check_interval: int = Field(default=30, ge=1)
+    health_check_timeout: float = Field(default=5.0, gt=0)
+
+
+class CompressionSettings(BaseSettings):
+    """HTTP response compression configuration."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="COMPRESSION_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    minimum_size: int = Field(default=1000, ge=0)
+
+    # Per-encoding levels: favour speed, responses are compressed per request
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+    zstd_level: int = Field(default=3, ge=1, le=22)
 
 
 class FeatureFlags(BaseSettings):
@@ -373,6 +399,7 @@ class AppSettings(BaseSettings):
     llm: LLMSettings = Field(default_factory=LLMSettings)
     telegram: TelegramSettings = Field(default_factory=TelegramSettings)
     observability: ObservabilitySettings = Field(default_factory=ObservabilitySettings)
+    compression: CompressionSettings = Field(default_factory=CompressionSettings)
     features: FeatureFlags = Field(default_factory=FeatureFlags)
 
     @model_validator(mode="after")
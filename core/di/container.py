@@ -252,17 +252,21 @@ def _initialize_container(container: Container) -> None:
 
     Registers:
         - memory_manager: MemoryManager singleton
+        - audit_buffer: WriteBehindAuditBuffer singleton (started by the API lifespan)
         - tool_registry: ToolRegistry singleton
         - mega_agent: MegaAgent factory (creates new instance on each get)
     """
     from core.groupagents.mega_agent import MegaAgent
     from core.memory.memory_manager import MemoryManager
+    from core.memory.write_behind import WriteBehindAuditBuffer
     from core.tools.tool_registry import get_tool_registry
 
     logger.info("di.container.initializing_defaults")
 
     # Singletons - shared across all components
-    container.register_singleton("memory_manager", MemoryManager())
+    memory_manager = MemoryManager()
+    container.register_singleton("memory_manager", memory_manager)
+    container.register_singleton("audit_buffer", WriteBehindAuditBuffer(memory_manager))
     container.register_singleton("tool_registry", get_tool_registry())
 
     # Factories - create on demand
@@ -273,6 +277,7 @@ def _initialize_container(container: Container) -> None:
         return MegaAgent(
             memory_manager=memory,
             use_chain_of_thought=True,  # Enable CoT by default
+            audit_buffer=container.get("audit_buffer"),
         )
 
     container.register_factory("mega_agent", create_mega_agent)
@@ -187,11 +187,12 @@ class AuthenticationError(MegaAgentError):
     """Authentication failed."""
 
     def __init__(self, message: str = "Authentication failed", **kwargs: Any):
+        # Subclasses pass their own code and user message
+        kwargs.setdefault("code", ErrorCode.AUTH_FAILED)
+        kwargs.setdefault("user_message", "Authentication failed. Please check your credentials.")
         super().__init__(
             message=message,
-            code=ErrorCode.AUTH_FAILED,
             category=ErrorCategory.AUTHENTICATION,
-            user_message="Authentication failed. Please check your credentials.",
             recoverable=True,
             **kwargs,
         )
@@ -365,15 +366,13 @@ class AgentError(MegaAgentError):
         if agent_name:
             details["agent"] = agent_name
 
-        super().__init__(
-            message=message,
-            code=ErrorCode.AGENT_ERROR,
-            category=ErrorCategory.BUSINESS_LOGIC,
-            details=details,
-            user_message="An error occurred during processing.",
-            recoverable=True,
-            **kwargs,
-        )
+        # Subclasses (WorkflowError, ...) override code/user_message via kwargs
+        kwargs.setdefault("code", ErrorCode.AGENT_ERROR)
+        kwargs.setdefault("category", ErrorCategory.BUSINESS_LOGIC)
+        kwargs.setdefault("user_message", "An error occurred during processing.")
+        kwargs.setdefault("recoverable", True)
+
+        super().__init__(message=message, details=details, **kwargs)
 
 
 class WorkflowError(AgentError):
@@ -395,6 +394,7 @@ class WorkflowError(AgentError):
         super().__init__(
             message=message,
             code=ErrorCode.WORKFLOW_ERROR,
+            details=details,
             user_message="Workflow execution failed. Please try again.",
             **kwargs,
         )
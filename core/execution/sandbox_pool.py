@@ -0,0 +1,439 @@
+"""Process-isolated sandbox backend: a pool of pre-forked worker processes.
+
+Each call is shipped to an idle worker, which before running it:
+
+- lowers its soft ``RLIMIT_CPU`` to the CPU time used so far plus the
+  policy's ``max_cpu_seconds`` (exceeding it kills the worker with SIGXCPU),
+- lowers its soft ``RLIMIT_AS`` to its current size plus ``max_memory_mb``
+  (allocations beyond it raise ``MemoryError``),
+- switches into a fresh temporary working directory (also ``HOME`` and
+  ``TMPDIR``) that is deleted afterwards,
+- activates an audit hook (``sys.addaudithook``) that denies sockets unless
+  ``network_access`` is set, file access outside the working directory and
+  the Python installation unless ``filesystem_access`` is set, and any
+  process creation.
+
+The parent kills a worker that exceeds the wall-clock timeout and starts a
+replacement, so a runaway tool stops consuming CPU as soon as the timeout
+fires. Limits are restored after each call and workers are reused, which
+keeps the warm per-call overhead to one pipe round-trip.
+
+Functions must be picklable (module-level); coroutine functions are run on
+the worker's own event loop. The audit hook guards Python-level operations
+and is defence in depth, not a boundary against hostile native code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import inspect
+import math
+import multiprocessing
+import os
+from pathlib import Path
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .secure_sandbox import SandboxPolicy, SandboxViolation
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POOL_SIZE = min(4, os.cpu_count() or 1)
+DEFAULT_MAX_CALLS_PER_WORKER = 500
+
+_MIB = 1024 * 1024
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR | os.O_CREAT | os.O_APPEND | os.O_TRUNC
+_PROCESS_EVENTS = ("subprocess.Popen", "os.system", "os.exec", "os.posix_spawn", "os.spawn")
+_PROCESS_EVENTS_EXACT = frozenset({"os.fork", "os.forkpty", "pty.spawn"})
+_NETWORK_EVENTS = frozenset(
+    {
+        "socket.connect",
+        "socket.bind",
+        "socket.sendto",
+        "socket.sendmsg",
+        "socket.getaddrinfo",
+        "socket.gethostbyname",
+        "socket.gethostbyaddr",
+    }
+)
+
+
+class SandboxDenied(PermissionError):
+    """Raised inside a worker when the active policy forbids an operation."""
+
+
+@dataclass(slots=True, frozen=True)
+class _CallLimits:
+    max_cpu_seconds: float
+    max_memory_mb: int
+    network_access: bool
+    filesystem_access: bool
+
+    @classmethod
+    def from_policy(cls, policy: SandboxPolicy) -> _CallLimits:
+        return cls(
+            max_cpu_seconds=policy.max_cpu_seconds,
+            max_memory_mb=policy.max_memory_mb,
+            network_access=policy.network_access,
+            filesystem_access=policy.filesystem_access,
+        )
+
+
+# ============================================================================
+# Worker side
+# ============================================================================
+
+
+_active: tuple[_CallLimits, str, tuple[str, ...]] | None = None
+
+
+def _is_write(mode: Any, flags: Any) -> bool:
+    if isinstance(mode, str):
+        return any(ch in mode for ch in "wax+")
+    return isinstance(flags, int) and bool(flags & _WRITE_FLAGS)
+
+
+def _within(path: str, roots: tuple[str, ...]) -> bool:
+    return any(path == root or path.startswith(root + os.sep) for root in roots)
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    if _active is None:
+        return
+    limits, workdir, read_roots = _active
+
+    if event == "open":
+        path, mode, flags = (*args, None, None, None)[:3]
+        if limits.filesystem_access or isinstance(path, int) or path is None:
+            return
+        resolved = os.path.realpath(os.fsdecode(path))
+        if _within(resolved, (workdir,)):
+            return
+        if not _is_write(mode, flags) and _within(resolved, read_roots):
+            return
+        raise SandboxDenied(f"Filesystem access denied: {resolved}")
+
+    if event in _NETWORK_EVENTS and not limits.network_access:
+        raise SandboxDenied(f"Network access denied ({event})")
+
+    if event in _PROCESS_EVENTS_EXACT or event.startswith(_PROCESS_EVENTS):
+        raise SandboxDenied(f"Process creation denied ({event})")
+
+
+def _read_roots() -> tuple[str, ...]:
+    """Directories a sandboxed call may read from (the Python installation)."""
+    candidates = {sys.prefix, sys.base_prefix, sys.exec_prefix, *sys.path}
+    return tuple(
+        os.path.realpath(path) for path in candidates if path and Path(path).is_dir()
+    )
+
+
+def _address_space() -> int | None:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _apply_limits(limits: _CallLimits) -> list[tuple[int, tuple[int, int]]]:
+    """Lower soft limits for one call; returns what to restore afterwards."""
+    if resource is None:
+        return []
+    saved: list[tuple[int, tuple[int, int]]] = []
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_soft = math.ceil(usage.ru_utime + usage.ru_stime + limits.max_cpu_seconds)
+    current = resource.getrlimit(resource.RLIMIT_CPU)
+    if current[1] == resource.RLIM_INFINITY or cpu_soft < current[1]:
+        saved.append((resource.RLIMIT_CPU, current))
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_soft, current[1]))
+
+    size = _address_space()
+    if size is not None and limits.max_memory_mb > 0:
+        current = resource.getrlimit(resource.RLIMIT_AS)
+        as_soft = size + limits.max_memory_mb * _MIB
+        if current[1] == resource.RLIM_INFINITY or as_soft < current[1]:
+            saved.append((resource.RLIMIT_AS, current))
+            resource.setrlimit(resource.RLIMIT_AS, (as_soft, current[1]))
+    return saved
+
+
+def _run_call(
+    loop: asyncio.AbstractEventLoop,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    limits: _CallLimits,
+    read_roots: tuple[str, ...],
+) -> tuple[str, Any]:
+    global _active
+    home = Path.cwd()
+    env = {key: os.environ.get(key) for key in ("HOME", "TMPDIR")}
+    workdir = os.path.realpath(tempfile.mkdtemp(prefix="sandbox-"))
+    saved: list[tuple[int, tuple[int, int]]] = []
+    try:
+        os.chdir(workdir)
+        os.environ["HOME"] = os.environ["TMPDIR"] = workdir
+        tempfile.tempdir = workdir
+        saved = _apply_limits(limits)
+        _active = (limits, workdir, read_roots)
+
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = loop.run_until_complete(result)
+        return "ok", result
+    except MemoryError:
+        return "error", SandboxViolation(f"Memory limit of {limits.max_memory_mb} MB exceeded")
+    except BaseException as exc:
+        return "error", exc
+    finally:
+        _active = None
+        for which, value in saved:
+            resource.setrlimit(which, value)
+        tempfile.tempdir = None
+        for key, value in env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        os.chdir(home)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _worker_main(conn: Connection) -> None:
+    """Worker loop: receive ``(func, args, kwargs, limits)``, reply with the outcome."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    sys.addaudithook(_audit_hook)
+    read_roots = _read_roots()
+    loop = asyncio.new_event_loop()
+
+    while True:
+        try:
+            func, args, kwargs, limits = conn.recv()
+        except (EOFError, OSError):
+            break
+        started = time.process_time()
+        status, value = _run_call(loop, func, args, kwargs, limits, read_roots)
+        cpu = time.process_time() - started
+        try:
+            conn.send((status, value, cpu))
+        except Exception as exc:  # unpicklable result or exception
+            conn.send(("error", RuntimeError(f"Unpicklable sandbox result: {exc!r}"), cpu))
+
+
+# ============================================================================
+# Parent side
+# ============================================================================
+
+
+class _Worker:
+    __slots__ = ("calls", "conn", "process")
+
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        self.calls = 0
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1.0)
+        self.conn.close()
+
+
+def _default_start_method() -> str:
+    methods = multiprocessing.get_all_start_methods()
+    # forkserver forks from a clean, single-threaded server process
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+class SandboxPool:
+    """Pool of warm worker processes that run calls under a ``SandboxPolicy``.
+
+    Example:
+        >>> pool = SandboxPool(size=2)
+        >>> await pool.start()
+        >>> await pool.run(math.factorial, 20, policy=policy, timeout=1.0)
+        2432902008176640000
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        *,
+        start_method: str | None = None,
+        max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER,
+    ) -> None:
+        """
+        Args:
+            size: Number of worker processes
+            start_method: ``multiprocessing`` start method (forkserver if available)
+            max_calls_per_worker: Calls after which a worker is recycled
+        """
+        self.size = size
+        self.max_calls_per_worker = max_calls_per_worker
+        self._ctx = multiprocessing.get_context(start_method or _default_start_method())
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._workers: set[_Worker] = set()
+        self._closed = False
+        self._stats = {"calls": 0, "timeouts": 0, "crashes": 0, "spawned": 0}
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn,), name="sandbox-worker", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.add(worker)
+        self._stats["spawned"] += 1
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        worker.kill()
+
+    def _respawn(self, worker: _Worker) -> _Worker | None:
+        """Replace ``worker`` with a fresh one (None once closed); blocks, run in an executor."""
+        self._retire(worker)
+        return None if self._closed else self._spawn()
+
+    async def _recycle(self, worker: _Worker, replace: bool) -> None:
+        """Return ``worker``, or a replacement, to the idle queue."""
+        if replace:
+            loop = asyncio.get_running_loop()
+            worker = await loop.run_in_executor(None, self._respawn, worker)
+        if worker is not None and not self._closed and self._idle is not None:
+            self._idle.put_nowait(worker)
+
+    async def start(self) -> None:
+        """Pre-fork the workers (called automatically on first use)."""
+        if self._idle is not None:
+            return
+        if self._closed:
+            raise RuntimeError("SandboxPool is closed")
+        self._idle = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        for _ in range(self.size):
+            self._idle.put_nowait(await loop.run_in_executor(None, self._spawn))
+        logger.info("sandbox.pool.started", size=self.size, start_method=self._ctx.get_start_method())
+
+    async def _receive(self, worker: _Worker, timeout: float) -> Any:
+        """Wait for the worker's reply without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = worker.conn.fileno()
+        try:
+            loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        except NotImplementedError:  # pragma: no cover - Proactor loop
+            return await asyncio.wait_for(loop.run_in_executor(None, worker.conn.recv), timeout)
+        try:
+            await asyncio.wait_for(ready, timeout)
+        finally:
+            loop.remove_reader(fd)
+        return worker.conn.recv()
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        policy: SandboxPolicy,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` in a worker under ``policy``.
+
+        Raises:
+            SandboxViolation: On timeout, CPU or memory limit, denied
+                operation, or if the worker died
+        """
+        await self.start()
+        assert self._idle is not None
+        timeout = timeout or policy.max_cpu_seconds
+        loop = asyncio.get_running_loop()
+        worker = await self._idle.get()
+        if not worker.process.is_alive():
+            replacement = await loop.run_in_executor(None, self._respawn, worker)
+            if replacement is None:
+                raise RuntimeError("SandboxPool is closed")
+            worker = replacement
+
+        self._stats["calls"] += 1
+        replace = True
+        try:
+            worker.conn.send((func, args, kwargs, _CallLimits.from_policy(policy)))
+            worker.calls += 1
+            status, value, _cpu = await self._receive(worker, timeout)
+            replace = worker.calls >= self.max_calls_per_worker
+        except TimeoutError as exc:
+            self._stats["timeouts"] += 1
+            raise SandboxViolation("Execution exceeded time limit") from exc
+        except (EOFError, OSError) as exc:
+            self._stats["crashes"] += 1
+            await loop.run_in_executor(None, worker.process.join, 1.0)
+            raise SandboxViolation(self._describe_exit(worker, policy)) from exc
+        finally:
+            # Killing and re-forking block; keep them off the event loop, and
+            # finish recycling even if this call is cancelled meanwhile
+            await asyncio.shield(self._recycle(worker, replace))
+
+        if status == "ok":
+            return value
+        if isinstance(value, SandboxDenied):
+            raise SandboxViolation(str(value)) from value
+        raise value
+
+    @staticmethod
+    def _describe_exit(worker: _Worker, policy: SandboxPolicy) -> str:
+        code = worker.process.exitcode
+        if code is not None and code < 0 and -code == getattr(signal, "SIGXCPU", None):
+            return f"CPU limit of {policy.max_cpu_seconds:g}s exceeded"
+        return f"Sandbox worker died (exit code {code})"
+
+    async def close(self) -> None:
+        """Terminate all workers."""
+        self._closed = True
+        self._idle = None
+        # Killing and joining block; retire the workers in parallel off the loop
+        await asyncio.gather(
+            *(asyncio.to_thread(self._retire, worker) for worker in list(self._workers))
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get call and worker counters."""
+        return {**self._stats, "workers": len(self._workers)}
+
+
+# Global instance
+_sandbox_pool: SandboxPool | None = None
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Get or create the shared sandbox pool (workers start on first use)."""
+    global _sandbox_pool
+    if _sandbox_pool is None:
+        _sandbox_pool = SandboxPool()
+    return _sandbox_pool
+
+
+__all__ = ["SandboxDenied", "SandboxPool", "get_sandbox_pool"]
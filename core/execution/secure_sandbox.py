@@ -1,8 +1,9 @@
 """Secure sandbox utilities for executing tools and code with policies.
 
-Phase 3 scaffolding: provides policy loading, resource limits, and a simple
-async runner interface. Concrete enforcement (e.g. OS-level sandboxing) will be
-implemented incrementally.
+Provides the sandbox policy, an async runner interface and tool allow-listing.
+Without a pool the runner only enforces the timeout in-process; with a
+``SandboxPool`` (see ``sandbox_pool``) calls run in isolated worker processes
+with CPU, memory, network and filesystem limits enforced.
 """
 
 from __future__ import annotations
@@ -10,7 +11,10 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sandbox_pool import SandboxPool
 
 
 @dataclass(slots=True)
@@ -31,10 +35,17 @@ class SandboxViolation(Exception):
 
 
 class SandboxRunner:
-    """Run callables under a sandbox policy (placeholder implementation)."""
+    """Run callables under a sandbox policy.
+
+    Args:
+        policy: Limits and permissions to apply
+        pool: Worker pool for process isolation; when omitted, only the
+            timeout is enforced and ``func`` runs in the current process
+    """
 
-    def __init__(self, policy: SandboxPolicy) -> None:
+    def __init__(self, policy: SandboxPolicy, pool: SandboxPool | None = None) -> None:
         self.policy = policy
+        self.pool = pool
 
     async def run_async(
         self,
@@ -45,11 +56,13 @@ class SandboxRunner:
     ) -> Any:
         """Execute ``func`` with timeout enforcement.
 
-        Resource isolation is minimal for now; future work will integrate
-        subprocess sandboxing / cgroups. Timeout guarantees are provided.
+        With a pool, ``func`` must be picklable (a module-level function) and
+        the worker running it is killed if the timeout fires.
         """
 
         timeout = timeout or self.policy.max_cpu_seconds
+        if self.pool is not None:
+            return await self.pool.run(func, policy=self.policy, timeout=timeout, **kwargs)
 
         try:
             return await asyncio.wait_for(func(**kwargs), timeout=timeout)
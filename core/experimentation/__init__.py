@@ -1 +1,40 @@
 """Experimentation package."""
+
+from __future__ import annotations
+
+from .ab_testing import PromptABTester
+from .engine import (
+    BUCKETS,
+    Allocation,
+    Assignment,
+    Experiment,
+    ExperimentEngine,
+    ExperimentStore,
+    InMemoryExperimentStore,
+    RedisExperimentStore,
+    bucket_for,
+    configure_experiment_engine,
+    create_experiment_store,
+    get_experiment_engine,
+)
+from .statistics import VariantStats, VariantSummary, recommend_variant, summarize_variants
+
+__all__ = [
+    "BUCKETS",
+    "Allocation",
+    "Assignment",
+    "Experiment",
+    "ExperimentEngine",
+    "ExperimentStore",
+    "InMemoryExperimentStore",
+    "PromptABTester",
+    "RedisExperimentStore",
+    "VariantStats",
+    "VariantSummary",
+    "bucket_for",
+    "configure_experiment_engine",
+    "create_experiment_store",
+    "get_experiment_engine",
+    "recommend_variant",
+    "summarize_variants",
+]
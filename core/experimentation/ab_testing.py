@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import hashlib
+import secrets
 from typing import Any
 
+from .engine import bucket_boundaries, bucket_for, normalize_weights
+from .statistics import VariantStats, summarize_variants
+
 
 class PromptABTester:
     """
     A/B testing framework for prompts.
+
+    Synchronous and kept in a single dictionary; use ``ExperimentEngine`` for
+    experiments shared between workers.
     """
 
     def __init__(self, storage: dict[str, Any] | None = None):
@@ -44,7 +50,9 @@ class PromptABTester:
 
         self.storage[experiment_name] = {
             "prompts": prompts,
-            "distribution": distribution or [1.0 / len(prompts)] * len(prompts),
+            "distribution": normalize_weights(len(prompts), distribution),
+            "salt": secrets.token_hex(8),
+            "assignments": {},
             "results": [0] * len(prompts),
             "trials": [0] * len(prompts),
         }
@@ -53,6 +61,9 @@ class PromptABTester:
         """
         Gets a prompt variant for a given user.
 
+        Users are hashed into 10,000 buckets with the experiment's salt; a
+        trial is counted only on a user's first call.
+
         Args:
             experiment_name: The name of the experiment.
             user_id: The ID of the user.
@@ -64,23 +75,16 @@ class PromptABTester:
             raise ValueError(f"Experiment '{experiment_name}' not found.")
 
         experiment = self.storage[experiment_name]
+        assignments = experiment.setdefault("assignments", {})
 
-        # Use a hash of the user ID to ensure a consistent assignment
-        user_hash = int(hashlib.sha256(user_id.encode()).hexdigest(), 16)
-
-        # Use the distribution to select a variant
-        rand_val = user_hash % 100 / 100.0
-
-        cumulative_dist = 0.0
-        for i, weight in enumerate(experiment["distribution"]):
-            cumulative_dist += weight
-            if rand_val < cumulative_dist:
-                variant_index = i
-                break
-        else:
-            variant_index = len(experiment["prompts"]) - 1
+        variant_index = assignments.get(user_id)
+        if variant_index is None:
+            bucket = bucket_for(user_id, experiment.setdefault("salt", experiment_name))
+            bounds = bucket_boundaries(experiment["distribution"])
+            variant_index = next(i for i, bound in enumerate(bounds) if bucket < bound)
+            assignments[user_id] = variant_index
+            experiment["trials"][variant_index] += 1
 
-        experiment["trials"][variant_index] += 1
         return experiment["prompts"][variant_index]
 
     def record_outcome(self, experiment_name: str, prompt: str, score: float):
@@ -120,6 +124,14 @@ class PromptABTester:
             raise ValueError(f"Experiment '{experiment_name}' not found.")
 
         experiment = self.storage[experiment_name]
+        summaries = summarize_variants(
+            {
+                str(i): VariantStats(exposures=trials, reward=float(successes))
+                for i, (trials, successes) in enumerate(
+                    zip(experiment["trials"], experiment["results"], strict=True)
+                )
+            }
+        )
 
         results = []
         for i, prompt in enumerate(experiment["prompts"]):
@@ -132,6 +144,8 @@ class PromptABTester:
                     "trials": trials,
                     "successes": successes,
                     "conversion_rate": conversion_rate,
+                    "posterior_mean": summaries[i].posterior_mean,
+                    "prob_best": summaries[i].prob_best,
                 }
             )
 
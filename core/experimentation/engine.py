@@ -0,0 +1,488 @@
+"""Persistent experiment engine for prompt variants.
+
+- Users are hashed into 10,000 buckets with a per-experiment salt, so
+  weights have 0.01% resolution and assignments in different experiments
+  are independent.
+- The first assignment of a user is stored and sticky; only that first
+  exposure is counted, and only the user's first outcome is recorded.
+  Exposures still awaiting an outcome are indexed per user, so feedback
+  is credited without scanning every experiment.
+  Exposure and counter updates happen in one atomic step (a Lua script on
+  Redis), so concurrent workers never double count.
+- With ``Allocation.THOMPSON`` new users go to the variant that wins a draw
+  from the current Beta posteriors, shifting traffic towards better
+  variants while the experiment runs.
+- ``summarize`` reports Bayesian posterior summaries (see ``statistics``).
+
+Redis is used when ``USE_REDIS`` is enabled, otherwise state is in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from enum import StrEnum
+import hashlib
+import json
+import secrets
+from typing import Any, Protocol
+
+import numpy as np
+import structlog
+
+from .statistics import (
+    DEFAULT_LOSS_THRESHOLD,
+    DEFAULT_SAMPLES,
+    VariantStats,
+    recommend_variant,
+    sample_posteriors,
+    summarize_variants,
+)
+
+logger = structlog.get_logger(__name__)
+
+BUCKETS = 10_000
+
+
+class Allocation(StrEnum):
+    """How new users are allocated to variants."""
+
+    FIXED = "fixed"  # Weighted hash buckets
+    THOMPSON = "thompson"  # Thompson sampling on the Beta posteriors
+
+
+def bucket_for(user_id: str, salt: str) -> int:
+    """Deterministic bucket in ``[0, BUCKETS)`` for ``user_id``."""
+    digest = hashlib.sha256(f"{salt}:{user_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % BUCKETS
+
+
+def bucket_boundaries(weights: list[float]) -> list[int]:
+    """Cumulative upper bucket bound of each weight (last one is ``BUCKETS``)."""
+    bounds, total = [], 0.0
+    for weight in weights:
+        total += weight
+        bounds.append(round(total * BUCKETS))
+    bounds[-1] = BUCKETS
+    return bounds
+
+
+def normalize_weights(count: int, weights: list[float] | None) -> list[float]:
+    """Validate weights (or build a uniform split) for ``count`` variants."""
+    if weights is None:
+        return [1.0 / count] * count
+    if len(weights) != count:
+        raise ValueError("The number of variants and weights must be the same.")
+    if any(w < 0 for w in weights) or abs(sum(weights) - 1.0) > 1e-6:
+        raise ValueError("Weights must be non-negative and sum to 1.")
+    return list(weights)
+
+
+@dataclass(slots=True)
+class Experiment:
+    """Experiment definition (immutable once created)."""
+
+    name: str
+    variants: dict[str, str]  # variant name -> prompt or template
+    weights: list[float]
+    allocation: Allocation = Allocation.FIXED
+    salt: str = field(default_factory=lambda: secrets.token_hex(8))
+    description: str = ""
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> Experiment:
+        data = json.loads(raw)
+        data["allocation"] = Allocation(data["allocation"])
+        return cls(**data)
+
+    def variant_for_bucket(self, bucket: int) -> str:
+        for name, bound in zip(self.variants, bucket_boundaries(self.weights), strict=True):
+            if bucket < bound:
+                return name
+        return next(reversed(self.variants))  # pragma: no cover - bounds end at BUCKETS
+
+
+@dataclass(slots=True, frozen=True)
+class Assignment:
+    """Variant a user sees in an experiment."""
+
+    experiment: str
+    variant: str
+    value: str
+    new: bool  # First exposure of this user
+
+
+class ExperimentStore(Protocol):
+    """Persistence for experiments, sticky assignments and counters."""
+
+    async def add_experiment(self, experiment: Experiment) -> bool: ...
+
+    async def get_experiment(self, name: str) -> Experiment | None: ...
+
+    async def list_experiments(self) -> list[str]: ...
+
+    async def active_experiments(self, user_id: str) -> list[str]: ...
+
+    async def get_assignment(self, name: str, user_id: str) -> str | None: ...
+
+    async def expose(self, name: str, user_id: str, variant: str) -> tuple[str, bool]: ...
+
+    async def record_outcome(self, name: str, user_id: str, reward: float) -> str | None: ...
+
+    async def get_stats(self, name: str) -> dict[str, VariantStats]: ...
+
+
+class InMemoryExperimentStore:
+    """Process-local store (development and tests)."""
+
+    def __init__(self) -> None:
+        self._experiments: dict[str, Experiment] = {}
+        self._assignments: dict[str, dict[str, str]] = defaultdict(dict)
+        self._outcomes: dict[str, set[str]] = defaultdict(set)
+        self._active: dict[str, set[str]] = defaultdict(set)
+        self._stats: dict[str, dict[str, VariantStats]] = defaultdict(
+            lambda: defaultdict(VariantStats)
+        )
+
+    async def add_experiment(self, experiment: Experiment) -> bool:
+        if experiment.name in self._experiments:
+            return False
+        self._experiments[experiment.name] = experiment
+        return True
+
+    async def get_experiment(self, name: str) -> Experiment | None:
+        return self._experiments.get(name)
+
+    async def list_experiments(self) -> list[str]:
+        return list(self._experiments)
+
+    async def active_experiments(self, user_id: str) -> list[str]:
+        return sorted(self._active.get(user_id, ()))
+
+    async def get_assignment(self, name: str, user_id: str) -> str | None:
+        return self._assignments[name].get(user_id)
+
+    async def expose(self, name: str, user_id: str, variant: str) -> tuple[str, bool]:
+        assignments = self._assignments[name]
+        if user_id in assignments:
+            return assignments[user_id], False
+        assignments[user_id] = variant
+        self._active[user_id].add(name)
+        self._stats[name][variant].exposures += 1
+        return variant, True
+
+    async def record_outcome(self, name: str, user_id: str, reward: float) -> str | None:
+        variant = self._assignments[name].get(user_id)
+        if variant is None or user_id in self._outcomes[name]:
+            return None
+        self._outcomes[name].add(user_id)
+        self._active[user_id].discard(name)
+        stats = self._stats[name][variant]
+        stats.outcomes += 1
+        stats.reward += reward
+        return variant
+
+    async def get_stats(self, name: str) -> dict[str, VariantStats]:
+        return {variant: VariantStats(**asdict(s)) for variant, s in self._stats[name].items()}
+
+
+# KEYS: assignments, counters, user's active set; ARGV: user_id, variant, experiment
+_EXPOSE_SCRIPT = """
+local existing = redis.call('HGET', KEYS[1], ARGV[1])
+if existing then return {existing, 0} end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('HINCRBY', KEYS[2], ARGV[2] .. ':exposures', 1)
+redis.call('SADD', KEYS[3], ARGV[3])
+return {ARGV[2], 1}
+"""
+
+# KEYS: assignments, outcomes, counters, user's active set; ARGV: user_id, reward, experiment
+_OUTCOME_SCRIPT = """
+local variant = redis.call('HGET', KEYS[1], ARGV[1])
+if not variant then return false end
+if redis.call('HSETNX', KEYS[2], ARGV[1], ARGV[2]) == 0 then return false end
+redis.call('SREM', KEYS[4], ARGV[3])
+redis.call('HINCRBY', KEYS[3], variant .. ':outcomes', 1)
+redis.call('HINCRBYFLOAT', KEYS[3], variant .. ':reward', ARGV[2])
+return variant
+"""
+
+
+class RedisExperimentStore:
+    """Store shared by every worker; counters are updated atomically."""
+
+    def __init__(self, redis_client: Any, prefix: str = "experiments") -> None:
+        self.redis = redis_client
+        self.prefix = prefix
+        self._expose = redis_client.register_script(_EXPOSE_SCRIPT)
+        self._outcome = redis_client.register_script(_OUTCOME_SCRIPT)
+
+    def _key(self, name: str, part: str) -> str:
+        return f"{self.prefix}:{name}:{part}"
+
+    async def add_experiment(self, experiment: Experiment) -> bool:
+        return bool(
+            await self.redis.hsetnx(f"{self.prefix}:defs", experiment.name, experiment.to_json())
+        )
+
+    async def get_experiment(self, name: str) -> Experiment | None:
+        raw = await self.redis.hget(f"{self.prefix}:defs", name)
+        return Experiment.from_json(_text(raw)) if raw else None
+
+    async def list_experiments(self) -> list[str]:
+        return [_text(name) for name in await self.redis.hkeys(f"{self.prefix}:defs")]
+
+    async def active_experiments(self, user_id: str) -> list[str]:
+        return sorted(_text(name) for name in await self.redis.smembers(self._active_key(user_id)))
+
+    def _active_key(self, user_id: str) -> str:
+        return f"{self.prefix}:active:{user_id}"
+
+    async def get_assignment(self, name: str, user_id: str) -> str | None:
+        raw = await self.redis.hget(self._key(name, "assignments"), user_id)
+        return _text(raw) if raw else None
+
+    async def expose(self, name: str, user_id: str, variant: str) -> tuple[str, bool]:
+        stored, new = await self._expose(
+            keys=[
+                self._key(name, "assignments"),
+                self._key(name, "counters"),
+                self._active_key(user_id),
+            ],
+            args=[user_id, variant, name],
+        )
+        return _text(stored), bool(new)
+
+    async def record_outcome(self, name: str, user_id: str, reward: float) -> str | None:
+        variant = await self._outcome(
+            keys=[
+                self._key(name, "assignments"),
+                self._key(name, "outcomes"),
+                self._key(name, "counters"),
+                self._active_key(user_id),
+            ],
+            args=[user_id, repr(float(reward)), name],
+        )
+        return _text(variant) if variant else None
+
+    async def get_stats(self, name: str) -> dict[str, VariantStats]:
+        stats: dict[str, VariantStats] = defaultdict(VariantStats)
+        for raw_field, raw_value in (await self.redis.hgetall(self._key(name, "counters"))).items():
+            variant, _, counter = _text(raw_field).rpartition(":")
+            value = _text(raw_value)
+            if counter == "reward":
+                stats[variant].reward = float(value)
+            else:
+                setattr(stats[variant], counter, int(value))
+        return dict(stats)
+
+
+def _text(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+async def create_experiment_store() -> ExperimentStore:
+    """Use the Redis store when Redis is enabled, else an in-memory one."""
+    from core.storage.redis_client import get_redis_client
+
+    redis = await get_redis_client()
+    return RedisExperimentStore(redis) if redis is not None else InMemoryExperimentStore()
+
+
+class ExperimentEngine:
+    """Assigns users to prompt variants and evaluates experiments.
+
+    Example:
+        >>> engine = ExperimentEngine(InMemoryExperimentStore())
+        >>> await engine.create_experiment(
+        ...     "greeting", {"control": "Hello.", "warm": "Hi there!"}, weights=[0.9, 0.1]
+        ... )
+        >>> assignment = await engine.assign("greeting", "user-1")
+        >>> await engine.record_outcome("greeting", "user-1", 1.0)
+        True
+        >>> summary = await engine.summarize("greeting")
+    """
+
+    def __init__(self, store: ExperimentStore, *, rng: np.random.Generator | None = None) -> None:
+        """
+        Args:
+            store: Where experiments, assignments and counters are kept
+            rng: Random generator for Thompson sampling and summaries
+        """
+        self.store = store
+        self.rng = rng or np.random.default_rng()
+        self._definitions: dict[str, Experiment] = {}
+
+    async def create_experiment(
+        self,
+        name: str,
+        variants: dict[str, str],
+        *,
+        weights: list[float] | None = None,
+        allocation: Allocation = Allocation.FIXED,
+        salt: str | None = None,
+        description: str = "",
+    ) -> Experiment:
+        """Create an experiment; the first variant is the control.
+
+        Raises:
+            ValueError: If the experiment exists or the weights are invalid
+        """
+        if not variants:
+            raise ValueError("At least one variant is required.")
+        experiment = Experiment(
+            name=name,
+            variants=dict(variants),
+            weights=normalize_weights(len(variants), weights),
+            allocation=Allocation(allocation),
+            description=description,
+        )
+        if salt is not None:
+            experiment.salt = salt
+        if not await self.store.add_experiment(experiment):
+            raise ValueError(f"Experiment '{name}' already exists.")
+        self._definitions[name] = experiment
+        logger.info("experiment.created", experiment=name, allocation=experiment.allocation.value)
+        return experiment
+
+    async def get_experiment(self, name: str) -> Experiment | None:
+        """Experiment definition (cached, since definitions never change)."""
+        experiment = self._definitions.get(name)
+        if experiment is None:
+            experiment = await self.store.get_experiment(name)
+            if experiment is not None:
+                self._definitions[name] = experiment
+        return experiment
+
+    async def _require(self, name: str) -> Experiment:
+        experiment = await self.get_experiment(name)
+        if experiment is None:
+            raise ValueError(f"Experiment '{name}' not found.")
+        return experiment
+
+    async def _thompson_choice(self, experiment: Experiment) -> str:
+        stats = await self.store.get_stats(experiment.name)
+        names = list(experiment.variants)
+        draws = sample_posteriors([stats.get(n, VariantStats()) for n in names], 1, self.rng)
+        return names[int(draws[0].argmax())]
+
+    async def assign(self, name: str, user_id: str) -> Assignment:
+        """Variant for ``user_id``, logging the exposure once per user.
+
+        Raises:
+            ValueError: If the experiment does not exist
+        """
+        experiment = await self._require(name)
+        variant = await self.store.get_assignment(name, user_id)
+        new = False
+        if variant is None:
+            if experiment.allocation is Allocation.THOMPSON:
+                candidate = await self._thompson_choice(experiment)
+            else:
+                candidate = experiment.variant_for_bucket(bucket_for(user_id, experiment.salt))
+            variant, new = await self.store.expose(name, user_id, candidate)
+        return Assignment(name, variant, experiment.variants[variant], new)
+
+    async def get_prompt(self, name: str, user_id: str, default: str) -> str:
+        """Prompt for ``user_id`` if experiment ``name`` exists, else ``default``."""
+        if await self.get_experiment(name) is None:
+            return default
+        return (await self.assign(name, user_id)).value
+
+    async def record_outcome(self, name: str, user_id: str, reward: float) -> bool:
+        """Record the first outcome (0..1) of an exposed user.
+
+        Returns:
+            False if the user was never exposed or already has an outcome
+        """
+        if not 0.0 <= reward <= 1.0:
+            raise ValueError("Reward must be between 0 and 1.")
+        await self._require(name)
+        return await self.store.record_outcome(name, user_id, reward) is not None
+
+    async def record_feedback(
+        self, user_id: str, reward: float, experiments: list[str] | None = None
+    ) -> list[str]:
+        """Record ``reward`` for ``user_id`` in the experiments it refers to.
+
+        Args:
+            user_id: User who gave the feedback
+            reward: Outcome between 0 and 1
+            experiments: Experiments the rated response came from; by default
+                every experiment the user is exposed to without an outcome yet
+
+        Returns:
+            Experiments in which the outcome was recorded
+
+        Raises:
+            ValueError: If a named experiment does not exist
+        """
+        names = experiments
+        if names is None:
+            names = await self.store.active_experiments(user_id)
+        recorded = await asyncio.gather(
+            *(self.record_outcome(name, user_id, reward) for name in names)
+        )
+        return [name for name, ok in zip(names, recorded, strict=True) if ok]
+
+    async def summarize(
+        self,
+        name: str,
+        *,
+        samples: int = DEFAULT_SAMPLES,
+        loss_threshold: float = DEFAULT_LOSS_THRESHOLD,
+    ) -> dict[str, Any]:
+        """Posterior summary per variant and the recommended variant, if any."""
+        experiment = await self._require(name)
+        stats = await self.store.get_stats(name)
+        summaries = summarize_variants(
+            {variant: stats.get(variant, VariantStats()) for variant in experiment.variants},
+            samples=samples,
+            rng=self.rng,
+        )
+        return {
+            "experiment": name,
+            "allocation": experiment.allocation.value,
+            "variants": [asdict(s) for s in summaries],
+            "recommended": recommend_variant(summaries, loss_threshold),
+        }
+
+
+# Global instance
+_experiment_engine: ExperimentEngine | None = None
+
+
+async def get_experiment_engine() -> ExperimentEngine:
+    """Get or create the global experiment engine."""
+    global _experiment_engine
+    if _experiment_engine is None:
+        _experiment_engine = ExperimentEngine(await create_experiment_store())
+    return _experiment_engine
+
+
+def configure_experiment_engine(engine: ExperimentEngine | None) -> None:
+    """Replace the global experiment engine (e.g. in tests)."""
+    global _experiment_engine
+    _experiment_engine = engine
+
+
+__all__ = [
+    "BUCKETS",
+    "Allocation",
+    "Assignment",
+    "Experiment",
+    "ExperimentEngine",
+    "ExperimentStore",
+    "InMemoryExperimentStore",
+    "RedisExperimentStore",
+    "bucket_for",
+    "configure_experiment_engine",
+    "create_experiment_store",
+    "get_experiment_engine",
+]
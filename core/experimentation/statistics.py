@@ -0,0 +1,126 @@
+"""Bayesian summaries for conversion-style experiments.
+
+Every exposure is a Bernoulli trial whose reward (0..1) is the conversion.
+Each variant gets a ``Beta(1 + reward, 1 + exposures - reward)`` posterior
+(uniform prior), and the summaries are computed from joint Monte-Carlo draws:
+
+- ``prob_best``: probability that the variant has the highest rate,
+- ``expected_loss``: expected rate given up by shipping this variant instead
+  of the best one. Stopping once a variant's expected loss falls below a
+  small threshold remains valid however often results are checked, unlike
+  repeatedly checking a fixed-horizon p-value.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_SAMPLES = 20_000
+DEFAULT_LOSS_THRESHOLD = 0.001
+
+
+@dataclass(slots=True)
+class VariantStats:
+    """Aggregated counters for one variant."""
+
+    exposures: int = 0
+    outcomes: int = 0
+    reward: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.reward / self.exposures if self.exposures else 0.0
+
+    def posterior(self) -> tuple[float, float]:
+        """Beta posterior parameters ``(alpha, beta)``."""
+        reward = min(self.reward, float(self.exposures))
+        return 1.0 + reward, 1.0 + self.exposures - reward
+
+
+@dataclass(slots=True)
+class VariantSummary:
+    """Posterior summary of one variant."""
+
+    variant: str
+    exposures: int
+    outcomes: int
+    reward: float
+    rate: float
+    posterior_mean: float
+    credible_interval: tuple[float, float]
+    prob_best: float
+    prob_beats_control: float
+    expected_loss: float
+
+
+def sample_posteriors(
+    stats: list[VariantStats], samples: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draw ``samples`` joint posterior rates, shape ``(samples, len(stats))``."""
+    alpha, beta = np.array([s.posterior() for s in stats]).T
+    return rng.beta(alpha, beta, size=(samples, len(stats)))
+
+
+def summarize_variants(
+    stats: dict[str, VariantStats],
+    *,
+    samples: int = DEFAULT_SAMPLES,
+    rng: np.random.Generator | None = None,
+) -> list[VariantSummary]:
+    """Summarize variant posteriors; the first variant is the control.
+
+    Example:
+        >>> summaries = summarize_variants(
+        ...     {"a": VariantStats(1000, 100, 100), "b": VariantStats(1000, 140, 140)}
+        ... )
+        >>> summaries[1].prob_best > 0.99
+        True
+    """
+    names = list(stats)
+    values = list(stats.values())
+    draws = sample_posteriors(values, samples, rng or np.random.default_rng())
+    best = draws.argmax(axis=1)
+    loss = draws.max(axis=1, keepdims=True) - draws
+    low, high = np.quantile(draws, [0.025, 0.975], axis=0)
+
+    summaries = []
+    for i, (name, stat) in enumerate(zip(names, values, strict=True)):
+        alpha, beta = stat.posterior()
+        summaries.append(
+            VariantSummary(
+                variant=name,
+                exposures=stat.exposures,
+                outcomes=stat.outcomes,
+                reward=stat.reward,
+                rate=stat.rate,
+                posterior_mean=alpha / (alpha + beta),
+                credible_interval=(float(low[i]), float(high[i])),
+                prob_best=float(np.mean(best == i)),
+                prob_beats_control=float(np.mean(draws[:, i] > draws[:, 0])) if i else 0.0,
+                expected_loss=float(loss[:, i].mean()),
+            )
+        )
+    return summaries
+
+
+def recommend_variant(
+    summaries: list[VariantSummary], loss_threshold: float = DEFAULT_LOSS_THRESHOLD
+) -> str | None:
+    """Variant whose expected loss is below ``loss_threshold``, if any."""
+    best = min(summaries, key=lambda s: s.expected_loss, default=None)
+    if best is None or best.expected_loss >= loss_threshold:
+        return None
+    return best.variant
+
+
+__all__ = [
+    "DEFAULT_LOSS_THRESHOLD",
+    "DEFAULT_SAMPLES",
+    "VariantStats",
+    "VariantSummary",
+    "recommend_variant",
+    "sample_posteriors",
+    "summarize_variants",
+]
@@ -16,6 +16,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import Any
 
 import structlog
@@ -23,16 +24,19 @@ from pydantic import BaseModel, Field, ValidationError
 
 from ..agents import ComplexityAnalyzer, ComplexityResult, TaskTier
 from ..exceptions import AgentError, MegaAgentError
+from ..experimentation import ExperimentEngine
+from ..execution.sandbox_pool import get_sandbox_pool
 from ..execution.secure_sandbox import (SandboxPolicy, SandboxRunner,
                                         SandboxViolation, ensure_tool_allowed)
 from ..memory.memory_manager import MemoryManager
 from ..memory.models import AuditEvent
+from ..memory.write_behind import WriteBehindAuditBuffer
 from ..orchestration.enhanced_workflows import EnhancedWorkflowState
 from ..orchestration.pipeline_manager import (build_enhanced_pipeline,
                                               build_pipeline)
 from ..orchestration.pipeline_manager import run as run_pipeline
 from ..orchestration.workflow_graph import WorkflowState, build_case_workflow
-from ..prompts import CoTTemplate, enhance_prompt_with_cot, select_cot_template
+from ..prompts import CoTTemplate, get_cot_prompt, select_cot_template
 from ..retry import with_retry
 from ..security import (PromptInjectionResult, get_audit_trail,
                         get_prompt_detector, get_rbac_manager, security_config)
@@ -266,6 +270,8 @@ class MegaAgent:
         complexity_analyzer: ComplexityAnalyzer | None = None,
         supervisor_agent: SupervisorAgent | None = None,
         use_chain_of_thought: bool = True,
+        audit_buffer: WriteBehindAuditBuffer | None = None,
+        experiments: ExperimentEngine | None = None,
     ):
         """
         Инициализация MegaAgent.
@@ -275,10 +281,15 @@ class MegaAgent:
             complexity_analyzer: Анализатор сложности задач
             supervisor_agent: Supervisor agent для планирования
             use_chain_of_thought: Enable Chain-of-Thought prompting for better reasoning (default: True)
+            audit_buffer: Write-behind буфер для audit событий (вне пути запроса)
+            experiments: Движок экспериментов; эксперимент ``cot.<command_type>``
+                выбирает CoT шаблон для пользователя, /feedback записывает исход
         """
         self.memory = memory_manager or MemoryManager()
+        self.audit_buffer = audit_buffer
         self.complexity_analyzer = complexity_analyzer or ComplexityAnalyzer()
         self.use_cot = use_chain_of_thought
+        self.experiments = experiments
 
         # Инициализация агентов
         self.case_agent = CaseAgent(memory_manager=self.memory)
@@ -725,9 +736,7 @@ class MegaAgent:
             )
 
         # Apply CoT enhancement
-        enhanced = enhance_prompt_with_cot(
-            prompt, command_type=command.command_type.value, action=command.action
-        )
+        enhanced = get_cot_prompt(template, prompt)
 
         logger.debug(
             "megaagent.cot.enhanced",
@@ -741,6 +750,19 @@ class MegaAgent:
 
         return enhanced
 
+    async def _experiment_cot_template(self, command: MegaAgentCommand) -> CoTTemplate | None:
+        """CoT template assigned to the user by a ``cot.<command_type>`` experiment."""
+        if self.experiments is None or not self.use_cot:
+            return None
+
+        name = f"cot.{command.command_type.value}"
+        value = await self.experiments.get_prompt(name, command.user_id, default="")
+        try:
+            return CoTTemplate(value) if value else None
+        except ValueError:
+            logger.warning("megaagent.cot.unknown_template", experiment=name, template=value)
+            return None
+
     async def _handle_case_command(self, command: MegaAgentCommand) -> dict[str, Any]:
         """Обработка команд case_agent"""
         state = await self._run_case_workflow(
@@ -898,6 +920,14 @@ class MegaAgent:
             action="feedback",
             payload={"target_id": payload.target_id, "rating": payload.rating},
         )
+        if self.experiments is not None and payload.rating is not None:
+            # Ratings 1..5 become rewards 0..1 for the rated experiment, or for
+            # the user's exposures still awaiting an outcome
+            await self.experiments.record_feedback(
+                command.user_id,
+                (payload.rating - 1) / 4,
+                [payload.experiment] if payload.experiment else None,
+            )
         return {"operation": "feedback", "ok": True}
 
     async def _handle_legal_command(self, command: MegaAgentCommand) -> dict[str, Any]:
@@ -1007,12 +1037,20 @@ class MegaAgent:
 
         ensure_tool_allowed(policy, tool_id)
         runner = SandboxRunner(policy)
+        # Isolated tools run in a sandbox worker process that enforces the
+        # policy's CPU, memory, network and filesystem limits
+        isolated = (
+            partial(SandboxRunner(policy, get_sandbox_pool()).run_async, timeout=timeout)
+            if metadata.isolated
+            else None
+        )
 
         async def _invoke():
             return await registry.invoke(
                 tool_id,
                 caller_role=user_role.value,
                 arguments=arguments,
+                runner=isolated,
             )
 
         try:
@@ -1145,7 +1183,9 @@ class MegaAgent:
             ).strip()
 
             # Apply Chain-of-Thought enhancement for better reasoning
-            prompt = self._enhance_with_cot(prompt, command)
+            prompt = self._enhance_with_cot(
+                prompt, command, template=await self._experiment_cot_template(command)
+            )
 
             logger.info(
                 "mega.ask.prompt_built",
@@ -1674,7 +1714,11 @@ class MegaAgent:
             tags=tags or ["mega_agent", "orchestration"],
         )
 
-        await self.memory.alog_audit(event)
+        if self.audit_buffer is not None:
+            # Persisted by the background drain task; command latency excludes audit I/O
+            await self.audit_buffer.submit(event)
+        else:
+            await self.memory.alog_audit(event)
         # Note: AuditTrail.log_event() requires different parameters than record_event()
         # Structlog already provides comprehensive logging, so we skip AuditTrail for now
         # if self.audit_trail and security_config.audit_enabled:
@@ -219,6 +219,9 @@ class FeedbackPayload(_AgentBaseModel):
     target_id: str = Field(..., min_length=1)
     feedback: str = Field(..., min_length=1)
     rating: int | None = Field(default=None, ge=1, le=5)
+    experiment: str | None = Field(
+        default=None, description="Experiment that produced the rated response"
+    )
 
 
 class WorkflowCommandPayload(_AgentBaseModel):
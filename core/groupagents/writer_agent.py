@@ -14,8 +14,10 @@ WriterAgent - Генерация документов и писем.
 
 from __future__ import annotations
 
+import asyncio
 import html
 import json
+import shutil
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -29,6 +31,17 @@ from ..exceptions import AgentError, DocumentGenerationError
 from ..memory.memory_manager import MemoryManager
 from ..memory.models import AuditEvent
 from ..prompts import enhance_prompt_with_cot
+from ..rendering import get_pdf_renderer
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+
+
+def _write_text(target: Path, text: str) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text)
 
 
 class _WriterBaseModel(BaseModel):
@@ -1143,23 +1156,32 @@ Best regards,
         return content
 
     async def _generate_pdf(self, document: GeneratedDocument) -> str:
-        """Генерация PDF файла"""
-        # Заглушка для PDF генерации
-        # В реальности использовать библиотеку типа reportlab или weasyprint
+        """Генерация PDF файла (рендеринг в пуле процессов, без блокировки event loop)"""
+        pdf_path = Path("documents") / f"{document.document_id}.pdf"
 
-        pdf_path = f"documents/{document.document_id}.pdf"
+        body = (
+            document.content
+            if document.format == DocumentFormat.HTML
+            else self._markdown_to_html(document.content)
+        )
+        body = f"<h1>{html.escape(document.title)}</h1>\n{body}"
 
-        # Имитация создания PDF
-        Path("documents").mkdir(exist_ok=True)
-        with open(pdf_path, "w") as f:
-            f.write(f"PDF content for document {document.document_id}\n")
-            f.write(f"Title: {document.title}\n")
-            f.write(f"Content: {document.content}\n")
+        try:
+            rendered = await get_pdf_renderer().render(body)
+            await asyncio.to_thread(_copy_file, rendered, pdf_path)
+        except ImportError:
+            # WeasyPrint не установлен - текстовая заглушка, как раньше
+            placeholder = (
+                f"PDF content for document {document.document_id}\n"
+                f"Title: {document.title}\n"
+                f"Content: {document.content}\n"
+            )
+            await asyncio.to_thread(_write_text, pdf_path, placeholder)
 
         # Обновление размера файла
         document.file_size = len(document.content.encode("utf-8"))
 
-        return pdf_path
+        return str(pdf_path)
 
     def _generate_title(self, request: DocumentRequest) -> str:
         """Генерация заголовка документа"""
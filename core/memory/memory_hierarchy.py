@@ -65,14 +65,20 @@ class MemoryHierarchy:
     async def record_events(
         self, events: Iterable[AuditEvent], *, reflect: bool = True
     ) -> list[MemoryRecord]:
-        """Bulk variant of :meth:`record_event`."""
+        """Bulk variant of :meth:`record_event`.
 
-        reflected: list[MemoryRecord] = []
-        for event in events:
-            await self.manager.alog_audit(event)
-            if reflect:
-                reflected.extend(await self.manager.awrite(event))
-        return reflected
+        Events are appended to episodic memory as one batch and, when reflecting,
+        all salient facts are embedded and stored in one semantic write.
+        """
+
+        batch = list(events)
+        if not batch:
+            return []
+
+        await self.manager.alog_audit_many(batch)
+        if reflect:
+            return await self.manager.awrite_many(batch)
+        return []
 
     async def update_working_memory(self, thread_id: str, slots: dict[str, str]) -> None:
         """Persist RMT buffer for the conversation thread."""
@@ -23,8 +23,8 @@ class _NoOpEmbedder:
 class MemoryManager:
     """Facade over episodic/semantic stores and RMT buffer with optional embeddings.
 
-    - alog_audit: persist raw event (episodic)
-    - awrite: reflect salient facts and store as semantic memory (embeddings optional)
+    - alog_audit / alog_audit_many: persist raw event(s) (episodic)
+    - awrite / awrite_many: reflect salient facts and store as semantic memory (embeddings optional)
     - aretrieve: hybrid placeholder retrieval from semantic store
     - aconsodlidate: naive dedupe/prune placeholder
     - asnapshot_thread: dump episodic events for a thread
@@ -47,6 +47,19 @@ class MemoryManager:
     async def alog_audit(self, event: AuditEvent) -> None:
         await self.episodic.aappend(event)
 
+    async def alog_audit_many(self, events: Iterable[AuditEvent]) -> int:
+        """Persist a batch of events, using the store's bulk append when available."""
+        batch = list(events)
+        if not batch:
+            return 0
+        append_many = getattr(self.episodic, "aappend_many", None)
+        if append_many is not None:
+            await append_many(batch)
+        else:
+            for event in batch:
+                await self.episodic.aappend(event)
+        return len(batch)
+
     # ---- Write/Reflect ----
     async def awrite(
         self,
@@ -73,6 +86,13 @@ class MemoryManager:
         await self.semantic.ainsert(records)
         return records
 
+    async def awrite_many(self, events: Iterable[AuditEvent]) -> list[MemoryRecord]:
+        """Reflect a batch of events with one embedding call and one semantic insert."""
+        records = [record for event in events for record in select_salient_facts(event)]
+        if not records:
+            return []
+        return await self.awrite(records)
+
     # ---- Retrieve ----
     async def aretrieve(
         self,
@@ -103,6 +103,36 @@ class MemoryManager:
         """
         await self.episodic.aappend(event)
 
+    async def alog_audit_many(self, events: Iterable[AuditEvent]) -> int:
+        """
+        Log a batch of audit events to episodic memory.
+
+        Stores exposing ``aappend_many`` (PostgreSQL, in-memory) persist the whole
+        batch in one session; other stores fall back to per-event appends.
+
+        Args:
+            events: AuditEvents to log
+
+        Returns:
+            Number of events logged
+
+        Example:
+            >>> memory = MemoryManager()
+            >>> await memory.alog_audit_many([event_1, event_2])
+            2
+        """
+        batch = list(events)
+        if not batch:
+            return 0
+
+        append_many = getattr(self.episodic, "aappend_many", None)
+        if append_many is not None:
+            await append_many(batch)
+        else:
+            for event in batch:
+                await self.episodic.aappend(event)
+        return len(batch)
+
     # ---- Write/Reflect ----
     async def awrite(
         self,
@@ -145,6 +175,28 @@ class MemoryManager:
         await self.semantic.ainsert(records)
         return records
 
+    async def awrite_many(self, events: Iterable[AuditEvent]) -> list[MemoryRecord]:
+        """
+        Reflect a batch of AuditEvents into semantic memory.
+
+        Salient facts from every event are embedded in a single embedder call and
+        inserted into the semantic store in a single ``ainsert``.
+
+        Args:
+            events: AuditEvents to reflect
+
+        Returns:
+            List of MemoryRecord objects that were stored, in event order
+
+        Example:
+            >>> memory = MemoryManager()
+            >>> records = await memory.awrite_many([event_1, event_2])
+        """
+        records = [record for event in events for record in select_salient_facts(event)]
+        if not records:
+            return []
+        return await self.awrite(records)
+
     # ---- Retrieve ----
     async def aretrieve(
         self,
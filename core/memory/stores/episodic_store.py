@@ -4,6 +4,8 @@ from collections import defaultdict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..models import AuditEvent
 
 
@@ -12,10 +14,23 @@ class EpisodicStore:
 
     def __init__(self) -> None:
         self._by_thread: dict[str, list[AuditEvent]] = defaultdict(list)
+        self._event_ids: set[str] = set()
 
     async def aappend(self, event: AuditEvent) -> None:
         tid = event.thread_id or "global"
         self._by_thread[tid].append(event)
+        self._event_ids.add(event.event_id)
+
+    async def aappend_many(self, events: Iterable[AuditEvent]) -> int:
+        """Append events, skipping ids already stored (like the PostgreSQL store)."""
+        count = 0
+        for event in events:
+            if event.event_id in self._event_ids:
+                continue
+            self._by_thread[event.thread_id or "global"].append(event)
+            self._event_ids.add(event.event_id)
+            count += 1
+        return count
 
     async def aget_thread_events(self, thread_id: str) -> list[AuditEvent]:
         return list(self._by_thread.get(thread_id, []))
@@ -0,0 +1,313 @@
+"""Write-behind buffer for episodic/audit logging.
+
+Audit events are queued in memory and flushed to the episodic store by a
+background task, either when a batch fills up or when the flush interval
+elapses. This keeps episodic I/O off the request path of command handlers.
+
+Guarantees:
+    * bounded memory - the queue has a fixed capacity and ``submit`` waits
+      (backpressure) when it is full
+    * graceful drain - ``stop`` flushes everything still queued
+    * durability - batches that cannot be written are appended to a local
+      JSONL spill file and replayed once the store is reachable again
+
+Each worker process spills to its own file (``audit_write_behind.<pid>.spill.jsonl``)
+so uvicorn workers never share one. On start, a worker also takes over the
+spill files of workers that are no longer running. Replays may re-send events
+that were already committed; the episodic stores skip known ``event_id``s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .models import AuditEvent
+
+if TYPE_CHECKING:
+    from .memory_manager import MemoryManager
+
+logger = structlog.get_logger(__name__)
+
+SPILL_DIR_ENV = "AUDIT_SPILL_DIR"
+_SPILL_PREFIX = "audit_write_behind."
+_SPILL_SUFFIX = ".spill.jsonl"
+
+
+def default_spill_dir() -> Path:
+    """``$AUDIT_SPILL_DIR``, else ``$LOG_DIR``, else ``./logs``, as an absolute path."""
+    return Path(os.getenv(SPILL_DIR_ENV) or os.getenv("LOG_DIR") or "logs").resolve()
+
+
+class WriteBehindAuditBuffer:
+    """Batching, asynchronous front-end for ``MemoryManager.alog_audit``.
+
+    Example:
+        >>> buffer = WriteBehindAuditBuffer(memory)
+        >>> await buffer.start()
+        >>> await buffer.submit(event)  # returns without touching the store
+        >>> await buffer.stop()  # drains and flushes remaining events
+    """
+
+    def __init__(
+        self,
+        memory: MemoryManager,
+        *,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10_000,
+        spill_dir: str | Path | None = None,
+        spill: bool = True,
+    ) -> None:
+        """
+        Args:
+            memory: Memory manager whose episodic store receives the events
+            max_batch_size: Maximum events written per flush
+            flush_interval: Seconds between time-based flushes
+            max_queue_size: Queue capacity; producers wait when it is reached
+            spill_dir: Directory for this worker's spill file (default: ``default_spill_dir()``)
+            spill: Spill events that failed to flush to disk (False drops them)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_queue_size < max_batch_size:
+            raise ValueError("max_queue_size must be >= max_batch_size")
+
+        self.memory = memory
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.spill_path: Path | None = None
+        if spill:
+            directory = Path(spill_dir).resolve() if spill_dir is not None else default_spill_dir()
+            self.spill_path = directory / f"{_SPILL_PREFIX}{os.getpid()}{_SPILL_SUFFIX}"
+
+        self._queue: asyncio.Queue[AuditEvent] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._in_flight: list[AuditEvent] = []
+        self._closing = False
+        self._has_spill = False
+
+        self._stats: dict[str, Any] = {
+            "submitted": 0,
+            "flushed": 0,
+            "batches": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "failed_flushes": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background drain task and replay any spilled events."""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        if self.spill_path is not None:
+            await asyncio.to_thread(_adopt_orphaned_spills, self.spill_path)
+        self._has_spill = self.spill_path is not None and self.spill_path.exists()
+        await self._replay_spill()
+        self._task = asyncio.create_task(self._run(), name="audit-write-behind")
+        logger.info(
+            "audit_buffer.started",
+            max_batch_size=self.max_batch_size,
+            flush_interval=self.flush_interval,
+            max_queue_size=self.max_queue_size,
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain the queue, flush remaining events and stop the background task.
+
+        Events still queued or mid-flush when ``timeout`` expires are spilled to disk.
+        """
+        if self._task is None:
+            return
+
+        self._closing = True
+        assert self._wakeup is not None
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except TimeoutError:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            # The cancelled flush may or may not have reached the store; spill it
+            # rather than lose it (replay can then write it twice at worst)
+            in_flight, self._in_flight = self._in_flight, []
+            await self._spill(in_flight + self._take_batch(self.max_queue_size))
+            logger.warning("audit_buffer.stop_timeout", timeout=timeout)
+        finally:
+            self._task = None
+        logger.info("audit_buffer.stopped", **self._stats)
+
+    # ------------------------------------------------------------------ #
+    # Producer API
+    # ------------------------------------------------------------------ #
+    async def submit(self, event: AuditEvent) -> None:
+        """Queue an event for background persistence.
+
+        Waits while the queue is full. When the buffer is not running (e.g. in
+        scripts and tests that never start it) the event is written directly.
+        """
+        self._stats["submitted"] += 1
+        if not self.running or self._closing:
+            await self.memory.alog_audit(event)
+            self._stats["flushed"] += 1
+            return
+
+        assert self._queue is not None and self._wakeup is not None
+        await self._queue.put(event)
+        if self._queue.qsize() >= self.max_batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write every queued event now (used by tests and admin tooling)."""
+        while batch := self._take_batch(self.max_batch_size):
+            await self._flush_batch(batch)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return counters plus the current queue depth."""
+        return {
+            **self._stats,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+            if self._closing:
+                return
+
+    def _take_batch(self, limit: int) -> list[AuditEvent]:
+        batch: list[AuditEvent] = []
+        if self._queue is None:
+            return batch
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush_batch(self, batch: list[AuditEvent]) -> None:
+        started = time.perf_counter()
+        self._in_flight = batch
+        try:
+            await self.memory.alog_audit_many(batch)
+        except Exception as exc:
+            self._in_flight = []
+            self._stats["failed_flushes"] += 1
+            logger.warning("audit_buffer.flush_failed", error=str(exc), events=len(batch))
+            await self._spill(batch)
+            return
+
+        self._in_flight = []
+        self._stats["flushed"] += len(batch)
+        self._stats["batches"] += 1
+        self._stats["last_flush_ms"] = (time.perf_counter() - started) * 1000
+        if self._has_spill:
+            await self._replay_spill()
+
+    async def _spill(self, batch: list[AuditEvent]) -> None:
+        if not batch:
+            return
+        if self.spill_path is None:
+            logger.error("audit_buffer.events_dropped", events=len(batch))
+            return
+
+        lines = "".join(event.model_dump_json() + "\n" for event in batch)
+        await asyncio.to_thread(_append_text, self.spill_path, lines)
+        self._has_spill = True
+        self._stats["spilled"] += len(batch)
+
+    async def _replay_spill(self) -> None:
+        """Re-submit spilled events to the store; keep the file if that fails."""
+        if self.spill_path is None or not self.spill_path.exists():
+            self._has_spill = False
+            return
+
+        raw = await asyncio.to_thread(self.spill_path.read_text, encoding="utf-8")
+        events = [AuditEvent.model_validate_json(line) for line in raw.splitlines() if line]
+        for start in range(0, len(events), self.max_batch_size):
+            try:
+                await self.memory.alog_audit_many(events[start : start + self.max_batch_size])
+            except Exception as exc:
+                # Keep only the events that were not written so they are not duplicated
+                remaining = "".join(event.model_dump_json() + "\n" for event in events[start:])
+                await asyncio.to_thread(self.spill_path.write_text, remaining, encoding="utf-8")
+                self._stats["replayed"] += start
+                logger.warning(
+                    "audit_buffer.replay_failed", error=str(exc), remaining=len(events) - start
+                )
+                return
+
+        self.spill_path.unlink(missing_ok=True)
+        self._has_spill = False
+        self._stats["replayed"] += len(events)
+        logger.info("audit_buffer.replayed", events=len(events))
+
+
+def _append_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def _pid_running(pid: int) -> bool:
+    if os.name == "nt":  # os.kill would terminate the process there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _adopt_orphaned_spills(spill_path: Path) -> None:
+    """Move the spill files of workers that are gone into ``spill_path``."""
+    if not spill_path.parent.is_dir():
+        return
+    for path in spill_path.parent.glob(f"{_SPILL_PREFIX}*{_SPILL_SUFFIX}"):
+        owner = path.name.removeprefix(_SPILL_PREFIX).removesuffix(_SPILL_SUFFIX)
+        if path == spill_path or not owner.isdigit() or _pid_running(int(owner)):
+            continue
+        # Renaming first lets exactly one of several starting workers claim the file
+        claimed = path.with_name(f"{path.name}.{os.getpid()}.claimed")
+        try:
+            path.rename(claimed)
+        except FileNotFoundError:
+            continue
+        _append_text(spill_path, claimed.read_text(encoding="utf-8"))
+        claimed.unlink()
+        logger.info("audit_buffer.spill_adopted", path=str(path))
+
+
+__all__ = ["SPILL_DIR_ENV", "WriteBehindAuditBuffer", "default_spill_dir"]
@@ -0,0 +1,15 @@
+"""Model monitoring: streaming drift detection with Prometheus export."""
+
+from __future__ import annotations
+
+from .drift import ADWIN, PageHinkley, PSIDetector, reference_bins
+from .model_monitor import DriftMetrics, ModelMonitor
+
+__all__ = [
+    "ADWIN",
+    "DriftMetrics",
+    "ModelMonitor",
+    "PSIDetector",
+    "PageHinkley",
+    "reference_bins",
+]
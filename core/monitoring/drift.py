@@ -0,0 +1,307 @@
+"""Streaming drift detectors with constant work per observation.
+
+- ``PSIDetector``: population stability index of a sliding window against
+  reference bins. The window is a ring buffer of bin indices, so updating is
+  a bisect plus two counter changes and memory is one byte per slot.
+- ``ADWIN``: adaptive windowing (Bifet & Gavaldà, 2007) over an exponential
+  histogram. Memory is ``O(max_buckets * log(width))`` and the cut check
+  runs every ``clock`` observations.
+- ``PageHinkley``: two-sided cumulative-sum test for a shift in the mean.
+
+None of them needs scipy.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+import math
+
+import numpy as np
+
+DEFAULT_BINS = 10
+DEFAULT_PSI_THRESHOLD = 0.2  # > 0.2 is commonly read as a significant shift
+_PSI_EPSILON = 1e-4
+
+
+def reference_bins(
+    reference: Sequence[float] | np.ndarray, bins: int = DEFAULT_BINS
+) -> tuple[list[float], np.ndarray]:
+    """Equal-mass bin edges of ``reference`` and the share of it in each bin."""
+    reference = np.asarray(reference, dtype=float)
+    if reference.size == 0:
+        raise ValueError("Reference data must not be empty.")
+    if not 2 <= bins <= 255:
+        raise ValueError("bins must be between 2 and 255.")
+    edges = np.unique(np.quantile(reference, np.linspace(0, 1, bins + 1)[1:-1]))
+    counts = np.bincount(np.searchsorted(edges, reference, side="right"), minlength=len(edges) + 1)
+    return edges.tolist(), np.maximum(counts / reference.size, _PSI_EPSILON)
+
+
+class PSIDetector:
+    """Population stability index of a sliding window.
+
+    Example:
+        >>> psi = PSIDetector(reference_scores, window=1000)
+        >>> for score in live_scores:
+        ...     psi.update(score)
+        >>> psi.value, psi.drift_detected
+    """
+
+    def __init__(
+        self,
+        reference: Sequence[float] | np.ndarray,
+        *,
+        window: int = 1000,
+        bins: int = DEFAULT_BINS,
+        threshold: float = DEFAULT_PSI_THRESHOLD,
+    ) -> None:
+        """
+        Args:
+            reference: Reference sample; bins are its quantiles
+            window: Number of most recent observations compared
+            bins: Number of (equal-mass) bins
+            threshold: PSI above which drift is reported
+        """
+        self._setup(*reference_bins(reference, bins), window, threshold)
+
+    @classmethod
+    def from_bins(
+        cls,
+        edges: list[float],
+        expected: np.ndarray,
+        *,
+        window: int = 1000,
+        threshold: float = DEFAULT_PSI_THRESHOLD,
+    ) -> PSIDetector:
+        """Build from precomputed ``reference_bins`` (shared by many streams)."""
+        detector = cls.__new__(cls)
+        detector._setup(edges, expected, window, threshold)
+        return detector
+
+    def _setup(
+        self, edges: list[float], expected: np.ndarray, window: int, threshold: float
+    ) -> None:
+        self.window = window
+        self.threshold = threshold
+        self.edges = edges
+        self.expected = expected
+        self._counts = np.zeros(len(self.expected), dtype=np.int64)
+        self._ring = np.zeros(window, dtype=np.uint8)
+        self._position = 0
+        self.n_seen = 0
+
+    @property
+    def size(self) -> int:
+        """Observations currently in the window."""
+        return min(self.n_seen, self.window)
+
+    def update(self, value: float) -> None:
+        """Add one observation, evicting the oldest once the window is full."""
+        index = bisect_right(self.edges, value)
+        if self.n_seen >= self.window:
+            self._counts[self._ring[self._position]] -= 1
+        self._ring[self._position] = index
+        self._counts[index] += 1
+        self._position = (self._position + 1) % self.window
+        self.n_seen += 1
+
+    @property
+    def value(self) -> float:
+        """PSI of the current window (0.0 while empty)."""
+        if not self.n_seen:
+            return 0.0
+        actual = np.maximum(self._counts / self.size, _PSI_EPSILON)
+        return float(np.sum((actual - self.expected) * np.log(actual / self.expected)))
+
+    @property
+    def drift_detected(self) -> bool:
+        return self.value > self.threshold
+
+
+class ADWIN:
+    """Adaptive windowing change detector.
+
+    Keeps the longest recent window whose two halves have no statistically
+    different mean, dropping the oldest observations when a cut is found.
+
+    Example:
+        >>> adwin = ADWIN(delta=0.002)
+        >>> changed = [adwin.update(x) for x in stream]
+        >>> adwin.estimation  # mean of the current window
+    """
+
+    def __init__(
+        self,
+        delta: float = 0.002,
+        *,
+        max_buckets: int = 5,
+        clock: int = 32,
+        min_window: int = 5,
+    ) -> None:
+        """
+        Args:
+            delta: Confidence; smaller values mean fewer false alarms
+            max_buckets: Buckets kept per size before merging
+            clock: Observations between cut checks
+            min_window: Minimum length of each sub-window in a cut
+        """
+        self.delta = delta
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self.min_window = min_window
+        self.reset()
+
+    def reset(self) -> None:
+        # rows[i] holds (total, variance) buckets of 2**i observations, oldest first
+        self._rows: list[list[tuple[float, float]]] = [[]]
+        self.width = 0
+        self.total = 0.0
+        self.variance = 0.0
+        self.n_detections = 0
+        self._ticks = 0
+
+    @property
+    def estimation(self) -> float:
+        """Mean of the current window."""
+        return self.total / self.width if self.width else 0.0
+
+    def update(self, value: float) -> bool:
+        """Add one observation; returns True if a change was detected."""
+        self.width += 1
+        if self.width > 1:
+            mean = self.total / (self.width - 1)
+            self.variance += (self.width - 1) * (value - mean) ** 2 / self.width
+        self.total += value
+        self._rows[0].append((value, 0.0))
+        self._compress()
+
+        self._ticks += 1
+        if self._ticks % self.clock or self.width < 2 * self.min_window:
+            return False
+        detected = False
+        while self._cut():
+            detected = True
+            self._drop_oldest()
+        if detected:
+            self.n_detections += 1
+        return detected
+
+    def _compress(self) -> None:
+        for i, row in enumerate(self._rows):
+            if len(row) <= self.max_buckets:
+                return
+            (t1, v1), (t2, v2) = row.pop(0), row.pop(0)
+            size = 2**i
+            merged = (t1 + t2, v1 + v2 + size * size * (t1 / size - t2 / size) ** 2 / (2 * size))
+            if i + 1 == len(self._rows):
+                self._rows.append([])
+            self._rows[i + 1].append(merged)
+
+    def _cut(self) -> bool:
+        """True if some split of the window into old/new halves differs in mean."""
+        log_term = math.log(2 * math.log(self.width) / self.delta)
+        n0, total0 = 0, 0.0
+        for i in range(len(self._rows) - 1, -1, -1):
+            size = 2**i
+            for total, _ in self._rows[i]:
+                n0 += size
+                total0 += total
+                n1 = self.width - n0
+                if n1 <= self.min_window:
+                    return False
+                if n0 <= self.min_window:
+                    continue
+                m_recip = 1 / (n0 - self.min_window + 1) + 1 / (n1 - self.min_window + 1)
+                epsilon = (
+                    math.sqrt(2 * m_recip * (self.variance / self.width) * log_term)
+                    + 2 / 3 * log_term * m_recip
+                )
+                if abs(total0 / n0 - (self.total - total0) / n1) > epsilon:
+                    return True
+        return False
+
+    def _drop_oldest(self) -> None:
+        while not self._rows[-1]:
+            self._rows.pop()
+        i = len(self._rows) - 1
+        total, variance = self._rows[i].pop(0)
+        size = 2**i
+        self.width -= size
+        self.total -= total
+        if self.width:
+            mean = total / size
+            self.variance -= variance + size * self.width * (mean - self.total / self.width) ** 2 / (
+                size + self.width
+            )
+            self.variance = max(self.variance, 0.0)
+        else:
+            self.variance = 0.0
+
+    @property
+    def n_buckets(self) -> int:
+        return sum(len(row) for row in self._rows)
+
+
+class PageHinkley:
+    """Two-sided Page-Hinkley test for a shift in the mean.
+
+    Example:
+        >>> ph = PageHinkley(threshold=50)
+        >>> changed = [ph.update(x) for x in stream]
+    """
+
+    def __init__(
+        self,
+        delta: float = 0.005,
+        threshold: float = 50.0,
+        *,
+        min_instances: int = 30,
+        alpha: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            delta: Magnitude of changes that are tolerated
+            threshold: Cumulative deviation that signals a change (lambda)
+            min_instances: Observations before detection starts
+            alpha: Fading factor of the cumulative sums (1.0 = no fading)
+        """
+        self.delta = delta
+        self.threshold = threshold
+        self.min_instances = min_instances
+        self.alpha = alpha
+        self.n_detections = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self._up = self._up_min = 0.0
+        self._down = self._down_max = 0.0
+
+    def update(self, value: float) -> bool:
+        """Add one observation; returns True (and restarts) on a change."""
+        self.n += 1
+        self.mean += (value - self.mean) / self.n
+        self._up = self.alpha * self._up + value - self.mean - self.delta
+        self._down = self.alpha * self._down + value - self.mean + self.delta
+        self._up_min = min(self._up_min, self._up)
+        self._down_max = max(self._down_max, self._down)
+
+        if self.n < self.min_instances:
+            return False
+        if self._up - self._up_min > self.threshold or self._down_max - self._down > self.threshold:
+            self.n_detections += 1
+            self.reset()
+            return True
+        return False
+
+
+__all__ = [
+    "ADWIN",
+    "DEFAULT_BINS",
+    "DEFAULT_PSI_THRESHOLD",
+    "PSIDetector",
+    "PageHinkley",
+    "reference_bins",
+]
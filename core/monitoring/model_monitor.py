@@ -1,37 +1,193 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
+import structlog
+
+from .drift import (
+    ADWIN,
+    DEFAULT_BINS,
+    DEFAULT_PSI_THRESHOLD,
+    PageHinkley,
+    PSIDetector,
+    reference_bins,
+)
+
+logger = structlog.get_logger(__name__)
+
+PREDICTION = "prediction"  # Feature name of the scalar prediction stream
+DEFAULT_MAX_STREAMS = 10_000
+
+
+class DriftMetrics:
+    """Prometheus gauges for drift state, labelled by model and feature."""
+
+    def __init__(self, registry: Any = None) -> None:
+        from prometheus_client import REGISTRY, Gauge
+
+        registry = registry or REGISTRY
+        self.psi = Gauge(
+            "model_feature_psi",
+            "Population stability index of the live window",
+            ["model", "feature"],
+            registry=registry,
+        )
+        self.drift = Gauge(
+            "model_feature_drift",
+            "1 if the detector currently reports drift",
+            ["model", "feature", "detector"],
+            registry=registry,
+        )
+        self.window_mean = Gauge(
+            "model_feature_window_mean",
+            "Mean of the ADWIN window (standardized when a reference is set)",
+            ["model", "feature"],
+            registry=registry,
+        )
+
+    def publish(self, model: str, feature: str, status: dict[str, Any]) -> None:
+        if status["psi"] is not None:
+            self.psi.labels(model, feature).set(status["psi"])
+        for detector, detected in status["detectors"].items():
+            self.drift.labels(model, feature, detector).set(int(detected))
+        self.window_mean.labels(model, feature).set(status["window_mean"])
+
+    def remove(self, model: str, feature: str) -> None:
+        for gauge, labels in (
+            (self.psi, [(model, feature)]),
+            (self.window_mean, [(model, feature)]),
+            (self.drift, [(model, feature, d) for d in ("psi", "adwin", "page_hinkley")]),
+        ):
+            for label_values in labels:
+                try:
+                    gauge.remove(*label_values)
+                except KeyError:
+                    pass
+
+
+_default_metrics: DriftMetrics | None = None
+
+
+def _get_default_metrics() -> DriftMetrics:
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = DriftMetrics()
+    return _default_metrics
+
+
+@dataclass(slots=True)
+class _Reference:
+    """What is kept of a reference sample (bins and moments, no raw data)."""
+
+    bins: tuple[list[float], np.ndarray]
+    mean: float
+    std: float
+
+
+@dataclass(slots=True)
+class _Stream:
+    psi: PSIDetector | None
+    adwin: ADWIN
+    page_hinkley: PageHinkley
+    mean: float = 0.0
+    std: float = 1.0
+    n_seen: int = 0
+    last_change: dict[str, int] = field(default_factory=dict)
+
+    def update(self, value: float) -> None:
+        self.n_seen += 1
+        if self.psi is not None:
+            self.psi.update(value)
+        z = (value - self.mean) / self.std
+        if self.adwin.update(z):
+            self.last_change["adwin"] = self.n_seen
+        if self.page_hinkley.update(z):
+            self.last_change["page_hinkley"] = self.n_seen
 
 
 class ModelMonitor:
     """
-    A simple model drift monitor.
+    Streaming drift monitor for many models and features.
+
+    Each (model, feature) stream runs a PSI window, ADWIN and Page-Hinkley
+    detector, all updated in constant time per observation; values are
+    standardized with the reference mean and std before ADWIN and
+    Page-Hinkley. Streams live in a bounded LRU, so memory stays flat with
+    thousands of streams, and are indexed per model, so reading one model's
+    drift touches only that model's streams.
     """
 
-    def __init__(self, window_size: int = 1000):
+    def __init__(
+        self,
+        window_size: int = 1000,
+        *,
+        bins: int = DEFAULT_BINS,
+        psi_threshold: float = DEFAULT_PSI_THRESHOLD,
+        adwin_delta: float = 0.002,
+        ph_delta: float = 0.5,
+        ph_threshold: float = 10.0,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+        publish_every: int = 100,
+        metrics: DriftMetrics | None = None,
+        export_metrics: bool = True,
+    ):
         """
         Initializes the model monitor.
 
         Args:
             window_size: The size of the sliding window for drift detection.
+            bins: Number of PSI bins (reference quantiles).
+            psi_threshold: PSI above which drift is reported.
+            adwin_delta: ADWIN confidence parameter.
+            ph_delta: Page-Hinkley tolerated shift, in reference standard deviations.
+            ph_threshold: Page-Hinkley threshold, in reference standard deviations.
+            max_streams: Streams kept before the least recently updated is dropped.
+            publish_every: Observations per stream between Prometheus updates.
+            metrics: Gauges to publish to (default: the process-wide ones).
+            export_metrics: Set False to skip Prometheus entirely.
         """
         self.window_size = window_size
-        self.reference_data: dict[str, np.ndarray] = {}
-        self.live_data: dict[str, deque] = {}
+        self.bins = bins
+        self.psi_threshold = psi_threshold
+        self.adwin_delta = adwin_delta
+        self.ph_delta = ph_delta
+        self.ph_threshold = ph_threshold
+        self.max_streams = max_streams
+        self.publish_every = publish_every
+        self.metrics = metrics or (_get_default_metrics() if export_metrics else None)
+        self.reference_data: dict[str, dict[str, _Reference]] = {}
+        self._streams: OrderedDict[tuple[str, str], _Stream] = OrderedDict()
+        # model -> its features with a live stream (dict as an ordered set)
+        self._model_features: dict[str, dict[str, None]] = {}
+        self.evicted_streams = 0
 
-    def set_reference_data(self, model_name: str, data: list[float]):
+    def set_reference_data(
+        self, model_name: str, data: Sequence[float] | Mapping[str, Sequence[float]]
+    ):
         """
         Sets the reference data for a model.
 
         Args:
             model_name: The name of the model.
-            data: A list of numerical data points (e.g., prediction scores).
+            data: Numerical data points (e.g., prediction scores), or a mapping
+                of feature name to data points for multivariate streams.
         """
-        self.reference_data[model_name] = np.array(data)
-        self.live_data[model_name] = deque(maxlen=self.window_size)
+        features = data if isinstance(data, Mapping) else {PREDICTION: data}
+        references = {}
+        for feature, values in features.items():
+            sample = np.asarray(values, dtype=float)
+            if sample.size == 0:
+                raise ValueError(f"Reference data for '{model_name}.{feature}' is empty.")
+            references[feature] = _Reference(
+                reference_bins(sample, self.bins), float(sample.mean()), float(sample.std()) or 1.0
+            )
+        self.reference_data[model_name] = references
+        for feature in list(self._model_features.get(model_name, ())):
+            self._drop((model_name, feature))
 
     def track_prediction(self, model_name: str, prediction: float):
         """
@@ -41,52 +197,133 @@ class ModelMonitor:
             model_name: The name of the model.
             prediction: The numerical prediction to track.
         """
-        if model_name not in self.live_data:
+        self.track_features(model_name, {PREDICTION: prediction})
+
+    def track_features(self, model_name: str, features: Mapping[str, float]):
+        """
+        Tracks one observation of several features.
+
+        Args:
+            model_name: The name of the model.
+            features: Feature name to value; features without reference data
+                get ADWIN and Page-Hinkley on raw values but no PSI.
+        """
+        if model_name not in self.reference_data:
             raise ValueError(f"Reference data for model '{model_name}' not set.")
 
-        self.live_data[model_name].append(prediction)
+        for feature, value in features.items():
+            key = (model_name, feature)
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._create_stream(key)
+            else:
+                self._streams.move_to_end(key)
+            stream.update(float(value))
+            if self.metrics is not None and stream.n_seen % self.publish_every == 0:
+                self.metrics.publish(model_name, feature, self._status(stream))
+
+    def _create_stream(self, key: tuple[str, str]) -> _Stream:
+        reference = self.reference_data[key[0]].get(key[1])
+        stream = _Stream(
+            psi=None,
+            adwin=ADWIN(delta=self.adwin_delta),
+            page_hinkley=PageHinkley(delta=self.ph_delta, threshold=self.ph_threshold),
+        )
+        if reference is not None:
+            stream.psi = PSIDetector.from_bins(
+                *reference.bins, window=self.window_size, threshold=self.psi_threshold
+            )
+            stream.mean, stream.std = reference.mean, reference.std
+        self._streams[key] = stream
+        self._model_features.setdefault(key[0], {})[key[1]] = None
+        while len(self._streams) > self.max_streams:
+            self._drop(next(iter(self._streams)))
+            self.evicted_streams += 1
+        return stream
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        del self._streams[key]
+        features = self._model_features[key[0]]
+        del features[key[1]]
+        if not features:
+            del self._model_features[key[0]]
+        if self.metrics is not None:
+            self.metrics.remove(*key)
+
+    def _status(self, stream: _Stream) -> dict[str, Any]:
+        psi = stream.psi.value if stream.psi is not None and stream.psi.size else None
+        recent = stream.n_seen - self.window_size
+        detectors = {
+            "psi": psi is not None and psi > self.psi_threshold,
+            "adwin": stream.last_change.get("adwin", recent) > recent,
+            "page_hinkley": stream.last_change.get("page_hinkley", recent) > recent,
+        }
+        return {
+            "drift_detected": any(detectors.values()),
+            "psi": psi,
+            "detectors": detectors,
+            "window_mean": stream.adwin.estimation,
+            "adwin_width": stream.adwin.width,
+            "changes": {
+                "adwin": stream.adwin.n_detections,
+                "page_hinkley": stream.page_hinkley.n_detections,
+            },
+            "live_data_size": stream.psi.size if stream.psi is not None else stream.n_seen,
+        }
 
     def detect_drift(self, model_name: str) -> dict[str, Any]:
         """
-        Detects drift for a model using the Kolmogorov-Smirnov test.
+        Reports drift for a model from its streaming detectors.
+
+        PSI is reported once half a window has been seen; ADWIN and
+        Page-Hinkley count as drift when they fired within the last window.
 
         Args:
             model_name: The name of the model.
 
         Returns:
-            A dictionary containing the drift detection results.
+            A dictionary containing the drift detection results, overall and
+            per feature.
         """
-        if model_name not in self.reference_data or model_name not in self.live_data:
+        if model_name not in self.reference_data:
             raise ValueError(f"Model '{model_name}' not found.")
 
-        reference_dist = self.reference_data[model_name]
-        live_dist = np.array(self.live_data[model_name])
+        features = {}
+        for feature in self._model_features.get(model_name, ()):
+            stream = self._streams[(model_name, feature)]
+            status = self._status(stream)
+            if stream.psi is not None and stream.psi.size < self.window_size / 2:
+                status["psi"] = None
+                status["detectors"]["psi"] = False
+                status["drift_detected"] = any(status["detectors"].values())
+            features[feature] = status
+            if self.metrics is not None:
+                self.metrics.publish(model_name, feature, status)
 
-        if len(live_dist) < self.window_size / 2:  # Wait for enough data
+        primary = features.get(PREDICTION) or next(iter(features.values()), None)
+        if primary is None or primary["live_data_size"] < self.window_size / 2:
             return {
-                "drift_detected": False,
-                "p_value": None,
+                "drift_detected": any(f["drift_detected"] for f in features.values()),
+                "psi": None,
+                "features": features,
                 "message": "Not enough live data to detect drift.",
             }
 
-        # A simple drift detection using Kolmogorov-Smirnov test
-        # In a real system, you would use more sophisticated methods.
-        try:
-            from scipy.stats import ks_2samp
-
-            ks_statistic, p_value = ks_2samp(reference_dist, live_dist)
-        except ImportError:
-            return {
-                "drift_detected": False,
-                "p_value": None,
-                "message": "scipy is not installed. Cannot perform drift detection.",
-            }
-
-        drift_detected = p_value < 0.05  # Significance level
+        drifted = sorted(name for name, status in features.items() if status["drift_detected"])
+        if drifted:
+            logger.warning("model_monitor.drift", model=model_name, features=drifted)
+        return {
+            "drift_detected": bool(drifted),
+            "drifted_features": drifted,
+            "psi": primary["psi"],
+            "live_data_size": primary["live_data_size"],
+            "features": features,
+        }
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get stream counts."""
         return {
-            "drift_detected": drift_detected,
-            "p_value": p_value,
-            "ks_statistic": ks_statistic,
-            "live_data_size": len(live_dist),
+            "streams": len(self._streams),
+            "models": len(self.reference_data),
+            "evicted_streams": self.evicted_streams,
         }
@@ -24,6 +24,7 @@ class MetricsCollector:
     - Database operations
     - Vector store operations
     - LLM requests
+    - PDF rendering
     - System resources
     """
 
@@ -169,6 +170,24 @@ class MetricsCollector:
             ["model"],
         )
 
+        # PDF rendering metrics
+        self.pdf_renders = Counter(
+            "pdf_renders_total",
+            "PDF render requests by outcome",
+            ["status"],
+        )
+
+        self.pdf_render_duration_seconds = Histogram(
+            "pdf_render_duration_seconds",
+            "PDF render duration in the worker pool",
+            buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+        )
+
+        self.pdf_render_queue_depth = Gauge(
+            "pdf_render_queue_depth",
+            "PDF renders waiting for or running in the worker pool",
+        )
+
         # System metrics
         self.system_info = Info(
             "megaagent_system_info",
@@ -338,6 +357,18 @@ class MetricsCollector:
         if cached:
             self.llm_cache_hits.labels(model=model).inc()
 
+    # PDF rendering methods
+    def record_pdf_render(self, status: str, duration_seconds: float | None = None) -> None:
+        """Record a PDF render request (rendered, cache_hit, rejected, failed)."""
+        self.pdf_renders.labels(status=status).inc()
+
+        if duration_seconds is not None:
+            self.pdf_render_duration_seconds.observe(duration_seconds)
+
+    def set_pdf_render_queue_depth(self, depth: int) -> None:
+        """Set the number of queued and running PDF renders."""
+        self.pdf_render_queue_depth.set(depth)
+
     # System methods
     def set_system_info(self, info: dict[str, Any]) -> None:
         """Set system information."""
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from .cost_optimizer import (CostOptimizer, CostTracker, ModelCost, ModelTier,
-                             get_cost_optimizer, get_cost_tracker)
+from .cost_optimizer import (CallBudget, CostOptimizer, CostTracker,
+                             ModelCost, ModelTier, get_cost_optimizer,
+                             get_cost_tracker)
 
 __all__ = [
+    "CallBudget",
     "CostOptimizer",
     "CostTracker",
     "ModelCost",
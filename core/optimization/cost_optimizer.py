@@ -105,6 +105,78 @@ class CostRecord:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class CallBudget:
+    """
+    Token and cost allowance of a single logical call.
+
+    Work that is about to start reserves its estimated usage; once it
+    finishes, ``settle`` replaces the reservation with the actual usage.
+    A limit of None is unlimited.
+    """
+
+    max_cost_usd: float | None = None
+    max_tokens: int | None = None
+    spent_usd: float = 0.0
+    spent_tokens: int = 0
+    reserved_usd: float = 0.0
+    reserved_tokens: float = 0.0
+
+    def can_afford(self, cost_usd: float = 0.0, tokens: float = 0) -> bool:
+        """Whether ``cost_usd``/``tokens`` more fit next to spending and reservations."""
+        over_cost = self.max_cost_usd is not None and (
+            self.spent_usd + self.reserved_usd + cost_usd > self.max_cost_usd
+        )
+        over_tokens = self.max_tokens is not None and (
+            self.spent_tokens + self.reserved_tokens + tokens > self.max_tokens
+        )
+        return not (self.exhausted or over_cost or over_tokens)
+
+    def reserve(self, cost_usd: float = 0.0, tokens: float = 0) -> bool:
+        """Reserve an estimated usage; False (and nothing reserved) if it does not fit."""
+        if not self.can_afford(cost_usd, tokens):
+            return False
+        self.reserved_usd += cost_usd
+        self.reserved_tokens += tokens
+        return True
+
+    def release(self, cost_usd: float = 0.0, tokens: float = 0) -> None:
+        """Drop a reservation without spending it."""
+        self.reserved_usd = max(self.reserved_usd - cost_usd, 0.0)
+        self.reserved_tokens = max(self.reserved_tokens - tokens, 0)
+
+    def settle(
+        self,
+        reserved_usd: float,
+        reserved_tokens: float,
+        cost_usd: float,
+        tokens: int,
+    ) -> None:
+        """Replace a reservation with the usage actually incurred."""
+        self.release(reserved_usd, reserved_tokens)
+        self.spent_usd += cost_usd
+        self.spent_tokens += tokens
+
+    def consume(self, cost_usd: float = 0.0, tokens: float = 0) -> None:
+        """Count a reservation as spent, for work cut off after it started."""
+        self.settle(cost_usd, tokens, cost_usd, round(tokens))
+
+    @property
+    def exhausted(self) -> bool:
+        return (self.max_cost_usd is not None and self.spent_usd >= self.max_cost_usd) or (
+            self.max_tokens is not None and self.spent_tokens >= self.max_tokens
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_cost_usd": self.max_cost_usd,
+            "max_tokens": self.max_tokens,
+            "spent_usd": self.spent_usd,
+            "spent_tokens": self.spent_tokens,
+            "exhausted": self.exhausted,
+        }
+
+
 class CostTracker:
     """
     Tracks LLM operation costs and provides analytics.
@@ -206,18 +278,8 @@ class CostTracker:
             ... )
             >>> print(f"Cost: ${cost:.4f}")
         """
-        # Calculate cost
-        if cached:
-            cost = 0.0  # Cached responses are free
-        else:
-            model_cost = self.model_costs.get(model)
-            if model_cost:
-                input_cost = (input_tokens / 1000) * model_cost.cost_per_1k_input_tokens
-                output_cost = (output_tokens / 1000) * model_cost.cost_per_1k_output_tokens
-                cost = input_cost + output_cost + model_cost.cost_per_request
-            else:
-                # Unknown model, estimate
-                cost = (input_tokens + output_tokens) / 1000 * 0.002
+        # Calculate cost (cached responses are free)
+        cost = 0.0 if cached else self.estimate_cost(model, input_tokens, output_tokens)
 
         # Create record
         record = CostRecord(
@@ -262,6 +324,57 @@ class CostTracker:
 
         return cost
 
+    def estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Cost in USD of an uncached operation with the given token counts."""
+        model_cost = self.model_costs.get(model)
+        if model_cost:
+            input_cost = (input_tokens / 1000) * model_cost.cost_per_1k_input_tokens
+            output_cost = (output_tokens / 1000) * model_cost.cost_per_1k_output_tokens
+            return input_cost + output_cost + model_cost.cost_per_request
+        # Unknown model, estimate
+        return (input_tokens + output_tokens) / 1000 * 0.002
+
+    def average_operation_cost(self) -> tuple[float, float] | None:
+        """Mean (cost USD, tokens) per recorded operation, or None without history."""
+        if not self.total_operations:
+            return None
+        return (
+            self.total_cost_usd / self.total_operations,
+            (self.total_input_tokens + self.total_output_tokens) / self.total_operations,
+        )
+
+    def remaining_budget_usd(self) -> float | None:
+        """Smallest of the remaining daily and monthly budgets (None when unlimited)."""
+        remaining = [
+            budget - spent
+            for budget, spent in (
+                (self.daily_budget, self.get_daily_cost()),
+                (self.monthly_budget, self.get_monthly_cost()),
+            )
+            if budget
+        ]
+        return max(min(remaining), 0.0) if remaining else None
+
+    def call_budget(
+        self,
+        max_cost_usd: float | None = None,
+        max_tokens: int | None = None,
+    ) -> CallBudget:
+        """
+        Create the allowance of one logical call (e.g. all candidates of an answer).
+
+        The cost limit is capped by the remaining daily/monthly budget.
+
+        Example:
+            >>> budget = tracker.call_budget(max_cost_usd=0.05, max_tokens=8000)
+            >>> budget.reserve(0.01, 2000)
+            True
+        """
+        remaining = self.remaining_budget_usd()
+        if remaining is not None:
+            max_cost_usd = remaining if max_cost_usd is None else min(max_cost_usd, remaining)
+        return CallBudget(max_cost_usd=max_cost_usd, max_tokens=max_tokens)
+
     def _check_budget_alerts(self) -> None:
         """Check if budget thresholds are exceeded."""
         today = datetime.utcnow().strftime("%Y-%m-%d")
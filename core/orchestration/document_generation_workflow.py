@@ -7,19 +7,27 @@ Integrates:
 - MemoryManager for semantic context
 - Real-time status updates to document_workflow_store
 - WebSocket broadcasting for instant UI updates
+
+The per-section graph (generate -> validate) is compiled once per process.
+Sections run as a dependency DAG: a section listing ``depends_on`` waits for
+those sections, independent sections generate concurrently (bounded by
+``DOCUMENT_SECTION_CONCURRENCY``). Pause/cancel is a cooperative
+``GenerationControl`` signal observed by the scheduler and in-flight sections.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import datetime
+import os
+import time
 from typing import Any
 
 import structlog
 
 from core.exceptions import WorkflowError
 from core.groupagents.writer_agent import DocumentType, WriterAgent
-from core.memory.memory_manager_v2 import get_memory_manager
 from core.orchestration.workflow_graph import WorkflowState
 from core.storage.document_workflow_store import get_document_workflow_store
 
@@ -32,6 +40,16 @@ try:
 except ImportError:
     LANGGRAPH_AVAILABLE = False
 
+# Maximum number of sections generated at the same time
+DEFAULT_SECTION_CONCURRENCY = int(os.getenv("DOCUMENT_SECTION_CONCURRENCY", "4"))
+
+
+def get_memory_manager() -> Any:
+    """Shared MemoryManager from the DI container."""
+    from core.di import get_container
+
+    return get_container().get("memory_manager")
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SECTION DEFINITIONS
@@ -93,9 +111,109 @@ EB1A_SECTIONS = [
         "prompt": "Conclude the petition with a strong summary of extraordinary ability.",
         "min_tokens": 200,
         "max_tokens": 300,
+        # Summarizes the criteria sections, so it is generated after them
+        "depends_on": ["awards", "membership", "publications", "critical_role"],
     },
 ]
 
+_SECTION_DEFINITIONS = {section["id"]: section for section in EB1A_SECTIONS}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PAUSE / CANCEL SIGNAL
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class GenerationCancelled(WorkflowError):
+    """Raised inside a section when generation was cancelled mid-flight."""
+
+    def __init__(self, section_id: str):
+        super().__init__(
+            f"Generation of section {section_id} was cancelled",
+            workflow_name="document_generation",
+            node_name="generate_section",
+        )
+        self.section_id = section_id
+
+
+class GenerationControl:
+    """Cooperative pause/cancel signal shared by all sections of one thread.
+
+    * pause - no new sections start; in-flight sections finish and are kept
+    * cancel - no new sections start; in-flight generation is abandoned and
+      the section is reset to ``pending`` so a resume regenerates it
+
+    Example:
+        >>> control = get_generation_control(thread_id)
+        >>> control.pause()  # from the /pause endpoint
+        >>> control.stop_requested
+        True
+    """
+
+    def __init__(self) -> None:
+        self._stop = asyncio.Event()
+        self._cancel = asyncio.Event()
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def pause(self) -> None:
+        self._stop.set()
+
+    def cancel(self) -> None:
+        self._stop.set()
+        self._cancel.set()
+
+    async def run(self, coro: Any, section_id: str) -> Any:
+        """Await ``coro`` unless the thread is cancelled first."""
+        task = asyncio.ensure_future(coro)
+        waiter = asyncio.ensure_future(self._cancel.wait())
+        try:
+            await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if task.done():
+            return task.result()
+
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        raise GenerationCancelled(section_id)
+
+
+_controls: dict[str, GenerationControl] = {}
+
+
+def get_generation_control(thread_id: str) -> GenerationControl:
+    """Get (or create) the pause/cancel signal for a workflow thread."""
+    control = _controls.get(thread_id)
+    if control is None:
+        control = _controls[thread_id] = GenerationControl()
+    return control
+
+
+def request_pause(thread_id: str) -> bool:
+    """Signal a running generation to pause. Returns False if none is running."""
+    control = _controls.get(thread_id)
+    if control is None:
+        return False
+    control.pause()
+    return True
+
+
+def request_cancel(thread_id: str) -> bool:
+    """Signal a running generation to cancel. Returns False if none is running."""
+    control = _controls.get(thread_id)
+    if control is None:
+        return False
+    control.cancel()
+    return True
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # WORKFLOW NODES
@@ -142,7 +260,12 @@ async def node_generate_section(state: WorkflowState) -> WorkflowState:
 
     section_id = current_section["id"]
     section_name = current_section["name"]
-    section_prompt = current_section["prompt"]
+    section_prompt = current_section.get("prompt") or f"Write the {section_name} section."
+
+    control = _controls.get(thread_id)
+    if control and control.stop_requested:
+        state.workflow_step = f"section_{section_id}_skipped"
+        return state
 
     logger.info(
         "generating_section",
@@ -172,11 +295,11 @@ async def node_generate_section(state: WorkflowState) -> WorkflowState:
 
     try:
         # Initialize WriterAgent
-        writer = WriterAgent(memory=memory_manager)
+        writer = WriterAgent(memory_manager=memory_manager)
 
         # Retrieve relevant context from memory
         context_records = await memory_manager.aretrieve(
-            query=section_prompt, user_id=state.user_id, limit=5
+            query=section_prompt, user_id=state.user_id, topk=5
         )
         context = "\n".join([rec.text for rec in context_records]) if context_records else ""
 
@@ -193,12 +316,13 @@ async def node_generate_section(state: WorkflowState) -> WorkflowState:
 
         # Generate (simplified - real WriterAgent would have generate_section method)
         # For now, we'll simulate the content generation
-        content_html = await _generate_section_content(
+        generation = _generate_section_content(
             section_name=section_name,
             prompt=section_prompt,
             context=context,
             writer=writer,
         )
+        content_html = await control.run(generation, section_id) if control else await generation
 
         # Count tokens (approximate)
         tokens_used = len(content_html.split()) * 1.3  # Rough estimate
@@ -243,6 +367,12 @@ async def node_generate_section(state: WorkflowState) -> WorkflowState:
 
         state.workflow_step = f"section_{section_id}_completed"
 
+    except GenerationCancelled:
+        # Not an error: put the section back so a resume regenerates it
+        await workflow_store.update_section(thread_id, section_id, {"status": "pending"})
+        await broadcast_workflow_update(thread_id, {"section_id": section_id, "status": "pending"})
+        raise
+
     except Exception as e:
         logger.error("section_generation_error", section_id=section_id, error=str(e))
 
@@ -278,7 +408,7 @@ async def node_validate_section(state: WorkflowState) -> WorkflowState:
     workflow_store = get_document_workflow_store()
 
     current_section = state.document_data.get("current_section") if state.document_data else None
-    if not current_section:
+    if not current_section or (state.workflow_step or "").endswith("_skipped"):
         return state
 
     section_id = current_section["id"]
@@ -312,10 +442,7 @@ async def node_finalize_document(state: WorkflowState) -> WorkflowState:
     logger.info("finalizing_document", thread_id=thread_id)
 
     # Update overall status to completed
-    current_state = await workflow_store.load_state(thread_id)
-    if current_state:
-        current_state["status"] = "completed"
-        await workflow_store.save_state(thread_id, current_state)
+    await workflow_store.update_workflow_status(thread_id, "completed")
 
     # Add completion log
     await workflow_store.add_log(
@@ -417,8 +544,128 @@ def build_document_generation_workflow() -> StateGraph:
     return graph
 
 
+def build_section_workflow() -> StateGraph:
+    """Build the per-section LangGraph workflow (generate -> validate).
+
+    Init and finalize run once per document in ``run_document_generation``;
+    this graph is invoked once per section.
+
+    Returns:
+        Uncompiled StateGraph for a single section
+    """
+
+    if not LANGGRAPH_AVAILABLE:
+        raise RuntimeError("LangGraph is required. Install with: pip install langgraph")
+
+    graph = StateGraph(WorkflowState)
+    graph.add_node("generate_section", node_generate_section)
+    graph.add_node("validate_section", node_validate_section)
+    graph.set_entry_point("generate_section")
+    graph.add_edge("generate_section", "validate_section")
+    graph.set_finish_point("validate_section")
+
+    return graph
+
+
+_compiled_section_workflow: Any | None = None
+
+
+def get_section_workflow() -> Any:
+    """Return the per-section workflow, compiling it on first use only."""
+    global _compiled_section_workflow
+    if _compiled_section_workflow is None:
+        _compiled_section_workflow = build_section_workflow().compile()
+    return _compiled_section_workflow
+
+
+def _section_dependencies(sections: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Map section id -> ids it must wait for (only among ``sections``).
+
+    Raises:
+        WorkflowError: If the dependencies contain a cycle
+    """
+    ids = {section["id"] for section in sections}
+    deps = {
+        section["id"]: [d for d in section.get("depends_on", []) if d in ids and d != section["id"]]
+        for section in sections
+    }
+
+    # Kahn's algorithm, only to reject cycles before anything starts
+    indegree = {sid: len(d) for sid, d in deps.items()}
+    dependents: dict[str, list[str]] = {sid: [] for sid in deps}
+    for sid, waiting_on in deps.items():
+        for dep in waiting_on:
+            dependents[dep].append(sid)
+    ready = [sid for sid, n in indegree.items() if n == 0]
+    visited = 0
+    while ready:
+        sid = ready.pop()
+        visited += 1
+        for other in dependents[sid]:
+            indegree[other] -= 1
+            if indegree[other] == 0:
+                ready.append(other)
+    if visited < len(deps):
+        cyclic = sorted(sid for sid, n in indegree.items() if n > 0)
+        raise WorkflowError(
+            f"Section dependencies contain a cycle: {', '.join(cyclic)}",
+            workflow_name="document_generation",
+        )
+    return deps
+
+
+async def _run_section_dag(
+    sections: list[dict[str, Any]],
+    run_section: Any,
+    *,
+    max_concurrency: int,
+    control: GenerationControl,
+) -> dict[str, float]:
+    """Run ``run_section`` for every section, respecting ``depends_on``.
+
+    Returns:
+        Per-section latency in seconds (sections that never started are absent)
+
+    The first failure cancels every other section and is re-raised.
+    """
+    deps = _section_dependencies(sections)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks: dict[str, asyncio.Task[None]] = {}
+    latencies: dict[str, float] = {}
+
+    async def run(section: dict[str, Any]) -> None:
+        for dep in deps[section["id"]]:
+            await tasks[dep]
+        async with semaphore:
+            if control.stop_requested:
+                return
+            started = time.perf_counter()
+            try:
+                await run_section(section)
+            except GenerationCancelled:
+                return
+            latencies[section["id"]] = time.perf_counter() - started
+
+    for section in sections:
+        tasks[section["id"]] = asyncio.create_task(run(section))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return latencies
+
+
 async def run_document_generation(
-    thread_id: str, case_id: str, document_type: str, user_id: str, sections: list[dict[str, Any]]
+    thread_id: str,
+    case_id: str,
+    document_type: str,
+    user_id: str,
+    sections: list[dict[str, Any]],
+    max_concurrency: int | None = None,
 ) -> None:
     """Run complete document generation workflow with real-time updates.
 
@@ -428,16 +675,28 @@ async def run_document_generation(
         document_type: Type of document (petition, letter, etc.)
         user_id: User ID
         sections: List of section definitions to generate
+        max_concurrency: Sections generated at once
+            (default ``DOCUMENT_SECTION_CONCURRENCY``)
 
     This function:
-    1. Initializes the LangGraph workflow
-    2. Processes each section sequentially
+    1. Initializes the workflow once
+    2. Runs sections as a dependency DAG on the shared compiled graph
     3. Updates workflow_store in real-time
     4. Broadcasts WebSocket updates
-    5. Handles errors gracefully
+    5. Stops early on pause/cancel (see ``request_pause``/``request_cancel``)
+    6. Handles errors gracefully
     """
 
     workflow_store = get_document_workflow_store()
+    control = _controls[thread_id] = GenerationControl()
+    concurrency = max_concurrency or DEFAULT_SECTION_CONCURRENCY
+
+    # Fill in prompts/dependencies from the built-in definitions
+    pending = [
+        {**_SECTION_DEFINITIONS.get(section["id"], {}), **section}
+        for section in sections
+        if section.get("status") != "completed"
+    ]
 
     logger.info(
         "run_document_generation_start",
@@ -445,62 +704,60 @@ async def run_document_generation(
         case_id=case_id,
         document_type=document_type,
         total_sections=len(sections),
+        pending_sections=len(pending),
+        max_concurrency=concurrency,
     )
 
-    try:
-        # Process each section
-        for section in sections:
-            # Check if paused
-            current_state = await workflow_store.load_state(thread_id)
-            if current_state and current_state.get("status") == "paused":
-                logger.info("workflow_paused", thread_id=thread_id)
-                return
+    def section_state(section: dict[str, Any] | None = None, step: str = "start") -> WorkflowState:
+        return WorkflowState(
+            thread_id=thread_id,
+            user_id=user_id,
+            case_id=case_id,
+            document_data={"document_type": document_type, "current_section": section},
+            workflow_step=step,
+        )
 
-            # Create workflow state for this section
-            state = WorkflowState(
-                thread_id=thread_id,
-                user_id=user_id,
-                case_id=case_id,
-                document_data={
-                    "document_type": document_type,
-                    "current_section": section,
-                },
-                workflow_step="start",
-            )
+    async def run_section(section: dict[str, Any]) -> None:
+        result = await get_section_workflow().ainvoke(section_state(section))
+        step = result["workflow_step"] if isinstance(result, dict) else result.workflow_step
+        logger.info(
+            "section_workflow_completed",
+            thread_id=thread_id,
+            section_id=section["id"],
+            workflow_step=step,
+        )
 
-            # Build and compile workflow
-            workflow = build_document_generation_workflow()
-            compiled_workflow = workflow.compile()
+    try:
+        await node_init_generation(section_state(step="init"))
 
-            # Run workflow for this section
-            result = await compiled_workflow.ainvoke(state)
+        started = time.perf_counter()
+        latencies = await _run_section_dag(
+            pending, run_section, max_concurrency=concurrency, control=control
+        )
 
+        if control.stop_requested:
             logger.info(
-                "section_workflow_completed",
+                "workflow_paused",
                 thread_id=thread_id,
-                section_id=section["id"],
-                workflow_step=result.workflow_step,
+                cancelled=control.cancelled,
+                completed_sections=len(latencies),
             )
+            return
 
-        # Finalize
-        await node_finalize_document(
-            WorkflowState(
-                thread_id=thread_id,
-                user_id=user_id,
-                case_id=case_id,
-                workflow_step="finalizing",
-            )
+        logger.info(
+            "run_document_generation_sections_done",
+            thread_id=thread_id,
+            wall_clock_s=round(time.perf_counter() - started, 3),
+            section_latency_s={sid: round(t, 3) for sid, t in latencies.items()},
         )
 
+        # Finalize
+        await node_finalize_document(section_state(step="finalizing"))
     except Exception as e:
         logger.error("document_generation_failed", thread_id=thread_id, error=str(e))
 
         # Update state to error
-        current_state = await workflow_store.load_state(thread_id)
-        if current_state:
-            current_state["status"] = "error"
-            current_state["error_message"] = str(e)
-            await workflow_store.save_state(thread_id, current_state)
+        await workflow_store.update_workflow_status(thread_id, "error", error_message=str(e))
 
         # Add error log
         await workflow_store.add_log(
@@ -519,3 +776,7 @@ async def run_document_generation(
         await broadcast_workflow_update(thread_id, {"status": "error", "error": str(e)})
 
         raise
+
+    finally:
+        if _controls.get(thread_id) is control:
+            del _controls[thread_id]
@@ -11,15 +11,39 @@ if TYPE_CHECKING:
     from ..memory.memory_manager import MemoryManager
 
 
-def setup_checkpointer(url: str | None = None):
+def setup_checkpointer(url: str | None = None, *, keep_last: int | None = 50):
     """Configure a LangGraph checkpointer.
 
     - If `url` is None, uses in-memory checkpointer (non-persistent).
-    - For production, pass a database URL (e.g., sqlite:///file.db or postgres://...).
+    - `postgres://...` / `postgresql://...`: async delta checkpointer on the shared
+      `DatabaseManager` pool (DSN from storage config), safe across API replicas.
+    - `redis://...`: async delta checkpointer on Redis.
+    - Anything else is treated as a SQLite database (single process only).
+
+    The Postgres/Redis savers store per-channel deltas, compress large blobs and
+    keep only the newest `keep_last` checkpoints per thread (None keeps all).
     """
     try:
+        if url and url.startswith(("postgres://", "postgresql")):
+            from core.storage.checkpointer import (DeltaCheckpointSaver,
+                                                   PostgresCheckpointBackend,
+                                                   RetentionPolicy)
+
+            return DeltaCheckpointSaver(
+                PostgresCheckpointBackend(), retention=RetentionPolicy(keep_last=keep_last)
+            )
+        if url and url.startswith(("redis://", "rediss://")):
+            import redis.asyncio as aioredis
+
+            from core.storage.checkpointer import (DeltaCheckpointSaver,
+                                                   RedisCheckpointBackend,
+                                                   RetentionPolicy)
+
+            return DeltaCheckpointSaver(
+                RedisCheckpointBackend(aioredis.from_url(url)),
+                retention=RetentionPolicy(keep_last=keep_last),
+            )
         if url:
-            # Note: LangGraph currently ships a SQLite checkpointer; Postgres via community
             from langgraph.checkpoint.sqlite import SqliteSaver  # type: ignore
 
             return SqliteSaver(url)
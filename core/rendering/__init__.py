@@ -0,0 +1,21 @@
+"""Document rendering services."""
+
+from __future__ import annotations
+
+from .pdf_renderer import (
+    DEFAULT_STYLESHEET,
+    PDFRenderer,
+    RenderQueueFullError,
+    get_pdf_renderer,
+    render_cache_key,
+    render_with_weasyprint,
+)
+
+__all__ = [
+    "DEFAULT_STYLESHEET",
+    "PDFRenderer",
+    "RenderQueueFullError",
+    "get_pdf_renderer",
+    "render_cache_key",
+    "render_with_weasyprint",
+]
@@ -0,0 +1,342 @@
+"""
+Off-event-loop PDF rendering with a content-addressed result cache.
+
+HTML -> PDF conversion (WeasyPrint) is CPU-bound and takes seconds for a full
+petition. Run inline in a request handler it blocks the event loop, freezing
+every other request and WebSocket on that worker. ``PDFRenderer`` instead:
+
+    - renders in a ``SandboxPool`` of worker processes, at most
+      ``max_workers`` at a time; a render that exceeds ``timeout`` has its
+      worker killed (and replaced), so timeouts bound CPU and memory use;
+    - admits at most ``max_queue`` queued + running renders and rejects the
+      rest with ``RenderQueueFullError`` (HTTP 503 + Retry-After upstream);
+    - caches output under ``sha256(stylesheet, html)``, so re-downloading an
+      unchanged document is a file lookup, and concurrent requests for the
+      same content share one render task, which keeps running if the request
+      that started it is cancelled;
+    - evicts least recently used PDFs, but never one returned in the last
+      ``eviction_grace`` seconds (a response may be about to open it);
+    - reports queue depth and render duration through ``MetricsCollector``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import cache
+import hashlib
+import importlib.util
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import structlog
+
+from ..exceptions import DocumentGenerationError
+from ..execution.sandbox_pool import SandboxPool
+from ..execution.secure_sandbox import SandboxPolicy, SandboxViolation
+
+logger = structlog.get_logger(__name__)
+
+RenderFunction = Callable[[str, str], bytes]
+
+DEFAULT_STYLESHEET = (
+    "body { font-family: Arial, sans-serif; margin: 40px; }\n"
+    "h2 { color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }"
+)
+DEFAULT_MAX_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+DEFAULT_MAX_QUEUE = int(os.getenv("PDF_RENDER_QUEUE_SIZE", "16"))
+DEFAULT_RENDER_TIMEOUT = float(os.getenv("PDF_RENDER_TIMEOUT_SECONDS", "120"))
+DEFAULT_RENDER_MEMORY_MB = int(os.getenv("PDF_RENDER_MEMORY_MB", "1024"))
+DEFAULT_CACHE_DIR = Path(os.getenv("PDF_RENDER_CACHE_DIR", "pdfs/cache"))
+DEFAULT_MAX_CACHE_FILES = 500
+DEFAULT_EVICTION_GRACE = 300.0
+
+
+class RenderQueueFullError(DocumentGenerationError):
+    """Too many PDF renders are already queued; retry later."""
+
+    def __init__(self, message: str, retry_after: int = 5, **kwargs: Any):
+        details = kwargs.pop("details", {})
+        details["retry_after_seconds"] = retry_after
+        super().__init__(message, details=details, recoverable=True, **kwargs)
+        self.retry_after = retry_after
+
+
+def render_with_weasyprint(html: str, stylesheet: str) -> bytes:
+    """
+    Render ``html`` with ``stylesheet`` to PDF bytes (runs in a worker process).
+
+    Raises:
+        ImportError: If WeasyPrint is not installed
+    """
+    from weasyprint import CSS, HTML
+
+    return HTML(string=html).write_pdf(stylesheets=[CSS(string=stylesheet)])
+
+
+@cache
+def weasyprint_available() -> bool:
+    """Whether the default renderer can run (checked without importing it)."""
+    return importlib.util.find_spec("weasyprint") is not None
+
+
+def render_cache_key(html: str, stylesheet: str) -> str:
+    """Content hash identifying a rendered document."""
+    digest = hashlib.sha256()
+    digest.update(stylesheet.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PDFRenderer:
+    """
+    Render PDFs in a process pool behind a bounded queue, with result caching.
+
+    Example:
+        >>> renderer = get_pdf_renderer()
+        >>> path = await renderer.render("<h1>Petition</h1>")
+        >>> path.read_bytes()[:4]
+        b'%PDF'
+        >>> renderer.get_stats()["queue_depth"]
+        0
+        >>> await renderer.shutdown()
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        timeout: float = DEFAULT_RENDER_TIMEOUT,
+        memory_mb: int = DEFAULT_RENDER_MEMORY_MB,
+        render_fn: RenderFunction = render_with_weasyprint,
+        max_cache_files: int = DEFAULT_MAX_CACHE_FILES,
+        eviction_grace: float = DEFAULT_EVICTION_GRACE,
+        metrics: Any | None = None,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directory holding rendered PDFs named by content hash
+            max_workers: Worker processes rendering in parallel
+            max_queue: Queued + running renders admitted before rejecting
+            timeout: Seconds allowed per render once it has a worker; the
+                worker is killed when it is exceeded
+            memory_mb: Memory a render may allocate beyond the worker's baseline
+            render_fn: Picklable ``(html, stylesheet) -> bytes`` run in a worker
+            max_cache_files: Least recently used PDFs beyond this are deleted
+            eviction_grace: PDFs returned this recently are kept even over the limit
+            metrics: ``MetricsCollector`` (defaults to the global collector)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < max_workers:
+            raise ValueError("max_queue must be >= max_workers")
+        self.cache_dir = Path(cache_dir)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.render_fn = render_fn
+        self.max_cache_files = max_cache_files
+        self.eviction_grace = eviction_grace
+        self._metrics = metrics
+        # Renders read fonts and package data; remote resources stay blocked
+        self._policy = SandboxPolicy(
+            name="pdf_render",
+            description="HTML to PDF rendering",
+            filesystem_access=True,
+            max_cpu_seconds=timeout,
+            max_memory_mb=memory_mb,
+        )
+        self._pool: SandboxPool | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._inflight: dict[str, asyncio.Task[Path]] = {}
+        self._pending = 0
+        self._running = 0
+        self._rendered = 0
+        self._cache_hits = 0
+        self._rejected = 0
+        self._failed = 0
+
+    @property
+    def metrics(self) -> Any:
+        if self._metrics is None:
+            from ..observability import get_metrics_collector
+
+            self._metrics = get_metrics_collector()
+        return self._metrics
+
+    @property
+    def queue_depth(self) -> int:
+        """Renders admitted but not finished (waiting + running)."""
+        return self._pending
+
+    async def render(self, html: str, stylesheet: str = DEFAULT_STYLESHEET) -> Path:
+        """
+        Render ``html`` to a PDF file, reusing a cached result when possible.
+
+        Args:
+            html: Document body HTML
+            stylesheet: CSS applied to the document
+
+        Returns:
+            Path to the rendered PDF inside ``cache_dir``
+
+        Raises:
+            RenderQueueFullError: If ``max_queue`` renders are already admitted
+            ImportError: If the default renderer's WeasyPrint is missing
+            TimeoutError: If the render exceeds ``timeout`` (its worker is killed)
+        """
+        if self.render_fn is render_with_weasyprint and not weasyprint_available():
+            # Fail fast instead of spawning a worker just to hit the ImportError
+            raise ImportError("weasyprint is not installed")
+
+        key = render_cache_key(html, stylesheet)
+        path = self.cache_dir / f"{key}.pdf"
+
+        if await asyncio.to_thread(_touch_if_exists, path):
+            self._cache_hits += 1
+            self.metrics.record_pdf_render("cache_hit")
+            return path
+
+        task = self._inflight.get(key)
+        if task is None:
+            if self._pending >= self.max_queue:
+                self._rejected += 1
+                self.metrics.record_pdf_render("rejected")
+                logger.warning("pdf_render_rejected", queue_depth=self._pending)
+                raise RenderQueueFullError(f"PDF render queue is full ({self._pending} pending)")
+
+            # The render belongs to no single request: cancelling the caller
+            # that started it must not cancel it for the others waiting on it
+            task = asyncio.create_task(self._render_job(key, path, html, stylesheet))
+            # Waiters may all be gone by the time it fails; don't log "never retrieved"
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+            self._set_pending(self._pending + 1)
+        return await asyncio.shield(task)
+
+    async def _render_job(self, key: str, path: Path, html: str, stylesheet: str) -> Path:
+        try:
+            return await self._render_to_cache(key, path, html, stylesheet)
+        except Exception as e:
+            self._failed += 1
+            self.metrics.record_pdf_render("failed")
+            logger.error("pdf_render_failed", key=key, error=str(e))
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            self._set_pending(self._pending - 1)
+
+    async def _render_to_cache(self, key: str, path: Path, html: str, stylesheet: str) -> Path:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        if self._pool is None:
+            self._pool = SandboxPool(size=self.max_workers)
+        async with self._slots:
+            self._running += 1
+            started = time.perf_counter()
+            try:
+                data = await self._pool.run(
+                    self.render_fn, html, stylesheet, policy=self._policy, timeout=self.timeout
+                )
+            except SandboxViolation as e:
+                if isinstance(e.__cause__, TimeoutError):
+                    raise TimeoutError(f"PDF render exceeded {self.timeout:g}s") from e
+                raise
+            finally:
+                self._running -= 1
+            duration = time.perf_counter() - started
+
+        await asyncio.to_thread(self._store, path, data)
+        self._rendered += 1
+        self.metrics.record_pdf_render("rendered", duration)
+        logger.info("pdf_rendered", key=key, size=len(data), duration_s=round(duration, 3))
+        return path
+
+    def _store(self, path: Path, data: bytes) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+        cached = []
+        for entry in self.cache_dir.glob("*.pdf"):
+            try:
+                cached.append((entry.stat().st_mtime, entry))
+            except FileNotFoundError:
+                continue
+        if len(cached) > self.max_cache_files:
+            # mtime is refreshed whenever render() returns a path; recent ones may
+            # still be about to be served, so the cache can briefly exceed its limit
+            recent = time.time() - self.eviction_grace
+            cached.sort()
+            for mtime, stale in cached[: len(cached) - self.max_cache_files]:
+                if mtime < recent:
+                    stale.unlink(missing_ok=True)
+
+    def _set_pending(self, value: int) -> None:
+        self._pending = value
+        self.metrics.set_pdf_render_queue_depth(value)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue and cache counters for health/metrics endpoints."""
+        return {
+            "queue_depth": self._pending,
+            "running": self._running,
+            "max_queue": self.max_queue,
+            "max_workers": self.max_workers,
+            "rendered": self._rendered,
+            "cache_hits": self._cache_hits,
+            "rejected": self._rejected,
+            "failed": self._failed,
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel in-flight renders and stop the worker processes."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+def _touch_if_exists(path: Path) -> bool:
+    """Refresh ``path``'s mtime (LRU order) and report whether it exists."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+# Global singleton
+_pdf_renderer: PDFRenderer | None = None
+
+
+def get_pdf_renderer() -> PDFRenderer:
+    """
+    Get global PDF renderer instance.
+
+    Returns:
+        PDFRenderer instance
+    """
+    global _pdf_renderer
+
+    if _pdf_renderer is None:
+        _pdf_renderer = PDFRenderer()
+
+    return _pdf_renderer
+
+
+__all__ = [
+    "DEFAULT_STYLESHEET",
+    "PDFRenderer",
+    "RenderQueueFullError",
+    "get_pdf_renderer",
+    "render_cache_key",
+    "render_with_weasyprint",
+]
@@ -508,6 +508,11 @@ class CircuitBreakers:
         else:
             cls._breakers.clear()
 
+    @classmethod
+    def states(cls) -> dict[str, CircuitState]:
+        """Get the current state of every registered circuit breaker."""
+        return {name: breaker.state for name, breaker in cls._breakers.items()}
+
 
 # Convenience functions
 def get_llm_circuit_breaker() -> CircuitBreaker:
@@ -14,6 +14,8 @@ from __future__ import annotations
 
 from .advanced_rbac import (Permission, RBACManager, Role, User,
                             get_rbac_manager, initialize_rbac_from_policy)
+from .api_keys import (APIKeyManager, APIKeyRecord, InMemoryAPIKeyStore,
+                       get_api_key_manager)
 from .audit_trail import (AuditEvent, AuditEventType, AuditTrail,
                           get_audit_trail)
 from .config import (CORSConfig, SecurityConfig, SecurityHeaders,
@@ -24,6 +26,8 @@ from .prompt_injection_detector import (InjectionType, PromptInjectionDetector,
                                         PromptInjectionResult,
                                         configure_prompt_detector,
                                         get_prompt_detector)
+from .rate_limiter import (LocalRateLimiter, RateLimitResult, RateLimitRule,
+                           RedisRateLimiter, RouteTier, resolve_tier)
 
 
 def configure_security(config: SecurityConfig) -> None:
@@ -36,11 +40,15 @@ def configure_security(config: SecurityConfig) -> None:
 
 
 __all__ = [
+    "APIKeyManager",
+    "APIKeyRecord",
     "AuditEvent",
     "AuditEventType",
     "AuditTrail",
     "CORSConfig",
+    "InMemoryAPIKeyStore",
     "InjectionType",
+    "LocalRateLimiter",
     "PIIDetectionResult",
     "PIIDetector",
     "PIIType",
@@ -48,16 +56,22 @@ __all__ = [
     "PromptInjectionDetector",
     "PromptInjectionResult",
     "RBACManager",
+    "RateLimitResult",
+    "RateLimitRule",
+    "RedisRateLimiter",
     "Role",
+    "RouteTier",
     "SecurityConfig",
     "SecurityHeaders",
     "User",
     "configure_prompt_detector",
     "configure_security",
+    "get_api_key_manager",
     "get_audit_trail",
     "get_pii_detector",
     "get_prompt_detector",
     "get_rbac_manager",
     "initialize_rbac_from_policy",
+    "resolve_tier",
     "security_config",
 ]
@@ -0,0 +1,272 @@
+"""
+API key issuance, verification and revocation.
+
+A key looks like ``<prefix><key_id><secret>``: ``key_id`` is a fixed-length
+public identifier used to look the key up, and only a salted SHA-256 of the
+secret is stored. Keys are high-entropy random strings, so a fast hash is
+sufficient (unlike passwords, they cannot be brute-forced from a hash).
+
+Successful verifications are cached in a bounded LRU for ``cache_ttl``
+seconds, keyed by a digest of the presented key, so the common case costs
+one dictionary lookup instead of a database round-trip. Revoking a key
+evicts it from the local cache immediately; other workers drop it within
+``cache_ttl``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+import hashlib
+import hmac
+import secrets
+import time
+from typing import Any, Protocol
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+KEY_ID_LENGTH = 12  # hex characters
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class APIKeyRecord:
+    """Stored metadata of an issued API key (never the key itself)."""
+
+    key_id: str
+    user_id: str
+    email: str
+    role: str
+    salt: str
+    key_hash: str
+    name: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    expires_at: datetime | None = None
+    revoked_at: datetime | None = None
+
+    def is_active(self, now: datetime | None = None) -> bool:
+        """True if the key is neither revoked nor expired."""
+        now = now or datetime.utcnow()
+        return self.revoked_at is None and (self.expires_at is None or self.expires_at > now)
+
+
+class APIKeyStore(Protocol):
+    """Persistence for API key records."""
+
+    async def aadd(self, record: APIKeyRecord) -> None: ...
+
+    async def aget(self, key_id: str) -> APIKeyRecord | None: ...
+
+    async def arevoke(self, key_id: str, revoked_at: datetime) -> bool: ...
+
+    async def alist(self, user_id: str) -> list[APIKeyRecord]: ...
+
+
+class InMemoryAPIKeyStore:
+    """Process-local API key store (development and tests)."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, APIKeyRecord] = {}
+
+    async def aadd(self, record: APIKeyRecord) -> None:
+        self._records[record.key_id] = record
+
+    async def aget(self, key_id: str) -> APIKeyRecord | None:
+        return self._records.get(key_id)
+
+    async def arevoke(self, key_id: str, revoked_at: datetime) -> bool:
+        record = self._records.get(key_id)
+        if record is None or record.revoked_at is not None:
+            return False
+        self._records[key_id] = replace(record, revoked_at=revoked_at)
+        return True
+
+    async def alist(self, user_id: str) -> list[APIKeyRecord]:
+        records = [r for r in self._records.values() if r.user_id == user_id]
+        return sorted(records, key=lambda r: r.created_at, reverse=True)
+
+
+def hash_secret(secret: str, salt: str) -> str:
+    """Salted SHA-256 of an API key secret (hex)."""
+    return hashlib.sha256(bytes.fromhex(salt) + secret.encode()).hexdigest()
+
+
+class APIKeyManager:
+    """Issues API keys and verifies presented keys through a TTL cache.
+
+    Example:
+        >>> manager = APIKeyManager(InMemoryAPIKeyStore())
+        >>> api_key, record = await manager.create_key("svc-1", "svc@example.com")
+        >>> (await manager.verify(api_key)).user_id
+        'svc-1'
+        >>> await manager.revoke(record.key_id)
+        True
+        >>> await manager.verify(api_key) is None
+        True
+    """
+
+    def __init__(
+        self,
+        store: APIKeyStore,
+        *,
+        prefix: str = "sk_",
+        secret_bytes: int = 32,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """
+        Args:
+            store: Where key records are persisted
+            prefix: Prefix of every issued key
+            secret_bytes: Random bytes in the secret part of a key
+            cache_ttl: Seconds a successful verification is trusted without the store
+            cache_size: Maximum cached verifications (least recently used dropped)
+        """
+        self.store = store
+        self.prefix = prefix
+        self.secret_bytes = secret_bytes
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, tuple[float, APIKeyRecord]] = OrderedDict()
+        self._stats = {"cache_hits": 0, "cache_misses": 0, "rejected": 0}
+
+    def _split(self, api_key: str) -> tuple[str, str] | None:
+        body = api_key[len(self.prefix) :]
+        if not api_key.startswith(self.prefix) or len(body) <= KEY_ID_LENGTH:
+            return None
+        return body[:KEY_ID_LENGTH], body[KEY_ID_LENGTH:]
+
+    async def create_key(
+        self,
+        user_id: str,
+        email: str,
+        role: str = "service",
+        *,
+        name: str | None = None,
+        expires_in: timedelta | None = None,
+    ) -> tuple[str, APIKeyRecord]:
+        """Issue a new key.
+
+        Returns:
+            The plaintext key (shown once, never stored) and its record
+        """
+        key_id = secrets.token_hex(KEY_ID_LENGTH // 2)
+        secret = secrets.token_urlsafe(self.secret_bytes)
+        salt = secrets.token_hex(16)
+        now = datetime.utcnow()
+        record = APIKeyRecord(
+            key_id=key_id,
+            user_id=user_id,
+            email=email,
+            role=role,
+            name=name,
+            salt=salt,
+            key_hash=hash_secret(secret, salt),
+            created_at=now,
+            expires_at=now + expires_in if expires_in else None,
+        )
+        await self.store.aadd(record)
+        logger.info("api_key.created", key_id=key_id, user_id=user_id, role=role)
+        return f"{self.prefix}{key_id}{secret}", record
+
+    async def verify(self, api_key: str) -> APIKeyRecord | None:
+        """Return the record of a valid, active key, or None."""
+        digest = hashlib.sha256(api_key.encode()).digest()
+        cached = self._cache.get(digest)
+        if cached is not None:
+            expires_at, record = cached
+            if expires_at > time.monotonic() and record.is_active():
+                self._cache.move_to_end(digest)
+                self._stats["cache_hits"] += 1
+                return record
+            del self._cache[digest]
+
+        self._stats["cache_misses"] += 1
+        parts = self._split(api_key)
+        record = await self.store.aget(parts[0]) if parts else None
+        if (
+            record is None
+            or not hmac.compare_digest(record.key_hash, hash_secret(parts[1], record.salt))
+            or not record.is_active()
+        ):
+            self._stats["rejected"] += 1
+            return None
+
+        self._cache[digest] = (time.monotonic() + self.cache_ttl, record)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return record
+
+    async def revoke(self, key_id: str) -> bool:
+        """Revoke a key and drop it from this process's cache.
+
+        Returns:
+            True if an active key was revoked
+        """
+        revoked = await self.store.arevoke(key_id, datetime.utcnow())
+        for digest, (_, record) in list(self._cache.items()):
+            if record.key_id == key_id:
+                del self._cache[digest]
+        if revoked:
+            logger.info("api_key.revoked", key_id=key_id)
+        return revoked
+
+    async def list_keys(self, user_id: str) -> list[APIKeyRecord]:
+        """List the keys issued to ``user_id``, newest first."""
+        return await self.store.alist(user_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get verification cache statistics."""
+        return {**self._stats, "cached": len(self._cache)}
+
+
+# Global instance
+_api_key_manager: APIKeyManager | None = None
+
+
+def get_api_key_manager() -> APIKeyManager:
+    """Get or create the global API key manager.
+
+    Production stores keys in PostgreSQL; other environments keep them in
+    memory.
+    """
+    global _api_key_manager
+    if _api_key_manager is None:
+        from core.config.production_settings import get_settings
+
+        settings = get_settings()
+        if settings.is_production:
+            from core.storage.postgres_stores import PostgresAPIKeyStore
+
+            store: APIKeyStore = PostgresAPIKeyStore()
+        else:
+            store = InMemoryAPIKeyStore()
+        _api_key_manager = APIKeyManager(
+            store,
+            prefix=settings.security.api_key_prefix,
+            secret_bytes=settings.security.api_key_length,
+            cache_ttl=settings.security.api_key_cache_ttl_seconds,
+            cache_size=settings.security.auth_cache_size,
+        )
+    return _api_key_manager
+
+
+def configure_api_key_manager(manager: APIKeyManager | None) -> None:
+    """Replace the global API key manager (e.g. with a custom store)."""
+    global _api_key_manager
+    _api_key_manager = manager
+
+
+__all__ = [
+    "APIKeyManager",
+    "APIKeyRecord",
+    "APIKeyStore",
+    "InMemoryAPIKeyStore",
+    "configure_api_key_manager",
+    "get_api_key_manager",
+    "hash_secret",
+]
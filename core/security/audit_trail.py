@@ -1,18 +1,47 @@
-"""Immutable audit trail system."""
+"""Immutable audit trail system.
+
+Events are hash-chained and stored in append-only segment files that roll by
+size, event count or age. Rolling a segment seals it: a manifest records the
+tail hash and a Merkle root over the segment's event hashes, and a sidecar
+holds secondary indexes (user, event type, time bucket) plus line offsets.
+Only the active segment and a small LRU of sealed indexes stay in memory, so
+queries touch the matching events only, and ``verify_chain`` re-hashes just
+the segments that have not been verified yet.
+
+Layout of ``storage_path``::
+
+    segment-000001.jsonl       events, one JSON object per line
+    segment-000001.seal.json   checkpoint: counts, tail hash, Merkle root
+    segment-000001.idx.json    offsets and secondary indexes
+    verified.json              Merkle roots of segments already verified
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
 import logging
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEGMENT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_SEGMENT_MAX_EVENTS = 100_000
+DEFAULT_SEGMENT_MAX_AGE = timedelta(hours=24)
+DEFAULT_BUCKET_SECONDS = 3600
+DEFAULT_INDEX_CACHE_SEGMENTS = 8
+
+_EPOCH = datetime(1970, 1, 1)
+_VERIFIED_STATE = "verified.json"
+
 
 class AuditEventType(str, Enum):
     """Types of audit events."""
@@ -115,46 +144,429 @@ class AuditEvent:
         }
 
 
+def merkle_root(leaf_hashes: Iterable[str]) -> str:
+    """Compute the Merkle root of hex-encoded SHA256 leaf hashes.
+
+    An odd node at any level is carried up unchanged rather than paired
+    with itself, so no two distinct leaf lists share a root.
+
+    Args:
+        leaf_hashes: Event hashes in chain order
+
+    Returns:
+        Hex root hash, or "" for no leaves
+    """
+    level = [bytes.fromhex(h) for h in leaf_hashes]
+    if not level:
+        return ""
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def _time_bucket(timestamp: datetime, bucket_seconds: int) -> int:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    return int((timestamp - _EPOCH).total_seconds()) // bucket_seconds
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    tmp.replace(path)
+
+
+@dataclass
+class _SegmentIndex:
+    """Line offsets and posting lists (positions within one segment)."""
+
+    offsets: array = field(default_factory=lambda: array("Q"))
+    by_user: dict[str, array] = field(default_factory=dict)
+    by_type: dict[str, array] = field(default_factory=dict)
+    by_bucket: dict[int, array] = field(default_factory=dict)
+
+    def add(self, position: int, event: AuditEvent, bucket: int) -> None:
+        if event.user_id is not None:
+            self.by_user.setdefault(event.user_id, array("I")).append(position)
+        self.by_type.setdefault(event.event_type.value, array("I")).append(position)
+        self.by_bucket.setdefault(bucket, array("I")).append(position)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "offsets": self.offsets.tolist(),
+            "user": {k: v.tolist() for k, v in self.by_user.items()},
+            "event_type": {k: v.tolist() for k, v in self.by_type.items()},
+            "bucket": {str(k): v.tolist() for k, v in self.by_bucket.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _SegmentIndex:
+        return cls(
+            offsets=array("Q", data["offsets"]),
+            by_user={k: array("I", v) for k, v in data["user"].items()},
+            by_type={k: array("I", v) for k, v in data["event_type"].items()},
+            by_bucket={int(k): array("I", v) for k, v in data["bucket"].items()},
+        )
+
+
+@dataclass
+class _Segment:
+    """One append-only run of the chain.
+
+    ``events`` and ``index`` are held for the active segment (and for every
+    segment in memory-only mode); sealed file segments keep just the summary
+    and load their index on demand.
+    """
+
+    seq: int
+    start: int
+    first_previous_hash: str
+    path: Path | None = None
+    count: int = 0
+    size: int = 0
+    first_timestamp: datetime | None = None
+    last_timestamp: datetime | None = None
+    tail_hash: str = ""
+    merkle_root: str = ""
+    sealed: bool = False
+    verified_upto: int = 0
+    users: frozenset[str] = frozenset()
+    event_types: frozenset[str] = frozenset()
+    events: list[AuditEvent] | None = None
+    index: _SegmentIndex | None = None
+
+    @property
+    def seal_path(self) -> Path:
+        return self.path.with_suffix(".seal.json")  # type: ignore[union-attr]
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx.json")  # type: ignore[union-attr]
+
+    def manifest(self) -> dict[str, Any]:
+        return {
+            "segment": self.seq,
+            "start": self.start,
+            "count": self.count,
+            "size": self.size,
+            "first_timestamp": self.first_timestamp.isoformat() if self.first_timestamp else None,
+            "last_timestamp": self.last_timestamp.isoformat() if self.last_timestamp else None,
+            "first_previous_hash": self.first_previous_hash,
+            "tail_hash": self.tail_hash,
+            "merkle_root": self.merkle_root,
+            "users": sorted(self.users),
+            "event_types": sorted(self.event_types),
+            "sealed_at": datetime.utcnow().isoformat(),
+        }
+
+    @classmethod
+    def from_manifest(cls, path: Path, data: dict[str, Any]) -> _Segment:
+        return cls(
+            seq=data["segment"],
+            start=data["start"],
+            first_previous_hash=data["first_previous_hash"],
+            path=path,
+            count=data["count"],
+            size=data["size"],
+            first_timestamp=(
+                datetime.fromisoformat(data["first_timestamp"]) if data["first_timestamp"] else None
+            ),
+            last_timestamp=(
+                datetime.fromisoformat(data["last_timestamp"]) if data["last_timestamp"] else None
+            ),
+            tail_hash=data["tail_hash"],
+            merkle_root=data["merkle_root"],
+            sealed=True,
+            users=frozenset(data["users"]),
+            event_types=frozenset(data["event_types"]),
+        )
+
+
 class AuditTrail:
-    """Manages immutable audit trail with blockchain-like integrity."""
+    """Manages immutable audit trail with blockchain-like integrity.
+
+    Example:
+        >>> trail = AuditTrail(Path("audits/trail"), segment_max_events=100_000)
+        >>> trail.log_event(
+        ...     AuditEventType.LOGIN, "user-1", "session", None, "login", "success"
+        ... )
+        >>> trail.get_user_activity("user-1")[0].action
+        'login'
+        >>> trail.verify_chain()  # re-hashes only unverified segments
+        True
+    """
 
-    def __init__(self, storage_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        storage_path: Path | None = None,
+        *,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        segment_max_events: int = DEFAULT_SEGMENT_MAX_EVENTS,
+        segment_max_age: timedelta = DEFAULT_SEGMENT_MAX_AGE,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        index_cache_segments: int = DEFAULT_INDEX_CACHE_SEGMENTS,
+    ) -> None:
         """Initialize audit trail.
 
         Args:
-            storage_path: Path to store audit logs (None for in-memory only)
+            storage_path: Directory for segment files (None for in-memory only).
+                A single JSONL file at this path from earlier versions is
+                migrated into segments and kept as ``<name>.legacy``.
+            segment_max_bytes: Roll the active segment file at this size
+            segment_max_events: Roll the active segment at this many events
+            segment_max_age: Roll the active segment once its first event is this old
+            bucket_seconds: Width of the time-bucket index
+            index_cache_segments: Sealed segment indexes kept in memory
         """
         self.storage_path = storage_path
-        self.events: list[AuditEvent] = []
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_events = segment_max_events
+        self.segment_max_age = segment_max_age
+        self.bucket_seconds = bucket_seconds
+        self.index_cache_segments = index_cache_segments
         self.last_hash = ""
 
-        if storage_path:
-            storage_path.parent.mkdir(parents=True, exist_ok=True)
-            self._load_existing_events()
+        self._segments: list[_Segment] = []
+        self._index_cache: OrderedDict[int, _SegmentIndex] = OrderedDict()
+        self._writer: IO[bytes] | None = None
+        self._lock = threading.RLock()
 
-        logger.info(f"AuditTrail initialized (storage: {'file' if storage_path else 'memory'})")
+        if storage_path:
+            if storage_path.is_file():
+                self._migrate_legacy_file()
+            else:
+                storage_path.mkdir(parents=True, exist_ok=True)
+                self._load_segments()
+        if not self._segments or self._segments[-1].sealed:
+            self._open_segment()
+
+        if self._segments[0].count and not self.verify_chain():
+            logger.error("Audit trail integrity verification failed!")
+
+        logger.info(
+            f"AuditTrail initialized (storage: {'file' if storage_path else 'memory'}, "
+            f"{len(self)} events in {len(self._segments)} segments)"
+        )
 
-    def _load_existing_events(self) -> None:
-        """Load existing audit events from storage."""
-        if not self.storage_path or not self.storage_path.exists():
-            return
+    def __len__(self) -> int:
+        return sum(seg.count for seg in self._segments)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _load_segments(self) -> None:
+        """Load segment summaries; only the unsealed tail is read in full."""
+        assert self.storage_path is not None
+        verified = self._read_verified_state()
+
+        for path in sorted(self.storage_path.glob("segment-*.jsonl")):
+            seal_path = path.with_suffix(".seal.json")
+            if seal_path.exists():
+                seg = _Segment.from_manifest(path, json.loads(seal_path.read_text("utf-8")))
+                if verified.get(str(seg.seq)) == [seg.merkle_root, path.stat().st_size]:
+                    seg.verified_upto = seg.count
+            else:
+                seg = self._load_unsealed(path)
+            previous = self._segments[-1] if self._segments else None
+            if previous is not None and not previous.sealed:
+                # Crashed between rolling and sealing: check before checkpointing
+                if not self._verify_segment(previous):
+                    logger.error(f"Sealing unverifiable audit segment {previous.seq}")
+                self._seal(previous)
+            self._segments.append(seg)
+            self.last_hash = seg.tail_hash or self.last_hash
+
+        if self._segments and not self._segments[-1].sealed:
+            self._writer = self._segments[-1].path.open("ab")  # type: ignore[union-attr]
+
+        logger.info(f"Loaded {len(self)} audit events from {len(self._segments)} segments")
+
+    def _load_unsealed(self, path: Path) -> _Segment:
+        seq = int(path.stem.split("-")[1])
+        seg = _Segment(
+            seq=seq,
+            start=self._segments[-1].start + self._segments[-1].count if self._segments else 0,
+            first_previous_hash=self.last_hash,
+            path=path,
+            events=[],
+            index=_SegmentIndex(),
+        )
+        with path.open("rb") as f:
+            offset = 0
+            for line in f:
+                if not line.strip():
+                    offset += len(line)
+                    continue
+                try:
+                    event = self._dict_to_event(json.loads(line))
+                except (ValueError, KeyError) as e:
+                    logger.error(f"Failed to load audit event at {path}:{offset}: {e}")
+                    break
+                if seg.count == 0:
+                    seg.first_previous_hash = event.previous_hash
+                self._add_to_segment(seg, event, offset, len(line))
+                offset += len(line)
+        return seg
+
+    def _migrate_legacy_file(self) -> None:
+        """Move a single-file JSONL trail from earlier versions into segments."""
+        assert self.storage_path is not None
+        legacy = self.storage_path.with_name(self.storage_path.name + ".legacy")
+        self.storage_path.replace(legacy)
+        self.storage_path.mkdir(parents=True)
+        self._open_segment()
+
+        with legacy.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self._append(self._dict_to_event(json.loads(line)), verified=False)
+        logger.info(f"Migrated {len(self)} audit events from {legacy}")
+
+    def _open_segment(self) -> _Segment:
+        last = self._segments[-1] if self._segments else None
+        seq = last.seq + 1 if last else 1
+        seg = _Segment(
+            seq=seq,
+            start=last.start + last.count if last else 0,
+            first_previous_hash=self.last_hash,
+            events=[],
+            index=_SegmentIndex(),
+        )
+        if self.storage_path:
+            seg.path = self.storage_path / f"segment-{seq:06d}.jsonl"
+            self._writer = seg.path.open("ab")
+        self._segments.append(seg)
+        return seg
+
+    def _should_roll(self, seg: _Segment, timestamp: datetime) -> bool:
+        if not seg.count:
+            return False
+        if seg.count >= self.segment_max_events:
+            return True
+        if seg.path is not None and seg.size >= self.segment_max_bytes:
+            return True
+        return timestamp - seg.first_timestamp >= self.segment_max_age  # type: ignore[operator]
 
-        try:
-            with self.storage_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    event_data = json.loads(line.strip())
-                    event = self._dict_to_event(event_data)
-                    self.events.append(event)
-                    self.last_hash = event.current_hash
+    def _seal(self, seg: _Segment) -> None:
+        """Write the segment checkpoint and drop its events from memory."""
+        assert seg.events is not None and seg.index is not None
+        seg.merkle_root = merkle_root(e.current_hash for e in seg.events)
+        seg.users = frozenset(seg.index.by_user)
+        seg.event_types = frozenset(seg.index.by_type)
+        seg.sealed = True
 
-            logger.info(f"Loaded {len(self.events)} audit events from storage")
+        if seg.path is None:
+            return
 
-            # Verify chain integrity
-            if not self.verify_chain():
-                logger.error("Audit trail integrity verification failed!")
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        _write_json_atomic(seg.index_path, seg.index.to_dict())
+        _write_json_atomic(seg.seal_path, seg.manifest())
+        self._cache_index(seg.seq, seg.index)
+        seg.events = None
+        seg.index = None
+        if seg.verified_upto == seg.count:
+            self._write_verified_state()
+        logger.info(
+            f"Sealed audit segment {seg.seq}: {seg.count} events, merkle root {seg.merkle_root}"
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to load audit events: {e}")
+    def _add_to_segment(self, seg: _Segment, event: AuditEvent, offset: int, size: int) -> None:
+        assert seg.events is not None and seg.index is not None
+        position = seg.count
+        if seg.path is not None:
+            seg.index.offsets.append(offset)
+        seg.index.add(position, event, _time_bucket(event.timestamp, self.bucket_seconds))
+        seg.events.append(event)
+        seg.count += 1
+        seg.size += size
+        seg.tail_hash = event.current_hash
+        if seg.first_timestamp is None:
+            seg.first_timestamp = event.timestamp
+        seg.last_timestamp = event.timestamp
+
+    def _append(self, event: AuditEvent, *, verified: bool = True) -> None:
+        """Append an already-hashed event to the active segment."""
+        with self._lock:
+            seg = self._segments[-1]
+            if self._should_roll(seg, event.timestamp):
+                self._seal(seg)
+                seg = self._open_segment()
+
+            caught_up = seg.verified_upto == seg.count
+            line = (json.dumps(event.to_dict()) + "\n").encode()
+            if self._writer is not None:
+                try:
+                    self._writer.write(line)
+                    self._writer.flush()
+                except Exception as e:
+                    logger.error(f"Failed to persist audit event: {e}")
+            self._add_to_segment(seg, event, seg.size, len(line))
+            if verified and caught_up:
+                seg.verified_upto = seg.count
+            self.last_hash = event.current_hash
+
+    def close(self) -> None:
+        """Close the active segment file."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def _segment_index(self, seg: _Segment) -> _SegmentIndex:
+        if seg.index is not None:
+            return seg.index
+        index = self._index_cache.get(seg.seq)
+        if index is None:
+            index = _SegmentIndex.from_dict(json.loads(seg.index_path.read_text("utf-8")))
+            self._cache_index(seg.seq, index)
+        else:
+            self._index_cache.move_to_end(seg.seq)
+        return index
+
+    def _cache_index(self, seq: int, index: _SegmentIndex) -> None:
+        self._index_cache[seq] = index
+        while len(self._index_cache) > self.index_cache_segments:
+            self._index_cache.popitem(last=False)
+
+    def _iter_segment_events(self, seg: _Segment) -> Iterator[AuditEvent]:
+        if seg.events is not None:
+            yield from seg.events
+            return
+        with seg.path.open("rb") as f:  # type: ignore[union-attr]
+            for line in f:
+                if line.strip():
+                    yield self._dict_to_event(json.loads(line))
+
+    def iter_events(self) -> Iterator[AuditEvent]:
+        """Iterate over every event, oldest first."""
+        for seg in list(self._segments):
+            yield from self._iter_segment_events(seg)
+
+    def _read_verified_state(self) -> dict[str, list[Any]]:
+        path = self.storage_path / _VERIFIED_STATE  # type: ignore[operator]
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text("utf-8"))
+        except ValueError:
+            return {}
+
+    def _write_verified_state(self) -> None:
+        state = {
+            str(seg.seq): [seg.merkle_root, seg.size]
+            for seg in self._segments
+            if seg.sealed and seg.verified_upto == seg.count
+        }
+        _write_json_atomic(self.storage_path / _VERIFIED_STATE, state)  # type: ignore[operator]
 
     def _dict_to_event(self, data: dict[str, Any]) -> AuditEvent:
         """Convert dictionary to AuditEvent.
@@ -214,32 +626,28 @@ class AuditTrail:
             f"{datetime.utcnow().isoformat()}{user_id}{action}".encode()
         ).hexdigest()[:16]
 
-        # Create event
-        event = AuditEvent(
-            event_id=event_id,
-            event_type=event_type,
-            timestamp=datetime.utcnow(),
-            user_id=user_id,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            action=action,
-            result=result,
-            details=details or {},
-            ip_address=ip_address,
-            user_agent=user_agent,
-            previous_hash=self.last_hash,
-        )
-
-        # Calculate hash for integrity
-        event.current_hash = event.calculate_hash()
+        with self._lock:
+            # Create event
+            event = AuditEvent(
+                event_id=event_id,
+                event_type=event_type,
+                timestamp=datetime.utcnow(),
+                user_id=user_id,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                action=action,
+                result=result,
+                details=details or {},
+                ip_address=ip_address,
+                user_agent=user_agent,
+                previous_hash=self.last_hash,
+            )
 
-        # Add to chain
-        self.events.append(event)
-        self.last_hash = event.current_hash
+            # Calculate hash for integrity
+            event.current_hash = event.calculate_hash()
 
-        # Persist to storage
-        if self.storage_path:
-            self._append_to_storage(event)
+            # Add to chain (and persist to the active segment)
+            self._append(event)
 
         logger.debug(
             f"Audit event logged: {event_type} by {user_id} on {resource_type}/{resource_id}"
@@ -247,49 +655,119 @@ class AuditTrail:
 
         return event
 
-    def _append_to_storage(self, event: AuditEvent) -> None:
-        """Append event to persistent storage.
-
-        Args:
-            event: Event to append
-        """
-        try:
-            with self.storage_path.open("a", encoding="utf-8") as f:  # type: ignore[union-attr]
-                f.write(json.dumps(event.to_dict()) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to persist audit event: {e}")
-
-    def verify_chain(self) -> bool:
-        """Verify integrity of entire audit chain.
-
-        Returns:
-            True if chain is valid
-        """
-        if not self.events:
-            return True
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def _verify_segment(self, seg: _Segment) -> bool:
+        """Re-hash the unverified part of one segment and check its checkpoint."""
+        start = 0 if seg.sealed else seg.verified_upto
+        expected_previous = seg.first_previous_hash
+        leaves: list[str] = []
+        count = 0
+
+        for i, event in enumerate(self._iter_segment_events(seg)):
+            count += 1
+            if seg.sealed:
+                leaves.append(event.current_hash)
+            if i < start:
+                expected_previous = event.current_hash
+                continue
 
-        for i, event in enumerate(self.events):
-            # Verify hash
+            if event.previous_hash != expected_previous:
+                logger.error(
+                    f"Chain break at event {seg.start + i} ({event.event_id}): "
+                    "previous_hash doesn't match"
+                )
+                return False
             expected_hash = event.calculate_hash()
             if event.current_hash != expected_hash:
                 logger.error(
-                    f"Hash mismatch at event {i} ({event.event_id}): "
+                    f"Hash mismatch at event {seg.start + i} ({event.event_id}): "
                     f"expected {expected_hash}, got {event.current_hash}"
                 )
                 return False
+            expected_previous = event.current_hash
+
+        if count != seg.count or (count and expected_previous != seg.tail_hash):
+            logger.error(f"Audit segment {seg.seq} does not match its recorded tail")
+            return False
+        if seg.sealed and merkle_root(leaves) != seg.merkle_root:
+            logger.error(f"Merkle root mismatch in sealed audit segment {seg.seq}")
+            return False
+
+        seg.verified_upto = count
+        return True
+
+    def verify_chain(self, full: bool = False) -> bool:
+        """Verify integrity of the audit chain.
+
+        Segment links are always checked; events are re-hashed only in
+        segments (or the tail of the active segment) not verified before.
 
-            # Verify chain link
-            if i > 0:
-                previous_event = self.events[i - 1]
-                if event.previous_hash != previous_event.current_hash:
-                    logger.error(
-                        f"Chain break at event {i} ({event.event_id}): previous_hash doesn't match"
-                    )
+        Args:
+            full: Re-hash every event, ignoring earlier verification
+
+        Returns:
+            True if chain is valid
+        """
+        with self._lock:
+            checked = 0
+            newly_sealed = False
+            for i, seg in enumerate(self._segments):
+                if i > 0 and seg.first_previous_hash != self._segments[i - 1].tail_hash:
+                    logger.error(f"Chain break between audit segments {seg.seq - 1} and {seg.seq}")
+                    return False
+                if full:
+                    seg.verified_upto = 0
+                if seg.verified_upto == seg.count:
+                    continue
+
+                checked += seg.count - (0 if seg.sealed else seg.verified_upto)
+                if not self._verify_segment(seg):
                     return False
+                newly_sealed = newly_sealed or seg.sealed
 
-        logger.info(f"Audit chain verified: {len(self.events)} events")
+            if newly_sealed and self.storage_path:
+                self._write_verified_state()
+
+        logger.info(f"Audit chain verified: {len(self)} events ({checked} re-hashed)")
         return True
 
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _candidates(
+        self,
+        seg: _Segment,
+        event_type: AuditEventType | None,
+        user_id: str | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+    ) -> Iterable[int]:
+        """Positions in ``seg`` that may match, from the most selective index."""
+        index = self._segment_index(seg)
+        postings = []
+        if user_id:
+            postings.append(index.by_user.get(user_id, array("I")))
+        if event_type:
+            postings.append(index.by_type.get(event_type.value, array("I")))
+        if postings:
+            return min(postings, key=len)
+
+        if start_time or end_time:
+            low = _time_bucket(start_time, self.bucket_seconds) if start_time else None
+            high = _time_bucket(end_time, self.bucket_seconds) if end_time else None
+            buckets = [
+                b
+                for b in index.by_bucket
+                if (low is None or b >= low) and (high is None or b <= high)
+            ]
+            if len(buckets) < len(index.by_bucket):
+                return sorted(p for b in buckets for p in index.by_bucket[b])
+        return range(seg.count)
+
     def query_events(
         self,
         event_type: AuditEventType | None = None,
@@ -312,25 +790,55 @@ class AuditTrail:
         Returns:
             List of matching events
         """
-        results = []
-
-        for event in reversed(self.events):  # Most recent first
-            # Apply filters
-            if event_type and event.event_type != event_type:
-                continue
-            if user_id and event.user_id != user_id:
-                continue
-            if resource_type and event.resource_type != resource_type:
-                continue
-            if start_time and event.timestamp < start_time:
-                continue
-            if end_time and event.timestamp > end_time:
-                continue
-
-            results.append(event)
-
-            if len(results) >= limit:
-                break
+        results: list[AuditEvent] = []
+
+        with self._lock:
+            for seg in reversed(self._segments):  # Most recent first
+                if not seg.count:
+                    continue
+                # Prune whole segments from their summary before touching the index
+                if start_time and seg.last_timestamp < start_time:  # type: ignore[operator]
+                    continue
+                if end_time and seg.first_timestamp > end_time:  # type: ignore[operator]
+                    continue
+                if seg.sealed and user_id and user_id not in seg.users:
+                    continue
+                if seg.sealed and event_type and event_type.value not in seg.event_types:
+                    continue
+
+                candidates = self._candidates(seg, event_type, user_id, start_time, end_time)
+                reader = seg.path.open("rb") if seg.events is None else None  # type: ignore[union-attr]
+                try:
+                    offsets = self._segment_index(seg).offsets
+                    for position in reversed(candidates):
+                        if seg.events is not None:
+                            event = seg.events[position]
+                        else:
+                            reader.seek(offsets[position])  # type: ignore[union-attr]
+                            event = self._dict_to_event(json.loads(reader.readline()))  # type: ignore[union-attr]
+
+                        # Apply filters
+                        if event_type and event.event_type != event_type:
+                            continue
+                        if user_id and event.user_id != user_id:
+                            continue
+                        if resource_type and event.resource_type != resource_type:
+                            continue
+                        if start_time and event.timestamp < start_time:
+                            continue
+                        if end_time and event.timestamp > end_time:
+                            continue
+
+                        results.append(event)
+
+                        if len(results) >= limit:
+                            break
+                finally:
+                    if reader is not None:
+                        reader.close()
+
+                if len(results) >= limit:
+                    break
 
         logger.debug(f"Query returned {len(results)} events")
         return results
@@ -356,8 +864,6 @@ class AuditTrail:
         Returns:
             List of security events
         """
-        from datetime import timedelta
-
         start_time = datetime.utcnow() - timedelta(hours=hours)
 
         security_types = [
@@ -379,6 +885,22 @@ class AuditTrail:
 
         return results
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get segment and verification statistics.
+
+        Returns:
+            Dictionary with event, segment and index cache counts
+        """
+        with self._lock:
+            return {
+                "events": len(self),
+                "segments": len(self._segments),
+                "sealed_segments": sum(seg.sealed for seg in self._segments),
+                "unverified_events": sum(seg.count - seg.verified_upto for seg in self._segments),
+                "cached_indexes": len(self._index_cache),
+                "active_segment_bytes": self._segments[-1].size,
+            }
+
 
 # Global instance
 _audit_trail: AuditTrail | None = None
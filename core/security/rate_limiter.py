@@ -0,0 +1,371 @@
+"""
+Distributed rate limiting backed by Redis Lua scripts.
+
+Per-process buckets let each API worker admit the full limit (N workers admit
+N times the configured rate) and keep one entry per client forever. The
+``RedisRateLimiter`` keeps state in Redis instead: each check is one atomic
+Lua script (refill-and-take for the token bucket, rotate-and-count for the
+sliding window) using the Redis server clock, and every key expires once it
+could no longer affect a decision. ``hit_all`` checks several rules (e.g. per
+minute and per hour) in one script and charges them only if all admit the
+request, so a rejection never consumes another rule's budget.
+
+When Redis is unreachable the limiter degrades to ``LocalRateLimiter`` (same
+algorithms, bounded LRU of keys) and retries Redis after a short back-off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Literal
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Algorithm = Literal["token_bucket", "sliding_window"]
+
+DEFAULT_MAX_LOCAL_KEYS = 100_000
+
+# KEYS[i] state hash of rule i; ARGV: now_ms ('' = Redis server clock), cost,
+# then algorithm, limit, window_ms per rule. Every rule is checked before any
+# is charged, so a request denied by one rule consumes none of the others.
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms} per rule.
+RATE_LIMIT_LUA = """
+local unpack = unpack or table.unpack
+local now = tonumber(ARGV[1])
+if not now then
+    local t = redis.call('TIME')
+    now = t[1] * 1000 + math.floor(t[2] / 1000)
+end
+local cost = tonumber(ARGV[2])
+
+local results = {}
+local writes = {}
+local admitted = true
+for i, key in ipairs(KEYS) do
+    local algorithm = ARGV[i * 3]
+    local limit = tonumber(ARGV[i * 3 + 1])
+    local window = tonumber(ARGV[i * 3 + 2])
+
+    if algorithm == 'token_bucket' then
+        local rate = limit / window
+        local state = redis.call('HMGET', key, 'tokens', 'ts')
+        local tokens = tonumber(state[1]) or limit
+        local ts = tonumber(state[2]) or now
+        if now > ts then
+            tokens = math.min(limit, tokens + (now - ts) * rate)
+            ts = now
+        end
+        if tokens >= cost then
+            tokens = tokens - cost
+            local reset = math.ceil((limit - tokens) / rate)
+            writes[i] = {math.max(reset, 1), 'tokens', tostring(tokens), 'ts', ts}
+            results[i] = {1, math.floor(tokens), 0, reset}
+        else
+            admitted = false
+            results[i] = {
+                0, math.floor(tokens), math.ceil((cost - tokens) / rate),
+                math.ceil((limit - tokens) / rate),
+            }
+        end
+    else
+        -- Weighted two-window counter: O(1) memory per key, approximates a true log
+        local start = now - (now % window)
+        local state = redis.call('HMGET', key, 'start', 'curr', 'prev')
+        local cur_start = tonumber(state[1]) or start
+        local curr = tonumber(state[2]) or 0
+        local prev = tonumber(state[3]) or 0
+        if cur_start ~= start then
+            if start - cur_start == window then prev = curr else prev = 0 end
+            curr = 0
+        end
+
+        local elapsed = now - start
+        local used = prev * (window - elapsed) / window + curr
+        if used + cost > limit then
+            admitted = false
+            local retry = window - elapsed
+            if curr + cost <= limit and prev > 0 then
+                local needed = window * (1 - (limit - curr - cost) / prev)
+                retry = math.max(1, math.ceil(needed - elapsed))
+            end
+            results[i] = {0, 0, retry, window - elapsed}
+        else
+            writes[i] = {2 * window - elapsed, 'start', start, 'curr', curr + cost, 'prev', prev}
+            results[i] = {1, math.floor(limit - used - cost), 0, window - elapsed}
+        end
+    end
+end
+
+if admitted then
+    for i, key in ipairs(KEYS) do
+        redis.call('HSET', key, unpack(writes[i], 2))
+        redis.call('PEXPIRE', key, writes[i][1])
+    end
+end
+return results
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitRule:
+    """``limit`` requests per ``window_seconds`` using ``algorithm``."""
+
+    limit: int
+    window_seconds: float
+    algorithm: Algorithm = "token_bucket"
+
+    def __post_init__(self) -> None:
+        if self.limit < 1:
+            raise ValueError("limit must be >= 1")
+        if self.window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+
+    @property
+    def window_ms(self) -> int:
+        return max(1, int(self.window_seconds * 1000))
+
+    @property
+    def label(self) -> str:
+        """Stable identifier used in storage keys, e.g. ``tb:60:60000``."""
+        short = "tb" if self.algorithm == "token_bucket" else "sw"
+        return f"{short}:{self.limit}:{self.window_ms}"
+
+
+@dataclass(frozen=True, slots=True)
+class RouteTier:
+    """Rules applied to requests whose path starts with one of ``prefixes``."""
+
+    name: str
+    prefixes: tuple[str, ...]
+    rules: tuple[RateLimitRule, ...]
+
+
+@dataclass(slots=True)
+class RateLimitResult:
+    """Outcome of one rate-limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+    backend: str = "local"
+
+
+def resolve_tier(path: str, tiers: list[RouteTier], default: RouteTier) -> RouteTier:
+    """Pick the tier with the longest prefix matching ``path``."""
+    best = default
+    best_len = -1
+    for tier in tiers:
+        for prefix in tier.prefixes:
+            if path.startswith(prefix) and len(prefix) > best_len:
+                best, best_len = tier, len(prefix)
+    return best
+
+
+class LocalRateLimiter:
+    """
+    In-process token bucket / sliding window limiter with a bounded key LRU.
+
+    Used on its own for single-worker deployments and as the Redis fallback.
+
+    Example:
+        >>> limiter = LocalRateLimiter()
+        >>> result = await limiter.hit("ip:1.2.3.4", RateLimitRule(60, 60))
+        >>> result.allowed, result.remaining
+        (True, 59)
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_LOCAL_KEYS) -> None:
+        """
+        Args:
+            max_keys: Least recently used keys beyond this are forgotten
+        """
+        self.max_keys = max_keys
+        self._state: OrderedDict[str, list[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    async def hit(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        """Consume ``cost`` units of ``rule`` for ``key``."""
+        [result] = await self.hit_all(key, (rule,), cost)
+        return result
+
+    async def hit_all(
+        self, key: str, rules: Sequence[RateLimitRule], cost: int = 1
+    ) -> list[RateLimitResult]:
+        """Consume ``cost`` units of every rule for ``key``, or of none if any denies."""
+        now = time.monotonic()
+        results = []
+        updates = []
+        for rule in rules:
+            state_key = f"{rule.label}:{key}"
+            state = self._state.get(state_key)
+            if rule.algorithm == "token_bucket":
+                result, state = self._token_bucket(state, rule, cost, now)
+            else:
+                result, state = self._sliding_window(state, rule, cost, now)
+            results.append(result)
+            updates.append((state_key, state))
+
+        if all(result.allowed for result in results):
+            for state_key, state in updates:
+                self._state.pop(state_key, None)
+                self._state[state_key] = state
+            while len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        return results
+
+    @staticmethod
+    def _token_bucket(
+        state: list[float] | None, rule: RateLimitRule, cost: int, now: float
+    ) -> tuple[RateLimitResult, list[float]]:
+        rate = rule.limit / rule.window_seconds
+        tokens, ts = state if state is not None else (float(rule.limit), now)
+        tokens = min(float(rule.limit), tokens + (now - ts) * rate)
+
+        allowed = tokens >= cost
+        retry = 0.0
+        if allowed:
+            tokens -= cost
+        else:
+            retry = (cost - tokens) / rate
+        reset = (rule.limit - tokens) / rate
+        return (
+            RateLimitResult(allowed, rule.limit, math.floor(tokens), retry, reset),
+            [tokens, now],
+        )
+
+    @staticmethod
+    def _sliding_window(
+        state: list[float] | None, rule: RateLimitRule, cost: int, now: float
+    ) -> tuple[RateLimitResult, list[float]]:
+        window = rule.window_seconds
+        start = now - (now % window)
+        cur_start, curr, prev = state if state is not None else (start, 0.0, 0.0)
+        if cur_start != start:
+            prev = curr if math.isclose(start - cur_start, window) else 0.0
+            curr = 0.0
+
+        elapsed = now - start
+        used = prev * (window - elapsed) / window + curr
+        if used + cost > rule.limit:
+            retry = window - elapsed
+            if curr + cost <= rule.limit and prev > 0:
+                retry = window * (1 - (rule.limit - curr - cost) / prev) - elapsed
+            result = RateLimitResult(False, rule.limit, 0, max(retry, 0.0), window - elapsed)
+            return result, [start, curr, prev]
+
+        curr += cost
+        remaining = math.floor(rule.limit - used - cost)
+        return (
+            RateLimitResult(True, rule.limit, remaining, 0.0, window - elapsed),
+            [start, curr, prev],
+        )
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed limiter shared by every worker, with local fallback.
+
+    Example:
+        >>> limiter = RedisRateLimiter(await get_redis_client())
+        >>> result = await limiter.hit(
+        ...     "user:42", RateLimitRule(10, 60, algorithm="sliding_window")
+        ... )
+        >>> result.backend
+        'redis'
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        prefix: str = "ratelimit",
+        fallback: LocalRateLimiter | None = None,
+        retry_interval: float = 5.0,
+        timeout: float = 0.25,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """
+        Args:
+            redis_client: ``redis.asyncio`` client
+            prefix: Key namespace
+            fallback: Limiter used while Redis is unreachable
+            retry_interval: Seconds to stay on the fallback after a Redis error
+            timeout: Seconds allowed per Redis check before falling back
+            clock: Epoch-seconds clock passed to the script; by default the
+                Redis server clock is used so every worker agrees on time
+        """
+        self.redis = redis_client
+        self.prefix = prefix
+        self.fallback = fallback or LocalRateLimiter()
+        self.retry_interval = retry_interval
+        self.timeout = timeout
+        self.clock = clock
+        self._script = redis_client.register_script(RATE_LIMIT_LUA)
+        self._unavailable_until = 0.0
+
+    @property
+    def degraded(self) -> bool:
+        """True while checks are served by the local fallback."""
+        return time.monotonic() < self._unavailable_until
+
+    async def hit(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        """Consume ``cost`` units of ``rule`` for ``key``."""
+        [result] = await self.hit_all(key, (rule,), cost)
+        return result
+
+    async def hit_all(
+        self, key: str, rules: Sequence[RateLimitRule], cost: int = 1
+    ) -> list[RateLimitResult]:
+        """Consume ``cost`` units of every rule for ``key``, or of none if any denies."""
+        if self.degraded:
+            return await self.fallback.hit_all(key, rules, cost)
+
+        # The hash tag keeps all of a key's rules in one cluster slot for the script
+        keys = [f"{self.prefix}:{{{key}}}:{rule.label}" for rule in rules]
+        args: list[Any] = ["" if self.clock is None else int(self.clock() * 1000), cost]
+        for rule in rules:
+            args += [rule.algorithm, rule.limit, rule.window_ms]
+        try:
+            replies = await asyncio.wait_for(self._script(keys=keys, args=args), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._unavailable_until = time.monotonic() + self.retry_interval
+            logger.warning(
+                "rate_limiter_redis_unavailable",
+                error=str(e),
+                retry_in_s=self.retry_interval,
+            )
+            return await self.fallback.hit_all(key, rules, cost)
+
+        return [
+            RateLimitResult(
+                allowed=bool(int(allowed)),
+                limit=rule.limit,
+                remaining=int(remaining),
+                retry_after=int(retry_ms) / 1000,
+                reset_after=int(reset_ms) / 1000,
+                backend="redis",
+            )
+            for rule, (allowed, remaining, retry_ms, reset_ms) in zip(rules, replies, strict=True)
+        ]
+
+__all__ = [
+    "LocalRateLimiter",
+    "RateLimitResult",
+    "RateLimitRule",
+    "RedisRateLimiter",
+    "RouteTier",
+    "resolve_tier",
+]
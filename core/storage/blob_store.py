@@ -0,0 +1,236 @@
+"""Content-addressed blob storage for uploaded exhibits.
+
+Uploads are streamed to a temporary file in fixed-size chunks while their
+SHA-256 is computed, then stored exactly once under that hash. Exhibits in
+different workflow threads that upload the same PDF point at the same blob.
+
+Backends:
+    * LocalBlobStore - ``<root>/<sha[:2]>/<sha>`` on local disk (default)
+    * R2BlobStore - ``blobs/<sha>`` objects in Cloudflare R2
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import aiofiles
+import aiofiles.os
+import structlog
+
+if TYPE_CHECKING:
+    from .r2_storage import R2Storage
+
+logger = structlog.get_logger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class BlobTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds maximum size of {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass(slots=True)
+class BlobRef:
+    """Result of storing a blob."""
+
+    sha256: str
+    size: int
+    location: str
+    deduplicated: bool
+
+
+class BlobStore(ABC):
+    """Shared spooling/hashing logic; subclasses decide where blobs live."""
+
+    def __init__(self, spool_dir: str | Path, *, chunk_size: int = CHUNK_SIZE) -> None:
+        self.spool_dir = Path(spool_dir)
+        self.chunk_size = chunk_size
+
+    async def put_stream(
+        self, chunks: AsyncIterable[bytes], *, max_bytes: int | None = None
+    ) -> BlobRef:
+        """
+        Store a byte stream under its SHA-256, skipping the write if it already exists.
+
+        Args:
+            chunks: Async iterable of byte chunks
+            max_bytes: Reject streams larger than this (raises BlobTooLargeError)
+
+        Returns:
+            BlobRef describing the stored (or already present) blob
+        """
+        tmp_path, sha256, size = await self._spool(chunks, max_bytes)
+        try:
+            location, deduplicated = await self._commit(tmp_path, sha256)
+        finally:
+            if tmp_path.exists():
+                await aiofiles.os.remove(tmp_path)
+
+        logger.info("blob_stored", sha256=sha256, size=size, deduplicated=deduplicated)
+        return BlobRef(sha256=sha256, size=size, location=location, deduplicated=deduplicated)
+
+    @abstractmethod
+    async def exists(self, sha256: str) -> bool:
+        """Whether a blob with this hash is stored."""
+
+    async def local_path(self, sha256: str) -> Path | None:
+        """Path of the blob on local disk, if this backend keeps one."""
+        return None
+
+    async def presigned_url(self, sha256: str, expiration: int = 3600) -> str | None:
+        """Temporary download URL, if this backend serves blobs remotely."""
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    async def _spool(
+        self, chunks: AsyncIterable[bytes], max_bytes: int | None
+    ) -> tuple[Path, str, int]:
+        tmp_dir = self.spool_dir / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = tmp_dir / f"{uuid4().hex}.part"
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as fh:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise BlobTooLargeError(max_bytes)
+                    digest.update(chunk)
+                    await fh.write(chunk)
+        except BaseException:
+            if tmp_path.exists():
+                await aiofiles.os.remove(tmp_path)
+            raise
+
+        return tmp_path, digest.hexdigest(), size
+
+    @abstractmethod
+    async def _commit(self, tmp_path: Path, sha256: str) -> tuple[str, bool]:
+        """Move the spooled file into place; returns (location, deduplicated)."""
+
+    async def _iter_file(self, path: Path) -> AsyncIterator[bytes]:
+        async with aiofiles.open(path, "rb") as fh:
+            while chunk := await fh.read(self.chunk_size):
+                yield chunk
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs on local disk under ``<root>/<sha[:2]>/<sha>``."""
+
+    def __init__(self, root: str | Path = "uploads/blobs", *, chunk_size: int = CHUNK_SIZE):
+        super().__init__(root, chunk_size=chunk_size)
+        self.root = Path(root)
+
+    def path_for(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    async def exists(self, sha256: str) -> bool:
+        return self.path_for(sha256).exists()
+
+    async def local_path(self, sha256: str) -> Path | None:
+        path = self.path_for(sha256)
+        return path if path.exists() else None
+
+    async def _commit(self, tmp_path: Path, sha256: str) -> tuple[str, bool]:
+        target = self.path_for(sha256)
+        if target.exists():
+            return str(target), True
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic: a concurrent upload of the same content just replaces identical bytes
+        tmp_path.replace(target)
+        return str(target), False
+
+
+class R2BlobStore(BlobStore):
+    """Blobs as ``<prefix>/<sha>`` objects in R2; spooling stays local."""
+
+    def __init__(
+        self,
+        storage: R2Storage,
+        *,
+        prefix: str = "blobs",
+        spool_dir: str | Path = "uploads/blobs",
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        super().__init__(spool_dir, chunk_size=chunk_size)
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+
+    def key_for(self, sha256: str) -> str:
+        return f"{self.prefix}/{sha256}"
+
+    async def exists(self, sha256: str) -> bool:
+        try:
+            await self.storage.get_metadata(self.key_for(sha256))
+        except Exception:
+            return False
+        return True
+
+    async def presigned_url(self, sha256: str, expiration: int = 3600) -> str | None:
+        if not await self.exists(sha256):
+            return None
+        return await self.storage.generate_presigned_url(self.key_for(sha256), expiration)
+
+    async def _commit(self, tmp_path: Path, sha256: str) -> tuple[str, bool]:
+        key = self.key_for(sha256)
+        if await self.exists(sha256):
+            return key, True
+        await self.storage.upload_stream(
+            self._iter_file(tmp_path),
+            sha256,
+            "application/octet-stream",
+            metadata={"sha256": sha256},
+            r2_key=key,
+        )
+        return key, False
+
+
+# Singleton instance
+_blob_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Get singleton blob store instance.
+
+    ``EXHIBIT_BLOB_BACKEND=r2`` stores blobs in R2; anything else uses local disk
+    under ``EXHIBIT_BLOB_DIR`` (default ``uploads/blobs``).
+
+    Returns:
+        BlobStore instance
+    """
+    global _blob_store
+    if _blob_store is None:
+        blob_dir = os.getenv("EXHIBIT_BLOB_DIR", "uploads/blobs")
+        if os.getenv("EXHIBIT_BLOB_BACKEND", "local").lower() == "r2":
+            from .r2_storage import create_r2_storage
+
+            _blob_store = R2BlobStore(create_r2_storage(), spool_dir=blob_dir)
+        else:
+            _blob_store = LocalBlobStore(blob_dir)
+    return _blob_store
+
+
+__all__ = [
+    "BlobRef",
+    "BlobStore",
+    "BlobTooLargeError",
+    "LocalBlobStore",
+    "R2BlobStore",
+    "get_blob_store",
+]
@@ -50,6 +50,15 @@ class StorageConfig(BaseSettings):
     r2_public_url: str | None = Field(
         default=None, description="R2 public URL (custom domain if configured)"
     )
+    r2_max_concurrency: int = Field(
+        default=8, description="Max concurrent R2 requests (I/O thread pool size) per client"
+    )
+    r2_multipart_threshold: int = Field(
+        default=16 * 1024 * 1024, description="Uploads at or above this size use multipart"
+    )
+    r2_multipart_part_size: int = Field(
+        default=8 * 1024 * 1024, description="Multipart part size in bytes (min 5 MiB)"
+    )
 
     model_config = {
         "env_file": ".env",
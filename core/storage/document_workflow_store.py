@@ -3,26 +3,128 @@ Storage layer for document generation workflow states.
 
 Provides persistence for document monitor workflow states using in-memory
 storage (development) with option to use Redis (production).
+
+State is stored as deltas rather than one JSON blob per thread, so that a
+section update or a log line never rewrites the whole document:
+
+    document_workflow:{thread_id}:meta      hash  - top-level fields + _version
+    document_workflow:{thread_id}:sections  hash  - one JSON field per section
+    document_workflow:{thread_id}:logs      list  - append-only, trimmed to MAX_LOGS
+    document_workflow:{thread_id}:exhibits  list  - append-only
+    document_workflow:{thread_id}:deltas    list  - patch journal, trimmed to MAX_DELTAS
+
+The full state dict is only assembled on ``load_state``. Every mutation bumps
+``_version``; section updates use optimistic concurrency (WATCH/MULTI in
+Redis) so concurrent writers never lose each other's changes, and callers can
+pass ``expected_version`` to make their own read-modify-write conditional.
+
+Each mutation also appends one entry of JSON-patch style operations to the
+delta journal in the same transaction, so ``get_deltas`` can replay exactly
+what changed after a given version (used for WebSocket delta pushes and
+client resume). Operation paths address sections by id rather than index:
+
+    {"op": "replace", "path": "/sections/intro/status", "value": "completed"}
+    {"op": "add", "path": "/logs/-", "value": {...}}
+    {"op": "replace", "path": "/status", "value": "paused"}
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
+import copy
+from dataclasses import dataclass, field
 from datetime import datetime
+import json
 from typing import Any
 
 import structlog
 
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - redis is optional in development
+
+    class WatchError(Exception):  # type: ignore[no-redef]
+        """Placeholder when redis is not installed."""
+
+
 logger = structlog.get_logger(__name__)
 
+KEY_PREFIX = "document_workflow"
+STATE_TTL_SECONDS = 86400  # 24 hours
+MAX_LOGS = 100
+MAX_WATCH_RETRIES = 20
+MAX_DELTAS = 256
+
+# Top-level state keys that are stored as separate structures
+_SECTIONS = "sections"
+_LOGS = "logs"
+_EXHIBITS = "exhibits"
+_COLLECTIONS = (_SECTIONS, _LOGS, _EXHIBITS)
+_DELTAS = "deltas"
+_VERSION = "_version"
+_SECTION_ORDER = "_section_order"
+
+
+class WorkflowVersionConflict(RuntimeError):
+    """Raised when a conditional write sees a newer version than expected."""
+
+    def __init__(self, thread_id: str, expected: int | None, actual: int | None):
+        super().__init__(f"Workflow {thread_id} is at version {actual}, expected {expected}")
+        self.thread_id = thread_id
+        self.expected = expected
+        self.actual = actual
+
+
+class WorkflowContentionError(WorkflowVersionConflict):
+    """Raised when concurrent writers won every optimistic retry; the write can be retried."""
+
+    def __init__(self, thread_id: str, expected: int | None = None):
+        RuntimeError.__init__(
+            self,
+            f"Workflow {thread_id} changed during each of {MAX_WATCH_RETRIES} write attempts",
+        )
+        self.thread_id = thread_id
+        self.expected = expected
+        self.actual = None
+
+
+def _section_key(section: dict[str, Any], index: int) -> str:
+    return str(section.get("id") or section.get("section_id") or index)
+
+
+def _decode(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+@dataclass
+class _ThreadRecord:
+    """In-memory equivalent of the per-thread Redis structures."""
+
+    meta: dict[str, Any] = field(default_factory=dict)
+    sections: dict[str, dict[str, Any]] = field(default_factory=dict)
+    logs: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_LOGS))
+    exhibits: list[dict[str, Any]] = field(default_factory=list)
+    version: int = 0
+    deltas: deque[tuple[int, list[dict[str, Any]]]] = field(
+        default_factory=lambda: deque(maxlen=MAX_DELTAS)
+    )
+
 
 class DocumentWorkflowStore:
     """
     Storage for document generation workflow states.
 
-    In development: Uses in-memory dict
+    In development: Uses in-memory per-thread records
     In production: Can use Redis for persistence
+
+    Example:
+        >>> store = DocumentWorkflowStore()
+        >>> await store.save_state("t1", {"status": "generating", "sections": [...]})
+        >>> await store.update_section("t1", "intro", {"status": "completed"})
+        >>> state = await store.load_state("t1")
+        >>> state["_version"]
+        2
     """
 
     def __init__(self, use_redis: bool = False, redis_client: Any | None = None):
@@ -35,77 +137,207 @@ class DocumentWorkflowStore:
         """
         self.use_redis = use_redis
         self.redis = redis_client
-        self._memory_store: dict[str, dict[str, Any]] = {}
+        self._memory_store: dict[str, _ThreadRecord] = {}
         self._lock = asyncio.Lock()
 
-    async def save_state(self, thread_id: str, state: dict[str, Any]) -> None:
+    @property
+    def _redis_enabled(self) -> bool:
+        return bool(self.use_redis and self.redis)
+
+    @staticmethod
+    def _keys(thread_id: str) -> dict[str, str]:
+        base = f"{KEY_PREFIX}:{thread_id}"
+        return {
+            "meta": f"{base}:meta",
+            _SECTIONS: f"{base}:{_SECTIONS}",
+            _LOGS: f"{base}:{_LOGS}",
+            _EXHIBITS: f"{base}:{_EXHIBITS}",
+            _DELTAS: f"{base}:{_DELTAS}",
+        }
+
+    # ------------------------------------------------------------------ #
+    # Whole-state operations
+    # ------------------------------------------------------------------ #
+    async def save_state(
+        self,
+        thread_id: str,
+        state: dict[str, Any],
+        expected_version: int | None = None,
+    ) -> int:
         """
-        Save workflow state.
+        Save (replace) the complete workflow state.
 
         Args:
             thread_id: Workflow thread ID
             state: Complete workflow state dictionary
+            expected_version: Only write if the stored version matches
+                (0 means "must not exist yet")
+
+        Returns:
+            New state version
+
+        Raises:
+            WorkflowVersionConflict: If ``expected_version`` does not match
         """
-        async with self._lock:
-            try:
-                # Add updated timestamp
-                state["_updated_at"] = datetime.now().isoformat()
-
-                if self.use_redis and self.redis:
-                    # Save to Redis with 24-hour TTL
-                    key = f"document_workflow:{thread_id}"
-                    await self.redis.setex(
-                        key,
-                        86400,  # 24 hours
-                        json.dumps(state),
+        updated_at = datetime.now().isoformat()
+        meta = {k: v for k, v in state.items() if k not in _COLLECTIONS and k != _VERSION}
+        meta["_updated_at"] = updated_at
+        sections = [dict(s) for s in state.get(_SECTIONS, [])]
+        logs = list(state.get(_LOGS, []))[-MAX_LOGS:]
+        exhibits = list(state.get(_EXHIBITS, []))
+
+        try:
+            if self._redis_enabled:
+                version = await self._redis_save(
+                    thread_id, meta, sections, logs, exhibits, expected_version
+                )
+                logger.info("document_workflow_saved_redis", thread_id=thread_id)
+            else:
+                async with self._lock:
+                    current = self._memory_store.get(thread_id)
+                    current_version = current.version if current else 0
+                    if expected_version is not None and expected_version != current_version:
+                        raise WorkflowVersionConflict(thread_id, expected_version, current_version)
+                    record = _ThreadRecord(
+                        meta=copy.deepcopy(meta),
+                        sections={
+                            _section_key(s, i): copy.deepcopy(s) for i, s in enumerate(sections)
+                        },
+                        logs=deque(copy.deepcopy(logs), maxlen=MAX_LOGS),
+                        exhibits=copy.deepcopy(exhibits),
+                        version=current_version + 1,
                     )
-                    logger.info("document_workflow_saved_redis", thread_id=thread_id)
-                else:
-                    # Save to memory
-                    self._memory_store[thread_id] = state
-                    logger.debug("document_workflow_saved_memory", thread_id=thread_id)
+                    self._memory_store[thread_id] = record
+                    version = record.version
+                logger.debug("document_workflow_saved_memory", thread_id=thread_id)
 
-            except Exception as e:
-                logger.error("document_workflow_save_error", thread_id=thread_id, error=str(e))
-                raise
+        except WorkflowVersionConflict:
+            raise
+        except Exception as e:
+            logger.error("document_workflow_save_error", thread_id=thread_id, error=str(e))
+            raise
+
+        state[_VERSION] = version
+        state["_updated_at"] = updated_at
+        return version
 
     async def load_state(self, thread_id: str) -> dict[str, Any] | None:
         """
-        Load workflow state.
+        Load workflow state, assembling it from its parts.
+
+        The returned dict is a copy; mutating it does not change the store.
 
         Args:
             thread_id: Workflow thread ID
 
         Returns:
-            Workflow state dict or None if not found
+            Workflow state dict (with ``_version``) or None if not found
         """
-        async with self._lock:
-            try:
-                if self.use_redis and self.redis:
-                    key = f"document_workflow:{thread_id}"
-                    data = await self.redis.get(key)
-                    if data:
-                        state = json.loads(data)
-                        logger.debug("document_workflow_loaded_redis", thread_id=thread_id)
-                        return state
+        try:
+            if self._redis_enabled:
+                state = await self._redis_load(thread_id)
+                if state is None:
                     logger.debug("document_workflow_not_found_redis", thread_id=thread_id)
-                    return None
-                state = self._memory_store.get(thread_id)
-                if state:
-                    logger.debug("document_workflow_loaded_memory", thread_id=thread_id)
                 else:
-                    logger.debug("document_workflow_not_found_memory", thread_id=thread_id)
+                    logger.debug("document_workflow_loaded_redis", thread_id=thread_id)
                 return state
 
-            except Exception as e:
-                logger.error("document_workflow_load_error", thread_id=thread_id, error=str(e))
+            async with self._lock:
+                record = self._memory_store.get(thread_id)
+                if record is None:
+                    logger.debug("document_workflow_not_found_memory", thread_id=thread_id)
+                    return None
+                state = copy.deepcopy(record.meta)
+                state[_SECTIONS] = copy.deepcopy(list(record.sections.values()))
+                state[_LOGS] = copy.deepcopy(list(record.logs))
+                state[_EXHIBITS] = copy.deepcopy(record.exhibits)
+                state[_VERSION] = record.version
+            logger.debug("document_workflow_loaded_memory", thread_id=thread_id)
+            return state
+
+        except Exception as e:
+            logger.error("document_workflow_load_error", thread_id=thread_id, error=str(e))
+            return None
+
+    async def get_version(self, thread_id: str) -> int | None:
+        """
+        Get the current state version without assembling the state.
+
+        Args:
+            thread_id: Workflow thread ID
+
+        Returns:
+            Version number or None if not found
+        """
+        if self._redis_enabled:
+            raw = await self.redis.hget(self._keys(thread_id)["meta"], _VERSION)
+            return int(_decode(raw)) if raw is not None else None
+        record = self._memory_store.get(thread_id)
+        return record.version if record else None
+
+    async def get_logs(self, thread_id: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Read log entries without loading sections or exhibits.
+
+        Args:
+            thread_id: Workflow thread ID
+            limit: Return only the most recent ``limit`` entries
+
+        Returns:
+            Log entries, oldest first
+        """
+        if self._redis_enabled:
+            start = -limit if limit else 0
+            raw = await self.redis.lrange(self._keys(thread_id)[_LOGS], start, -1)
+            return [json.loads(_decode(item)) for item in raw]
+        async with self._lock:
+            record = self._memory_store.get(thread_id)
+            if record is None:
+                return []
+            logs = list(record.logs)
+        return copy.deepcopy(logs[-limit:] if limit else logs)
+
+    async def get_deltas(
+        self, thread_id: str, since_version: int
+    ) -> tuple[int, list[dict[str, Any]]] | None:
+        """
+        Read the patch operations applied after ``since_version``.
+
+        Args:
+            thread_id: Workflow thread ID
+            since_version: Last version the caller has seen
+
+        Returns:
+            ``(current_version, [{"v": version, "ops": [...]}, ...])`` ordered by
+            version, or None if the thread is unknown or ``since_version`` is
+            no longer covered by the journal (the caller must reload the state)
+
+        Example:
+            >>> version, deltas = await store.get_deltas("t1", since_version=3)
+            >>> deltas[0]
+            {'v': 4, 'ops': [{'op': 'add', 'path': '/logs/-', 'value': {...}}]}
+        """
+        if self._redis_enabled:
+            return await self._redis_get_deltas(thread_id, since_version)
+
+        async with self._lock:
+            record = self._memory_store.get(thread_id)
+            if record is None or since_version > record.version:
                 return None
+            needed = record.version - since_version
+            if needed > len(record.deltas):
+                return None
+            entries = list(record.deltas)[len(record.deltas) - needed :]
+            return record.version, [{"v": v, "ops": copy.deepcopy(ops)} for v, ops in entries]
 
+    # ------------------------------------------------------------------ #
+    # Delta operations
+    # ------------------------------------------------------------------ #
     async def update_section(
         self, thread_id: str, section_id: str, updates: dict[str, Any]
     ) -> bool:
         """
-        Update a specific section in workflow state.
+        Atomically update a specific section in workflow state.
 
         Args:
             thread_id: Workflow thread ID
@@ -113,33 +345,45 @@ class DocumentWorkflowStore:
             updates: Fields to update in section
 
         Returns:
-            True if successful, False otherwise
+            True if successful, False if the workflow or section does not exist
+
+        Raises:
+            WorkflowContentionError: Concurrent writers kept winning (Redis); retry later
         """
-        state = await self.load_state(thread_id)
-        if not state:
+        if self._redis_enabled:
+            result = await self._redis_update_section(thread_id, section_id, updates)
+        else:
+            async with self._lock:
+                record = self._memory_store.get(thread_id)
+                if record is None:
+                    result = None
+                elif section_id not in record.sections:
+                    result = False
+                else:
+                    section = record.sections[section_id]
+                    section.update(copy.deepcopy(updates))
+                    section["updated_at"] = datetime.now().isoformat()
+                    self._touch(record, _section_ops(section_id, section, updates))
+                    result = True
+
+        if result is None:
             logger.warning("section_update_no_state", thread_id=thread_id, section_id=section_id)
             return False
+        if not result:
+            logger.warning("section_not_found", thread_id=thread_id, section_id=section_id)
+            return False
 
-        sections = state.get("sections", [])
-        for section in sections:
-            if section.get("id") == section_id or section.get("section_id") == section_id:
-                section.update(updates)
-                section["updated_at"] = datetime.now().isoformat()
-                await self.save_state(thread_id, state)
-                logger.info(
-                    "section_updated",
-                    thread_id=thread_id,
-                    section_id=section_id,
-                    updates=list(updates.keys()),
-                )
-                return True
-
-        logger.warning("section_not_found", thread_id=thread_id, section_id=section_id)
-        return False
+        logger.info(
+            "section_updated",
+            thread_id=thread_id,
+            section_id=section_id,
+            updates=list(updates.keys()),
+        )
+        return True
 
     async def add_log(self, thread_id: str, log_entry: dict[str, Any]) -> bool:
         """
-        Add log entry to workflow state.
+        Append a log entry to workflow state (only the last MAX_LOGS are kept).
 
         Args:
             thread_id: Workflow thread ID
@@ -148,25 +392,14 @@ class DocumentWorkflowStore:
         Returns:
             True if successful, False otherwise
         """
-        state = await self.load_state(thread_id)
-        if not state:
-            logger.warning("add_log_no_state", thread_id=thread_id)
-            return False
-
-        if "logs" not in state:
-            state["logs"] = []
-
         # Add timestamp if not present
         if "timestamp" not in log_entry:
             log_entry["timestamp"] = datetime.now().isoformat()
 
-        state["logs"].append(log_entry)
-
-        # Keep only last 100 logs
-        if len(state["logs"]) > 100:
-            state["logs"] = state["logs"][-100:]
+        if not await self._append(thread_id, _LOGS, log_entry, trim=MAX_LOGS):
+            logger.warning("add_log_no_state", thread_id=thread_id)
+            return False
 
-        await self.save_state(thread_id, state)
         logger.debug("log_added", thread_id=thread_id, level=log_entry.get("level"))
         return True
 
@@ -181,20 +414,13 @@ class DocumentWorkflowStore:
         Returns:
             True if successful, False otherwise
         """
-        state = await self.load_state(thread_id)
-        if not state:
-            logger.warning("add_exhibit_no_state", thread_id=thread_id)
-            return False
-
-        if "exhibits" not in state:
-            state["exhibits"] = []
-
         # Add timestamp if not present
         if "uploaded_at" not in exhibit_data:
             exhibit_data["uploaded_at"] = datetime.now().isoformat()
 
-        state["exhibits"].append(exhibit_data)
-        await self.save_state(thread_id, state)
+        if not await self._append(thread_id, _EXHIBITS, exhibit_data):
+            logger.warning("add_exhibit_no_state", thread_id=thread_id)
+            return False
 
         logger.info(
             "exhibit_added",
@@ -204,6 +430,43 @@ class DocumentWorkflowStore:
         )
         return True
 
+    async def update_fields(
+        self,
+        thread_id: str,
+        fields: dict[str, Any],
+        expected_version: int | None = None,
+    ) -> int | None:
+        """
+        Update top-level (non-collection) state fields.
+
+        Args:
+            thread_id: Workflow thread ID
+            fields: Fields to set, e.g. ``{"status": "completed"}``
+            expected_version: Only write if the stored version matches
+
+        Returns:
+            New state version, or None if the workflow does not exist
+
+        Raises:
+            ValueError: If ``fields`` contains sections/logs/exhibits
+            WorkflowVersionConflict: If ``expected_version`` does not match
+        """
+        invalid = [k for k in fields if k in _COLLECTIONS or k == _VERSION]
+        if invalid:
+            raise ValueError(f"Use the dedicated update methods for: {', '.join(invalid)}")
+
+        if self._redis_enabled:
+            return await self._redis_update_fields(thread_id, fields, expected_version)
+
+        async with self._lock:
+            record = self._memory_store.get(thread_id)
+            if record is None:
+                return None
+            if expected_version is not None and expected_version != record.version:
+                raise WorkflowVersionConflict(thread_id, expected_version, record.version)
+            record.meta.update(copy.deepcopy(fields))
+            return self._touch(record, _field_ops(fields))
+
     async def update_workflow_status(
         self, thread_id: str, status: str, error_message: str | None = None
     ) -> bool:
@@ -218,22 +481,15 @@ class DocumentWorkflowStore:
         Returns:
             True if successful, False otherwise
         """
-        state = await self.load_state(thread_id)
-        if not state:
-            logger.warning("update_status_no_state", thread_id=thread_id)
-            return False
-
-        old_status = state.get("status")
-        state["status"] = status
-
+        fields: dict[str, Any] = {"status": status}
         if error_message:
-            state["error_message"] = error_message
+            fields["error_message"] = error_message
 
-        await self.save_state(thread_id, state)
+        if await self.update_fields(thread_id, fields) is None:
+            logger.warning("update_status_no_state", thread_id=thread_id)
+            return False
 
-        logger.info(
-            "workflow_status_updated", thread_id=thread_id, old_status=old_status, new_status=status
-        )
+        logger.info("workflow_status_updated", thread_id=thread_id, new_status=status)
         return True
 
     async def delete_state(self, thread_id: str) -> bool:
@@ -246,20 +502,19 @@ class DocumentWorkflowStore:
         Returns:
             True if successful, False otherwise
         """
-        async with self._lock:
-            try:
-                if self.use_redis and self.redis:
-                    key = f"document_workflow:{thread_id}"
-                    await self.redis.delete(key)
-                elif thread_id in self._memory_store:
-                    del self._memory_store[thread_id]
-
-                logger.info("document_workflow_deleted", thread_id=thread_id)
-                return True
-
-            except Exception as e:
-                logger.error("document_workflow_delete_error", thread_id=thread_id, error=str(e))
-                return False
+        try:
+            if self._redis_enabled:
+                await self.redis.delete(*self._keys(thread_id).values())
+            else:
+                async with self._lock:
+                    self._memory_store.pop(thread_id, None)
+
+            logger.info("document_workflow_deleted", thread_id=thread_id)
+            return True
+
+        except Exception as e:
+            logger.error("document_workflow_delete_error", thread_id=thread_id, error=str(e))
+            return False
 
     async def list_active_workflows(self) -> list[str]:
         """
@@ -268,11 +523,244 @@ class DocumentWorkflowStore:
         Returns:
             List of thread IDs
         """
-        if self.use_redis and self.redis:
-            keys = await self.redis.keys("document_workflow:*")
-            return [key.decode().split(":", 1)[1] for key in keys]
+        if self._redis_enabled:
+            thread_ids = []
+            async for key in self.redis.scan_iter(match=f"{KEY_PREFIX}:*:meta"):
+                thread_ids.append(_decode(key)[len(KEY_PREFIX) + 1 : -len(":meta")])
+            return thread_ids
         return list(self._memory_store.keys())
 
+    # ------------------------------------------------------------------ #
+    # In-memory internals
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _touch(record: _ThreadRecord, ops: list[dict[str, Any]]) -> int:
+        record.version += 1
+        record.meta["_updated_at"] = datetime.now().isoformat()
+        record.deltas.append((record.version, copy.deepcopy(ops)))
+        return record.version
+
+    async def _append(
+        self, thread_id: str, collection: str, item: dict[str, Any], trim: int | None = None
+    ) -> bool:
+        if self._redis_enabled:
+            return await self._redis_append(thread_id, collection, item, trim)
+
+        async with self._lock:
+            record = self._memory_store.get(thread_id)
+            if record is None:
+                return False
+            getattr(record, collection).append(copy.deepcopy(item))
+            self._touch(record, _append_ops(collection, item))
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Redis internals
+    # ------------------------------------------------------------------ #
+    async def _redis_save(
+        self,
+        thread_id: str,
+        meta: dict[str, Any],
+        sections: list[dict[str, Any]],
+        logs: list[dict[str, Any]],
+        exhibits: list[dict[str, Any]],
+        expected_version: int | None,
+    ) -> int:
+        keys = self._keys(thread_id)
+        order = [_section_key(s, i) for i, s in enumerate(sections)]
+        meta_fields = {k: json.dumps(v) for k, v in meta.items()}
+        meta_fields[_SECTION_ORDER] = json.dumps(order)
+
+        for _ in range(MAX_WATCH_RETRIES):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(keys["meta"])
+                    raw = await pipe.hget(keys["meta"], _VERSION)
+                    current = int(_decode(raw)) if raw is not None else 0
+                    if expected_version is not None and expected_version != current:
+                        raise WorkflowVersionConflict(thread_id, expected_version, current)
+
+                    pipe.multi()
+                    pipe.delete(*keys.values())
+                    pipe.hset(keys["meta"], mapping={**meta_fields, _VERSION: current + 1})
+                    if sections:
+                        pipe.hset(
+                            keys[_SECTIONS],
+                            mapping={
+                                k: json.dumps(s) for k, s in zip(order, sections, strict=True)
+                            },
+                        )
+                    if logs:
+                        pipe.rpush(keys[_LOGS], *(json.dumps(entry) for entry in logs))
+                    if exhibits:
+                        pipe.rpush(keys[_EXHIBITS], *(json.dumps(ex) for ex in exhibits))
+                    self._redis_expire(pipe, keys)
+                    await pipe.execute()
+                    return current + 1
+                except WatchError:
+                    continue
+        raise WorkflowContentionError(thread_id, expected_version)
+
+    async def _redis_load(self, thread_id: str) -> dict[str, Any] | None:
+        keys = self._keys(thread_id)
+        # MULTI gives a consistent snapshot of all four structures
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(keys["meta"])
+            pipe.hgetall(keys[_SECTIONS])
+            pipe.lrange(keys[_LOGS], 0, -1)
+            pipe.lrange(keys[_EXHIBITS], 0, -1)
+            raw_meta, raw_sections, raw_logs, raw_exhibits = await pipe.execute()
+
+        if not raw_meta:
+            return None
+
+        meta = {_decode(k): _decode(v) for k, v in raw_meta.items()}
+        version = int(meta.pop(_VERSION, 0))
+        order = json.loads(meta.pop(_SECTION_ORDER, "[]"))
+        sections = {_decode(k): json.loads(_decode(v)) for k, v in raw_sections.items()}
+
+        state: dict[str, Any] = {k: json.loads(v) for k, v in meta.items()}
+        state[_SECTIONS] = [sections[sid] for sid in order if sid in sections]
+        state[_LOGS] = [json.loads(_decode(item)) for item in raw_logs]
+        state[_EXHIBITS] = [json.loads(_decode(item)) for item in raw_exhibits]
+        state[_VERSION] = version
+        return state
+
+    async def _redis_update_section(
+        self, thread_id: str, section_id: str, updates: dict[str, Any]
+    ) -> bool | None:
+        """Optimistic read-modify-write of a single section field."""
+        keys = self._keys(thread_id)
+        for _ in range(MAX_WATCH_RETRIES):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(keys[_SECTIONS])
+                    if not await pipe.exists(keys["meta"]):
+                        return None
+                    raw = await pipe.hget(keys[_SECTIONS], section_id)
+                    if raw is None:
+                        return False
+
+                    section = json.loads(_decode(raw))
+                    section.update(updates)
+                    section["updated_at"] = datetime.now().isoformat()
+
+                    pipe.multi()
+                    pipe.hset(keys[_SECTIONS], section_id, json.dumps(section))
+                    self._redis_bump(pipe, keys, _section_ops(section_id, section, updates))
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    logger.debug("section_update_retry", thread_id=thread_id, section_id=section_id)
+                    continue
+
+        logger.error("section_update_contention", thread_id=thread_id, section_id=section_id)
+        raise WorkflowContentionError(thread_id)
+
+    async def _redis_update_fields(
+        self, thread_id: str, fields: dict[str, Any], expected_version: int | None
+    ) -> int | None:
+        keys = self._keys(thread_id)
+        encoded = {k: json.dumps(v) for k, v in fields.items()}
+        for _ in range(MAX_WATCH_RETRIES):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(keys["meta"])
+                    raw = await pipe.hget(keys["meta"], _VERSION)
+                    if raw is None:
+                        return None
+                    current = int(_decode(raw))
+                    if expected_version is not None and expected_version != current:
+                        raise WorkflowVersionConflict(thread_id, expected_version, current)
+
+                    pipe.multi()
+                    pipe.hset(keys["meta"], mapping=encoded)
+                    self._redis_bump(pipe, keys, _field_ops(fields))
+                    await pipe.execute()
+                    return current + 1
+                except WatchError:
+                    continue
+        raise WorkflowContentionError(thread_id, expected_version)
+
+    async def _redis_append(
+        self, thread_id: str, collection: str, item: dict[str, Any], trim: int | None
+    ) -> bool:
+        keys = self._keys(thread_id)
+        if not await self.redis.exists(keys["meta"]):
+            return False
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(keys[collection], json.dumps(item))
+            if trim:
+                pipe.ltrim(keys[collection], -trim, -1)
+            self._redis_bump(pipe, keys, _append_ops(collection, item))
+            await pipe.execute()
+        return True
+
+    async def _redis_get_deltas(
+        self, thread_id: str, since_version: int
+    ) -> tuple[int, list[dict[str, Any]]] | None:
+        """Read the journal tail together with the version in one MULTI.
+
+        Journal entries carry no version: each bump appends exactly one entry
+        in the same transaction, so the last entry always belongs to the
+        current version and the rest follow by position.
+        """
+        keys = self._keys(thread_id)
+        fetch = 16
+        while True:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hget(keys["meta"], _VERSION)
+                pipe.lrange(keys[_DELTAS], -fetch, -1)
+                raw_version, raw_entries = await pipe.execute()
+
+            if raw_version is None:
+                return None
+            version = int(_decode(raw_version))
+            needed = version - since_version
+            if needed < 0:
+                return None
+            if needed <= len(raw_entries):
+                break
+            if len(raw_entries) < fetch or fetch >= MAX_DELTAS:
+                return None  # journal was trimmed or reset past since_version
+            fetch = min(needed, MAX_DELTAS)
+
+        tail = raw_entries[len(raw_entries) - needed :] if needed else []
+        return version, [
+            {"v": since_version + i + 1, "ops": json.loads(_decode(entry))}
+            for i, entry in enumerate(tail)
+        ]
+
+    @staticmethod
+    def _redis_bump(pipe: Any, keys: dict[str, str], ops: list[dict[str, Any]]) -> None:
+        pipe.hincrby(keys["meta"], _VERSION, 1)
+        pipe.hset(keys["meta"], "_updated_at", json.dumps(datetime.now().isoformat()))
+        pipe.rpush(keys[_DELTAS], json.dumps(ops))
+        pipe.ltrim(keys[_DELTAS], -MAX_DELTAS, -1)
+        DocumentWorkflowStore._redis_expire(pipe, keys)
+
+    @staticmethod
+    def _redis_expire(pipe: Any, keys: dict[str, str]) -> None:
+        for key in keys.values():
+            pipe.expire(key, STATE_TTL_SECONDS)
+
+
+def _section_ops(
+    section_id: str, section: dict[str, Any], updates: dict[str, Any]
+) -> list[dict[str, Any]]:
+    return [
+        {"op": "replace", "path": f"/{_SECTIONS}/{section_id}/{key}", "value": section[key]}
+        for key in dict.fromkeys([*updates, "updated_at"])
+    ]
+
+
+def _field_ops(fields: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"op": "replace", "path": f"/{key}", "value": value} for key, value in fields.items()]
+
+
+def _append_ops(collection: str, item: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"op": "add", "path": f"/{collection}/-", "value": item}]
+
 
 # Singleton instance
 _store: DocumentWorkflowStore | None = None
@@ -6,6 +6,8 @@ Schema includes:
 - rmt_buffers: RMT (working memory) buffers
 - cases: Legal case records
 - documents: Document metadata with R2 references
+- api_keys: Salted hashes of issued API keys
+- langgraph_checkpoint*: LangGraph checkpoints stored as per-channel deltas
 """
 
 from __future__ import annotations
@@ -14,7 +16,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import TIMESTAMP, CheckConstraint, Index, String, Text
+from sqlalchemy import TIMESTAMP, CheckConstraint, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncAttrs
@@ -241,3 +243,99 @@ class DocumentDB(Base):
     # Timestamps
     uploaded_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     processed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+
+
+class APIKeyDB(Base):
+    """
+    Issued API keys (see ``core.security.api_keys``).
+
+    Only a salted hash of the secret is stored; ``key_id`` is the public,
+    indexed part of the key used for lookup.
+    """
+
+    __tablename__ = "api_keys"
+    __table_args__ = (
+        Index("idx_api_keys_user_id", "user_id"),
+        {"schema": "mega_agent"},
+    )
+
+    key_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    role: Mapped[str] = mapped_column(String(50), default="service")
+    name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    salt: Mapped[str] = mapped_column(String(64), nullable=False)
+    key_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    expires_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+
+
+class CheckpointDB(Base):
+    """
+    LangGraph checkpoint header (see ``core.storage.checkpointer``).
+
+    Channel values are not stored here; ``channel_versions`` points into
+    ``langgraph_checkpoint_channels``.
+    """
+
+    __tablename__ = "langgraph_checkpoints"
+    __table_args__ = (
+        Index("idx_lg_checkpoints_thread", "thread_id", "checkpoint_ns", "checkpoint_id"),
+        {"schema": "mega_agent"},
+    )
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    parent_checkpoint_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    checkpoint: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    metadata_blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    channel_versions: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class CheckpointChannelDB(Base):
+    """Channel version -> content digest pointer for LangGraph checkpoints."""
+
+    __tablename__ = "langgraph_checkpoint_channels"
+    __table_args__ = ({"schema": "mega_agent"},)
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    channel: Mapped[str] = mapped_column(String(255), primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    digest: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+class CheckpointBlobDB(Base):
+    """Content-addressed (optionally zlib-compressed) LangGraph channel values."""
+
+    __tablename__ = "langgraph_checkpoint_blobs"
+    __table_args__ = ({"schema": "mega_agent"},)
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class CheckpointWriteDB(Base):
+    """Pending writes attached to a LangGraph checkpoint."""
+
+    __tablename__ = "langgraph_checkpoint_writes"
+    __table_args__ = ({"schema": "mega_agent"},)
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    task_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    idx: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    channel: Mapped[str] = mapped_column(String(255), nullable=False)
+    task_path: Mapped[str] = mapped_column(String(1000), default="")
+    value: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -22,6 +22,9 @@ try:
 except ImportError:
     PINECONE_AVAILABLE = False
 
+# Pinecone recommends upserting at most ~100 high-dimensional vectors per request
+UPSERT_BATCH_SIZE = 100
+
 
 class PineconeSemanticStore:
     """
@@ -86,6 +89,8 @@ class PineconeSemanticStore:
         self,
         records: list[MemoryRecord],
         embeddings: list[list[float]],
+        *,
+        batch_size: int = UPSERT_BATCH_SIZE,
     ) -> int:
         """
         Insert or update records with embeddings in Pinecone.
@@ -93,6 +98,7 @@ class PineconeSemanticStore:
         Args:
             records: Memory records with text and metadata
             embeddings: Corresponding Voyage embeddings (2048-dim each)
+            batch_size: Maximum vectors per upsert request
 
         Returns:
             Number of vectors upserted
@@ -146,9 +152,10 @@ class PineconeSemanticStore:
 
             vectors.append({"id": pinecone_id, "values": embedding, "metadata": metadata})
 
-        # Batch upsert to Pinecone
+        # Batch upsert to Pinecone in provider-sized chunks (2 MB request limit)
         # https://docs.pinecone.io/docs/upsert-data
-        self.index.upsert(vectors=vectors, namespace=self.namespace)
+        for start in range(0, len(vectors), batch_size):
+            self.index.upsert(vectors=vectors[start : start + batch_size], namespace=self.namespace)
 
         return len(vectors)
 
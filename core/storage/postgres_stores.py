@@ -1,4 +1,4 @@
-"""PostgreSQL-backed stores for episodic memory and working memory.
+"""PostgreSQL-backed stores for episodic memory, working memory and API keys.
 
 These stores replace the in-memory implementations with persistent PostgreSQL storage.
 """
@@ -8,13 +8,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from .connection import get_db_manager
-from .models import EpisodicMemoryDB, RMTBufferDB
+from .models import APIKeyDB, EpisodicMemoryDB, RMTBufferDB
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
     from ..memory.models import AuditEvent
+    from ..security.api_keys import APIKeyRecord
 
 
 class PostgresEpisodicStore:
@@ -59,6 +64,49 @@ class PostgresEpisodicStore:
             )
             session.add(db_event)
 
+    async def aappend_many(self, events: Iterable[AuditEvent]) -> int:
+        """
+        Append a batch of audit events in one session and one multi-row INSERT.
+
+        Events whose ``event_id`` is already stored are skipped, so replaying a
+        batch that was committed before its writer was interrupted is harmless.
+
+        Args:
+            events: AuditEvents to store
+
+        Returns:
+            Number of events newly written
+
+        Example:
+            >>> store = PostgresEpisodicStore()
+            >>> await store.aappend_many([event_1, event_2, event_3])
+            3
+        """
+        rows = [
+            {
+                "event_id": event.event_id or uuid4(),
+                "user_id": event.user_id,
+                "thread_id": event.thread_id or "global",
+                "source": event.source,
+                "action": event.action,
+                "payload": event.payload,
+                "tags": event.tags or [],
+                "timestamp": event.timestamp,
+            }
+            for event in events
+        ]
+        if not rows:
+            return 0
+
+        async with self.db.session() as session:
+            # A single INSERT ... VALUES (...), (...) keeps the batch to one round-trip
+            result = await session.execute(
+                insert(EpisodicMemoryDB)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["event_id"])
+            )
+        return result.rowcount
+
     async def aget_thread_events(self, thread_id: str) -> list[AuditEvent]:
         """
         Get all events for a specific thread.
@@ -289,3 +337,107 @@ class PostgresWorkingMemory:
             buffers = result.scalars().all()
 
             return {buffer.thread_id: buffer.slots for buffer in buffers}
+
+
+class PostgresAPIKeyStore:
+    """
+    PostgreSQL-backed store for hashed API keys.
+
+    Used by ``core.security.api_keys.APIKeyManager``.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+
+    @staticmethod
+    def _to_record(row: APIKeyDB) -> APIKeyRecord:
+        from ..security.api_keys import APIKeyRecord
+
+        return APIKeyRecord(
+            key_id=row.key_id,
+            user_id=row.user_id,
+            email=row.email,
+            role=row.role,
+            name=row.name,
+            salt=row.salt,
+            key_hash=row.key_hash,
+            created_at=row.created_at,
+            expires_at=row.expires_at,
+            revoked_at=row.revoked_at,
+        )
+
+    async def aadd(self, record: APIKeyRecord) -> None:
+        """
+        Store a newly issued API key.
+
+        Args:
+            record: Key metadata with the salted secret hash
+        """
+        async with self.db.session() as session:
+            session.add(
+                APIKeyDB(
+                    key_id=record.key_id,
+                    user_id=record.user_id,
+                    email=record.email,
+                    role=record.role,
+                    name=record.name,
+                    salt=record.salt,
+                    key_hash=record.key_hash,
+                    created_at=record.created_at,
+                    expires_at=record.expires_at,
+                    revoked_at=record.revoked_at,
+                )
+            )
+
+    async def aget(self, key_id: str) -> APIKeyRecord | None:
+        """
+        Get an API key by its public id.
+
+        Args:
+            key_id: Public part of the key
+
+        Returns:
+            Key record or None if not found
+        """
+        async with self.db.session() as session:
+            row = await session.get(APIKeyDB, key_id)
+            return self._to_record(row) if row else None
+
+    async def arevoke(self, key_id: str, revoked_at: datetime) -> bool:
+        """
+        Mark an API key as revoked.
+
+        Args:
+            key_id: Public part of the key
+            revoked_at: Revocation time
+
+        Returns:
+            True if an active key was revoked
+        """
+        async with self.db.session() as session:
+            stmt = (
+                update(APIKeyDB)
+                .where(APIKeyDB.key_id == key_id, APIKeyDB.revoked_at.is_(None))
+                .values(revoked_at=revoked_at)
+            )
+            result = await session.execute(stmt)
+            return bool(result.rowcount)
+
+    async def alist(self, user_id: str) -> list[APIKeyRecord]:
+        """
+        List the API keys issued to a user.
+
+        Args:
+            user_id: Owner of the keys
+
+        Returns:
+            Key records, newest first
+        """
+        async with self.db.session() as session:
+            stmt = (
+                select(APIKeyDB)
+                .where(APIKeyDB.user_id == user_id)
+                .order_by(desc(APIKeyDB.created_at))
+            )
+            result = await session.execute(stmt)
+            return [self._to_record(row) for row in result.scalars().all()]
@@ -1,5 +1,10 @@
 """Cloudflare R2 storage client for document management.
 
+All boto3 calls run on a bounded, per-client thread pool so the event loop is
+never blocked by network I/O. Large uploads are streamed as multipart uploads
+with parallel parts, and downloads can be streamed (optionally by byte range)
+without holding the whole object in memory.
+
 Official Documentation:
 https://developers.cloudflare.com/r2/api/s3/api/
 https://developers.cloudflare.com/r2/api/s3/tokens/
@@ -7,12 +12,19 @@ https://developers.cloudflare.com/r2/api/s3/tokens/
 
 from __future__ import annotations
 
-import io
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
+import io
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 from uuid import uuid4
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pydantic import SecretStr
 
 try:
@@ -23,6 +35,12 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+# S3/R2 require every multipart part except the last to be at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class R2Storage:
     """
@@ -33,6 +51,9 @@ class R2Storage:
     - No egress fees
     - Automatic presigned URL generation
     - Metadata storage with files
+    - Non-blocking: boto3 calls run on a bounded I/O thread pool
+    - Multipart streaming uploads with parallel parts
+    - Streaming / ranged / parallel downloads
 
     Docs: https://developers.cloudflare.com/r2/
     """
@@ -43,6 +64,10 @@ class R2Storage:
         access_key_id: SecretStr | None = None,
         secret_access_key: SecretStr | None = None,
         bucket_name: str | None = None,
+        *,
+        max_concurrency: int | None = None,
+        multipart_threshold: int | None = None,
+        part_size: int | None = None,
     ):
         if not BOTO3_AVAILABLE:
             raise ImportError("boto3 is required for R2. Install with: pip install boto3")
@@ -59,16 +84,29 @@ class R2Storage:
         self.endpoint = config.r2_endpoint
         self.public_url = config.r2_public_url
 
+        self.max_concurrency = max_concurrency or config.r2_max_concurrency
+        self.multipart_threshold = multipart_threshold or config.r2_multipart_threshold
+        self.part_size = max(part_size or config.r2_multipart_part_size, MIN_PART_SIZE)
+
         # Initialize S3-compatible client for R2
         # https://developers.cloudflare.com/r2/api/s3/tokens/
+        # boto3 clients are thread-safe; the connection pool matches the thread pool
         self.s3_client = boto3.client(
             "s3",
             endpoint_url=self.endpoint,
             aws_access_key_id=self.access_key_id.get_secret_value(),
             aws_secret_access_key=self.secret_access_key.get_secret_value(),
-            config=Config(signature_version="s3v4"),
+            config=Config(signature_version="s3v4", max_pool_connections=self.max_concurrency),
             region_name="auto",  # R2 uses "auto" region
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="r2-io"
+        )
+
+    async def _call(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking boto3 call on the I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
 
     async def upload_file(
         self,
@@ -81,6 +119,10 @@ class R2Storage:
         """
         Upload file to R2.
 
+        Files at or above ``multipart_threshold`` are sent as a multipart upload,
+        reading one part at a time from the file object and uploading parts in
+        parallel, so at most ``max_concurrency`` parts are held in memory.
+
         Args:
             file_content: File bytes or file-like object
             filename: Original filename
@@ -100,14 +142,12 @@ class R2Storage:
             >>> print(result["r2_key"])
             cases/123/550e8400-e29b-41d4-a716-446655440000.pdf
         """
-        # Generate unique key with UUID
-        file_id = str(uuid4())
-        file_extension = filename.split(".")[-1] if "." in filename else ""
-        r2_key = f"{folder}/{file_id}.{file_extension}" if folder else f"{file_id}.{file_extension}"
+        file_id, r2_key = self._new_key(filename, folder)
+        s3_metadata = self._build_metadata(filename, file_id, metadata)
 
         # Prepare file content
         if isinstance(file_content, bytes):
-            file_obj = io.BytesIO(file_content)
+            file_obj: BinaryIO = io.BytesIO(file_content)
             file_size = len(file_content)
         else:
             # File-like object
@@ -116,42 +156,157 @@ class R2Storage:
             file_size = file_obj.tell()
             file_obj.seek(0)  # Reset to beginning
 
-        # Prepare S3 metadata
-        s3_metadata = {
-            "original-filename": filename,
-            "uploaded-at": datetime.utcnow().isoformat(),
-            "file-id": file_id,
-        }
+        if file_size >= self.multipart_threshold:
+            await self._multipart_upload(
+                r2_key, self._read_parts(file_obj), content_type, s3_metadata
+            )
+        else:
+            # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.put_object
+            await self._call(
+                self.s3_client.put_object,
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                Body=file_obj,
+                ContentType=content_type,
+                Metadata=s3_metadata,
+            )
 
-        if metadata:
-            # Convert all values to strings (S3 metadata requirement)
-            s3_metadata.update({k: str(v) for k, v in metadata.items()})
+        return self._upload_result(r2_key, file_id, file_size)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes] | Iterable[bytes],
+        filename: str,
+        content_type: str,
+        folder: str = "",
+        metadata: dict[str, str] | None = None,
+        *,
+        r2_key: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Upload a stream of unknown length without buffering the whole file.
+
+        Chunks are regrouped into ``part_size`` parts; a stream shorter than one
+        part is sent with a single PUT, anything longer as a parallel multipart upload.
 
-        # Upload to R2
-        # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.put_object
-        self.s3_client.put_object(
+        Args:
+            chunks: Sync or async iterable of byte chunks (e.g. an HTTP request body)
+            filename: Original filename
+            content_type: MIME type
+            folder: Optional folder/prefix for organization
+            metadata: Additional metadata to store with file
+            r2_key: Explicit object key (defaults to ``<folder>/<uuid>.<ext>``)
+
+        Returns:
+            Dict with r2_key, r2_url, file_size, bucket
+
+        Example:
+            >>> storage = R2Storage()
+            >>> result = await storage.upload_stream(
+            ...     request.stream(), "exhibit.pdf", "application/pdf", folder="exhibits"
+            ... )
+        """
+        file_id, generated_key = self._new_key(filename, folder)
+        r2_key = r2_key or generated_key
+        s3_metadata = self._build_metadata(filename, file_id, metadata)
+
+        parts = _regroup(chunks, self.part_size)
+        first = await anext(parts, b"")
+        second = await anext(parts, None)
+
+        if second is None:
+            await self._call(
+                self.s3_client.put_object,
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                Body=first,
+                ContentType=content_type,
+                Metadata=s3_metadata,
+            )
+            return self._upload_result(r2_key, file_id, len(first))
+
+        async def _all_parts() -> AsyncIterator[bytes]:
+            yield first
+            yield second
+            async for part in parts:
+                yield part
+
+        file_size = await self._multipart_upload(r2_key, _all_parts(), content_type, s3_metadata)
+        return self._upload_result(r2_key, file_id, file_size)
+
+    async def _multipart_upload(
+        self,
+        r2_key: str,
+        parts: AsyncIterator[bytes],
+        content_type: str,
+        s3_metadata: dict[str, str],
+    ) -> int:
+        """Upload parts concurrently; aborts the upload on any failure."""
+        upload = await self._call(
+            self.s3_client.create_multipart_upload,
             Bucket=self.bucket_name,
             Key=r2_key,
-            Body=file_obj,
             ContentType=content_type,
             Metadata=s3_metadata,
         )
+        upload_id = upload["UploadId"]
+        # Bounds the number of parts held in memory at once
+        in_flight = asyncio.Semaphore(self.max_concurrency)
+        tasks: list[asyncio.Task[dict[str, Any]]] = []
+        total = 0
+
+        async def _send(part_number: int, body: bytes) -> dict[str, Any]:
+            try:
+                response = await self._call(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket_name,
+                    Key=r2_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            finally:
+                in_flight.release()
 
-        # Generate URL
-        r2_url = self._get_url(r2_key)
+        try:
+            async for body in parts:
+                await in_flight.acquire()
+                total += len(body)
+                tasks.append(asyncio.create_task(_send(len(tasks) + 1, body)))
+            completed = await asyncio.gather(*tasks)
+            await self._call(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._call(
+                self.s3_client.abort_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=r2_key,
+                UploadId=upload_id,
+            )
+            raise
 
-        return {
-            "r2_key": r2_key,
-            "r2_url": r2_url,
-            "file_size": file_size,
-            "bucket": self.bucket_name,
-            "file_id": file_id,
-        }
+        return total
+
+    async def _read_parts(self, file_obj: BinaryIO) -> AsyncIterator[bytes]:
+        """Read ``part_size`` chunks from a file object off the event loop."""
+        while part := await self._call(file_obj.read, self.part_size):
+            yield part
 
     async def download_file(self, r2_key: str) -> bytes:
         """
         Download file from R2.
 
+        Prefer :meth:`download_stream` or :meth:`download_to_path` for large files.
+
         Args:
             r2_key: File key in R2
 
@@ -164,8 +319,84 @@ class R2Storage:
             >>> len(content)
             52348
         """
-        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-        return response["Body"].read()
+        response = await self._call(self.s3_client.get_object, Bucket=self.bucket_name, Key=r2_key)
+        return await self._call(response["Body"].read)
+
+    async def download_stream(
+        self,
+        r2_key: str,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a file (or an inclusive byte range of it) in chunks.
+
+        Args:
+            r2_key: File key in R2
+            start: First byte offset (inclusive)
+            end: Last byte offset (inclusive)
+            chunk_size: Bytes per yielded chunk
+
+        Yields:
+            Consecutive chunks of the object body
+
+        Example:
+            >>> storage = R2Storage()
+            >>> async for chunk in storage.download_stream("cases/123/doc.pdf"):
+            ...     out.write(chunk)
+        """
+        params: dict[str, Any] = {"Bucket": self.bucket_name, "Key": r2_key}
+        if start is not None or end is not None:
+            params["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+
+        response = await self._call(self.s3_client.get_object, **params)
+        body = response["Body"]
+        try:
+            while chunk := await self._call(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def download_to_path(self, r2_key: str, path: str | Path) -> int:
+        """
+        Download a file to disk using parallel ranged GETs.
+
+        Each range is streamed straight into its offset in the destination file,
+        so memory use is bounded by ``max_concurrency * chunk size``.
+
+        Args:
+            r2_key: File key in R2
+            path: Destination file path
+
+        Returns:
+            Number of bytes written
+
+        Example:
+            >>> storage = R2Storage()
+            >>> await storage.download_to_path("cases/123/doc.pdf", "/tmp/doc.pdf")
+            52348
+        """
+        destination = Path(path)
+        size = (await self.get_metadata(r2_key))["content_length"] or 0
+        await asyncio.to_thread(_preallocate, destination, size)
+        # One open response per pooled connection
+        open_ranges = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch(offset: int) -> None:
+            last = min(offset + self.part_size, size) - 1
+            async with open_ranges:
+                fh = await asyncio.to_thread(destination.open, "r+b")
+                try:
+                    await asyncio.to_thread(fh.seek, offset)
+                    async for chunk in self.download_stream(r2_key, start=offset, end=last):
+                        await asyncio.to_thread(fh.write, chunk)
+                finally:
+                    await asyncio.to_thread(fh.close)
+
+        await asyncio.gather(*(_fetch(offset) for offset in range(0, size, self.part_size)))
+        return size
 
     async def get_metadata(self, r2_key: str) -> dict[str, Any]:
         """
@@ -183,7 +414,7 @@ class R2Storage:
             >>> print(meta["content_type"])
             application/pdf
         """
-        response = self.s3_client.head_object(Bucket=self.bucket_name, Key=r2_key)
+        response = await self._call(self.s3_client.head_object, Bucket=self.bucket_name, Key=r2_key)
         return {
             "content_type": response.get("ContentType"),
             "content_length": response.get("ContentLength"),
@@ -203,12 +434,15 @@ class R2Storage:
             >>> storage = R2Storage()
             >>> await storage.delete_file("cases/123/doc.pdf")
         """
-        self.s3_client.delete_object(Bucket=self.bucket_name, Key=r2_key)
+        await self._call(self.s3_client.delete_object, Bucket=self.bucket_name, Key=r2_key)
 
     async def delete_files(self, r2_keys: list[str]) -> None:
         """
         Batch delete multiple files from R2.
 
+        Keys are split into DeleteObjects requests of up to 1000 keys which run
+        concurrently.
+
         Args:
             r2_keys: List of file keys to delete
 
@@ -219,11 +453,19 @@ class R2Storage:
         if not r2_keys:
             return
 
-        # Prepare delete objects structure
-        objects = [{"Key": key} for key in r2_keys]
-
-        self.s3_client.delete_objects(
-            Bucket=self.bucket_name, Delete={"Objects": objects, "Quiet": True}
+        batches = [
+            r2_keys[start : start + DELETE_BATCH_SIZE]
+            for start in range(0, len(r2_keys), DELETE_BATCH_SIZE)
+        ]
+        await asyncio.gather(
+            *(
+                self._call(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+                for batch in batches
+            )
         )
 
     async def generate_presigned_url(
@@ -265,6 +507,7 @@ class R2Storage:
                 disposition += f'; filename="{download_filename}"'
             params["ResponseContentDisposition"] = disposition
 
+        # Signing is local CPU work, no network round-trip
         url = self.s3_client.generate_presigned_url(
             "get_object", Params=params, ExpiresIn=expiration
         )
@@ -275,6 +518,8 @@ class R2Storage:
         """
         List files in R2 bucket.
 
+        Follows continuation tokens until ``max_keys`` results are collected.
+
         Args:
             prefix: Filter by key prefix (e.g., "cases/123/")
             max_keys: Maximum number of results
@@ -288,21 +533,25 @@ class R2Storage:
             >>> len(files)
             5
         """
-        response = self.s3_client.list_objects_v2(
-            Bucket=self.bucket_name, Prefix=prefix, MaxKeys=max_keys
-        )
-
-        files = []
-        for obj in response.get("Contents", []):
-            files.append(
-                {
-                    "key": obj["Key"],
-                    "size": obj["Size"],
-                    "last_modified": obj["LastModified"],
-                    "etag": obj["ETag"],
-                    "url": self._get_url(obj["Key"]),
-                }
-            )
+        files: list[dict[str, Any]] = []
+        params: dict[str, Any] = {"Bucket": self.bucket_name, "Prefix": prefix}
+
+        while len(files) < max_keys:
+            params["MaxKeys"] = min(1000, max_keys - len(files))
+            response = await self._call(self.s3_client.list_objects_v2, **params)
+            for obj in response.get("Contents", []):
+                files.append(
+                    {
+                        "key": obj["Key"],
+                        "size": obj["Size"],
+                        "last_modified": obj["LastModified"],
+                        "etag": obj["ETag"],
+                        "url": self._get_url(obj["Key"]),
+                    }
+                )
+            if not response.get("IsTruncated"):
+                break
+            params["ContinuationToken"] = response["NextContinuationToken"]
 
         return files
 
@@ -319,7 +568,56 @@ class R2Storage:
             >>> await storage.copy_file("doc.pdf", "archive/doc.pdf")
         """
         copy_source = {"Bucket": self.bucket_name, "Key": source_key}
-        self.s3_client.copy_object(CopySource=copy_source, Bucket=self.bucket_name, Key=dest_key)
+        await self._call(
+            self.s3_client.copy_object,
+            CopySource=copy_source,
+            Bucket=self.bucket_name,
+            Key=dest_key,
+        )
+
+    async def copy_files(self, pairs: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        """
+        Copy several files concurrently (bounded by ``max_concurrency``).
+
+        Args:
+            pairs: Mapping or iterable of (source_key, dest_key)
+
+        Example:
+            >>> storage = R2Storage()
+            >>> await storage.copy_files({"a.pdf": "archive/a.pdf", "b.pdf": "archive/b.pdf"})
+        """
+        items = pairs.items() if isinstance(pairs, Mapping) else pairs
+        await asyncio.gather(*(self.copy_file(src, dst) for src, dst in items))
+
+    def _new_key(self, filename: str, folder: str) -> tuple[str, str]:
+        """Generate unique key with UUID."""
+        file_id = str(uuid4())
+        file_extension = filename.split(".")[-1] if "." in filename else ""
+        r2_key = f"{folder}/{file_id}.{file_extension}" if folder else f"{file_id}.{file_extension}"
+        return file_id, r2_key
+
+    @staticmethod
+    def _build_metadata(
+        filename: str, file_id: str, metadata: dict[str, str] | None
+    ) -> dict[str, str]:
+        """Prepare S3 metadata (all values must be strings)."""
+        s3_metadata = {
+            "original-filename": filename,
+            "uploaded-at": datetime.utcnow().isoformat(),
+            "file-id": file_id,
+        }
+        if metadata:
+            s3_metadata.update({k: str(v) for k, v in metadata.items()})
+        return s3_metadata
+
+    def _upload_result(self, r2_key: str, file_id: str, file_size: int) -> dict[str, Any]:
+        return {
+            "r2_key": r2_key,
+            "r2_url": self._get_url(r2_key),
+            "file_size": file_size,
+            "bucket": self.bucket_name,
+            "file_id": file_id,
+        }
 
     def _get_url(self, r2_key: str) -> str:
         """Generate URL for file (public URL if configured, else endpoint URL)."""
@@ -340,11 +638,44 @@ class R2Storage:
             True
         """
         try:
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            await self._call(self.s3_client.head_bucket, Bucket=self.bucket_name)
             return True
         except Exception:
             return False
 
+    async def close(self) -> None:
+        """Shut down the I/O thread pool once in-flight requests complete."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+
+async def _regroup(
+    chunks: AsyncIterable[bytes] | Iterable[bytes], size: int
+) -> AsyncIterator[bytes]:
+    """Re-chunk an arbitrary byte stream into ``size``-byte parts (last part may be shorter)."""
+    buffer = bytearray()
+
+    async def _iterate() -> AsyncIterator[bytes]:
+        if isinstance(chunks, AsyncIterable):
+            async for chunk in chunks:
+                yield chunk
+        else:
+            for chunk in chunks:
+                yield chunk
+
+    async for chunk in _iterate():
+        buffer.extend(chunk)
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _preallocate(path: Path, size: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as fh:
+        fh.truncate(size)
+
 
 def create_r2_storage() -> R2Storage:
     """
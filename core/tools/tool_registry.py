@@ -14,6 +14,7 @@ Updated for GPT-5 function calling (March 2025).
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Protocol
@@ -52,6 +53,7 @@ class ToolMetadata:
     parameters: dict[str, Any] | None = None  # JSON Schema for function parameters
     strict: bool = False  # Structured outputs mode (GPT-5)
     enabled: bool = True
+    isolated: bool = False  # Run in a sandbox worker process (tool must be picklable)
 
 
 class ToolRegistry:
@@ -99,8 +101,13 @@ class ToolRegistry:
         *,
         caller_role: str,
         arguments: dict[str, Any] | None = None,
+        runner: Callable[..., Awaitable[Any]] | None = None,
     ) -> Any:
-        """Invoke a tool ensuring role-based permissions."""
+        """Invoke a tool ensuring role-based permissions.
+
+        ``runner``, if given, is called as ``runner(tool, **arguments)`` instead
+        of calling the tool directly (e.g. ``SandboxRunner.run_async``).
+        """
 
         if tool_id not in self._tools:
             raise KeyError(f"Tool '{tool_id}' not registered")
@@ -111,7 +118,7 @@ class ToolRegistry:
 
         tool = self._tools[tool_id]
         args = dict(arguments or {})
-        result = await tool(**args)
+        result = await (runner(tool, **args) if runner else tool(**args))
         self._history[tool_id].append(
             {
                 "role": caller_role,
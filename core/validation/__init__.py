@@ -2,27 +2,57 @@
 
 This module provides validation and quality control capabilities:
 - Confidence scoring for agent outputs
-- Quality metrics tracking
+- Quality metrics tracking with streaming, mergeable aggregates
 - Validation loops with retry logic
 """
 
 from __future__ import annotations
 
-from .confidence_scorer import (ConfidenceMetrics, ConfidenceScorer,
-                                ConfidenceThreshold, get_confidence_scorer)
-from .quality_metrics import (QualityMetrics, QualityTracker,
-                              get_quality_tracker)
+from .confidence_scorer import (
+    ConfidenceMetrics,
+    ConfidenceScorer,
+    ConfidenceThreshold,
+    get_confidence_scorer,
+)
+from .quality_metrics import (
+    InMemoryQualityStore,
+    QualityAggregate,
+    QualityExporter,
+    QualityMetrics,
+    QualityStore,
+    QualityTracker,
+    RedisQualityStore,
+    configure_quality_tracker,
+    create_quality_store,
+    get_quality_tracker,
+    start_quality_flush,
+    stop_quality_flush,
+)
 from .retry_handler import RetryConfig, RetryHandler, RetryStrategy
+from .streaming_stats import EWMA, RunningStats, TDigest, robust_z
 
 __all__ = [
+    "EWMA",
     "ConfidenceMetrics",
     "ConfidenceScorer",
     "ConfidenceThreshold",
+    "InMemoryQualityStore",
+    "QualityAggregate",
+    "QualityExporter",
     "QualityMetrics",
+    "QualityStore",
     "QualityTracker",
+    "RedisQualityStore",
     "RetryConfig",
     "RetryHandler",
     "RetryStrategy",
+    "RunningStats",
+    "TDigest",
+    "configure_quality_tracker",
+    "create_quality_store",
     "get_confidence_scorer",
     "get_quality_tracker",
+    "robust_z",
+    "start_quality_flush",
+    "stop_quality_flush",
 ]
@@ -2,15 +2,51 @@
 
 This module provides quality metrics tracking and analytics for
 self-correcting agents.
+
+Aggregates are maintained incrementally as operations are recorded, per
+agent and per time bucket, so reads never rescan the history: totals are
+read directly, and a window merges at most ``max_buckets`` bucket
+aggregates (a few dozen t-digest centroids each):
+
+- totals and windows: Welford mean/variance plus t-digest quantiles,
+  mergeable across workers through a ``QualityStore``
+- trends: Welch's t-test between the two halves of the recent window,
+  computed from fixed-size blocks of operations
+- smoothing: EWMA of confidence, duration, retries and success
+- anomalies: modified z-scores against a rolling median/MAD baseline,
+  scored once when an operation is recorded
+
+At startup ``start_quality_flush`` gives the global tracker the shared
+store and flushes it periodically, so ``get_shared_stats`` sees every
+worker.
 """
 
 from __future__ import annotations
 
-import time
-from collections import deque
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+import json
+import math
+import os
+import socket
+import time
+from typing import Any, Protocol
+import uuid
+
+import structlog
+
+from .streaming_stats import EWMA, RunningStats, TDigest, robust_z
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BUCKET_SECONDS = 60
+DEFAULT_MAX_BUCKETS = 60  # one hour of one-minute buckets
+DIGEST_COMPRESSION = 50.0
+TOTAL_KEY = "total"  # store key of the all-time aggregate
+DEFAULT_FLUSH_INTERVAL = float(os.getenv("QUALITY_FLUSH_INTERVAL_SECONDS", "15"))
 
 
 @dataclass
@@ -28,6 +64,345 @@ class QualityMetrics:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class QualityAggregate:
+    """Mergeable summary of a set of operations."""
+
+    successes: int = 0
+    confidence: RunningStats = field(default_factory=RunningStats)
+    duration: RunningStats = field(default_factory=RunningStats)
+    retries: RunningStats = field(default_factory=RunningStats)
+    confidence_digest: TDigest = field(default_factory=lambda: TDigest(DIGEST_COMPRESSION))
+    duration_digest: TDigest = field(default_factory=lambda: TDigest(DIGEST_COMPRESSION))
+
+    @property
+    def operations(self) -> int:
+        return self.confidence.count
+
+    def add(self, metrics: QualityMetrics) -> None:
+        self.successes += metrics.success
+        self.confidence.add(metrics.confidence_score)
+        self.duration.add(metrics.duration_seconds)
+        self.retries.add(metrics.retry_count)
+        self.confidence_digest.update(metrics.confidence_score)
+        self.duration_digest.update(metrics.duration_seconds)
+
+    def merge(self, other: QualityAggregate) -> QualityAggregate:
+        self.successes += other.successes
+        self.confidence.merge(other.confidence)
+        self.duration.merge(other.duration)
+        self.retries.merge(other.retries)
+        self.confidence_digest.merge(other.confidence_digest)
+        self.duration_digest.merge(other.duration_digest)
+        return self
+
+    def describe(self) -> dict[str, Any]:
+        """Statistics with the keys ``get_agent_stats`` has always returned, plus spread and quantiles."""
+        total = self.operations
+        return {
+            "total_operations": total,
+            "successful_operations": self.successes,
+            "failed_operations": total - self.successes,
+            "total_retries": round(self.retries.total),
+            "total_duration": self.duration.total,
+            "avg_confidence": self.confidence.mean,
+            "avg_retries": self.retries.mean,
+            "avg_duration": self.duration.mean,
+            "success_rate": self.successes / total if total else 0.0,
+            "confidence_std": self.confidence.std,
+            "duration_std": self.duration.std,
+            "confidence_p10": self.confidence_digest.quantile(0.1),
+            "confidence_p50": self.confidence_digest.quantile(0.5),
+            "duration_p50": self.duration_digest.quantile(0.5),
+            "duration_p90": self.duration_digest.quantile(0.9),
+            "duration_p99": self.duration_digest.quantile(0.99),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "successes": self.successes,
+            "confidence": self.confidence.to_dict(),
+            "duration": self.duration.to_dict(),
+            "retries": self.retries.to_dict(),
+            "confidence_digest": self.confidence_digest.to_dict(),
+            "duration_digest": self.duration_digest.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QualityAggregate:
+        return cls(
+            successes=data["successes"],
+            confidence=RunningStats.from_dict(data["confidence"]),
+            duration=RunningStats.from_dict(data["duration"]),
+            retries=RunningStats.from_dict(data["retries"]),
+            confidence_digest=TDigest.from_dict(data["confidence_digest"]),
+            duration_digest=TDigest.from_dict(data["duration_digest"]),
+        )
+
+
+@dataclass(slots=True)
+class _Block:
+    """Moments of ``block_size`` consecutive operations (trend input)."""
+
+    confidence: RunningStats = field(default_factory=RunningStats)
+    retries: RunningStats = field(default_factory=RunningStats)
+    duration: RunningStats = field(default_factory=RunningStats)
+
+    def add(self, metrics: QualityMetrics) -> None:
+        self.confidence.add(metrics.confidence_score)
+        self.retries.add(metrics.retry_count)
+        self.duration.add(metrics.duration_seconds)
+
+    def merge(self, other: _Block) -> _Block:
+        self.confidence.merge(other.confidence)
+        self.retries.merge(other.retries)
+        self.duration.merge(other.duration)
+        return self
+
+
+@dataclass(slots=True)
+class _Baseline:
+    """Rolling median/MAD of one metric from two rotating t-digests."""
+
+    current: TDigest = field(default_factory=lambda: TDigest(DIGEST_COMPRESSION))
+    previous: TDigest | None = None
+    median: float = 0.0
+    mad: float = 0.0
+
+    def refresh(self) -> None:
+        digest = self.current
+        if self.previous is not None:
+            digest = TDigest(DIGEST_COMPRESSION).merge(self.previous).merge(self.current)
+        self.median = digest.quantile(0.5) or 0.0
+        # Half the interquartile range: equals the MAD for symmetric distributions
+        self.mad = ((digest.quantile(0.75) or 0.0) - (digest.quantile(0.25) or 0.0)) / 2
+
+    def rotate(self) -> None:
+        self.previous, self.current = self.current, TDigest(DIGEST_COMPRESSION)
+
+
+class _State:
+    """Incremental aggregates of one agent (or of all agents)."""
+
+    def __init__(self, history_size: int, block_size: int, ewma_alpha: float) -> None:
+        self.totals = QualityAggregate()
+        self.buckets: OrderedDict[int, QualityAggregate] = OrderedDict()
+        self.dirty: set[str] = set()
+        self.block_size = block_size
+        self.blocks: deque[_Block] = deque(maxlen=max(2, history_size // block_size))
+        self.ewma = {name: EWMA(ewma_alpha) for name in ("confidence", "duration", "retries", "success")}
+
+    def add(self, metrics: QualityMetrics, bucket: int, max_buckets: int) -> None:
+        self.totals.add(metrics)
+        aggregate = self.buckets.get(bucket)
+        if aggregate is None:
+            aggregate = self.buckets[bucket] = QualityAggregate()
+            while len(self.buckets) > max_buckets:
+                self.buckets.popitem(last=False)
+        aggregate.add(metrics)
+        self.dirty.update((TOTAL_KEY, str(bucket)))
+
+        if not self.blocks or self.blocks[-1].confidence.count >= self.block_size:
+            self.blocks.append(_Block())
+        self.blocks[-1].add(metrics)
+
+        self.ewma["confidence"].update(metrics.confidence_score)
+        self.ewma["duration"].update(metrics.duration_seconds)
+        self.ewma["retries"].update(metrics.retry_count)
+        self.ewma["success"].update(float(metrics.success))
+
+    def window(self, first_bucket: int) -> QualityAggregate:
+        aggregate = QualityAggregate()
+        for bucket, part in reversed(self.buckets.items()):
+            if bucket < first_bucket:
+                break
+            aggregate.merge(part)
+        return aggregate
+
+    def describe(self) -> dict[str, Any]:
+        stats = self.totals.describe()
+        stats.update({f"ewma_{name}": ewma.value for name, ewma in self.ewma.items()})
+        return stats
+
+
+class _AgentState(_State):
+    def __init__(
+        self, history_size: int, block_size: int, ewma_alpha: float, max_anomalies: int
+    ) -> None:
+        super().__init__(history_size, block_size, ewma_alpha)
+        self.history_size = history_size
+        self.recent: deque[QualityMetrics] = deque(maxlen=history_size)
+        self.anomalies: deque[dict[str, Any]] = deque(maxlen=max_anomalies)
+        self.baselines = {"confidence": _Baseline(), "duration": _Baseline()}
+        self.baseline_size = 0
+        self.next_refresh = 10
+        self.refresh_every = max(block_size, history_size // 20)
+
+    def score(self, metrics: QualityMetrics) -> dict[str, float]:
+        """Robust z-scores of ``metrics`` against the baseline, then learn from it."""
+        scores = {}
+        for name, value, stats in (
+            ("confidence", metrics.confidence_score, self.totals.confidence),
+            ("duration", metrics.duration_seconds, self.totals.duration),
+        ):
+            baseline = self.baselines[name]
+            if self.baseline_size >= 10:
+                scores[name] = robust_z(value, baseline.median, baseline.mad, stats.std)
+            baseline.current.update(value)
+
+        self.baseline_size += 1
+        if self.baseline_size % self.history_size == 0:
+            for baseline in self.baselines.values():
+                baseline.rotate()
+        if self.baseline_size >= self.next_refresh:
+            # Doubling while the baseline is young, then at a fixed interval
+            self.next_refresh += min(self.baseline_size, self.refresh_every)
+            for baseline in self.baselines.values():
+                baseline.refresh()
+        return scores
+
+
+class QualityStore(Protocol):
+    """Shared storage of per-worker aggregates."""
+
+    async def save(self, agent: str, worker_id: str, aggregates: dict[str, dict]) -> None: ...
+
+    async def load(self, agent: str, keys: list[str]) -> list[dict]: ...
+
+    async def list_agents(self) -> list[str]: ...
+
+
+class InMemoryQualityStore:
+    """Process-local store (tests and single-worker deployments)."""
+
+    def __init__(self) -> None:
+        self._data: dict[tuple[str, str], dict[str, dict]] = {}
+
+    async def save(self, agent: str, worker_id: str, aggregates: dict[str, dict]) -> None:
+        for key, payload in aggregates.items():
+            self._data.setdefault((agent, key), {})[worker_id] = payload
+
+    async def load(self, agent: str, keys: list[str]) -> list[dict]:
+        return [
+            payload for key in keys for payload in self._data.get((agent, key), {}).values()
+        ]
+
+    async def list_agents(self) -> list[str]:
+        return sorted({agent for agent, _ in self._data})
+
+
+class RedisQualityStore:
+    """Redis store: one hash per (agent, bucket) with a field per worker.
+
+    Each worker overwrites its own field with its cumulative aggregate, so
+    flushes are idempotent and concurrent workers never lose updates;
+    readers merge the fields.
+    """
+
+    def __init__(self, redis_client: Any, prefix: str = "quality", ttl_seconds: int = 7200) -> None:
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, agent: str, key: str) -> str:
+        return f"{self.prefix}:{agent}:{key}"
+
+    async def save(self, agent: str, worker_id: str, aggregates: dict[str, dict]) -> None:
+        pipe = self.redis.pipeline()
+        pipe.sadd(f"{self.prefix}:agents", agent)
+        for key, payload in aggregates.items():
+            pipe.hset(self._key(agent, key), worker_id, json.dumps(payload))
+            if key != TOTAL_KEY:
+                pipe.expire(self._key(agent, key), self.ttl_seconds)
+        await pipe.execute()
+
+    async def load(self, agent: str, keys: list[str]) -> list[dict]:
+        pipe = self.redis.pipeline()
+        for key in keys:
+            pipe.hvals(self._key(agent, key))
+        return [json.loads(raw) for values in await pipe.execute() for raw in values]
+
+    async def list_agents(self) -> list[str]:
+        members = await self.redis.smembers(f"{self.prefix}:agents")
+        return sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+
+
+async def create_quality_store() -> QualityStore:
+    """Use the Redis store when Redis is enabled, else an in-memory one."""
+    from core.storage.redis_client import get_redis_client
+
+    redis = await get_redis_client()
+    return RedisQualityStore(redis) if redis is not None else InMemoryQualityStore()
+
+
+class QualityExporter:
+    """Prometheus gauges for agent quality, labelled by agent."""
+
+    def __init__(self, registry: Any = None) -> None:
+        from prometheus_client import REGISTRY, Counter, Gauge
+
+        registry = registry or REGISTRY
+        self.operations = Gauge(
+            "agent_quality_operations",
+            "Operations recorded by this worker",
+            ["agent", "outcome"],
+            registry=registry,
+        )
+        self.confidence = Gauge(
+            "agent_quality_confidence",
+            "Confidence score statistics",
+            ["agent", "stat"],
+            registry=registry,
+        )
+        self.duration = Gauge(
+            "agent_quality_duration_seconds",
+            "Operation duration statistics",
+            ["agent", "stat"],
+            registry=registry,
+        )
+        self.anomalies = Counter(
+            "agent_quality_anomalies",
+            "Operations flagged as anomalous",
+            ["agent", "reason"],
+            registry=registry,
+        )
+
+    def publish(self, agent: str, stats: dict[str, Any]) -> None:
+        self.operations.labels(agent, "success").set(stats["successful_operations"])
+        self.operations.labels(agent, "failure").set(stats["failed_operations"])
+        for gauge, prefix, names in (
+            (self.confidence, "confidence", ("p10", "p50")),
+            (self.duration, "duration", ("p50", "p90", "p99")),
+        ):
+            gauge.labels(agent, "mean").set(stats[f"avg_{prefix}"])
+            gauge.labels(agent, "ewma").set(stats[f"ewma_{prefix}"])
+            for name in names:
+                gauge.labels(agent, name).set(stats[f"{prefix}_{name}"])
+
+
+_default_exporter: QualityExporter | None = None
+
+
+def _get_default_exporter() -> QualityExporter:
+    global _default_exporter
+    if _default_exporter is None:
+        _default_exporter = QualityExporter()
+    return _default_exporter
+
+
+def _welch_t(recent: RunningStats, older: RunningStats) -> float:
+    """Welch's t statistic of ``recent.mean - older.mean``."""
+    if recent.count < 2 or older.count < 2:
+        return 0.0
+    diff = recent.mean - older.mean
+    se = math.sqrt(
+        recent.m2 / (recent.count - 1) / recent.count + older.m2 / (older.count - 1) / older.count
+    )
+    if se:
+        return diff / se
+    return 0.0 if not diff else math.copysign(math.inf, diff)
+
+
 class QualityTracker:
     """
     Tracks and analyzes quality metrics for self-correcting agents.
@@ -39,6 +414,10 @@ class QualityTracker:
     - Quality trends analysis
     - Per-agent metrics
 
+    Every statistic is updated when an operation is recorded; reading
+    stats, trends or anomalies never rescans the history, and a window
+    merges at most ``max_buckets`` bucket aggregates.
+
     Example:
         >>> tracker = QualityTracker()
         >>> tracker.record_operation(
@@ -50,16 +429,67 @@ class QualityTracker:
         ... )
     """
 
-    def __init__(self, history_size: int = 1000):
+    def __init__(
+        self,
+        history_size: int = 1000,
+        *,
+        block_size: int = 10,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+        ewma_alpha: float = 0.1,
+        trend_threshold: float = 2.0,
+        min_anomaly_score: float = 2.0,
+        anomaly_threshold: float = 3.5,
+        max_anomalies: int = 100,
+        store: QualityStore | None = None,
+        worker_id: str | None = None,
+        exporter: QualityExporter | None = None,
+        export_metrics: bool = True,
+        publish_every: int = 50,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Initialize quality tracker.
 
         Args:
             history_size: Number of operations to keep in memory
+            block_size: Operations per trend block (trend window granularity)
+            bucket_seconds: Width of the time buckets behind windowed stats
+            max_buckets: Time buckets kept per agent
+            ewma_alpha: Smoothing factor of the EWMAs
+            trend_threshold: |t| above which a trend is reported
+            min_anomaly_score: Smallest robust z-score kept as an anomaly candidate
+            anomaly_threshold: Robust z-score counted as an anomaly in Prometheus
+            max_anomalies: Anomalies kept per agent
+            store: Shared store for cross-worker aggregates (see ``flush``)
+            worker_id: Identity of this worker in the store
+            exporter: Prometheus gauges to publish to (default: process-wide)
+            export_metrics: Set False to skip Prometheus entirely
+            publish_every: Operations per agent between Prometheus updates
+            clock: Time source for bucketing
         """
         self.history_size = history_size
+        self.block_size = block_size
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self.ewma_alpha = ewma_alpha
+        self.trend_threshold = trend_threshold
+        self.min_anomaly_score = min_anomaly_score
+        self.anomaly_threshold = anomaly_threshold
+        self.max_anomalies = max_anomalies
+        self.store = store
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.exporter = exporter or (_get_default_exporter() if export_metrics else None)
+        self.publish_every = publish_every
+        self.clock = clock
+
         self.operations: deque[QualityMetrics] = deque(maxlen=history_size)
-        self.agent_stats: dict[str, dict[str, Any]] = {}
+        self._agents: dict[str, _AgentState] = {}
+        self._all = _State(history_size, block_size, ewma_alpha)
+
+    @property
+    def agent_stats(self) -> dict[str, dict[str, Any]]:
+        return self.get_all_stats()
 
     def record_operation(
         self,
@@ -95,12 +525,13 @@ class QualityTracker:
             ...     user_id="123"
             ... )
         """
-        operation_id = operation_id or f"{agent_name}_{int(time.time() * 1000)}"
+        now = self.clock()
+        operation_id = operation_id or f"{agent_name}_{int(now * 1000)}"
 
         metrics = QualityMetrics(
             operation_id=operation_id,
             agent_name=agent_name,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.utcfromtimestamp(now),
             confidence_score=confidence_score,
             retry_count=retry_count,
             duration_seconds=duration_seconds,
@@ -110,43 +541,60 @@ class QualityTracker:
         )
 
         self.operations.append(metrics)
-        self._update_agent_stats(agent_name, metrics)
-
-    def _update_agent_stats(self, agent_name: str, metrics: QualityMetrics) -> None:
-        """Update per-agent statistics."""
-        if agent_name not in self.agent_stats:
-            self.agent_stats[agent_name] = {
-                "total_operations": 0,
-                "successful_operations": 0,
-                "failed_operations": 0,
-                "total_retries": 0,
-                "total_duration": 0.0,
-                "avg_confidence": 0.0,
-                "avg_retries": 0.0,
-                "avg_duration": 0.0,
-                "success_rate": 0.0,
+        state = self._agents.get(agent_name)
+        if state is None:
+            state = self._agents[agent_name] = _AgentState(
+                self.history_size, self.block_size, self.ewma_alpha, self.max_anomalies
+            )
+        state.recent.append(metrics)
+
+        scores = state.score(metrics)
+        bucket = int(now // self.bucket_seconds)
+        state.add(metrics, bucket, self.max_buckets)
+        self._all.add(metrics, bucket, self.max_buckets)
+        self._track_anomaly(state, metrics, scores)
+
+        if self.exporter is not None and state.totals.operations % self.publish_every == 0:
+            self.exporter.publish(agent_name, state.describe())
+
+    def _track_anomaly(
+        self, state: _AgentState, metrics: QualityMetrics, scores: dict[str, float]
+    ) -> None:
+        worst = max((abs(score) for score in scores.values()), default=0.0)
+        if worst < self.min_anomaly_score and metrics.retry_count <= 3:
+            return
+        state.anomalies.append(
+            {
+                "operation_id": metrics.operation_id,
+                "agent_name": metrics.agent_name,
+                "timestamp": metrics.timestamp.isoformat(),
+                "confidence_score": metrics.confidence_score,
+                "duration_seconds": metrics.duration_seconds,
+                "retry_count": metrics.retry_count,
+                "scores": scores,
             }
-
-        stats = self.agent_stats[agent_name]
-        stats["total_operations"] += 1
-
-        if metrics.success:
-            stats["successful_operations"] += 1
-        else:
-            stats["failed_operations"] += 1
-
-        stats["total_retries"] += metrics.retry_count
-        stats["total_duration"] += metrics.duration_seconds
-
-        # Calculate averages
-        total = stats["total_operations"]
-        stats["avg_confidence"] = (
-            stats["avg_confidence"] * (total - 1) + metrics.confidence_score
-        ) / total
-
-        stats["avg_retries"] = stats["total_retries"] / total
-        stats["avg_duration"] = stats["total_duration"] / total
-        stats["success_rate"] = stats["successful_operations"] / total
+        )
+        if self.exporter is not None:
+            for reason in self._reasons(state.anomalies[-1], self.anomaly_threshold):
+                self.exporter.anomalies.labels(metrics.agent_name, reason).inc()
+        if worst >= self.anomaly_threshold:
+            logger.info(
+                "quality_tracker.anomaly",
+                agent=metrics.agent_name,
+                operation_id=metrics.operation_id,
+                scores=scores,
+            )
+
+    @staticmethod
+    def _reasons(anomaly: dict[str, Any], threshold: float) -> list[str]:
+        reasons = [
+            f"unusual_{name}"
+            for name, score in anomaly["scores"].items()
+            if abs(score) > threshold
+        ]
+        if anomaly["retry_count"] > 3:
+            reasons.append("excessive_retries")
+        return reasons
 
     def get_agent_stats(self, agent_name: str) -> dict[str, Any]:
         """
@@ -163,11 +611,35 @@ class QualityTracker:
             >>> print(stats["avg_confidence"])
             0.85
         """
-        return self.agent_stats.get(agent_name, {}).copy()
+        state = self._agents.get(agent_name)
+        return state.describe() if state is not None else {}
 
     def get_all_stats(self) -> dict[str, dict[str, Any]]:
         """Get statistics for all agents."""
-        return {name: stats.copy() for name, stats in self.agent_stats.items()}
+        return {name: state.describe() for name, state in self._agents.items()}
+
+    def get_window_stats(
+        self,
+        agent_name: str | None = None,
+        seconds: int = 300,
+    ) -> dict[str, Any]:
+        """
+        Statistics of the operations recorded in the last ``seconds``.
+
+        Windows are made of whole time buckets, so they are resolved to
+        ``bucket_seconds`` and limited to ``max_buckets`` of history.
+
+        Example:
+            >>> tracker.get_window_stats("research_agent", seconds=600)["duration_p90"]
+        """
+        state = self._all if agent_name is None else self._agents.get(agent_name)
+        if state is None:
+            return {}
+        first = self._first_bucket(seconds)
+        return {"window_seconds": seconds, **state.window(first).describe()}
+
+    def _first_bucket(self, seconds: int) -> int:
+        return int(self.clock() // self.bucket_seconds) - math.ceil(seconds / self.bucket_seconds) + 1
 
     def get_recent_operations(
         self,
@@ -187,15 +659,14 @@ class QualityTracker:
         Example:
             >>> recent = tracker.get_recent_operations("research_agent", limit=5)
         """
-        operations = list(self.operations)
-
         if agent_name:
-            operations = [op for op in operations if op.agent_name == agent_name]
+            state = self._agents.get(agent_name)
+            operations = state.recent if state is not None else deque()
+        else:
+            operations = self.operations
 
         # Most recent first
-        operations.reverse()
-
-        return operations[:limit]
+        return [operations[-i] for i in range(1, min(limit, len(operations)) + 1)]
 
     def get_quality_trend(
         self,
@@ -205,6 +676,10 @@ class QualityTracker:
         """
         Analyze quality trends.
 
+        The last ``window_size`` operations (rounded up to whole blocks) are
+        split into an older and a recent half, compared with Welch's t-test;
+        a metric is "stable" unless |t| exceeds ``trend_threshold``.
+
         Args:
             agent_name: Optional filter by agent name
             window_size: Number of recent operations to analyze
@@ -217,33 +692,37 @@ class QualityTracker:
             >>> print(trend["confidence_trend"])
             'improving'
         """
-        operations = self.get_recent_operations(agent_name, window_size)
+        state = self._all if agent_name is None else self._agents.get(agent_name)
+        blocks = list(state.blocks)[-math.ceil(window_size / self.block_size) :] if state else []
+        operations_count = sum(block.confidence.count for block in blocks)
 
-        if len(operations) < 10:
+        if operations_count < 10 or len(blocks) < 2:
             return {
                 "status": "insufficient_data",
-                "operations_count": len(operations),
+                "operations_count": operations_count,
             }
 
-        # Split into old and recent halves
-        mid = len(operations) // 2
-        recent_half = operations[:mid]
-        older_half = operations[mid:]
-
-        # Calculate averages
-        recent_conf = sum(op.confidence_score for op in recent_half) / len(recent_half)
-        older_conf = sum(op.confidence_score for op in older_half) / len(older_half)
+        mid = len(blocks) // 2
+        older = _Block()
+        for block in blocks[:mid]:
+            older.merge(block)
+        recent = _Block()
+        for block in blocks[mid:]:
+            recent.merge(block)
 
-        recent_retries = sum(op.retry_count for op in recent_half) / len(recent_half)
-        older_retries = sum(op.retry_count for op in older_half) / len(older_half)
+        def trend(name: str, higher_is_better: bool) -> tuple[str, float]:
+            t = _welch_t(getattr(recent, name), getattr(older, name))
+            if abs(t) <= self.trend_threshold:
+                return "stable", t
+            return ("improving" if (t > 0) == higher_is_better else "declining"), t
 
-        recent_duration = sum(op.duration_seconds for op in recent_half) / len(recent_half)
-        older_duration = sum(op.duration_seconds for op in older_half) / len(older_half)
+        conf_trend, conf_t = trend("confidence", True)
+        retry_trend, retry_t = trend("retries", False)
+        duration_trend, duration_t = trend("duration", False)
 
-        # Determine trends
-        conf_trend = "improving" if recent_conf > older_conf else "declining"
-        retry_trend = "improving" if recent_retries < older_retries else "declining"
-        duration_trend = "improving" if recent_duration < older_duration else "declining"
+        recent_conf = recent.confidence.mean
+        recent_retries = recent.retries.mean
+        recent_duration = recent.duration.mean
 
         # Overall health
         health_score = (
@@ -254,16 +733,20 @@ class QualityTracker:
 
         return {
             "status": "analyzed",
-            "operations_count": len(operations),
+            "operations_count": operations_count,
             "recent_avg_confidence": recent_conf,
-            "older_avg_confidence": older_conf,
+            "older_avg_confidence": older.confidence.mean,
             "confidence_trend": conf_trend,
+            "confidence_t": conf_t,
             "recent_avg_retries": recent_retries,
-            "older_avg_retries": older_retries,
+            "older_avg_retries": older.retries.mean,
             "retry_trend": retry_trend,
+            "retry_t": retry_t,
             "recent_avg_duration": recent_duration,
-            "older_avg_duration": older_duration,
+            "older_avg_duration": older.duration.mean,
             "duration_trend": duration_trend,
+            "duration_t": duration_t,
+            "ewma_confidence": state.ewma["confidence"].value,
             "health_score": health_score,
             "health_status": "good" if health_score > 0.7 else "attention_needed",
         }
@@ -271,71 +754,40 @@ class QualityTracker:
     def detect_anomalies(
         self,
         agent_name: str | None = None,
-        threshold: float = 2.0,
+        threshold: float = 3.5,
     ) -> list[dict[str, Any]]:
         """
         Detect anomalous operations.
 
+        Each operation is scored when recorded with a modified z-score
+        (distance from the agent's rolling median in units of 1.4826 x MAD),
+        so outliers cannot inflate their own baseline. Scores below
+        ``min_anomaly_score`` are not kept.
+
         Args:
             agent_name: Optional filter by agent name
-            threshold: Standard deviations for anomaly detection
+            threshold: Robust z-score above which an operation is anomalous
 
         Returns:
-            List of anomalous operations
+            List of anomalous operations, oldest first
 
         Example:
             >>> anomalies = tracker.detect_anomalies(threshold=2.5)
         """
-        operations = list(self.operations)
-
         if agent_name:
-            operations = [op for op in operations if op.agent_name == agent_name]
-
-        if len(operations) < 10:
-            return []
-
-        # Calculate mean and std dev for confidence
-        confidences = [op.confidence_score for op in operations]
-        mean_conf = sum(confidences) / len(confidences)
-        var_conf = sum((c - mean_conf) ** 2 for c in confidences) / len(confidences)
-        std_conf = var_conf**0.5
-
-        # Calculate for duration
-        durations = [op.duration_seconds for op in operations]
-        mean_dur = sum(durations) / len(durations)
-        var_dur = sum((d - mean_dur) ** 2 for d in durations) / len(durations)
-        std_dur = var_dur**0.5
+            states = [self._agents[agent_name]] if agent_name in self._agents else []
+        else:
+            states = list(self._agents.values())
 
-        # Find anomalies
         anomalies = []
-        for op in operations:
-            reasons = []
-
-            # Check confidence anomaly
-            if abs(op.confidence_score - mean_conf) > threshold * std_conf:
-                reasons.append("unusual_confidence")
-
-            # Check duration anomaly
-            if abs(op.duration_seconds - mean_dur) > threshold * std_dur:
-                reasons.append("unusual_duration")
-
-            # Check excessive retries
-            if op.retry_count > 3:
-                reasons.append("excessive_retries")
-
-            if reasons:
-                anomalies.append(
-                    {
-                        "operation_id": op.operation_id,
-                        "agent_name": op.agent_name,
-                        "timestamp": op.timestamp.isoformat(),
-                        "confidence_score": op.confidence_score,
-                        "duration_seconds": op.duration_seconds,
-                        "retry_count": op.retry_count,
-                        "reasons": reasons,
-                    }
-                )
-
+        for state in states:
+            for anomaly in state.anomalies:
+                reasons = self._reasons(anomaly, threshold)
+                if reasons:
+                    anomalies.append({**anomaly, "reasons": reasons})
+
+        if len(states) > 1:
+            anomalies.sort(key=lambda anomaly: anomaly["timestamp"])
         return anomalies
 
     def get_summary(self) -> dict[str, Any]:
@@ -350,29 +802,90 @@ class QualityTracker:
             >>> print(summary["overall_success_rate"])
             0.92
         """
-        if not self.operations:
+        if not self._all.totals.operations:
             return {"status": "no_data"}
 
-        total_ops = len(self.operations)
-        successful_ops = sum(1 for op in self.operations if op.success)
-        total_retries = sum(op.retry_count for op in self.operations)
-        total_duration = sum(op.duration_seconds for op in self.operations)
-        avg_confidence = sum(op.confidence_score for op in self.operations) / total_ops
-
+        stats = self._all.describe()
         return {
             "status": "active",
-            "total_operations": total_ops,
-            "successful_operations": successful_ops,
-            "failed_operations": total_ops - successful_ops,
-            "overall_success_rate": successful_ops / total_ops,
-            "total_retries": total_retries,
-            "avg_retries": total_retries / total_ops,
-            "avg_confidence": avg_confidence,
-            "avg_duration": total_duration / total_ops,
-            "agents_count": len(self.agent_stats),
-            "agents": list(self.agent_stats.keys()),
+            "total_operations": stats["total_operations"],
+            "successful_operations": stats["successful_operations"],
+            "failed_operations": stats["failed_operations"],
+            "overall_success_rate": stats["success_rate"],
+            "total_retries": stats["total_retries"],
+            "avg_retries": stats["avg_retries"],
+            "avg_confidence": stats["avg_confidence"],
+            "avg_duration": stats["avg_duration"],
+            "ewma_confidence": stats["ewma_confidence"],
+            "duration_p90": stats["duration_p90"],
+            "agents_count": len(self._agents),
+            "agents": list(self._agents.keys()),
         }
 
+    async def flush(self) -> int:
+        """
+        Push this worker's changed aggregates to the shared store.
+
+        Returns:
+            Number of aggregates written
+        """
+        if self.store is None:
+            raise RuntimeError("QualityTracker has no store configured.")
+
+        written = 0
+        # Operations recorded while a save is awaited re-mark their keys dirty
+        for agent_name, state in list(self._agents.items()):
+            if not state.dirty:
+                continue
+            keys, state.dirty = state.dirty, set()
+            payload = {
+                key: (
+                    state.totals if key == TOTAL_KEY else state.buckets[int(key)]
+                ).to_dict()
+                for key in keys
+                if key == TOTAL_KEY or int(key) in state.buckets
+            }
+            try:
+                await self.store.save(agent_name, self.worker_id, payload)
+            except BaseException:
+                state.dirty |= keys
+                raise
+            written += len(payload)
+        return written
+
+    async def get_shared_stats(
+        self,
+        agent_name: str,
+        seconds: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Statistics of an agent merged across every worker in the store.
+
+        Args:
+            agent_name: Name of the agent
+            seconds: Window length; all-time totals when None
+
+        Example:
+            >>> await tracker.flush()
+            >>> stats = await tracker.get_shared_stats("research_agent", seconds=300)
+        """
+        if self.store is None:
+            raise RuntimeError("QualityTracker has no store configured.")
+
+        if seconds is None:
+            keys = [TOTAL_KEY]
+        else:
+            last = int(self.clock() // self.bucket_seconds)
+            keys = [str(bucket) for bucket in range(self._first_bucket(seconds), last + 1)]
+
+        merged = QualityAggregate()
+        payloads = await self.store.load(agent_name, keys)
+        for payload in payloads:
+            merged.merge(QualityAggregate.from_dict(payload))
+        stats = merged.describe()
+        stats["workers"] = len(payloads) if seconds is None else None
+        return stats
+
     def export_metrics(self, output_format: str = "dict") -> Any:
         """
         Export metrics in various formats.
@@ -428,3 +941,54 @@ def get_quality_tracker() -> QualityTracker:
         _quality_tracker = QualityTracker()
 
     return _quality_tracker
+
+
+def configure_quality_tracker(tracker: QualityTracker | None) -> None:
+    """Replace the global tracker (e.g. one with a shared store); None resets it."""
+    global _quality_tracker
+    _quality_tracker = tracker
+
+
+_flush_task: asyncio.Task[None] | None = None
+
+
+async def _flush_periodically(tracker: QualityTracker, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await tracker.flush()
+        except Exception:
+            logger.exception("quality_tracker.flush_failed")
+
+
+async def start_quality_flush(interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+    """
+    Share the global tracker's aggregates across workers (call at startup).
+
+    Gives the tracker the shared store (Redis when enabled) unless it already
+    has one, and flushes it every ``interval`` seconds.
+    """
+    global _flush_task
+    if _flush_task is not None:
+        return
+    tracker = get_quality_tracker()
+    if tracker.store is None:
+        tracker.store = await create_quality_store()
+    _flush_task = asyncio.create_task(
+        _flush_periodically(tracker, interval), name="quality-tracker-flush"
+    )
+    logger.info("quality_tracker.flush_started", interval_s=interval, worker=tracker.worker_id)
+
+
+async def stop_quality_flush() -> None:
+    """Stop periodic flushing and push the aggregates changed since the last flush."""
+    global _flush_task
+    if _flush_task is None:
+        return
+    _flush_task.cancel()
+    await asyncio.gather(_flush_task, return_exceptions=True)
+    _flush_task = None
+    try:
+        await get_quality_tracker().flush()
+    except Exception:
+        logger.exception("quality_tracker.flush_failed")
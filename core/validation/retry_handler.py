@@ -7,12 +7,13 @@ for self-correcting agents.
 from __future__ import annotations
 
 import asyncio
-import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+import time
 from typing import Any
 
+from ..optimization.cost_optimizer import CallBudget, CostTracker, get_cost_tracker
 from .confidence_scorer import ConfidenceMetrics, ConfidenceScorer
 
 
@@ -23,6 +24,7 @@ class RetryStrategy(str, Enum):
     FIXED_DELAY = "fixed_delay"
     IMMEDIATE = "immediate"
     NO_RETRY = "no_retry"
+    CONCURRENT_CANDIDATES = "concurrent_candidates"  # K candidates per round, best wins
 
 
 @dataclass
@@ -41,6 +43,12 @@ class RetryConfig:
     increase_temperature: bool = False
     use_different_model: bool = False
 
+    # Concurrent candidates (max_retries is the number of rounds)
+    candidates: int = 3  # Generated concurrently per round
+    early_stop: bool = True  # Return the first candidate that passes, cancel the rest
+    max_cost_usd: float | None = None  # Budget of the whole call, all candidates included
+    max_tokens: int | None = None
+
 
 class RetryHandler:
     """
@@ -52,6 +60,7 @@ class RetryHandler:
     - Automatic parameter adjustment
     - Timeout management
     - Detailed retry metrics
+    - Concurrent candidate sampling within a per-call cost/token budget
 
     Example:
         >>> handler = RetryHandler()
@@ -62,14 +71,20 @@ class RetryHandler:
         ... )
     """
 
-    def __init__(self, confidence_scorer: ConfidenceScorer | None = None):
+    def __init__(
+        self,
+        confidence_scorer: ConfidenceScorer | None = None,
+        cost_tracker: CostTracker | None = None,
+    ):
         """
         Initialize retry handler.
 
         Args:
             confidence_scorer: Optional custom confidence scorer
+            cost_tracker: Source of per-call budgets and cost estimates
         """
         self.confidence_scorer = confidence_scorer or ConfidenceScorer()
+        self.cost_tracker = cost_tracker or get_cost_tracker()
         self.retry_stats = {
             "total_retries": 0,
             "successful_retries": 0,
@@ -88,6 +103,10 @@ class RetryHandler:
         """
         Execute function with automatic retry and validation.
 
+        With ``RetryStrategy.CONCURRENT_CANDIDATES`` each round generates
+        ``config.candidates`` outputs concurrently instead of one; see
+        ``_retry_with_candidates``.
+
         Args:
             func: Async function to execute
             config: Retry configuration
@@ -111,6 +130,11 @@ class RetryHandler:
             ...     query="test"
             ... )
         """
+        if config.strategy == RetryStrategy.CONCURRENT_CANDIDATES:
+            return await self._retry_with_candidates(
+                func, config, args, kwargs, validation_func
+            )
+
         start_time = time.time()
         attempts = 0
         last_error = None
@@ -139,15 +163,9 @@ class RetryHandler:
                 call_kwargs.pop("context", None)
                 result = await func(*args, **call_kwargs)
 
-                # Extract output text
-                if isinstance(result, dict):
-                    output = result.get("output", result.get("content", str(result)))
-                else:
-                    output = str(result)
-
                 # Score confidence
                 confidence_metrics = self.confidence_scorer.score_output(
-                    output=output,
+                    output=self._output_text(result),
                     context=kwargs.get("context"),
                 )
 
@@ -224,6 +242,227 @@ class RetryHandler:
             raise last_error
         raise RuntimeError("Unexpected retry loop exit")
 
+    async def _retry_with_candidates(
+        self,
+        func: Callable,
+        config: RetryConfig,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        validation_func: Callable[[Any], bool] | None,
+    ) -> tuple[Any, ConfidenceMetrics, dict[str, Any]]:
+        """
+        Generate candidates concurrently and return the best one.
+
+        Each round starts up to ``config.candidates`` calls at once and
+        scores every candidate as soon as it finishes. With ``early_stop``
+        the first candidate reaching ``min_confidence`` (and passing
+        ``validation_func``) wins and the calls still running are
+        cancelled; otherwise the round completes and the highest-scoring
+        passing candidate wins. Rounds repeat up to ``max_retries``.
+
+        Each candidate reserves its expected usage from a ``CallBudget``:
+        the mean usage of every candidate this call has been charged for,
+        or the cost tracker's average per operation. Without either and with
+        a limit set, a single probe candidate runs first so the budget can
+        size the rounds after it. Rounds shrink to what the budget can still
+        cover. Candidates that fail or are cancelled after they started are
+        charged their reservation; only calls that never started give it
+        back. Actual usage is read from the ``cost`` and
+        ``tokens_used`` keys of dict results, as returned by the LLM router.
+        The handler does not record costs itself; the router already does.
+        """
+        start_time = time.time()
+        budget = self.cost_tracker.call_budget(config.max_cost_usd, config.max_tokens)
+        retry_info: dict[str, Any] = {
+            "attempts": 0,
+            "rounds": 0,
+            "total_duration": 0.0,
+            "retries": [],
+            "cancelled": 0,
+            "charged": 0,
+            "final_confidence": 0.0,
+        }
+        best: tuple[float, Any, ConfidenceMetrics] | None = None
+        last_error: Exception | None = None
+
+        try:
+            async with asyncio.timeout(config.timeout):
+                for round_number in range(1, config.max_retries + 1):
+                    if round_number > 1:
+                        kwargs = self._adjust_parameters(kwargs, config, round_number - 1)
+                    estimate = self._candidate_estimate(budget, retry_info)
+                    width = config.candidates
+                    if estimate is None:
+                        limited = config.max_cost_usd is not None or config.max_tokens is not None
+                        width = 1 if limited else width
+                        estimate = (0.0, 0.0)
+                    count = 0
+                    while count < width and budget.reserve(*estimate):
+                        count += 1
+                    if not count:
+                        break
+
+                    retry_info["rounds"] = round_number
+                    accepted, error = await self._run_candidates(
+                        func,
+                        config,
+                        args,
+                        kwargs,
+                        validation_func,
+                        count=count,
+                        estimate=estimate,
+                        budget=budget,
+                        retry_info=retry_info,
+                        round_number=round_number,
+                    )
+                    last_error = error or last_error
+                    for candidate in accepted:
+                        if best is None or candidate[0] > best[0]:
+                            best = candidate
+                    if best is not None and best[0] >= config.min_confidence:
+                        break
+        except TimeoutError:
+            self._update_stats(max(retry_info["attempts"], 1), success=False)
+            raise TimeoutError(
+                f"Retry timeout exceeded: {time.time() - start_time:.2f}s > {config.timeout}s"
+            ) from None
+
+        retry_info["total_duration"] = time.time() - start_time
+        retry_info["budget"] = budget.to_dict()
+        attempts = max(retry_info["attempts"], 1)
+        if best is not None and best[0] >= config.min_confidence:
+            confidence, result, metrics = best
+            retry_info["final_confidence"] = confidence
+            self._update_stats(attempts, success=True)
+            return result, metrics, retry_info
+
+        self._update_stats(attempts, success=False)
+        scored = [r["confidence"] for r in retry_info["retries"] if "confidence" in r]
+        if not scored and last_error is not None:
+            raise last_error
+        retry_info["final_confidence"] = max(scored, default=0.0)
+        estimate = self._candidate_estimate(budget, retry_info) or (0.0, 0.0)
+        if not budget.can_afford(*estimate):
+            raise ValueError(
+                f"Call budget exhausted after {retry_info['attempts']} candidates "
+                f"(${budget.spent_usd:.4f}, {budget.spent_tokens} tokens). "
+                f"Best confidence: {retry_info['final_confidence']:.2f}"
+            )
+        raise ValueError(
+            f"Max retries ({config.max_retries}) exceeded. "
+            f"Best confidence: {retry_info['final_confidence']:.2f}"
+        )
+
+    async def _run_candidates(
+        self,
+        func: Callable,
+        config: RetryConfig,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        validation_func: Callable[[Any], bool] | None,
+        *,
+        count: int,
+        estimate: tuple[float, float],
+        budget: CallBudget,
+        retry_info: dict[str, Any],
+        round_number: int,
+    ) -> tuple[list[tuple[float, Any, ConfidenceMetrics]], Exception | None]:
+        """Run one round of candidates; return the accepted ones and the last error."""
+        call_kwargs = kwargs.copy()
+        call_kwargs.pop("context", None)
+
+        started: set[asyncio.Task] = set()
+
+        async def generate() -> tuple[Any, float]:
+            started.add(asyncio.current_task())
+            start = time.time()
+            return await func(*args, **call_kwargs), time.time() - start
+
+        pending = {asyncio.create_task(generate()) for _ in range(count)}
+        accepted: list[tuple[float, Any, ConfidenceMetrics]] = []
+        last_error: Exception | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    retry_info["attempts"] += 1
+                    entry: dict[str, Any] = {
+                        "attempt": retry_info["attempts"],
+                        "round": round_number,
+                    }
+                    retry_info["retries"].append(entry)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        entry["error"] = str(last_error)
+                        # The provider may have billed a call that failed midway
+                        budget.consume(*estimate)
+                        retry_info["charged"] += 1
+                        continue
+
+                    result, entry["duration"] = task.result()
+                    cost, tokens = self._candidate_usage(result)
+                    budget.settle(*estimate, cost, tokens)
+                    retry_info["charged"] += 1
+                    metrics = self.confidence_scorer.score_output(
+                        output=self._output_text(result),
+                        context=kwargs.get("context"),
+                    )
+                    valid = validation_func(result) if validation_func else True
+                    entry.update(
+                        confidence=metrics.overall_confidence,
+                        threshold=metrics.threshold.value,
+                        cost_usd=cost,
+                        tokens=tokens,
+                        valid=valid,
+                    )
+                    if valid:
+                        accepted.append((metrics.overall_confidence, result, metrics))
+
+                passed = any(c[0] >= config.min_confidence for c in accepted)
+                if (passed and config.early_stop) or budget.exhausted:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                retry_info["cancelled"] += len(pending)
+                for task in pending:
+                    # Calls in flight were billed for what they streamed so far
+                    if task in started:
+                        budget.consume(*estimate)
+                        retry_info["charged"] += 1
+                    else:
+                        budget.release(*estimate)
+        return accepted, last_error
+
+    def _candidate_estimate(
+        self, budget: CallBudget, retry_info: dict[str, Any]
+    ) -> tuple[float, float] | None:
+        """Expected (cost USD, tokens) of the next candidate, or None without usage data."""
+        charged = retry_info["charged"]
+        if charged and (budget.spent_usd or budget.spent_tokens):
+            return budget.spent_usd / charged, budget.spent_tokens / charged
+        return self.cost_tracker.average_operation_cost()
+
+    def _candidate_usage(self, result: Any) -> tuple[float, int]:
+        """Actual (cost USD, tokens) reported by a candidate result."""
+        if not isinstance(result, dict):
+            return 0.0, 0
+        tokens = int(result.get("tokens_used") or 0)
+        cost = result.get("cost")
+        if cost is None:
+            model = result.get("model")
+            cost = self.cost_tracker.estimate_cost(model, 0, tokens) if model else 0.0
+        return float(cost), tokens
+
+    @staticmethod
+    def _output_text(result: Any) -> str:
+        """Text to score from a function result."""
+        if isinstance(result, dict):
+            return result.get("output", result.get("content", str(result)))
+        return str(result)
+
     async def _apply_retry_strategy(
         self,
         config: RetryConfig,
@@ -233,7 +472,7 @@ class RetryHandler:
         if config.strategy == RetryStrategy.NO_RETRY:
             return
 
-        if config.strategy == RetryStrategy.IMMEDIATE:
+        if config.strategy in (RetryStrategy.IMMEDIATE, RetryStrategy.CONCURRENT_CANDIDATES):
             return  # No delay
 
         if config.strategy == RetryStrategy.FIXED_DELAY:
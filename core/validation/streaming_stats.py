@@ -0,0 +1,269 @@
+"""Mergeable streaming statistics.
+
+- ``RunningStats``: count, mean and variance by Welford's update; two
+  summaries combine exactly with Chan's parallel formula.
+- ``EWMA``: exponentially weighted mean and variance.
+- ``TDigest``: merging t-digest (Dunning, 2019) for quantiles with bounded
+  memory; digests from different workers merge into one.
+- ``robust_z``: modified z-score from a median and a MAD.
+
+All of them serialize to plain dicts so they can be shared through a store.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Any
+
+import numpy as np
+
+MAD_TO_STD = 1.4826  # MAD of a normal distribution times this is its std
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """Count, mean, variance, min and max of a stream.
+
+    Example:
+        >>> stats = RunningStats()
+        >>> for x in (1.0, 2.0, 4.0):
+        ...     stats.add(x)
+        >>> stats.mean, stats.variance
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        # Plain comparisons: min()/max() calls dominate this hot path
+        if value < self.min:  # noqa: PLR1730
+            self.min = value
+        if value > self.max:  # noqa: PLR1730
+            self.max = value
+
+    def merge(self, other: RunningStats) -> RunningStats:
+        """Combine with ``other`` in place (exact, order independent)."""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RunningStats:
+        return cls(
+            count=data["count"],
+            mean=data["mean"],
+            m2=data["m2"],
+            min=math.inf if data["min"] is None else data["min"],
+            max=-math.inf if data["max"] is None else data["max"],
+        )
+
+
+@dataclass(slots=True)
+class EWMA:
+    """Exponentially weighted moving mean and variance.
+
+    Example:
+        >>> ewma = EWMA(alpha=0.1)
+        >>> ewma.update(0.9)
+        >>> ewma.value
+    """
+
+    alpha: float = 0.1
+    value: float | None = None
+    variance: float = 0.0
+
+    def update(self, value: float) -> None:
+        if self.value is None:
+            self.value = value
+            return
+        delta = value - self.value
+        increment = self.alpha * delta
+        self.value += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+
+
+class TDigest:
+    """Merging t-digest for streaming quantiles.
+
+    Values are buffered and folded into at most about ``compression``
+    centroids, which are small near the tails (k1 scale function), so
+    extreme quantiles stay accurate. Memory and query cost depend only on
+    ``compression``, not on how many values were added.
+
+    Example:
+        >>> digest = TDigest()
+        >>> for latency in latencies:
+        ...     digest.update(latency)
+        >>> digest.quantile(0.99)
+    """
+
+    def __init__(self, compression: float = 100.0) -> None:
+        self.compression = compression
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: list[float] = []
+        self._buffer_size = int(5 * compression)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float) -> None:
+        self._buffer.append(value)
+        self.count += 1
+        if value < self.min:  # noqa: PLR1730
+            self.min = value
+        if value > self.max:  # noqa: PLR1730
+            self.max = value
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def merge(self, other: TDigest) -> TDigest:
+        """Fold ``other`` into this digest in place."""
+        if not other.count:
+            return self
+        other._compress()
+        self._compress(other._means, other._weights)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def centroids(self) -> int:
+        self._compress()
+        return len(self._means)
+
+    def _compress(
+        self, extra_means: np.ndarray | None = None, extra_weights: np.ndarray | None = None
+    ) -> None:
+        if not self._buffer and extra_means is None:
+            return
+        means = np.concatenate(
+            [self._means, np.asarray(self._buffer, dtype=float)]
+            + ([extra_means] if extra_means is not None else [])
+        )
+        weights = np.concatenate(
+            [self._weights, np.ones(len(self._buffer))]
+            + ([extra_weights] if extra_weights is not None else [])
+        )
+        self._buffer = []
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order].tolist(), weights[order].tolist()
+
+        total = sum(weights)
+        merged_means: list[float] = []
+        merged_weights: list[float] = []
+        current_mean, current_weight = means[0], weights[0]
+        cumulative = 0.0
+        limit = self._q_limit(0.0) * total
+        for mean, weight in zip(means[1:], weights[1:], strict=True):
+            if cumulative + current_weight + weight <= limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                merged_means.append(current_mean)
+                merged_weights.append(current_weight)
+                cumulative += current_weight
+                limit = self._q_limit(cumulative / total) * total
+                current_mean, current_weight = mean, weight
+        merged_means.append(current_mean)
+        merged_weights.append(current_weight)
+
+        self._means = np.asarray(merged_means)
+        self._weights = np.asarray(merged_weights)
+
+    def _q_limit(self, q: float) -> float:
+        """Largest quantile a centroid starting at ``q`` may reach (k1 scale)."""
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated ``q``-quantile (``None`` while empty)."""
+        if not self.count:
+            return None
+        self._compress()
+        centers = np.cumsum(self._weights) - self._weights / 2
+        x = np.concatenate([[self.min], self._means, [self.max]])
+        y = np.concatenate([[0.0], centers, [float(self._weights.sum())]])
+        return float(np.interp(q * y[-1], y, x))
+
+    def to_dict(self) -> dict[str, Any]:
+        self._compress()
+        return {
+            "compression": self.compression,
+            "means": self._means.tolist(),
+            "weights": self._weights.tolist(),
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TDigest:
+        digest = cls(data["compression"])
+        digest._means = np.asarray(data["means"], dtype=float)
+        digest._weights = np.asarray(data["weights"], dtype=float)
+        digest.count = data["count"]
+        if data["count"]:
+            digest.min, digest.max = data["min"], data["max"]
+        return digest
+
+
+def robust_z(value: float, median: float, mad: float, fallback_scale: float = 0.0) -> float:
+    """Modified z-score ``(value - median) / (1.4826 * MAD)``.
+
+    When the MAD is zero (more than half the values are identical),
+    ``fallback_scale`` is used instead; if that is zero too, any deviation
+    from the median scores as infinitely unusual.
+    """
+    deviation = value - median
+    scale = MAD_TO_STD * mad or fallback_scale
+    if scale:
+        return deviation / scale
+    return 0.0 if abs(deviation) < 1e-12 else math.copysign(math.inf, deviation)
+
+
+__all__ = ["EWMA", "MAD_TO_STD", "RunningStats", "TDigest", "robust_z"]
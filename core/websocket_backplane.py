@@ -0,0 +1,190 @@
+"""
+Pub/sub backplane for WebSocket workflow events.
+
+A workflow running in one API worker must reach browsers connected to any
+other worker. ``ConnectionManager.broadcast`` publishes to a backplane, and
+every worker's manager subscribes to it and fans messages out to its own
+local connections.
+
+Backends:
+    - ``RedisStreamsBackplane``: ``XADD`` to a capped stream, one ``XREAD``
+      listener task per worker. Used when Redis is configured.
+    - ``InMemoryBackplane``: single-process fallback; several managers may
+      share one instance to simulate multiple workers in tests.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+MessageHandler = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+DEFAULT_STREAM_KEY = "ws:workflow_events"
+DEFAULT_STREAM_MAXLEN = 10_000
+
+
+class WebSocketBackplane(ABC):
+    """Transport that carries ``(thread_id, message)`` events between workers."""
+
+    @abstractmethod
+    async def start(self, handler: MessageHandler) -> None:
+        """Begin delivering published events to ``handler``."""
+
+    @abstractmethod
+    async def publish(self, thread_id: str, message: dict[str, Any]) -> None:
+        """Publish an event for every subscribed worker (including this one)."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop delivering events and release resources."""
+
+
+class InMemoryBackplane(WebSocketBackplane):
+    """
+    In-process backplane: ``publish`` invokes every subscribed handler directly.
+
+    Example:
+        >>> backplane = InMemoryBackplane()
+        >>> await worker_a.start(backplane)
+        >>> await worker_b.start(backplane)
+        >>> await worker_a.broadcast("thread-1", {...})  # reaches both workers
+    """
+
+    def __init__(self) -> None:
+        self._handlers: list[MessageHandler] = []
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handlers.append(handler)
+
+    async def publish(self, thread_id: str, message: dict[str, Any]) -> None:
+        for handler in list(self._handlers):
+            try:
+                await handler(thread_id, message)
+            except Exception as e:
+                logger.warning("ws_backplane_handler_failed", thread_id=thread_id, error=str(e))
+
+    async def stop(self) -> None:
+        self._handlers.clear()
+
+
+class RedisStreamsBackplane(WebSocketBackplane):
+    """
+    Redis Streams backplane.
+
+    Every worker appends events with ``XADD ... MAXLEN ~`` and tails the stream
+    with a blocking ``XREAD`` from the entry id that was last when it started,
+    so events published while a read is in flight are never skipped.
+
+    Example:
+        >>> redis = await get_redis_client()
+        >>> await manager.start(RedisStreamsBackplane(redis))
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        stream_key: str = DEFAULT_STREAM_KEY,
+        *,
+        maxlen: int = DEFAULT_STREAM_MAXLEN,
+        block_ms: int = 1000,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Args:
+            redis_client: ``redis.asyncio`` client
+            stream_key: Stream shared by all workers
+            maxlen: Approximate cap on retained stream entries
+            block_ms: ``XREAD BLOCK`` timeout per poll
+            batch_size: Maximum entries read per poll
+        """
+        self.redis = redis_client
+        self.stream_key = stream_key
+        self.maxlen = maxlen
+        self.block_ms = block_ms
+        self.batch_size = batch_size
+        self._handler: MessageHandler | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._last_id = "0-0"
+
+    async def start(self, handler: MessageHandler) -> None:
+        if self._task is not None:
+            return
+        self._handler = handler
+        latest = await self.redis.xrevrange(self.stream_key, count=1)
+        self._last_id = _as_str(latest[0][0]) if latest else "0-0"
+        self._task = asyncio.create_task(self._listen(), name="ws-backplane-listener")
+        logger.info("ws_backplane_started", backend="redis_streams", stream=self.stream_key)
+
+    async def publish(self, thread_id: str, message: dict[str, Any]) -> None:
+        await self.redis.xadd(
+            self.stream_key,
+            {"thread_id": thread_id, "payload": json.dumps(message, default=str)},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("ws_backplane_stopped", backend="redis_streams", stream=self.stream_key)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                response = await self.redis.xread(
+                    {self.stream_key: self._last_id},
+                    count=self.batch_size,
+                    block=self.block_ms,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("ws_backplane_read_failed", error=str(e))
+                await asyncio.sleep(1.0)
+                continue
+
+            for _stream, entries in response or []:
+                for entry_id, fields in entries:
+                    self._last_id = _as_str(entry_id)
+                    await self._dispatch(fields)
+
+    async def _dispatch(self, fields: dict[Any, Any]) -> None:
+        decoded = {_as_str(k): _as_str(v) for k, v in fields.items()}
+        try:
+            message = json.loads(decoded["payload"])
+            thread_id = decoded["thread_id"]
+        except (KeyError, ValueError) as e:
+            logger.warning("ws_backplane_bad_entry", error=str(e))
+            return
+        if self._handler is not None:
+            try:
+                await self._handler(thread_id, message)
+            except Exception as e:
+                logger.warning("ws_backplane_handler_failed", thread_id=thread_id, error=str(e))
+
+
+def _as_str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+__all__ = [
+    "DEFAULT_STREAM_KEY",
+    "InMemoryBackplane",
+    "MessageHandler",
+    "RedisStreamsBackplane",
+    "WebSocketBackplane",
+]
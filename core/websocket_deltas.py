@@ -0,0 +1,180 @@
+"""
+Versioned delta pushes for the document monitor WebSocket.
+
+Instead of pushing full workflow snapshots, each worker runs a
+``DeltaStreamer`` that wakes once per tick, checks the state version of every
+thread it has local subscribers for, and sends one ``delta`` frame containing
+all patch operations committed since its last push. Bursts of section, log and
+exhibit updates therefore collapse into a single frame per tick.
+
+Frame format::
+
+    {
+        "type": "delta",
+        "thread_id": "...",
+        "from_version": 41,
+        "version": 44,
+        "deltas": [{"v": 42, "ops": [...]}, {"v": 43, "ops": [...]}, ...],
+    }
+
+Clients apply ``deltas`` whose ``v`` is greater than their current version and
+ignore the rest. A gap (first unseen ``v`` > current + 1) or a
+``resync_required`` frame means the client should send
+``{"type": "resume", "since": <version>}``; the server answers with a catch-up
+``delta`` frame, or a fresh ``initial_state`` if the journal no longer reaches
+back that far.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+import structlog
+
+from core.storage.document_workflow_store import DocumentWorkflowStore, get_document_workflow_store
+from core.websocket_manager import ConnectionManager, manager
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_TICK_SECONDS = float(os.getenv("WS_DELTA_TICK_SECONDS", "0.1"))
+
+
+def build_delta_frame(
+    thread_id: str, from_version: int, version: int, deltas: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Assemble a ``delta`` frame from ``DocumentWorkflowStore.get_deltas`` output."""
+    return {
+        "type": "delta",
+        "thread_id": thread_id,
+        "from_version": from_version,
+        "version": version,
+        "deltas": deltas,
+    }
+
+
+class DeltaStreamer:
+    """
+    Push coalesced state deltas to locally connected clients once per tick.
+
+    Example:
+        >>> streamer = DeltaStreamer(tick_seconds=0.1)
+        >>> streamer.ensure_started()
+        >>> # after sending an initial_state at version 7 to a new client:
+        >>> streamer.track("thread-1", 7)
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager | None = None,
+        store: DocumentWorkflowStore | None = None,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+    ) -> None:
+        """
+        Args:
+            connection_manager: Manager whose local clients receive frames
+            store: Workflow store holding the delta journal
+            tick_seconds: Interval between version checks
+        """
+        self.manager = connection_manager or manager
+        self._store = store
+        self.tick_seconds = tick_seconds
+        self._published: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.frames_sent = 0
+
+    @property
+    def store(self) -> DocumentWorkflowStore:
+        return self._store or get_document_workflow_store()
+
+    def ensure_started(self) -> None:
+        """Start the tick loop if it is not already running."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = asyncio.create_task(self._run(), name="ws-delta-streamer")
+
+    async def stop(self) -> None:
+        """Stop the tick loop."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._published.clear()
+
+    def track(self, thread_id: str, version: int) -> None:
+        """Record that a client of ``thread_id`` was brought up to ``version``.
+
+        The next tick replays everything after the lowest tracked version, so a
+        client that joined between ticks never misses a delta (others simply
+        ignore versions they already have).
+        """
+        current = self._published.get(thread_id)
+        self._published[thread_id] = version if current is None else min(current, version)
+
+    async def catch_up(self, thread_id: str, since_version: int) -> dict[str, Any] | None:
+        """Build a catch-up frame for a resuming client.
+
+        Returns:
+            ``delta`` frame with everything after ``since_version``, or None if
+            the journal cannot cover it and the client needs a full state
+        """
+        result = await self.store.get_deltas(thread_id, since_version)
+        if result is None:
+            return None
+        version, deltas = result
+        return build_delta_frame(thread_id, since_version, version, deltas)
+
+    async def flush(self) -> int:
+        """Run one tick: send at most one frame per subscribed thread.
+
+        Returns:
+            Number of frames sent
+        """
+        thread_ids = self.manager.thread_ids()
+        for stale in set(self._published) - set(thread_ids):
+            del self._published[stale]
+
+        sent = 0
+        for thread_id in thread_ids:
+            version = await self.store.get_version(thread_id)
+            last = self._published.get(thread_id)
+            if version is None or version == last:
+                continue
+            self._published[thread_id] = version
+            if last is None:
+                continue  # first sighting; clients got initial_state at or after this
+
+            frame = await self.catch_up(thread_id, last) if last < version else None
+            if frame is None:
+                frame = {"type": "resync_required", "thread_id": thread_id, "version": version}
+            self.manager.broadcast_local(thread_id, frame)
+            sent += 1
+
+        self.frames_sent += sent
+        return sent
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("ws_delta_flush_failed", error=str(e))
+            await asyncio.sleep(self.tick_seconds)
+
+
+# Global delta streamer for the default connection manager
+delta_streamer = DeltaStreamer()
+
+
+__all__ = [
+    "DEFAULT_TICK_SECONDS",
+    "DeltaStreamer",
+    "build_delta_frame",
+    "delta_streamer",
+]
@@ -7,22 +7,186 @@ Replaces polling with push-based updates for better performance and UX.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import os
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 
 import structlog
 from fastapi import WebSocket
 
+from core.websocket_backplane import WebSocketBackplane
+
 logger = structlog.get_logger(__name__)
 
 # Active WebSocket connections: thread_id -> list of WebSocket connections
 active_connections: dict[str, list[WebSocket]] = {}
 
+DEFAULT_CLIENT_QUEUE_SIZE = int(os.getenv("WS_CLIENT_QUEUE_SIZE", "256"))
+DEFAULT_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "10"))
+
+# Pseudo thread id used to fan ``broadcast_to_all`` through the backplane
+ALL_THREADS = "*"
+
+_RESYNC_KEY = ("resync_required",)
+
+
+def _coalesce_key(message: dict[str, Any]) -> Hashable | None:
+    """Return the key under which a newer message replaces a queued older one.
+
+    State-style messages (section status, progress, overall status) only matter
+    in their latest form; logs, errors and handshake frames are never coalesced.
+    """
+    msg_type = message.get("type")
+    if msg_type == "workflow_update":
+        data = message.get("data") or {}
+        return (msg_type, data.get("section_id"))
+    if msg_type in {"progress_update", "status_change"}:
+        return (msg_type,)
+    return None
+
+
+class ClientConnection:
+    """One WebSocket with its own bounded send queue and sender task.
+
+    ``enqueue`` never blocks: a newer state message replaces a queued one with
+    the same coalesce key, and when the queue is full the oldest messages are
+    dropped and a ``resync_required`` notice tells the client to refetch state.
+    A client that cannot accept a frame within ``send_timeout`` is closed.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        thread_id: str,
+        *,
+        max_queue: int = DEFAULT_CLIENT_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ) -> None:
+        if max_queue < 2:
+            raise ValueError("max_queue must be >= 2")
+        self.websocket = websocket
+        self.thread_id = thread_id
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._pending: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending)
+
+    def start(self, on_failure: Any) -> None:
+        self._task = asyncio.create_task(self._run(on_failure))
+
+    def enqueue(self, message: dict[str, Any]) -> bool:
+        """Queue ``message`` for delivery; returns False if the client is closed."""
+        if self.closed:
+            return False
+
+        key = _coalesce_key(message)
+        if key is None:
+            key = next(self._seq)
+        elif key in self._pending:
+            # Re-append so the newest state keeps its place after earlier events
+            del self._pending[key]
+            self.coalesced += 1
+        self._pending[key] = message
+
+        if len(self._pending) > self.max_queue:
+            self._pending.pop(_RESYNC_KEY, None)
+            while len(self._pending) >= self.max_queue:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[_RESYNC_KEY] = {
+                "type": "resync_required",
+                "thread_id": self.thread_id,
+                "dropped": self.dropped,
+            }
+
+        self._wakeup.set()
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+        self._pending.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    async def _run(self, on_failure: Any) -> None:
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._pending and not self.closed:
+                    _, message = self._pending.popitem(last=False)
+                    await asyncio.wait_for(self.websocket.send_json(message), self.send_timeout)
+                    self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            timed_out = isinstance(e, TimeoutError)
+            logger.warning(
+                "websocket_client_send_failed",
+                thread_id=self.thread_id,
+                error=str(e) or type(e).__name__,
+                slow_client=timed_out,
+            )
+            on_failure(self, timed_out)
+            try:
+                await asyncio.wait_for(self.websocket.close(code=1013), 1.0)
+            except Exception:
+                pass
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for workflow updates."""
+    """Manages WebSocket connections for workflow updates.
 
-    def __init__(self):
-        self.active_connections: dict[str, list[WebSocket]] = {}
+    Broadcasts are published to a backplane (when started) so every worker
+    receives them, then fanned out to local clients by enqueueing onto each
+    client's bounded queue; per-client sender tasks write concurrently, so a
+    slow reader never delays the others.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_CLIENT_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ):
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._clients: dict[str, dict[WebSocket, ClientConnection]] = {}
+        self._backplane: WebSocketBackplane | None = None
+        self._dropped_total = 0
+        self._coalesced_total = 0
+        self._slow_disconnects = 0
+
+    @property
+    def active_connections(self) -> dict[str, list[WebSocket]]:
+        """Snapshot of registered connections: thread_id -> WebSockets."""
+        return {tid: list(clients) for tid, clients in self._clients.items()}
+
+    async def start(self, backplane: WebSocketBackplane) -> None:
+        """Subscribe to ``backplane`` so broadcasts from any worker reach local clients."""
+        if self._backplane is not None:
+            await self.stop()
+        await backplane.start(self._on_backplane_message)
+        self._backplane = backplane
+
+    async def stop(self) -> None:
+        """Detach from the backplane; broadcasts fall back to local delivery."""
+        backplane, self._backplane = self._backplane, None
+        if backplane is not None:
+            await backplane.stop()
 
     async def connect(self, websocket: WebSocket, thread_id: str) -> None:
         """Accept and register a new WebSocket connection.
@@ -33,15 +197,16 @@ class ConnectionManager:
         """
         await websocket.accept()
 
-        if thread_id not in self.active_connections:
-            self.active_connections[thread_id] = []
-
-        self.active_connections[thread_id].append(websocket)
+        client = ClientConnection(
+            websocket, thread_id, max_queue=self.max_queue, send_timeout=self.send_timeout
+        )
+        self._clients.setdefault(thread_id, {})[websocket] = client
+        client.start(self._on_client_failure)
 
         logger.info(
             "websocket_connected",
             thread_id=thread_id,
-            total_connections=len(self.active_connections[thread_id]),
+            total_connections=len(self._clients[thread_id]),
         )
 
     def disconnect(self, websocket: WebSocket, thread_id: str) -> None:
@@ -51,27 +216,40 @@ class ConnectionManager:
             websocket: WebSocket connection to remove
             thread_id: Workflow thread ID
         """
-        if thread_id in self.active_connections:
-            if websocket in self.active_connections[thread_id]:
-                self.active_connections[thread_id].remove(websocket)
+        clients = self._clients.get(thread_id)
+        if clients is not None:
+            client = clients.pop(websocket, None)
+            if client is not None:
+                self._dropped_total += client.dropped
+                self._coalesced_total += client.coalesced
+                client.close()
 
             # Cleanup empty thread entries
-            if not self.active_connections[thread_id]:
-                del self.active_connections[thread_id]
+            if not clients:
+                del self._clients[thread_id]
 
         logger.info(
             "websocket_disconnected",
             thread_id=thread_id,
-            remaining_connections=len(self.active_connections.get(thread_id, [])),
+            remaining_connections=len(self._clients.get(thread_id, {})),
         )
 
     async def send_personal_message(self, message: dict[str, Any], websocket: WebSocket) -> None:
         """Send message to a specific WebSocket connection.
 
+        Registered connections receive it through their send queue, so it is
+        ordered with broadcasts and never races the sender task.
+
         Args:
             message: Message data (will be JSON serialized)
             websocket: Target WebSocket connection
         """
+        for clients in self._clients.values():
+            client = clients.get(websocket)
+            if client is not None:
+                client.enqueue(message)
+                return
+
         try:
             await websocket.send_json(message)
         except Exception as e:
@@ -84,30 +262,16 @@ class ConnectionManager:
             thread_id: Workflow thread ID
             message: Message data (will be JSON serialized)
         """
-        if thread_id not in self.active_connections:
-            logger.debug("websocket_broadcast_no_connections", thread_id=thread_id)
-            return
-
-        connections = self.active_connections[thread_id].copy()
-        disconnected = []
-
-        for connection in connections:
+        if self._backplane is not None:
             try:
-                await connection.send_json(message)
+                await self._backplane.publish(thread_id, message)
+                return
             except Exception as e:
-                logger.warning("websocket_broadcast_failed", thread_id=thread_id, error=str(e))
-                disconnected.append(connection)
+                logger.warning(
+                    "websocket_backplane_publish_failed", thread_id=thread_id, error=str(e)
+                )
 
-        # Cleanup disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection, thread_id)
-
-        logger.debug(
-            "websocket_broadcast_sent",
-            thread_id=thread_id,
-            recipients=len(connections) - len(disconnected),
-            failed=len(disconnected),
-        )
+        self._deliver_local(thread_id, message)
 
     async def broadcast_to_all(self, message: dict[str, Any]) -> None:
         """Broadcast message to all active connections.
@@ -115,12 +279,8 @@ class ConnectionManager:
         Args:
             message: Message data (will be JSON serialized)
         """
-        total_sent = 0
-        for thread_id in list(self.active_connections.keys()):
-            await self.broadcast(thread_id, message)
-            total_sent += len(self.active_connections.get(thread_id, []))
-
-        logger.info("websocket_broadcast_all", total_recipients=total_sent)
+        await self.broadcast(ALL_THREADS, message)
+        logger.info("websocket_broadcast_all", local_recipients=self.get_connection_count())
 
     def get_connection_count(self, thread_id: str | None = None) -> int:
         """Get number of active connections.
@@ -132,8 +292,59 @@ class ConnectionManager:
             Number of active connections
         """
         if thread_id:
-            return len(self.active_connections.get(thread_id, []))
-        return sum(len(conns) for conns in self.active_connections.values())
+            return len(self._clients.get(thread_id, {}))
+        return sum(len(clients) for clients in self._clients.values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Fan-out counters for this worker (queue depth, drops, coalesced, slow clients)."""
+        clients = [c for group in self._clients.values() for c in group.values()]
+        return {
+            "connections": len(clients),
+            "threads": len(self._clients),
+            "queued": sum(c.queued for c in clients),
+            "max_queue_depth": max((c.queued for c in clients), default=0),
+            "dropped": self._dropped_total + sum(c.dropped for c in clients),
+            "coalesced": self._coalesced_total + sum(c.coalesced for c in clients),
+            "slow_disconnects": self._slow_disconnects,
+            "backplane": type(self._backplane).__name__ if self._backplane else None,
+        }
+
+    def broadcast_local(self, thread_id: str, message: dict[str, Any]) -> int:
+        """Queue a message for this worker's clients only, bypassing the backplane.
+
+        Used for frames every worker derives itself from shared state (e.g.
+        delta pushes), which would otherwise be duplicated across workers.
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        return self._deliver_local(thread_id, message)
+
+    def thread_ids(self) -> list[str]:
+        """Thread IDs with at least one local connection."""
+        return list(self._clients)
+
+    def _deliver_local(self, thread_id: str, message: dict[str, Any]) -> int:
+        if thread_id == ALL_THREADS:
+            targets = [c for group in self._clients.values() for c in group.values()]
+        else:
+            targets = list(self._clients.get(thread_id, {}).values())
+
+        if not targets:
+            logger.debug("websocket_broadcast_no_connections", thread_id=thread_id)
+            return 0
+
+        delivered = sum(1 for client in targets if client.enqueue(message))
+        logger.debug("websocket_broadcast_queued", thread_id=thread_id, recipients=delivered)
+        return delivered
+
+    async def _on_backplane_message(self, thread_id: str, message: dict[str, Any]) -> None:
+        self._deliver_local(thread_id, message)
+
+    def _on_client_failure(self, client: ClientConnection, timed_out: bool) -> None:
+        if timed_out:
+            self._slow_disconnects += 1
+        self.disconnect(client.websocket, client.thread_id)
 
 
 # Global connection manager instance
@@ -274,6 +485,7 @@ async def broadcast_error(thread_id: str, error_message: str, **kwargs: Any) ->
 # ═══════════════════════════════════════════════════════════════════════════
 
 __all__ = [
+    "ClientConnection",
     "ConnectionManager",
     "broadcast_error",
     "broadcast_log_entry",
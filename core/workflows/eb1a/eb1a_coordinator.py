@@ -10,6 +10,7 @@ This module coordinates the entire EB-1A petition workflow:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -18,6 +19,12 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 
 from ...memory.memory_manager import MemoryManager
+from .section_executor import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_SECTION_TIMEOUT,
+    SectionExecutor,
+    summarize_latencies,
+)
 
 
 class EB1ACriterion(str, Enum):
@@ -142,6 +149,12 @@ class EB1APetitionResult(BaseModel):
     # Metadata
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     generation_time_seconds: float | None = None
+    section_latencies: dict[str, float] = Field(
+        default_factory=dict, description="Per-criterion writer latency in seconds"
+    )
+    degraded_sections: list[EB1ACriterion] = Field(
+        default_factory=list, description="Criteria whose writer failed or timed out"
+    )
 
 
 class EB1ACoordinator:
@@ -150,7 +163,8 @@ class EB1ACoordinator:
 
     Orchestrates:
     1. Evidence research and validation
-    2. Section-by-section content generation
+    2. Criterion sections generated concurrently (bounded, with per-section
+       timeouts; a failing writer yields a degraded section, not an error)
     3. Quality assurance and legal compliance
     4. Final assembly and recommendations
 
@@ -173,14 +187,25 @@ class EB1ACoordinator:
         0.89
     """
 
-    def __init__(self, memory_manager: MemoryManager | None = None):
+    def __init__(
+        self,
+        memory_manager: MemoryManager | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        section_timeout: float | None = DEFAULT_SECTION_TIMEOUT,
+    ):
         """
         Initialize EB-1A Coordinator.
 
         Args:
             memory_manager: Memory manager for context and evidence storage
+            max_concurrency: Criterion sections generated at the same time
+            section_timeout: Seconds allowed per section writer
         """
         self.memory = memory_manager or MemoryManager()
+        self.section_executor = SectionExecutor(
+            max_concurrency=max_concurrency, timeout=section_timeout, name="eb1a_petition"
+        )
 
         # Will be initialized lazily
         self._section_writers: dict[EB1ACriterion, Any] = {}
@@ -209,14 +234,26 @@ class EB1ACoordinator:
         # Step 1: Research and gather additional evidence
         await self._research_evidence(request)
 
-        # Step 2: Generate executive summary
-        executive_summary = await self._generate_executive_summary(request)
+        # Steps 2-3: Executive summary and criterion sections are independent,
+        # so they run concurrently; sections keep the order of primary_criteria
+        executive_summary, runs = await asyncio.gather(
+            self._generate_executive_summary(request),
+            self.section_executor.run(
+                [
+                    (criterion.value, lambda c=criterion: self._generate_section(c, request))
+                    for criterion in request.primary_criteria
+                ]
+            ),
+        )
 
-        # Step 3: Generate each criterion section
         sections: dict[EB1ACriterion, SectionContent] = {}
-        for criterion in request.primary_criteria:
-            section = await self._generate_section(criterion, request)
-            sections[criterion] = section
+        degraded: list[EB1ACriterion] = []
+        for criterion, run in zip(request.primary_criteria, runs, strict=True):
+            if run.ok and run.result is not None:
+                sections[criterion] = run.result
+            else:
+                sections[criterion] = self._degraded_section(criterion, run.error or "")
+                degraded.append(criterion)
 
         # Step 4: Generate conclusion
         conclusion = await self._generate_conclusion(request, sections)
@@ -248,6 +285,8 @@ class EB1ACoordinator:
             weaknesses=weaknesses,
             recommendations=recommendations,
             generation_time_seconds=generation_time,
+            section_latencies=summarize_latencies(runs),
+            degraded_sections=degraded,
         )
 
     async def _research_evidence(self, request: EB1APetitionRequest) -> None:
@@ -350,6 +389,19 @@ The beneficiary {request.beneficiary_name} satisfies this criterion through the
             suggestions=["Add more specific examples", "Include peer comparisons"],
         )
 
+    def _degraded_section(self, criterion: EB1ACriterion, error: str) -> SectionContent:
+        """Placeholder section for a criterion whose writer failed or timed out."""
+        criterion_name = criterion.value.split("_", 1)[1].replace("_", " ").title()
+        content = f"[Section for {criterion_name} could not be generated: {error}]"
+        return SectionContent(
+            criterion=criterion,
+            title=f"Criterion: {criterion_name}",
+            content=content,
+            word_count=len(content.split()),
+            confidence_score=0.0,
+            suggestions=[f"Regenerate the {criterion_name} section"],
+        )
+
     async def _generate_conclusion(
         self, request: EB1APetitionRequest, sections: dict[EB1ACriterion, SectionContent]
     ) -> str:
@@ -12,15 +12,18 @@ additional evidence for EB-1A petitions, including:
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
+import re
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from ....memory.memory_manager import MemoryManager
-from ..eb1a_coordinator import (EB1ACriterion, EB1AEvidence,
-                                EB1APetitionRequest, EvidenceType)
+from ..eb1a_coordinator import EB1ACriterion, EB1AEvidence, EB1APetitionRequest, EvidenceType
+from ..section_executor import DEFAULT_MAX_CONCURRENCY, SectionExecutor
+
+# Research lookups are cheaper than section writers, so time out sooner
+DEFAULT_RESEARCH_TIMEOUT = 30.0
 
 # === New Models for Research ===
 
@@ -198,14 +201,25 @@ class EvidenceResearcher:
         >>> print(f"Found {len(additional_evidence)} additional evidence items")
     """
 
-    def __init__(self, memory_manager: MemoryManager):
+    def __init__(
+        self,
+        memory_manager: MemoryManager,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float | None = DEFAULT_RESEARCH_TIMEOUT,
+    ):
         """
         Initialize Evidence Researcher.
 
         Args:
             memory_manager: Memory manager for RAG queries
+            max_concurrency: Research lookups running at the same time
+            timeout: Seconds allowed per lookup
         """
         self.memory = memory_manager
+        self.executor = SectionExecutor(
+            max_concurrency=max_concurrency, timeout=timeout, name="eb1a_research"
+        )
 
         # Legal precedents database (in real implementation, would be in vector DB)
         self.legal_precedents = self._initialize_precedents()
@@ -254,21 +268,24 @@ class EvidenceResearcher:
 
         Returns:
             List of additional evidence items found through research
-        """
-        additional_evidence: list[EB1AEvidence] = []
-
-        # Research for each primary criterion
-        for criterion in request.primary_criteria:
-            criterion_evidence = await self._research_criterion(criterion, request)
-            additional_evidence.extend(criterion_evidence)
 
-        # Research legal precedents
-        legal_evidence = await self._research_legal_precedents(request)
-        additional_evidence.extend(legal_evidence)
+        Criteria are researched concurrently (see ``self.executor``); a lookup
+        that fails or times out contributes no evidence instead of aborting the
+        rest. Results keep the order criteria -> precedents -> benchmarks.
+        Per-lookup latency is logged by ``self.executor`` as ``latency_s`` on
+        the ``eb1a_research.section_*`` events.
+        """
+        jobs = [
+            (criterion.value, lambda c=criterion: self._research_criterion(c, request))
+            for criterion in request.primary_criteria
+        ]
+        jobs.append(("legal_precedents", lambda: self._research_legal_precedents(request)))
+        jobs.append(("benchmarks", lambda: self._research_benchmarks(request)))
 
-        # Research industry benchmarks
-        benchmark_evidence = await self._research_benchmarks(request)
-        additional_evidence.extend(benchmark_evidence)
+        additional_evidence: list[EB1AEvidence] = []
+        for run in await self.executor.run(jobs):
+            if run.ok and run.result:
+                additional_evidence.extend(run.result)
 
         return additional_evidence
 
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("none", "staging", "production", "archived")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS model_versions (
+    model_name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    stage TEXT NOT NULL DEFAULT 'none',
+    artifact_path TEXT NOT NULL,
+    artifact_sha256 TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    data_summary TEXT NOT NULL,
+    feature_scaler TEXT NOT NULL,
+    label_mapping TEXT NOT NULL,
+    training_params TEXT NOT NULL,
+    PRIMARY KEY (model_name, version)
+);
+CREATE INDEX IF NOT EXISTS idx_model_versions_stage ON model_versions (model_name, stage);
+CREATE TABLE IF NOT EXISTS stage_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model_name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    from_stage TEXT NOT NULL,
+    to_stage TEXT NOT NULL,
+    transitioned_at TEXT NOT NULL,
+    comment TEXT
+);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# registry_meta row recording that the legacy JSON registry was imported
+_LEGACY_IMPORT_KEY = "legacy_json_import"
+
+_JSON_FIELDS = ("metrics", "data_summary", "feature_scaler", "label_mapping", "training_params")
+
+
+@dataclass
+class ModelRegistryEntry:
+    """
+    Representation of a model record inside the local registry.
+    """
+
+    model_name: str
+    version: int | None
+    created_at: str
+    artifact_path: str
+    metrics: dict[str, Any]
+    data_summary: dict[str, Any]
+    feature_scaler: dict[str, Any]
+    label_mapping: dict[str, Any]
+    training_params: dict[str, Any]
+    stage: str = "none"
+    artifact_sha256: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "version": self.version,
+            "created_at": self.created_at,
+            "stage": self.stage,
+            "artifact_path": self.artifact_path,
+            "artifact_sha256": self.artifact_sha256,
+            "metrics": self.metrics,
+            "data_summary": self.data_summary,
+            "feature_scaler": self.feature_scaler,
+            "label_mapping": self.label_mapping,
+            "training_params": self.training_params,
+        }
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> ModelRegistryEntry:
+        data = dict(row)
+        for name in _JSON_FIELDS:
+            data[name] = json.loads(data[name])
+        return cls(**data)
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Local model registry backed by SQLite.
+
+    Versions are allocated per model inside an immediate (write-locked)
+    transaction, so concurrent registrations from several processes never
+    receive the same number. Each version records the SHA-256 of its
+    artifact and moves through the stages none -> staging -> production ->
+    archived; promoting a version to production archives the previous one.
+
+    A legacy JSON registry (``registry_path`` itself when it ends in
+    ``.json``, else the sibling file with the same stem, e.g.
+    ``model_registry.json`` next to ``model_registry.sqlite3``) is imported
+    once, in one transaction that also writes a marker row; later opens only
+    read the marker.
+    """
+
+    def __init__(self, registry_path: Path, *, timeout: float = 30.0) -> None:
+        registry_path = Path(registry_path)
+        registry_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy = registry_path.with_suffix(".json")
+        if registry_path == legacy:
+            registry_path = registry_path.with_suffix(".sqlite3")
+        self.registry_path = registry_path
+        self.timeout = timeout
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+        if legacy.exists():
+            self._import_json(legacy)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.registry_path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def register(self, entry: ModelRegistryEntry) -> dict[str, Any]:
+        """
+        Register a new version of ``entry.model_name``.
+
+        The version number is allocated atomically and the artifact checksum
+        is computed when not provided.
+        """
+        if not entry.artifact_sha256:
+            entry.artifact_sha256 = file_sha256(Path(entry.artifact_path))
+        if entry.stage not in STAGES:
+            raise ValueError(f"Unknown stage '{entry.stage}'. Expected one of {STAGES}.")
+
+        with self._transaction() as conn:
+            self._insert(conn, entry)
+        logger.info("Registered model '%s' version %s.", entry.model_name, entry.version)
+        return entry.to_dict()
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, entry: ModelRegistryEntry) -> None:
+        """Allocate the next version of ``entry.model_name`` and store it (in a transaction)."""
+        (latest,) = conn.execute(
+            "SELECT COALESCE(MAX(version), 0) FROM model_versions WHERE model_name = ?",
+            (entry.model_name,),
+        ).fetchone()
+        entry.version = latest + 1
+        record = entry.to_dict()
+        for name in _JSON_FIELDS:
+            record[name] = json.dumps(record[name], ensure_ascii=False)
+        conn.execute(
+            f"INSERT INTO model_versions ({', '.join(record)}) "  # noqa: S608
+            f"VALUES ({', '.join('?' * len(record))})",
+            tuple(record.values()),
+        )
+
+    def get(self, model_name: str, version: int | None = None) -> ModelRegistryEntry | None:
+        """Return a specific version, or the latest one when ``version`` is None."""
+        query = "SELECT * FROM model_versions WHERE model_name = ?"
+        params: tuple[Any, ...] = (model_name,)
+        if version is None:
+            query += " ORDER BY version DESC LIMIT 1"
+        else:
+            query += " AND version = ?"
+            params += (version,)
+        with closing(self._connect()) as conn:
+            row = conn.execute(query, params).fetchone()
+        return ModelRegistryEntry.from_row(row) if row else None
+
+    def get_stage(self, model_name: str, stage: str) -> ModelRegistryEntry | None:
+        """Return the newest version of ``model_name`` in ``stage``."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM model_versions WHERE model_name = ? AND stage = ? "
+                "ORDER BY version DESC LIMIT 1",
+                (model_name, stage),
+            ).fetchone()
+        return ModelRegistryEntry.from_row(row) if row else None
+
+    def list_versions(self, model_name: str) -> list[ModelRegistryEntry]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM model_versions WHERE model_name = ? ORDER BY version",
+                (model_name,),
+            ).fetchall()
+        return [ModelRegistryEntry.from_row(row) for row in rows]
+
+    def transition_stage(
+        self,
+        model_name: str,
+        version: int,
+        stage: str,
+        *,
+        archive_existing: bool = True,
+        comment: str | None = None,
+    ) -> ModelRegistryEntry:
+        """
+        Move a version to ``stage``.
+
+        With ``archive_existing``, other versions currently in ``production``
+        are archived in the same transaction when promoting to production.
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}'. Expected one of {STAGES}.")
+
+        now = datetime.utcnow().isoformat()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT stage FROM model_versions WHERE model_name = ? AND version = ?",
+                (model_name, version),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Model '{model_name}' version {version} not found.")
+
+            changes = [(version, row["stage"], stage)]
+            if stage == "production" and archive_existing:
+                changes += [
+                    (other["version"], "production", "archived")
+                    for other in conn.execute(
+                        "SELECT version FROM model_versions "
+                        "WHERE model_name = ? AND stage = 'production' AND version != ?",
+                        (model_name, version),
+                    )
+                ]
+            for changed_version, from_stage, to_stage in changes:
+                conn.execute(
+                    "UPDATE model_versions SET stage = ? WHERE model_name = ? AND version = ?",
+                    (to_stage, model_name, changed_version),
+                )
+                conn.execute(
+                    "INSERT INTO stage_transitions "
+                    "(model_name, version, from_stage, to_stage, transitioned_at, comment) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (model_name, changed_version, from_stage, to_stage, now, comment),
+                )
+
+        logger.info("Model '%s' version %s moved to %s.", model_name, version, stage)
+        entry = self.get(model_name, version)
+        assert entry is not None
+        return entry
+
+    def get_transitions(self, model_name: str) -> list[dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT version, from_stage, to_stage, transitioned_at, comment "
+                "FROM stage_transitions WHERE model_name = ? ORDER BY id",
+                (model_name,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def verify_artifact(self, model_name: str, version: int) -> bool:
+        """True if the artifact on disk still matches the recorded checksum."""
+        entry = self.get(model_name, version)
+        if entry is None:
+            raise ValueError(f"Model '{model_name}' version {version} not found.")
+        path = Path(entry.artifact_path)
+        return path.exists() and file_sha256(path) == entry.artifact_sha256
+
+    def _legacy_imported(self, conn: sqlite3.Connection) -> bool:
+        return (
+            conn.execute(
+                "SELECT 1 FROM registry_meta WHERE key = ?", (_LEGACY_IMPORT_KEY,)
+            ).fetchone()
+            is not None
+        )
+
+    def _import_json(self, legacy_path: Path) -> None:
+        with closing(self._connect()) as conn:
+            if self._legacy_imported(conn):
+                return
+
+        try:
+            with legacy_path.open("r", encoding="utf-8") as handle:
+                records = json.load(handle)
+        except json.JSONDecodeError:
+            logger.warning("Legacy model registry %s is corrupted; skipping import.", legacy_path)
+            return
+
+        # Hash artifacts before taking the write lock
+        entries = []
+        for record in sorted(records, key=lambda r: r.get("created_at", "")):
+            path = Path(record["artifact_path"])
+            entries.append(
+                ModelRegistryEntry(
+                    **{name: record.get(name, {}) for name in _JSON_FIELDS},
+                    model_name=record["model_name"],
+                    version=None,
+                    created_at=record["created_at"],
+                    artifact_path=record["artifact_path"],
+                    artifact_sha256=file_sha256(path) if path.exists() else "missing",
+                )
+            )
+
+        imported = 0
+        with self._transaction() as conn:
+            # Another process may have imported while we read the file
+            if self._legacy_imported(conn):
+                return
+            for entry in entries:
+                exists = conn.execute(
+                    "SELECT 1 FROM model_versions WHERE model_name = ? AND created_at = ? "
+                    "AND artifact_path = ?",
+                    (entry.model_name, entry.created_at, entry.artifact_path),
+                ).fetchone()
+                if not exists:
+                    self._insert(conn, entry)
+                    imported += 1
+            conn.execute(
+                "INSERT INTO registry_meta (key, value) VALUES (?, ?)",
+                (
+                    _LEGACY_IMPORT_KEY,
+                    json.dumps(
+                        {
+                            "path": str(legacy_path),
+                            "imported": imported,
+                            "at": datetime.utcnow().isoformat(),
+                        }
+                    ),
+                ),
+            )
+        logger.info("Imported %d entries from legacy registry %s.", imported, legacy_path)
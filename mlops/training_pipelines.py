@@ -3,21 +3,32 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import math
+import multiprocessing
 import pickle  # nosec B403 - required for model serialization
+import tempfile
 import uuid
 from collections import Counter
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice, repeat
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
 from core.monitoring.model_monitor import ModelMonitor
+from mlops.model_registry import ModelRegistry, ModelRegistryEntry
 
 logger = logging.getLogger(__name__)
 
+# Split codes stored with every spilled row
+TRAIN, VALIDATION, TEST = 0, 1, 2
+SPLIT_NAMES = {TRAIN: "train", VALIDATION: "validation", TEST: "test"}
+
 
 @dataclass
 class TrainingConfig:
@@ -32,9 +43,20 @@ class TrainingConfig:
     learning_rate: float = 0.1
     epochs: int = 400
     l2_regularization: float = 0.0
+    batch_size: int = 256
+    chunk_size: int = 20_000
+    validation_size: float = 0.1
+    patience: int = 5
+    min_delta: float = 1e-4
+    cv_folds: int = 0
+    cv_workers: int = 1
     model_dir: Path = field(default_factory=lambda: Path("artifacts") / "models")
-    registry_path: Path = field(default_factory=lambda: Path("artifacts") / "model_registry.json")
+    registry_path: Path = field(
+        default_factory=lambda: Path("artifacts") / "model_registry.sqlite3"
+    )
+    work_dir: Path | None = None
     monitor_window: int = 200
+    monitor_sample_size: int = 10_000
     min_samples: int = 30
     max_class_imbalance: float = 0.95
     decision_threshold: float = 0.5
@@ -42,16 +64,28 @@ class TrainingConfig:
     def __post_init__(self) -> None:
         if not 0 < self.test_size < 1:
             raise ValueError("test_size must be between 0 and 1.")
+        if not 0 <= self.validation_size < 1 - self.test_size:
+            raise ValueError("validation_size must be between 0 and 1 - test_size.")
         if self.epochs <= 0:
             raise ValueError("epochs must be greater than 0.")
         if self.learning_rate <= 0:
             raise ValueError("learning_rate must be positive.")
+        if self.batch_size <= 0 or self.chunk_size <= 0:
+            raise ValueError("batch_size and chunk_size must be positive.")
+        if self.patience <= 0:
+            raise ValueError("patience must be positive.")
+        if self.cv_folds == 1 or self.cv_folds < 0:
+            raise ValueError("cv_folds must be 0 (disabled) or at least 2.")
+        if self.cv_workers <= 0:
+            raise ValueError("cv_workers must be positive.")
         if self.monitor_window <= 0:
             raise ValueError("monitor_window must be positive.")
         if not 0.5 <= self.max_class_imbalance <= 1.0:
             raise ValueError("max_class_imbalance must be between 0.5 and 1.0.")
         self.model_dir = Path(self.model_dir)
         self.registry_path = Path(self.registry_path)
+        if self.work_dir is not None:
+            self.work_dir = Path(self.work_dir)
 
 
 @dataclass
@@ -102,36 +136,6 @@ class TrainingMetrics:
         return result
 
 
-@dataclass
-class ModelRegistryEntry:
-    """
-    Representation of a model record inside the local registry.
-    """
-
-    model_name: str
-    version: str
-    created_at: str
-    artifact_path: str
-    metrics: dict[str, Any]
-    data_summary: dict[str, Any]
-    feature_scaler: dict[str, Any]
-    label_mapping: dict[str, Any]
-    training_params: dict[str, Any]
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "model_name": self.model_name,
-            "version": self.version,
-            "created_at": self.created_at,
-            "artifact_path": self.artifact_path,
-            "metrics": self.metrics,
-            "data_summary": self.data_summary,
-            "feature_scaler": self.feature_scaler,
-            "label_mapping": self.label_mapping,
-            "training_params": self.training_params,
-        }
-
-
 class LabelEncoder:
     """
     Simple binary label encoder compatible with numpy arrays.
@@ -192,49 +196,207 @@ class LoadedDataset:
     class_distribution: dict[str, int]
 
 
+@dataclass
+class DataChunk:
+    """
+    A block of consecutive rows parsed from the dataset.
+    """
+
+    features: np.ndarray
+    labels: list[Any]
+    feature_names: list[str]
+    offset: int
+
+
+@dataclass
+class SpilledDataset:
+    """
+    A parsed dataset stored on disk as float32 rows and read back in chunks.
+
+    Each row holds the raw features, the label code and the split code, so
+    training never needs more than one chunk in memory.
+    """
+
+    path: Path
+    num_rows: int
+    feature_names: list[str]
+    label_encoder: LabelEncoder
+    label_codes: list[int]  # spilled label code -> label encoder index
+    class_distribution: dict[str, int]
+    split_counts: dict[str, int]
+    scaler: FeatureScaler
+    non_finite_rows: int
+
+    def iter_chunks(
+        self,
+        chunk_size: int,
+        *,
+        splits: Sequence[int] = (TRAIN,),
+        fold: tuple[int, int] | None = None,
+        in_fold: bool = False,
+        rng: np.random.Generator | None = None,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield scaled ``(features, labels)`` for the selected rows.
+
+        Args:
+            chunk_size: Rows read from disk at a time
+            splits: Split codes to keep
+            fold: ``(index, folds)``; rows with ``row % folds == index`` are in the fold
+            in_fold: Keep only the fold's rows instead of dropping them
+            rng: Shuffles the chunk order and the rows inside each chunk
+        """
+        width = len(self.feature_names) + 2
+        remap = np.asarray(self.label_codes, dtype=np.float64)
+        starts = np.arange(0, self.num_rows, chunk_size)
+        if rng is not None:
+            rng.shuffle(starts)
+        with self.path.open("rb") as handle:
+            for start in starts:
+                handle.seek(int(start) * width * 4)
+                block = np.fromfile(handle, dtype=np.float32, count=chunk_size * width)
+                block = block.reshape(-1, width)
+                mask = np.isin(block[:, -1], splits)
+                if fold is not None:
+                    index, folds = fold
+                    member = np.arange(start, start + len(block)) % folds == index
+                    mask &= member if in_fold else ~member
+                if rng is not None:
+                    selected = np.flatnonzero(mask)
+                    block = block[selected[rng.permutation(len(selected))]]
+                else:
+                    block = block[mask]
+                if len(block):
+                    yield (
+                        self.scaler.transform(block[:, :-2]),
+                        remap[block[:, -2].astype(np.intp)],
+                    )
+
+    def summary(self) -> DatasetSummary:
+        return DatasetSummary(
+            num_rows=self.num_rows,
+            num_features=len(self.feature_names),
+            feature_names=list(self.feature_names),
+            class_distribution=dict(self.class_distribution),
+        )
+
+
 class DatasetLoader:
     """
-    Loads datasets from disk and converts them into numpy arrays.
+    Loads datasets from disk in chunks and converts them into numpy arrays.
+
+    CSV and JSONL files are streamed; a JSON array has to be parsed whole
+    before it can be chunked.
     """
 
     def __init__(self, config: TrainingConfig) -> None:
         self.config = config
 
     def load(self, data_path: str) -> LoadedDataset:
+        """Load the whole dataset into memory."""
+        chunks = list(self.iter_chunks(data_path))
+        features = np.concatenate([chunk.features for chunk in chunks])
+        raw_labels = [label for chunk in chunks for label in chunk.labels]
+
+        label_encoder = LabelEncoder()
+        label_encoder.fit(raw_labels)
+        encoded_labels = label_encoder.transform(raw_labels)
+
+        class_distribution = Counter([str(label) for label in raw_labels])
+
+        return LoadedDataset(
+            features=features,
+            labels=encoded_labels,
+            feature_names=chunks[0].feature_names,
+            label_encoder=label_encoder,
+            class_distribution=dict(class_distribution),
+        )
+
+    def iter_chunks(self, data_path: str, chunk_size: int | None = None) -> Iterator[DataChunk]:
+        """Yield the dataset as blocks of at most ``chunk_size`` rows."""
         path = Path(data_path)
         if not path.exists():
             raise FileNotFoundError(f"Training data not found at path: {data_path}")
 
+        chunk_size = chunk_size or self.config.chunk_size
         suffix = path.suffix.lower()
         if suffix == ".csv":
-            records = self._load_csv(path)
+            chunks = self._iter_csv(path, chunk_size)
         elif suffix in {".json", ".jsonl"}:
-            records = self._load_json(path)
+            chunks = self._iter_json(path, chunk_size)
         else:
             raise ValueError(
                 f"Unsupported data format '{suffix}'. Only CSV, JSON, and JSONL are supported."
             )
 
-        if not records:
+        empty = True
+        for chunk in chunks:
+            empty = False
+            yield chunk
+        if empty:
             raise ValueError("Training data file is empty.")
 
-        feature_names = self._determine_feature_columns(records[0])
-        features, raw_labels = self._extract_arrays(records, feature_names)
+    def spill(self, data_path: str, directory: Path) -> SpilledDataset:
+        """
+        Parse ``data_path`` once into a row file under ``directory``.
+
+        Rows are assigned to the train, validation and test splits as they
+        are read, and the feature scaler is fitted on the training rows.
+        """
+        rng = np.random.default_rng(self.config.random_seed)
+        cut_test = self.config.test_size
+        cut_validation = cut_test + self.config.validation_size
+
+        scaler = FeatureScaler()
+        seen: dict[Any, int] = {}
+        label_counts: Counter[int] = Counter()
+        split_counts: Counter[int] = Counter()
+        feature_names: list[str] = []
+        num_rows = non_finite_rows = 0
+
+        path = Path(directory) / "rows.f32"
+        with path.open("wb") as handle:
+            for chunk in self.iter_chunks(data_path):
+                feature_names = chunk.feature_names
+                lookup = {
+                    label: self._label_code(seen, label) for label in dict.fromkeys(chunk.labels)
+                }
+                codes = np.array([lookup[label] for label in chunk.labels], dtype=np.float32)
+                draws = rng.random(len(codes))
+                splits = np.where(
+                    draws < cut_test, TEST, np.where(draws < cut_validation, VALIDATION, TRAIN)
+                )
+                scaler.partial_fit(chunk.features[splits == TRAIN])
+                non_finite_rows += int((~np.isfinite(chunk.features)).any(axis=1).sum())
+                label_counts.update(codes.astype(int).tolist())
+                split_counts.update(splits.tolist())
+                num_rows += len(codes)
+                np.column_stack([chunk.features, codes, splits]).astype(np.float32).tofile(handle)
 
         label_encoder = LabelEncoder()
-        label_encoder.fit(raw_labels)
-        encoded_labels = label_encoder.transform(raw_labels)
-
-        class_distribution = Counter([str(label) for label in raw_labels])
-
-        return LoadedDataset(
-            features=features,
-            labels=encoded_labels,
+        label_encoder.fit(seen)
+        return SpilledDataset(
+            path=path,
+            num_rows=num_rows,
             feature_names=feature_names,
             label_encoder=label_encoder,
-            class_distribution=dict(class_distribution),
+            label_codes=[label_encoder.class_to_index[label] for label in seen],
+            class_distribution={str(label): label_counts[code] for label, code in seen.items()},
+            split_counts={name: split_counts[code] for code, name in SPLIT_NAMES.items()},
+            scaler=scaler,
+            non_finite_rows=non_finite_rows,
         )
 
+    @staticmethod
+    def _label_code(seen: dict[Any, int], label: Any) -> int:
+        label = LabelEncoder._normalize_label(label)
+        code = seen.get(label)
+        if code is None:
+            if len(seen) == 2:
+                raise ValueError("Only binary classification is supported by this pipeline.")
+            code = seen[label] = len(seen)
+        return code
+
     def _determine_feature_columns(self, sample_row: Mapping[str, Any]) -> list[str]:
         if self.config.feature_columns:
             return [str(col) for col in self.config.feature_columns]
@@ -251,12 +413,15 @@ class DatasetLoader:
         return feature_names
 
     def _extract_arrays(
-        self, records: Sequence[Mapping[str, Any]], feature_names: Sequence[str]
+        self,
+        records: Sequence[Mapping[str, Any]],
+        feature_names: Sequence[str],
+        offset: int = 0,
     ) -> tuple[np.ndarray, list[Any]]:
         feature_matrix: list[list[float]] = []
         labels: list[Any] = []
 
-        for idx, row in enumerate(records):
+        for idx, row in enumerate(records, start=offset):
             try:
                 features = [self._to_float(row[col]) for col in feature_names]
             except KeyError as exc:
@@ -272,7 +437,7 @@ class DatasetLoader:
             feature_matrix.append(features)
             labels.append(row[self.config.target_column])
 
-        return np.array(feature_matrix, dtype=np.float64), labels
+        return np.array(feature_matrix, dtype=np.float64).reshape(-1, len(feature_names)), labels
 
     @staticmethod
     def _to_float(value: Any) -> float:
@@ -280,17 +445,58 @@ class DatasetLoader:
             raise ValueError("Encountered null value in dataset.")
         return float(value)
 
-    @staticmethod
-    def _load_csv(path: Path) -> list[dict[str, Any]]:
-        with path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            return [dict(row) for row in reader]
+    def _iter_csv(self, path: Path, chunk_size: int) -> Iterator[DataChunk]:
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return
+            feature_names = self._determine_feature_columns(dict.fromkeys(header))
+            columns = {name: idx for idx, name in enumerate(header)}
+            wanted = [*feature_names, self.config.target_column]
+            if any(name not in columns for name in wanted):
+                # Let the row-wise path report the missing column
+                getter = None
+            else:
+                getter = itemgetter(*(columns[name] for name in feature_names))
+                target = columns[self.config.target_column]
+
+            offset = 0
+            while rows := list(islice(reader, chunk_size)):
+                try:
+                    if getter is None or any(len(row) != len(header) for row in rows):
+                        raise ValueError
+                    features = np.array([getter(row) for row in rows], dtype=np.float64)
+                    labels = [row[target] for row in rows]
+                except ValueError:
+                    records = [dict(zip(header, row, strict=False)) for row in rows]
+                    features, labels = self._extract_arrays(records, feature_names, offset)
+                yield DataChunk(features.reshape(len(rows), -1), labels, feature_names, offset)
+                offset += len(rows)
+
+    def _iter_json(self, path: Path, chunk_size: int) -> Iterator[DataChunk]:
+        if path.suffix.lower() == ".jsonl":
+            with path.open("r", encoding="utf-8") as handle:
+                records = (json.loads(line) for line in handle if line.strip())
+                yield from self._chunk_records(records, chunk_size)
+        else:
+            yield from self._chunk_records(iter(self._load_json(path)), chunk_size)
+
+    def _chunk_records(
+        self, records: Iterator[Mapping[str, Any]], chunk_size: int
+    ) -> Iterator[DataChunk]:
+        feature_names: list[str] | None = None
+        offset = 0
+        while batch := list(islice(records, chunk_size)):
+            if feature_names is None:
+                feature_names = self._determine_feature_columns(batch[0])
+            features, labels = self._extract_arrays(batch, feature_names, offset)
+            yield DataChunk(features, labels, feature_names, offset)
+            offset += len(batch)
 
     @staticmethod
     def _load_json(path: Path) -> list[dict[str, Any]]:
         with path.open("r", encoding="utf-8") as handle:
-            if path.suffix.lower() == ".jsonl":
-                return [json.loads(line) for line in handle if line.strip()]
             data = json.load(handle)
         if isinstance(data, list):
             return data
@@ -307,18 +513,25 @@ class DatasetValidator:
     def __init__(self, config: TrainingConfig) -> None:
         self.config = config
 
-    def validate(self, dataset: LoadedDataset) -> None:
-        num_rows = dataset.features.shape[0]
+    def validate(self, dataset: LoadedDataset | SpilledDataset) -> None:
+        if isinstance(dataset, SpilledDataset):
+            num_rows = dataset.num_rows
+            non_finite = dataset.non_finite_rows > 0
+            counts = list(dataset.class_distribution.values())
+        else:
+            num_rows = dataset.features.shape[0]
+            non_finite = not np.isfinite(dataset.features).all()
+            _, counts = np.unique(dataset.labels, return_counts=True)
+
         if num_rows < self.config.min_samples:
             raise ValueError(
                 f"Insufficient training samples ({num_rows}). "
                 f"Minimum required: {self.config.min_samples}."
             )
 
-        if np.isnan(dataset.features).any() or np.isinf(dataset.features).any():
+        if non_finite:
             raise ValueError("Training features contain NaN or infinite values.")
 
-        _, counts = np.unique(dataset.labels, return_counts=True)
         max_ratio = max(counts) / num_rows
         if max_ratio > self.config.max_class_imbalance:
             raise ValueError(
@@ -326,19 +539,48 @@ class DatasetValidator:
                 "Consider collecting more data or adjusting max_class_imbalance."
             )
 
+        if isinstance(dataset, SpilledDataset):
+            for split in ("train", "test"):
+                if not dataset.split_counts[split]:
+                    raise ValueError(
+                        f"The {split} split is empty. Adjust test_size or provide more data."
+                    )
+
 
 class FeatureScaler:
     """
     Standard score feature scaler.
+
+    ``partial_fit`` merges per-chunk moments (Chan et al.), so the scaler
+    can be fitted on data that never fits in memory at once.
     """
 
     def __init__(self) -> None:
         self.mean_: np.ndarray | None = None
         self.std_: np.ndarray | None = None
+        self.n_samples_ = 0
+        self._m2: np.ndarray | None = None
 
     def fit(self, features: np.ndarray) -> None:
-        self.mean_ = np.mean(features, axis=0)
-        self.std_ = np.std(features, axis=0)
+        self.mean_ = self.std_ = self._m2 = None
+        self.n_samples_ = 0
+        self.partial_fit(features)
+
+    def partial_fit(self, features: np.ndarray) -> None:
+        count = features.shape[0]
+        if not count:
+            return
+        mean = np.mean(features, axis=0)
+        m2 = np.sum((features - mean) ** 2, axis=0)
+        if self.mean_ is None or self._m2 is None:
+            self.mean_, self._m2 = mean, m2
+        else:
+            total = self.n_samples_ + count
+            delta = mean - self.mean_
+            self.mean_ = self.mean_ + delta * count / total
+            self._m2 = self._m2 + m2 + delta**2 * self.n_samples_ * count / total
+        self.n_samples_ += count
+        self.std_ = np.sqrt(self._m2 / self.n_samples_)
         self.std_[self.std_ == 0] = 1.0  # Avoid division by zero
 
     def transform(self, features: np.ndarray) -> np.ndarray:
@@ -356,52 +598,151 @@ class FeatureScaler:
         return {"mean": self.mean_.tolist(), "std": self.std_.tolist()}
 
 
+class EarlyStopping:
+    """
+    Keeps the weights with the lowest monitored loss and signals when it
+    has not improved by ``min_delta`` for ``patience`` epochs.
+    """
+
+    def __init__(self, patience: int, min_delta: float = 0.0) -> None:
+        self.patience = patience
+        self.min_delta = min_delta
+        self.best_loss = math.inf
+        self.best_epoch: int | None = None
+        self.best_weights: np.ndarray | None = None
+        self._stale_epochs = 0
+
+    def update(self, loss: float, weights: np.ndarray, epoch: int) -> bool:
+        """Record an epoch's loss; returns True when training should stop."""
+        if loss < self.best_loss - self.min_delta:
+            self.best_loss = loss
+            self.best_epoch = epoch
+            self.best_weights = weights.copy()
+            self._stale_epochs = 0
+            return False
+        self._stale_epochs += 1
+        return self._stale_epochs >= self.patience
+
+
 class LogisticRegressionModel:
     """
-    Binary logistic regression implemented with gradient descent.
+    Binary logistic regression trained with mini-batch stochastic gradient descent.
+
+    ``fit`` trains on in-memory arrays with early stopping; ``partial_fit``
+    makes one pass over a chunk, so larger-than-memory data can be streamed
+    through the model.
     """
 
-    def __init__(self, learning_rate: float, epochs: int, l2_regularization: float = 0.0) -> None:
+    def __init__(
+        self,
+        learning_rate: float,
+        epochs: int,
+        l2_regularization: float = 0.0,
+        *,
+        batch_size: int = 256,
+        patience: int = 5,
+        min_delta: float = 1e-4,
+        random_seed: int = 42,
+    ) -> None:
         self.learning_rate = learning_rate
         self.epochs = epochs
         self.l2_regularization = l2_regularization
+        self.batch_size = batch_size
+        self.patience = patience
+        self.min_delta = min_delta
+        self.random_seed = random_seed
         self.weights: np.ndarray | None = None
+        self.best_epoch: int | None = None
+        self.validation_losses: list[float] = []
 
-    def fit(self, features: np.ndarray, labels: np.ndarray) -> list[float]:
-        n_samples, n_features = features.shape
-        extended = np.hstack([features, np.ones((n_samples, 1))])
-        self.weights = np.zeros(n_features + 1)
+    def fit(
+        self,
+        features: np.ndarray,
+        labels: np.ndarray,
+        *,
+        validation: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> list[float]:
+        """
+        Train from scratch, shuffling every epoch.
+
+        Stops once the validation loss (the training loss without a
+        validation set) stops improving and keeps the best weights.
+
+        Returns:
+            The mean training loss of each epoch.
+        """
+        rng = np.random.default_rng(self.random_seed)
+        stopper = EarlyStopping(self.patience, self.min_delta)
+        self.weights = None
+        self.validation_losses = []
 
         losses: list[float] = []
-        for _ in range(self.epochs):
-            logits = extended @ self.weights
-            predictions = self._sigmoid(logits)
+        for epoch in range(self.epochs):
+            order = rng.permutation(len(labels))
+            losses.append(self.partial_fit(features[order], labels[order]))
+            monitored = losses[-1]
+            if validation is not None:
+                monitored = self.loss(*validation)
+                self.validation_losses.append(monitored)
+            if stopper.update(monitored, self.weights, epoch):
+                break
+
+        self.restore(stopper)
+        return losses
 
-            errors = predictions - labels
-            gradient = extended.T @ errors / n_samples
-            if self.l2_regularization > 0:
-                gradient[:-1] += self.l2_regularization * self.weights[:-1]
+    def partial_fit(self, features: np.ndarray, labels: np.ndarray) -> float:
+        """
+        One pass of mini-batch SGD over the rows in their given order.
 
-            self.weights -= self.learning_rate * gradient
+        Returns:
+            The mean loss of the batches, each measured before its update.
+        """
+        n_samples, n_features = features.shape
+        if self.weights is None:
+            self.weights = np.zeros(n_features + 1)
+        coefficients = self.weights[:-1]  # view: updated in place
 
-            loss = self._binary_cross_entropy(labels, predictions)
+        total = 0.0
+        for start in range(0, n_samples, self.batch_size):
+            batch = features[start : start + self.batch_size]
+            target = labels[start : start + self.batch_size]
+            predictions = self._sigmoid(batch @ coefficients + self.weights[-1])
+
+            errors = predictions - target
+            gradient = batch.T @ errors / len(target)
             if self.l2_regularization > 0:
-                loss += (self.l2_regularization / 2) * np.sum(self.weights[:-1] ** 2)
-            losses.append(float(loss))
+                gradient += self.l2_regularization * coefficients
 
-        return losses
+            coefficients -= self.learning_rate * gradient
+            self.weights[-1] -= self.learning_rate * float(np.mean(errors))
+            total += self._binary_cross_entropy(target, predictions) * len(target)
+
+        return total / n_samples + self._penalty()
+
+    def loss(self, features: np.ndarray, labels: np.ndarray) -> float:
+        """Regularized cross-entropy of the current weights."""
+        return self._binary_cross_entropy(labels, self.predict_proba(features)) + self._penalty()
+
+    def restore(self, stopper: EarlyStopping) -> None:
+        """Load the best weights recorded by ``stopper``."""
+        if stopper.best_weights is not None:
+            self.weights = stopper.best_weights
+        self.best_epoch = stopper.best_epoch
 
     def predict_proba(self, features: np.ndarray) -> np.ndarray:
         if self.weights is None:
             raise ValueError("Model must be trained before calling predict_proba.")
-        extended = np.hstack([features, np.ones((features.shape[0], 1))])
-        logits = extended @ self.weights
-        return self._sigmoid(logits)
+        return self._sigmoid(features @ self.weights[:-1] + self.weights[-1])
 
     def predict(self, features: np.ndarray, threshold: float = 0.5) -> np.ndarray:
         probabilities = self.predict_proba(features)
         return (probabilities >= threshold).astype(int)
 
+    def _penalty(self) -> float:
+        if self.l2_regularization <= 0 or self.weights is None:
+            return 0.0
+        return float((self.l2_regularization / 2) * np.sum(self.weights[:-1] ** 2))
+
     @staticmethod
     def _sigmoid(x: np.ndarray) -> np.ndarray:
         # Clip values to avoid overflow in exp
@@ -451,19 +792,25 @@ def compute_metrics(
     probabilities: np.ndarray,
     loss: float,
 ) -> TrainingMetrics:
-    tp = float(np.sum((labels == 1) & (predictions == 1)))
-    tn = float(np.sum((labels == 0) & (predictions == 0)))
-    fp = float(np.sum((labels == 0) & (predictions == 1)))
-    fn = float(np.sum((labels == 1) & (predictions == 0)))
+    return _metrics_from_counts(
+        tp=float(np.sum((labels == 1) & (predictions == 1))),
+        tn=float(np.sum((labels == 0) & (predictions == 0))),
+        fp=float(np.sum((labels == 0) & (predictions == 1))),
+        fn=float(np.sum((labels == 1) & (predictions == 0))),
+        auc=_compute_auc(labels, probabilities),
+        loss=loss,
+    )
 
-    total = len(labels)
+
+def _metrics_from_counts(
+    tp: float, tn: float, fp: float, fn: float, auc: float | None, loss: float
+) -> TrainingMetrics:
+    total = tp + tn + fp + fn
     accuracy = (tp + tn) / total if total else 0.0
     precision = tp / (tp + fp) if (tp + fp) else 0.0
     recall = tp / (tp + fn) if (tp + fn) else 0.0
     f1_score = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
 
-    auc = _compute_auc(labels, probabilities)
-
     return TrainingMetrics(
         accuracy=accuracy,
         precision=precision,
@@ -475,54 +822,182 @@ def compute_metrics(
 
 
 def _compute_auc(labels: np.ndarray, probabilities: np.ndarray) -> float | None:
-    positive = probabilities[labels == 1]
-    negative = probabilities[labels == 0]
+    """Mann-Whitney AUC from average ranks (ties count half)."""
+    n_positive = int(np.sum(labels == 1))
+    n_negative = len(labels) - n_positive
 
-    if len(positive) == 0 or len(negative) == 0:
+    if n_positive == 0 or n_negative == 0:
         return None
 
-    positives = positive[:, np.newaxis]
-    comparison = positives - negative
-    greater = np.sum(comparison > 0)
-    equal = np.sum(comparison == 0)
+    _, inverse, counts = np.unique(probabilities, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2
+    rank_sum = float(np.sum(average_ranks[inverse][labels == 1]))
 
-    return float((greater + 0.5 * equal) / (len(positive) * len(negative)))
+    return (rank_sum - n_positive * (n_positive + 1) / 2) / (n_positive * n_negative)
 
 
-class ModelRegistry:
+class MetricsAccumulator:
     """
-    Minimal local model registry that tracks training metadata.
+    Classification metrics over streamed predictions in constant memory.
+
+    AUC is computed from per-class score histograms, so it matches the exact
+    value up to ties within one bin of width ``1 / bins``.
     """
 
-    def __init__(self, registry_path: Path) -> None:
-        self.registry_path = registry_path
-        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(self, threshold: float = 0.5, bins: int = 10_000) -> None:
+        self.threshold = threshold
+        self.bins = bins
+        self._histograms = np.zeros((2, bins), dtype=np.int64)
+        self._confusion = np.zeros((2, 2), dtype=np.int64)  # [label, prediction]
+        self._loss_sum = 0.0
+
+    def update(self, labels: np.ndarray, probabilities: np.ndarray) -> None:
+        classes = labels.astype(np.intp)
+        predictions = (probabilities >= self.threshold).astype(np.intp)
+        np.add.at(self._confusion, (classes, predictions), 1)
+        scores = np.minimum((probabilities * self.bins).astype(np.intp), self.bins - 1)
+        np.add.at(self._histograms, (classes, scores), 1)
+        self._loss_sum += LogisticRegressionModel._binary_cross_entropy(
+            labels, probabilities
+        ) * len(labels)
+
+    @property
+    def count(self) -> int:
+        return int(self._confusion.sum())
+
+    def result(self) -> TrainingMetrics:
+        (tn, fp), (fn, tp) = self._confusion.tolist()
+        negative, positive = self._histograms
+        auc = None
+        if positive.sum() and negative.sum():
+            below = np.cumsum(negative) - negative
+            auc = float(np.sum(positive * (below + 0.5 * negative))) / (
+                float(positive.sum()) * float(negative.sum())
+            )
+        return _metrics_from_counts(
+            tp=tp, tn=tn, fp=fp, fn=fn, auc=auc, loss=self._loss_sum / max(self.count, 1)
+        )
 
-    def register(self, entry: ModelRegistryEntry) -> dict[str, Any]:
-        records = self._load_registry()
-        serialized = entry.to_dict()
-        records.append(serialized)
-        self._save_registry(records)
-        return serialized
 
-    def _load_registry(self) -> list[dict[str, Any]]:
-        if not self.registry_path.exists():
-            return []
-        with self.registry_path.open("r", encoding="utf-8") as handle:
-            try:
-                return json.load(handle)
-            except json.JSONDecodeError:
-                logger.warning("Model registry file was corrupted. Starting with a fresh registry.")
-                return []
+def evaluate(
+    model: LogisticRegressionModel,
+    chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+    threshold: float = 0.5,
+) -> TrainingMetrics:
+    """Metrics of ``model`` over streamed ``(features, labels)`` chunks."""
+    accumulator = MetricsAccumulator(threshold)
+    for features, labels in chunks:
+        accumulator.update(labels, model.predict_proba(features))
+    return accumulator.result()
+
+
+def train_streaming(
+    dataset: SpilledDataset,
+    config: TrainingConfig,
+    *,
+    holdout_fold: tuple[int, int] | None = None,
+) -> tuple[LogisticRegressionModel, dict[str, Any]]:
+    """
+    Train on the spilled training split, one chunk in memory at a time.
+
+    Every epoch visits the chunks in a new random order with rows shuffled
+    inside each chunk. Early stopping watches the validation split, or the
+    training loss when that split is empty.
 
-    def _save_registry(self, entries: list[dict[str, Any]]) -> None:
-        with self.registry_path.open("w", encoding="utf-8") as handle:
-            json.dump(entries, handle, indent=2, ensure_ascii=False)
+    Args:
+        dataset: Spilled dataset
+        config: Training configuration
+        holdout_fold: ``(index, folds)`` of a cross-validation fold to leave out
+
+    Returns:
+        The model with its best weights, and the per-epoch loss history.
+    """
+    model = LogisticRegressionModel(
+        learning_rate=config.learning_rate,
+        epochs=config.epochs,
+        l2_regularization=config.l2_regularization,
+        batch_size=config.batch_size,
+        patience=config.patience,
+        min_delta=config.min_delta,
+        random_seed=config.random_seed,
+    )
+    rng = np.random.default_rng(config.random_seed)
+    stopper = EarlyStopping(config.patience, config.min_delta)
+    has_validation = dataset.split_counts["validation"] > 0
+    history: dict[str, Any] = {"loss": [], "validation_loss": []}
+
+    for epoch in range(config.epochs):
+        total = 0.0
+        seen = 0
+        for features, labels in dataset.iter_chunks(
+            config.chunk_size, fold=holdout_fold, rng=rng
+        ):
+            total += model.partial_fit(features, labels) * len(labels)
+            seen += len(labels)
+        history["loss"].append(total / max(seen, 1))
+
+        monitored = history["loss"][-1]
+        if has_validation:
+            monitored = evaluate(
+                model, dataset.iter_chunks(config.chunk_size, splits=(VALIDATION,))
+            ).loss + model._penalty()
+            history["validation_loss"].append(monitored)
+        assert model.weights is not None
+        if stopper.update(monitored, model.weights, epoch):
+            break
+
+    model.restore(stopper)
+    history["best_epoch"] = model.best_epoch
+    history["epochs_run"] = len(history["loss"])
+    return model, history
+
+
+def _cross_validation_fold(
+    dataset: SpilledDataset, config: TrainingConfig, fold: int
+) -> dict[str, Any]:
+    model, history = train_streaming(dataset, config, holdout_fold=(fold, config.cv_folds))
+    metrics = evaluate(
+        model,
+        dataset.iter_chunks(config.chunk_size, fold=(fold, config.cv_folds), in_fold=True),
+        config.decision_threshold,
+    )
+    return {"fold": fold, "epochs_run": history["epochs_run"], **metrics.to_dict()}
+
+
+def cross_validate(dataset: SpilledDataset, config: TrainingConfig) -> dict[str, Any]:
+    """
+    K-fold cross-validation over the training split.
+
+    Rows are assigned to folds by row number. With ``cv_workers > 1`` the
+    folds train in separate processes, all reading the same spill file.
+    """
+    folds = range(config.cv_folds)
+    if config.cv_workers > 1:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(config.cv_workers, config.cv_folds), mp_context=context
+        ) as pool:
+            results = list(pool.map(_cross_validation_fold, repeat(dataset), repeat(config), folds))
+    else:
+        results = [_cross_validation_fold(dataset, config, fold) for fold in folds]
+
+    summary: dict[str, Any] = {"folds": config.cv_folds, "fold_metrics": results}
+    for name in ("accuracy", "precision", "recall", "f1_score", "auc", "loss"):
+        values = [r[name] for r in results if r[name] is not None]
+        summary[name] = (
+            {"mean": float(np.mean(values)), "std": float(np.std(values))} if values else None
+        )
+    return summary
 
 
 class TrainingPipeline:
     """
     End-to-end training pipeline orchestration.
+
+    The dataset is parsed once into a spill file; training, evaluation and
+    cross-validation then stream it chunk by chunk, so memory does not grow
+    with the number of rows.
     """
 
     def __init__(self, config: TrainingConfig) -> None:
@@ -535,76 +1010,63 @@ class TrainingPipeline:
     def run(self, model_name: str, data_path: str) -> dict[str, Any]:
         logger.info("Starting training pipeline for '%s'.", model_name)
 
-        dataset = self.loader.load(data_path)
-        self.validator.validate(dataset)
-
-        summary = DatasetSummary(
-            num_rows=int(dataset.features.shape[0]),
-            num_features=int(dataset.features.shape[1]),
-            feature_names=list(dataset.feature_names),
-            class_distribution=dict(dataset.class_distribution),
-        )
-
-        scaled_features = self.scaler.fit_transform(dataset.features)
-        (
-            train_features,
-            test_features,
-            train_labels,
-            test_labels,
-        ) = train_test_split(
-            scaled_features,
-            dataset.labels,
-            test_size=self.config.test_size,
-            random_seed=self.config.random_seed,
-        )
-
-        model = LogisticRegressionModel(
-            learning_rate=self.config.learning_rate,
-            epochs=self.config.epochs,
-            l2_regularization=self.config.l2_regularization,
-        )
-        loss_history = model.fit(train_features, train_labels)
-
-        train_probabilities = model.predict_proba(train_features)
-        test_probabilities = model.predict_proba(test_features)
-        test_predictions = model.predict(test_features, threshold=self.config.decision_threshold)
-
-        metrics = compute_metrics(
-            labels=test_labels,
-            predictions=test_predictions,
-            probabilities=test_probabilities,
-            loss=loss_history[-1],
-        )
+        with tempfile.TemporaryDirectory(prefix="training-", dir=self.config.work_dir) as workdir:
+            dataset = self.loader.spill(data_path, Path(workdir))
+            self.validator.validate(dataset)
+            self.scaler = dataset.scaler
+            summary = dataset.summary()
+
+            model, history = train_streaming(dataset, self.config)
+            metrics = evaluate(
+                model,
+                dataset.iter_chunks(self.config.chunk_size, splits=(TEST,)),
+                self.config.decision_threshold,
+            )
+            cross_validation = (
+                cross_validate(dataset, self.config) if self.config.cv_folds else None
+            )
+            reference_probabilities = self._sample_probabilities(model, dataset, TRAIN)
+            live_probabilities = self._sample_probabilities(model, dataset, TEST)
 
-        artifact_path, model_version = self._persist_artifact(
+        artifact_path, run_id = self._persist_artifact(
             model_name=model_name,
             model=model,
             dataset=dataset,
         )
 
+        training_params = {
+            "learning_rate": self.config.learning_rate,
+            "epochs": self.config.epochs,
+            "epochs_run": history["epochs_run"],
+            "batch_size": self.config.batch_size,
+            "l2_regularization": self.config.l2_regularization,
+            "decision_threshold": self.config.decision_threshold,
+            "run_id": run_id,
+        }
+        if cross_validation is not None:
+            training_params["cross_validation"] = {
+                name: cross_validation[name] for name in ("folds", "accuracy", "auc", "loss")
+            }
+
         registry_entry = self.registry.register(
             ModelRegistryEntry(
                 model_name=model_name,
-                version=model_version,
+                version=None,
                 created_at=datetime.utcnow().isoformat(),
                 artifact_path=str(artifact_path),
                 metrics=metrics.to_dict(),
-                data_summary=summary.to_dict(),
+                data_summary={**summary.to_dict(), "split_counts": dataset.split_counts},
                 feature_scaler=self.scaler.to_dict(),
                 label_mapping=dataset.label_encoder.to_dict(),
-                training_params={
-                    "learning_rate": self.config.learning_rate,
-                    "epochs": self.config.epochs,
-                    "l2_regularization": self.config.l2_regularization,
-                    "decision_threshold": self.config.decision_threshold,
-                },
+                training_params=training_params,
             )
         )
+        model_version = registry_entry["version"]
 
         monitor_snapshot = self._initialize_monitor(
             model_name=model_name,
-            train_probabilities=train_probabilities,
-            test_probabilities=test_probabilities,
+            train_probabilities=reference_probabilities,
+            test_probabilities=live_probabilities,
         )
 
         logger.info(
@@ -613,22 +1075,38 @@ class TrainingPipeline:
             model_version,
         )
 
-        return {
+        result = {
             "model_name": model_name,
             "model_version": model_version,
             "model_artifact": str(artifact_path),
             "metrics": metrics.to_dict(),
             "data_summary": summary.to_dict(),
-            "training_history": {"loss": [float(value) for value in loss_history]},
+            "training_history": history,
             "monitoring": monitor_snapshot,
             "registry_entry": registry_entry,
         }
+        if cross_validation is not None:
+            result["cross_validation"] = cross_validation
+        return result
+
+    def _sample_probabilities(
+        self, model: LogisticRegressionModel, dataset: SpilledDataset, split: int
+    ) -> np.ndarray:
+        """Predictions for a uniform sample of at most ``monitor_sample_size`` rows."""
+        rows = dataset.split_counts[SPLIT_NAMES[split]]
+        fraction = min(1.0, self.config.monitor_sample_size / max(rows, 1))
+        rng = np.random.default_rng(self.config.random_seed)
+        samples = [
+            model.predict_proba(features[rng.random(len(features)) < fraction])
+            for features, _ in dataset.iter_chunks(self.config.chunk_size, splits=(split,))
+        ]
+        return np.concatenate(samples) if samples else np.empty(0)
 
     def _persist_artifact(
         self,
         model_name: str,
         model: LogisticRegressionModel,
-        dataset: LoadedDataset,
+        dataset: SpilledDataset,
     ) -> tuple[Path, str]:
         if model.weights is None:
             raise ValueError("Cannot persist an untrained model.")
@@ -636,12 +1114,12 @@ class TrainingPipeline:
         model_dir = self.config.model_dir
         model_dir.mkdir(parents=True, exist_ok=True)
 
-        version = self._generate_version()
-        artifact_path = model_dir / f"{model_name}-{version}.pkl"
+        run_id = self._generate_run_id()
+        artifact_path = model_dir / f"{model_name}-{run_id}.pkl"
 
         payload = {
             "model_name": model_name,
-            "version": version,
+            "run_id": run_id,
             "weights": model.weights.tolist(),
             "feature_names": dataset.feature_names,
             "feature_scaler": self.scaler.to_dict(),
@@ -649,6 +1127,7 @@ class TrainingPipeline:
             "training_params": {
                 "learning_rate": self.config.learning_rate,
                 "epochs": self.config.epochs,
+                "batch_size": self.config.batch_size,
                 "l2_regularization": self.config.l2_regularization,
             },
         }
@@ -656,9 +1135,9 @@ class TrainingPipeline:
         with artifact_path.open("wb") as handle:
             pickle.dump(payload, handle)
 
-        return artifact_path, version
+        return artifact_path, run_id
 
-    def _generate_version(self) -> str:
+    def _generate_run_id(self) -> str:
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
         short_uuid = uuid.uuid4().hex[:8]
         return f"{timestamp}-{short_uuid}"
@@ -669,7 +1148,7 @@ class TrainingPipeline:
         train_probabilities: np.ndarray,
         test_probabilities: np.ndarray,
     ) -> dict[str, Any]:
-        monitor = ModelMonitor(window_size=self.config.monitor_window)
+        monitor = ModelMonitor(window_size=self.config.monitor_window, export_metrics=False)
         monitor.set_reference_data(model_name, train_probabilities.tolist())
 
         for value in test_probabilities.tolist():
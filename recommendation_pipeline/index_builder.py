@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import asyncio
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import orjson
 import structlog
 import typer
-from anyio import to_thread
 
 from config.logging import setup_logging
 from recommendation_pipeline.schemas.exhibits import ExhibitMeta, ExhibitsIndex
@@ -23,21 +26,43 @@ logger = structlog.get_logger(__name__)
 cli = typer.Typer(help="Build exhibits index JSON from processed PDF exhibits.")
 
 
-async def build_index(pdf_paths: list[Path], index_out: Path) -> ExhibitsIndex:
-    """Build an exhibits index using metadata JSON alongside each PDF."""
+def _inspect_exhibit(pdf_path: Path) -> tuple[int, dict[str, Any]]:
+    """Read page count and sidecar metadata for one exhibit (runs in a worker)."""
+    meta_path = pdf_path.with_suffix(".json")
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Metadata JSON not found for {pdf_path}")
+    raw_meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    return pdf_utils.pdf_file_page_count(pdf_path), raw_meta
+
+
+async def build_index(
+    pdf_paths: list[Path],
+    index_out: Path,
+    *,
+    max_workers: int | None = None,
+) -> ExhibitsIndex:
+    """Build an exhibits index using metadata JSON alongside each PDF.
+
+    Exhibits are inspected in parallel in a process pool (PDF parsing is
+    CPU-bound); page ranges are then assigned in sorted path order, so the
+    index is identical to a sequential build.
+    """
     if not pdf_paths:
         raise ValueError("At least one exhibit PDF is required")
 
     pdf_paths = sorted(pdf_paths)
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers or os.cpu_count() or 1, len(pdf_paths)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        inspected = await asyncio.gather(
+            *(loop.run_in_executor(pool, _inspect_exhibit, path) for path in pdf_paths)
+        )
+
     total_pages = 0
     items: list[ExhibitMeta] = []
-    for pdf_path in pdf_paths:
-        pdf_bytes = io_utils.read_bytes(pdf_path)
-        page_count = await to_thread.run_sync(pdf_utils.pdf_page_count, pdf_bytes)
-        meta_path = pdf_path.with_suffix(".json")
-        if not meta_path.exists():
-            raise FileNotFoundError(f"Metadata JSON not found for {pdf_path}")
-        raw_meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    for pdf_path, (page_count, raw_meta) in zip(pdf_paths, inspected, strict=True):
         exhibit_id = raw_meta.get("exhibit_id") or pdf_path.stem
         title = raw_meta.get("summary") or exhibit_id.replace("_", " ").title()
         keywords = raw_meta.get("keywords") or []
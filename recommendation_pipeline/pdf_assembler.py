@@ -7,9 +7,11 @@ Example:
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 import json
 from pathlib import Path
 
+from anyio import to_thread
 import structlog
 import typer
 
@@ -27,22 +29,25 @@ async def assemble_master_pdf(
     index_path: Path,
     out_pdf: Path,
 ) -> Path:
-    text_bytes = io_utils.read_bytes(text_pdf)
-    exhibits_bytes = [io_utils.read_bytes(path) for path in exhibits]
+    """Merge the text PDF and exhibits into ``out_pdf`` with exhibit bookmarks.
+
+    Inputs are streamed from disk and the master PDF is written through a
+    temporary file in a worker thread, so memory stays close to the size of
+    the parsed page objects rather than several copies of every PDF.
+    """
     index_data = json.loads(index_path.read_text(encoding="utf-8"))
     index = ExhibitsIndex.model_validate(index_data)
 
-    expected_total = pdf_utils.pdf_page_count(text_bytes)
-    for exhibit_meta in index.items:
-        expected_total = max(expected_total, exhibit_meta.page_end)
-    merged = pdf_utils.merge_pdfs([text_bytes, *exhibits_bytes])
-
-    total_pages = pdf_utils.pdf_page_count(merged)
-    if total_pages < index.total_pages:
-        raise ValueError("Merged PDF has fewer pages than index specifies")
-
-    merged_with_bookmarks = pdf_utils.add_bookmarks(merged, index.items)
-    io_utils.write_bytes(out_pdf, merged_with_bookmarks)
+    io_utils.ensure_directory(out_pdf.parent)
+    total_pages = await to_thread.run_sync(
+        partial(
+            pdf_utils.merge_pdf_files,
+            [text_pdf, *exhibits],
+            out_pdf,
+            index.items,
+            min_pages=index.total_pages,
+        )
+    )
     logger.info("pdf_assembler.success", out=str(out_pdf), total_pages=total_pages)
     return out_pdf
 
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from io import BytesIO
+import os
+from pathlib import Path
+import tempfile
 
 import img2pdf
 from PyPDF2 import PdfMerger, PdfReader, PdfWriter
@@ -47,3 +51,59 @@ def pdf_page_count(pdf_bytes: bytes) -> int:
     """Return the number of pages in a PDF."""
     reader = PdfReader(BytesIO(pdf_bytes))
     return len(reader.pages)
+
+
+def pdf_file_page_count(path: Path) -> int:
+    """Return the number of pages in a PDF file without reading it into memory."""
+    with path.open("rb") as fh:
+        return len(PdfReader(fh).pages)
+
+
+def merge_pdf_files(
+    paths: list[Path],
+    out_path: Path,
+    metas: list[ExhibitMeta] | None = None,
+    *,
+    min_pages: int = 0,
+) -> int:
+    """Merge PDF files into ``out_path`` in one pass, adding exhibit bookmarks.
+
+    Pages are copied from open file handles rather than from ``bytes`` copies of
+    each input, and the result is streamed into a temporary file next to
+    ``out_path`` that is renamed into place, so a failed merge never leaves a
+    truncated master PDF. The output is byte-for-byte deterministic for the
+    same inputs.
+
+    Returns:
+        Total page count of the merged document
+
+    Raises:
+        ValueError: If the merged document has fewer than ``min_pages`` pages
+    """
+    writer = PdfWriter()
+    # Inputs stay open until written: the writer resolves some objects lazily
+    with ExitStack() as stack:
+        for path in paths:
+            reader = PdfReader(stack.enter_context(path.open("rb")))
+            for page in reader.pages:
+                writer.add_page(page)
+
+        total_pages = len(writer.pages)
+        if total_pages < min_pages:
+            writer.close()
+            raise ValueError("Merged PDF has fewer pages than index specifies")
+
+        for meta in metas or []:
+            writer.add_outline_item(meta.title, max(0, meta.page_start - 1))
+
+        fd, tmp_name = tempfile.mkstemp(dir=out_path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                writer.write(fh)
+            Path(tmp_name).replace(out_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        finally:
+            writer.close()
+    return total_pages
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import structlog
 from dotenv import load_dotenv
 from telegram import Update
@@ -14,6 +16,8 @@ from core.groupagents.mega_agent import MegaAgent
 from core.memory.memory_manager import MemoryManager
 from telegram_interface.handlers import register_handlers
 from telegram_interface.middlewares.di_injection import setup_di_middleware
+from telegram_interface.update_queue import (TelegramUpdateQueue,
+                                             create_update_store)
 
 logger = structlog.get_logger(__name__)
 
@@ -44,6 +48,8 @@ def build_application(
         ApplicationBuilder()
         .token(token)
         .defaults(Defaults(parse_mode=None))
+        # Only governs PTB's own update_queue (polling); webhook updates go through
+        # TelegramUpdateQueue, which runs chats concurrently and keeps each in order
         .concurrent_updates(False)
         .build()
     )
@@ -106,6 +112,20 @@ async def initialize_application(application: Application) -> None:
     logger.info("telegram.application.started")
 
 
+def build_update_queue(
+    application: Application, *, settings: AppSettings | None = None
+) -> TelegramUpdateQueue:
+    """Create the webhook ingest queue that dispatches into ``application``."""
+
+    settings = settings or get_settings()
+
+    async def process(payload: dict[str, Any]) -> None:
+        await application.process_update(Update.de_json(payload, application.bot))
+
+    store = create_update_store(settings.telegram_update_queue_path)
+    return TelegramUpdateQueue(process, store, workers=settings.telegram_update_workers)
+
+
 async def shutdown_application(application: Application) -> None:
     """Gracefully stop the telegram Application."""
 
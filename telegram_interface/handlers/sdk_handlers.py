@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterable
 
 import structlog
 from dotenv import load_dotenv
@@ -12,6 +11,7 @@ from openai.types import Model
 from telegram import Update
 from telegram.ext import CommandHandler, ContextTypes
 
+from ..notification_service import split_message
 from .context import BotContext
 
 # CRITICAL: Override system environment variables with .env file
@@ -57,9 +57,7 @@ async def _reply(update: Update, text: str) -> None:
     if message is None:
         return
 
-    chunk_size = 3500  # Telegram hard limit is 4096 characters
-    chunks: Iterable[str] = (text[i : i + chunk_size] for i in range(0, len(text), chunk_size))
-    for chunk in chunks:
+    for chunk in split_message(text):
         await message.reply_text(chunk)
 
 
@@ -1,7 +1,492 @@
+"""Outbound Telegram notifications for long-running workflows.
+
+``NotificationService`` pushes messages (petition ready, OCR finished, ...)
+to chats outside of an update handler. Messages are split like handler
+replies, persisted to an outbox before sending and removed only once every
+chunk is delivered, so a restart resumes where delivery stopped.
+
+Sending respects Telegram's limits: one chat receives at most one message
+per ``per_chat_interval`` (longer for groups), the bot sends at most
+``global_rate`` messages per second overall (paced through Redis when the
+outbox is, so the limit holds across every worker), and ``RetryAfter`` pauses
+the affected chat for the time Telegram asks. Messages to one chat keep their
+order; different chats are served concurrently.
+"""
+
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+import json
+import time
 from typing import Any
+import uuid
+
+import structlog
+from telegram.error import BadRequest, ChatMigrated, Forbidden, RetryAfter, TelegramError
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 3500  # Telegram hard limit is 4096 characters
+DEFAULT_PER_CHAT_INTERVAL = 1.0
+DEFAULT_GROUP_INTERVAL = 3.0  # groups: about 20 messages per minute
+DEFAULT_GLOBAL_RATE = 30.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE_SECONDS = 60.0
+
+
+def split_message(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[str]:
+    """Split ``text`` into chunks Telegram accepts as single messages."""
+    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+
+
+@dataclass
+class Notification:
+    """A message to one chat, possibly in several chunks."""
+
+    notification_id: str
+    chat_id: int | str
+    chunks: list[str]
+    options: dict[str, Any] = field(default_factory=dict)
+    sent: int = 0
+    attempts: int = 0
+    owner: str = ""
+    lease_until: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> Notification:
+        return cls(**json.loads(raw))
+
+
+class MemoryOutbox:
+    """Process-local outbox; undelivered notifications are lost on restart."""
+
+    durable = False
+
+    def __init__(self) -> None:
+        self._entries: dict[str, str] = {}
+
+    async def put(self, notification: Notification) -> None:
+        self._entries[notification.notification_id] = notification.to_json()
+
+    async def delete(self, notification_id: str) -> None:
+        self._entries.pop(notification_id, None)
+
+    async def claim(self, owner: str, lease_seconds: float) -> list[Notification]:
+        now = time.time()
+        claimed = []
+        for raw in list(self._entries.values()):
+            notification = Notification.from_json(raw)
+            if notification.lease_until < now:
+                notification.owner = owner
+                notification.lease_until = now + lease_seconds
+                await self.put(notification)
+                claimed.append(notification)
+        return claimed
+
+
+class RedisOutbox:
+    """Outbox in one Redis hash, shared by every worker."""
+
+    durable = True
+
+    def __init__(self, redis_client: Any, key: str = "telegram:outbox") -> None:
+        self.redis = redis_client
+        self.key = key
+
+    async def put(self, notification: Notification) -> None:
+        await self.redis.hset(self.key, notification.notification_id, notification.to_json())
+
+    async def delete(self, notification_id: str) -> None:
+        await self.redis.hdel(self.key, notification_id)
+
+    async def claim(self, owner: str, lease_seconds: float) -> list[Notification]:
+        """Take over notifications whose lease expired, atomically."""
+        from redis.exceptions import WatchError
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for _ in range(10):
+                try:
+                    await pipe.watch(self.key)
+                    now = time.time()
+                    claimed = [
+                        notification
+                        for notification in map(
+                            Notification.from_json, (await pipe.hgetall(self.key)).values()
+                        )
+                        if notification.lease_until < now
+                    ]
+                    if not claimed:
+                        await pipe.unwatch()
+                        return []
+                    for notification in claimed:
+                        notification.owner = owner
+                        notification.lease_until = now + lease_seconds
+                    pipe.multi()
+                    pipe.hset(
+                        self.key, mapping={n.notification_id: n.to_json() for n in claimed}
+                    )
+                    await pipe.execute()
+                    return claimed
+                except WatchError:
+                    continue
+        return []
+
+
+Outbox = MemoryOutbox | RedisOutbox
+
+
+async def create_outbox() -> Outbox:
+    """Use the Redis outbox when Redis is enabled, else an in-memory one."""
+    from core.storage.redis_client import get_redis_client
+
+    redis = await get_redis_client()
+    return RedisOutbox(redis) if redis is not None else MemoryOutbox()
+
+
+def _seconds(value: float | timedelta) -> float:
+    return value.total_seconds() if isinstance(value, timedelta) else float(value)
+
+
+class _GlobalPacer:
+    """Spaces sends evenly so the bot never exceeds ``rate`` messages/second."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(self._next, now) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# KEYS[1] next free send slot (ms, Redis clock); ARGV: interval_ms
+# Returns how long the caller must wait for the slot it just reserved.
+PACER_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + t[2] / 1000
+local interval = tonumber(ARGV[1])
+local slot = math.max(tonumber(redis.call('GET', KEYS[1])) or 0, now)
+redis.call('SET', KEYS[1], tostring(slot + interval), 'PX', math.ceil(slot - now + interval) + 1000)
+return math.ceil(slot - now)
+"""
+
+
+class _RedisPacer:
+    """``_GlobalPacer`` shared by every worker through one Redis key.
+
+    Falls back to pacing this process alone while Redis is unreachable.
+    """
+
+    def __init__(self, redis_client: Any, rate: float, key: str = "telegram:pacer") -> None:
+        self.interval_ms = 1000.0 / rate
+        self.key = key
+        self._script = redis_client.register_script(PACER_LUA)
+        self._local = _GlobalPacer(rate)
+
+    async def wait(self) -> None:
+        try:
+            delay_ms = await self._script(keys=[self.key], args=[self.interval_ms])
+        except Exception as exc:
+            logger.warning("telegram.notify.pacer_unavailable", error=str(exc))
+            await self._local.wait()
+            return
+        if int(delay_ms) > 0:
+            await asyncio.sleep(int(delay_ms) / 1000)
+
+
+class NotificationService:
+    """Rate-aware, durable send queue for outbound Telegram messages.
+
+    Example:
+        >>> service = NotificationService(application.bot, await create_outbox())
+        >>> await service.start()
+        >>> await service.notify(chat_id, "✅ Petition draft is ready")
+        'b7c4...'
+    """
+
+    def __init__(
+        self,
+        bot: Any,
+        outbox: Outbox | None = None,
+        *,
+        per_chat_interval: float = DEFAULT_PER_CHAT_INTERVAL,
+        group_interval: float = DEFAULT_GROUP_INTERVAL,
+        global_rate: float = DEFAULT_GLOBAL_RATE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        """
+        Args:
+            bot: ``telegram.Bot`` (anything with an async ``send_message``)
+            outbox: Where undelivered notifications are kept (in-memory if omitted)
+            per_chat_interval: Minimum seconds between messages to one private chat
+            group_interval: Minimum seconds between messages to one group chat
+            global_rate: Maximum messages per second across all chats (and
+                all workers sharing a Redis outbox)
+            max_attempts: Consecutive transient failures before a message is dropped
+            backoff_base: First retry delay after a transient failure
+            backoff_max: Cap for the exponential retry delay
+            chunk_size: Maximum characters per Telegram message
+            lease_seconds: How long other workers leave our queued notifications alone
+        """
+        self.bot = bot
+        self.outbox = outbox or MemoryOutbox()
+        self.per_chat_interval = per_chat_interval
+        self.group_interval = group_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.chunk_size = chunk_size
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+
+        self._pacer: _GlobalPacer | _RedisPacer = (
+            _RedisPacer(self.outbox.redis, global_rate)
+            if isinstance(self.outbox, RedisOutbox)
+            else _GlobalPacer(global_rate)
+        )
+        self._chats: dict[str, deque[Notification]] = {}
+        self._drainers: dict[str, asyncio.Task[None]] = {}
+        self._last_sent: dict[str, float] = {}
+        self._maintenance: asyncio.Task[None] | None = None
+        self._stats = {"queued": 0, "sent": 0, "delivered": 0, "dropped": 0, "retry_after": 0}
+
+    async def start(self) -> None:
+        """Resume undelivered notifications from the outbox."""
+        for notification in await self.outbox.claim(self.owner, self.lease_seconds):
+            self._schedule(notification)
+        if self.outbox.durable:
+            self._maintenance = asyncio.create_task(self._maintain(), name="telegram-outbox")
+        logger.info("telegram.notify.started", resumed=self.pending)
+
+    @property
+    def pending(self) -> int:
+        """Notifications queued but not yet fully delivered."""
+        return sum(len(queue) for queue in self._chats.values())
+
+    async def notify(self, chat_id: int | str, text: str, **options: Any) -> str:
+        """Queue ``text`` for ``chat_id``; returns the notification id.
+
+        ``options`` are passed to ``send_message`` (e.g. ``parse_mode``) and
+        must be JSON-serializable so the notification can be persisted.
+        """
+        notification = Notification(
+            notification_id=uuid.uuid4().hex,
+            chat_id=chat_id,
+            chunks=split_message(text, self.chunk_size),
+            options=options,
+            owner=self.owner,
+            lease_until=time.time() + self.lease_seconds,
+        )
+        await self.outbox.put(notification)
+        self._schedule(notification)
+        self._stats["queued"] += 1
+        return notification.notification_id
+
+    def _schedule(self, notification: Notification) -> None:
+        chat_key = str(notification.chat_id)
+        queue = self._chats.get(chat_key)
+        if queue is None:
+            queue = self._chats[chat_key] = deque()
+            self._drainers[chat_key] = asyncio.create_task(self._drain(chat_key))
+        queue.append(notification)
+
+    def _chat_interval(self, chat_id: int | str) -> float:
+        # Group and channel ids are negative
+        return self.group_interval if str(chat_id).startswith("-") else self.per_chat_interval
+
+    async def _drain(self, chat_key: str) -> None:
+        """Deliver one chat's notifications in order."""
+        queue = self._chats[chat_key]
+        try:
+            while queue:
+                await self._deliver(queue[0])
+                queue.popleft()
+        finally:
+            del self._chats[chat_key]
+            del self._drainers[chat_key]
+
+    async def _deliver(self, notification: Notification) -> None:
+        chat_key = str(notification.chat_id)
+        while notification.sent < len(notification.chunks):
+            wait = self._last_sent.get(chat_key, 0.0) + self._chat_interval(
+                notification.chat_id
+            )
+            if wait > time.monotonic():
+                await asyncio.sleep(wait - time.monotonic())
+            await self._pacer.wait()
+
+            try:
+                await self.bot.send_message(
+                    chat_id=notification.chat_id,
+                    text=notification.chunks[notification.sent],
+                    **notification.options,
+                )
+            except RetryAfter as exc:
+                # Flood control: wait as told; this is not a failed attempt
+                delay = _seconds(exc.retry_after)
+                self._stats["retry_after"] += 1
+                logger.warning("telegram.notify.retry_after", chat_id=chat_key, delay_s=delay)
+                await self._checkpoint(notification, extra_lease=delay)
+                await asyncio.sleep(delay)
+                continue
+            except ChatMigrated as exc:
+                notification.chat_id = exc.new_chat_id
+                continue
+            except (Forbidden, BadRequest) as exc:
+                # Bot blocked or message rejected: retrying cannot help
+                await self._drop(notification, exc)
+                return
+            except (TelegramError, OSError) as exc:
+                notification.attempts += 1
+                if notification.attempts >= self.max_attempts:
+                    await self._drop(notification, exc)
+                    return
+                delay = min(self.backoff_max, self.backoff_base * 2 ** (notification.attempts - 1))
+                logger.warning(
+                    "telegram.notify.send_failed",
+                    chat_id=chat_key,
+                    attempt=notification.attempts,
+                    retry_in_s=delay,
+                    error=str(exc),
+                )
+                await self._checkpoint(notification, extra_lease=delay)
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                self._last_sent[chat_key] = time.monotonic()
+
+            notification.sent += 1
+            notification.attempts = 0
+            self._stats["sent"] += 1
+            if notification.sent < len(notification.chunks):
+                await self._checkpoint(notification)
+
+        await self._forget(notification)
+        self._stats["delivered"] += 1
+
+    async def _checkpoint(self, notification: Notification, extra_lease: float = 0.0) -> None:
+        """Persist progress and extend our lease before any wait."""
+        notification.owner = self.owner
+        notification.lease_until = time.time() + self.lease_seconds + extra_lease
+        try:
+            await self.outbox.put(notification)
+        except Exception:
+            logger.exception("telegram.notify.checkpoint_failed", id=notification.notification_id)
+
+    async def _drop(self, notification: Notification, exc: Exception) -> None:
+        self._stats["dropped"] += 1
+        logger.error(
+            "telegram.notify.dropped",
+            chat_id=notification.chat_id,
+            id=notification.notification_id,
+            sent_chunks=notification.sent,
+            error=str(exc),
+        )
+        await self._forget(notification)
+
+    async def _forget(self, notification: Notification) -> None:
+        """Remove a finished notification; failures must not end the chat's drainer."""
+        try:
+            await self.outbox.delete(notification.notification_id)
+        except Exception:
+            # Left in the outbox, it is resent once its lease runs out
+            logger.exception("telegram.notify.delete_failed", id=notification.notification_id)
+
+    async def _maintain(self) -> None:
+        """Renew leases on queued notifications and adopt those of dead workers."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                for queue in list(self._chats.values()):
+                    for notification in list(queue):
+                        await self._checkpoint(notification)
+                for notification in await self.outbox.claim(self.owner, self.lease_seconds):
+                    self._schedule(notification)
+            except Exception:
+                logger.exception("telegram.notify.maintenance_failed")
+
+            cutoff = time.monotonic() - max(self.per_chat_interval, self.group_interval)
+            for chat_key, sent_at in list(self._last_sent.items()):
+                if sent_at < cutoff:
+                    del self._last_sent[chat_key]
+
+    async def join(self) -> None:
+        """Wait until every queued notification is delivered or dropped."""
+        while self._drainers:
+            await asyncio.gather(*list(self._drainers.values()), return_exceptions=True)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Deliver for up to ``timeout`` seconds, then stop.
+
+        Undelivered notifications stay in a durable outbox for the next start.
+        """
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except TimeoutError:
+            logger.warning("telegram.notify.stop_timeout", pending=self.pending)
+        tasks = [*self._drainers.values(), *([self._maintenance] if self._maintenance else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._maintenance = None
+        logger.info("telegram.notify.stopped", **self._stats)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get delivery counters."""
+        return {**self._stats, "pending": self.pending, "active_chats": len(self._chats)}
+
+
+# Global instance
+_service: NotificationService | None = None
+
+
+def configure_notifications(service: NotificationService | None) -> None:
+    """Install the service used by :func:`notify`."""
+    global _service
+    _service = service
+
+
+def get_notification_service() -> NotificationService | None:
+    """Return the configured notification service, if any."""
+    return _service
+
+
+async def notify(user_id: str, message: str, **kwargs: Any) -> str | None:
+    """Queue ``message`` for a Telegram chat via the configured service.
+
+    Returns:
+        Notification id, or None when Telegram is not configured
+    """
+    if _service is None:
+        logger.warning("telegram.notify.not_configured", user_id=user_id)
+        return None
+    return await _service.notify(user_id, message, **kwargs)
 
 
-async def notify(user_id: str, message: str, **kwargs: Any) -> None:  # pragma: no cover - scaffold
-    _ = (user_id, message, kwargs)
+__all__ = [
+    "MemoryOutbox",
+    "Notification",
+    "NotificationService",
+    "RedisOutbox",
+    "configure_notifications",
+    "create_outbox",
+    "get_notification_service",
+    "notify",
+    "split_message",
+]
@@ -1,4 +1,255 @@
+"""Telegram session storage shared by every API worker.
+
+Sessions are JSON dicts keyed by chat or user id, expire after a TTL that is
+renewed on every write, and are changed with ``update`` -- an atomic
+read-modify-write (Redis ``WATCH``/``MULTI`` with retry, or a lock in
+memory) so two workers handling the same chat never lose each other's
+changes. ``RedisSessionStore`` falls back to an in-memory store while Redis
+is unreachable.
+"""
+
 from __future__ import annotations
 
-# Simple in-memory session storage (scaffold)
-SESSIONS: dict[str, dict] = {}
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+import json
+import time
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Session = dict[str, Any]
+SessionMutator = Callable[[Session], Session | None]
+
+DEFAULT_SESSION_TTL = 7 * 24 * 3600.0
+DEFAULT_MAX_LOCAL_SESSIONS = 50_000
+
+
+class SessionConflictError(RuntimeError):
+    """Raised when an atomic update keeps losing races for the same session."""
+
+
+class MemorySessionStore:
+    """Process-local session store with TTLs and a bounded LRU.
+
+    Example:
+        >>> store = MemorySessionStore()
+        >>> await store.update("chat:42", lambda s: {**s, "active_case": "case-1"})
+        {'active_case': 'case-1'}
+        >>> (await store.get("chat:42"))["active_case"]
+        'case-1'
+    """
+
+    backend = "memory"
+
+    def __init__(
+        self, ttl: float = DEFAULT_SESSION_TTL, max_sessions: int = DEFAULT_MAX_LOCAL_SESSIONS
+    ) -> None:
+        """
+        Args:
+            ttl: Seconds a session lives after its last write
+            max_sessions: Least recently used sessions beyond this are dropped
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def _load(self, key: str) -> Session | None:
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            del self._sessions[key]
+            return None
+        self._sessions.move_to_end(key)
+        return json.loads(raw)
+
+    def _store(self, key: str, session: Session, ttl: float | None) -> None:
+        # Stored serialized so callers never share mutable state with the store
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._sessions[key] = (expires_at, json.dumps(session))
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    async def get(self, key: str) -> Session | None:
+        """Return the session for ``key`` or None if missing or expired."""
+        return self._load(key)
+
+    async def set(self, key: str, session: Session, ttl: float | None = None) -> None:
+        """Replace the session for ``key`` and renew its TTL."""
+        self._store(key, session, ttl)
+
+    async def update(
+        self, key: str, mutator: SessionMutator, ttl: float | None = None
+    ) -> Session:
+        """Atomically apply ``mutator`` to the session (``{}`` if missing).
+
+        ``mutator`` may change the dict in place (returning None) or return
+        a new one.
+        """
+        async with self._lock:
+            session = self._load(key) or {}
+            result = mutator(session)
+            session = session if result is None else result
+            self._store(key, session, ttl)
+            return session
+
+    async def delete(self, key: str) -> None:
+        """Remove the session for ``key``."""
+        self._sessions.pop(key, None)
+
+
+class RedisSessionStore:
+    """Redis-backed session store shared across workers, with local fallback.
+
+    Example:
+        >>> store = RedisSessionStore(await get_redis_client())
+        >>> await store.update("chat:42", lambda s: s.setdefault("history", []).append("hi"))
+        {'history': ['hi']}
+    """
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        prefix: str = "telegram:session",
+        ttl: float = DEFAULT_SESSION_TTL,
+        fallback: MemorySessionStore | None = None,
+        retry_interval: float = 5.0,
+        max_update_attempts: int = 20,
+    ) -> None:
+        """
+        Args:
+            redis_client: ``redis.asyncio`` client
+            prefix: Key namespace
+            ttl: Seconds a session lives after its last write
+            fallback: Store used while Redis is unreachable
+            retry_interval: Seconds to stay on the fallback after a Redis error
+            max_update_attempts: Optimistic retries before ``SessionConflictError``
+        """
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.fallback = fallback or MemorySessionStore(ttl=ttl)
+        self.retry_interval = retry_interval
+        self.max_update_attempts = max_update_attempts
+        self._unavailable_until = 0.0
+
+    @property
+    def degraded(self) -> bool:
+        """True while sessions are served by the local fallback."""
+        return time.monotonic() < self._unavailable_until
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _ttl_ms(self, ttl: float | None) -> int:
+        return max(1, int((self.ttl if ttl is None else ttl) * 1000))
+
+    def _redis_failed(self, exc: Exception) -> None:
+        self._unavailable_until = time.monotonic() + self.retry_interval
+        logger.warning(
+            "telegram.session.redis_unavailable", error=str(exc), retry_in_s=self.retry_interval
+        )
+
+    async def get(self, key: str) -> Session | None:
+        """Return the session for ``key`` or None if missing or expired."""
+        if self.degraded:
+            return await self.fallback.get(key)
+        try:
+            raw = await self.redis.get(self._key(key))
+        except Exception as exc:
+            self._redis_failed(exc)
+            return await self.fallback.get(key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, session: Session, ttl: float | None = None) -> None:
+        """Replace the session for ``key`` and renew its TTL."""
+        if self.degraded:
+            return await self.fallback.set(key, session, ttl)
+        try:
+            await self.redis.set(self._key(key), json.dumps(session), px=self._ttl_ms(ttl))
+        except Exception as exc:
+            self._redis_failed(exc)
+            await self.fallback.set(key, session, ttl)
+
+    async def update(
+        self, key: str, mutator: SessionMutator, ttl: float | None = None
+    ) -> Session:
+        """Atomically apply ``mutator`` to the session (``{}`` if missing).
+
+        Uses optimistic locking: if another worker writes the session between
+        the read and the write, the mutator is re-run on the fresh value.
+
+        Raises:
+            SessionConflictError: If every attempt lost a race
+        """
+        if self.degraded:
+            return await self.fallback.update(key, mutator, ttl)
+
+        from redis.exceptions import RedisError, WatchError
+
+        redis_key = self._key(key)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for _ in range(self.max_update_attempts):
+                    try:
+                        await pipe.watch(redis_key)
+                        raw = await pipe.get(redis_key)
+                        session = json.loads(raw) if raw else {}
+                        result = mutator(session)
+                        session = session if result is None else result
+                        pipe.multi()
+                        pipe.set(redis_key, json.dumps(session), px=self._ttl_ms(ttl))
+                        await pipe.execute()
+                        return session
+                    except WatchError:
+                        continue
+        except (RedisError, OSError) as exc:
+            # Errors raised by the mutator itself propagate to the caller
+            self._redis_failed(exc)
+            return await self.fallback.update(key, mutator, ttl)
+        raise SessionConflictError(f"Session {key!r} changed concurrently too often")
+
+    async def delete(self, key: str) -> None:
+        """Remove the session for ``key``."""
+        if self.degraded:
+            return await self.fallback.delete(key)
+        try:
+            await self.redis.delete(self._key(key))
+        except Exception as exc:
+            self._redis_failed(exc)
+            await self.fallback.delete(key)
+
+
+SessionStore = MemorySessionStore | RedisSessionStore
+
+_session_store: SessionStore | None = None
+
+
+async def get_session_store() -> SessionStore:
+    """Get or create the global session store (Redis when enabled)."""
+    global _session_store
+    if _session_store is None:
+        from core.storage.redis_client import get_redis_client
+
+        redis = await get_redis_client()
+        _session_store = RedisSessionStore(redis) if redis is not None else MemorySessionStore()
+        logger.info("telegram.session.store_initialized", backend=_session_store.backend)
+    return _session_store
+
+
+__all__ = [
+    "MemorySessionStore",
+    "RedisSessionStore",
+    "SessionConflictError",
+    "get_session_store",
+]
@@ -0,0 +1,476 @@
+"""Durable, deduplicating ingest queue for Telegram webhook updates.
+
+The webhook handler only persists the update and returns, so Telegram gets
+its acknowledgement immediately and never redelivers because a handler was
+slow. Workers then dispatch updates so that different chats run concurrently
+while updates within one chat are processed strictly in arrival order.
+
+Updates are deduplicated by ``update_id`` for ``dedup_ttl`` seconds (Telegram
+stops redelivering after 24 hours). The SQLite store survives restarts:
+pending updates are recovered on start, and rows left by a worker whose
+heartbeat has lapsed are reclaimed by the live workers sharing the file.
+
+Per-chat ordering is enforced within one process only: each process
+dispatches the updates it received (or adopted), and nothing coordinates a
+chat across processes. Run the webhook in a single process when ordering
+matters; extra processes sharing the file are safe for deduplication and
+recovery, but two of them can process updates of the same chat at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+import uuid
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+UpdateProcessor = Callable[[dict[str, Any]], Awaitable[None]]
+PendingUpdate = tuple[int, str, dict[str, Any]]
+
+DEFAULT_WORKERS = 8
+DEFAULT_DEDUP_TTL = 24 * 3600.0
+DEFAULT_LEASE_SECONDS = 30.0
+
+
+def update_chat_key(payload: dict[str, Any]) -> str:
+    """Return the ordering key for an update: its chat, else its sender.
+
+    Updates with neither (e.g. polls) get a key of their own and are not
+    ordered against anything.
+    """
+    sender: Any = None
+    for value in payload.values():
+        if not isinstance(value, dict):
+            continue
+        chat = value.get("chat") or (value.get("message") or {}).get("chat")
+        if chat and "id" in chat:
+            return f"chat:{chat['id']}"
+        sender = sender or (value.get("from") or value.get("user") or {}).get("id")
+    if sender is not None:
+        return f"user:{sender}"
+    return f"update:{payload.get('update_id')}"
+
+
+class MemoryUpdateStore:
+    """Process-local update store; pending updates are lost on restart."""
+
+    durable = False
+
+    def __init__(self, dedup_ttl: float = DEFAULT_DEDUP_TTL) -> None:
+        self.dedup_ttl = dedup_ttl
+        self._pending: dict[int, tuple[str, dict[str, Any]]] = {}
+        self._seen: OrderedDict[int, float] = OrderedDict()
+
+    async def add(self, update_id: int, chat_key: str, payload: dict[str, Any]) -> bool:
+        if update_id in self._seen:
+            return False
+        self._seen[update_id] = time.time()
+        self._pending[update_id] = (chat_key, payload)
+        return True
+
+    async def complete(self, update_id: int, ok: bool) -> None:
+        self._pending.pop(update_id, None)
+
+    async def claim_pending(self, *, orphans_only: bool = False) -> list[PendingUpdate]:
+        if orphans_only:
+            return []
+        return [(uid, key, payload) for uid, (key, payload) in sorted(self._pending.items())]
+
+    async def heartbeat(self) -> None:
+        return None
+
+    async def prune(self) -> int:
+        cutoff = time.time() - self.dedup_ttl
+        removed = 0
+        while self._seen:
+            update_id, seen_at = next(iter(self._seen.items()))
+            if seen_at >= cutoff or update_id in self._pending:
+                break
+            self._seen.popitem(last=False)
+            removed += 1
+        return removed
+
+    async def close(self) -> None:
+        return None
+
+
+class SQLiteUpdateStore:
+    """SQLite-backed update store shared by the workers on one host.
+
+    Every call runs in a thread so commits never block the event loop. WAL
+    mode with ``synchronous=NORMAL`` keeps acknowledged updates across
+    process crashes without an fsync per webhook.
+    """
+
+    durable = True
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        dedup_ttl: float = DEFAULT_DEDUP_TTL,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.dedup_ttl = dedup_ttl
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS telegram_updates (
+                update_id INTEGER PRIMARY KEY,
+                chat_key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT NOT NULL,
+                received_at REAL NOT NULL,
+                completed_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS telegram_updates_status
+                ON telegram_updates (status, completed_at);
+            CREATE TABLE IF NOT EXISTS telegram_update_owners (
+                owner TEXT PRIMARY KEY,
+                heartbeat REAL NOT NULL
+            );
+            """)
+        self._heartbeat_sync()
+
+    def _run(self, fn: Callable[[], Any]) -> Awaitable[Any]:
+        def locked() -> Any:
+            with self._lock:
+                return fn()
+
+        return asyncio.to_thread(locked)
+
+    async def add(self, update_id: int, chat_key: str, payload: dict[str, Any]) -> bool:
+        """Persist a new update; False if ``update_id`` was already seen."""
+        row = (update_id, chat_key, json.dumps(payload), self.owner, time.time())
+
+        def insert() -> bool:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO telegram_updates "
+                "(update_id, chat_key, payload, owner, received_at) VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+            return cursor.rowcount == 1
+
+        return await self._run(insert)
+
+    async def complete(self, update_id: int, ok: bool) -> None:
+        """Mark an update processed; the row stays for deduplication."""
+        status = "done" if ok else "failed"
+        await self._run(
+            lambda: self._conn.execute(
+                "UPDATE telegram_updates SET status = ?, completed_at = ? WHERE update_id = ?",
+                (status, time.time(), update_id),
+            )
+        )
+
+    async def claim_pending(self, *, orphans_only: bool = False) -> list[PendingUpdate]:
+        """Take over pending updates of dead owners (and our own, on start)."""
+        now = time.time()
+
+        def claim() -> list[PendingUpdate]:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                live = [
+                    owner
+                    for (owner,) in self._conn.execute(
+                        "SELECT owner FROM telegram_update_owners WHERE heartbeat >= ?",
+                        (now - self.lease_seconds,),
+                    )
+                    if owner != self.owner
+                ]
+                keep = [self.owner, *live] if orphans_only else live
+                owned = f"AND owner NOT IN ({','.join('?' * len(keep))})" if keep else ""
+                rows = self._conn.execute(
+                    "SELECT update_id, chat_key, payload FROM telegram_updates "  # noqa: S608
+                    f"WHERE status = 'pending' {owned} ORDER BY update_id",
+                    keep,
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE telegram_updates SET owner = ? WHERE update_id = ?",
+                    [(self.owner, update_id) for update_id, _, _ in rows],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return [(uid, key, json.loads(payload)) for uid, key, payload in rows]
+
+        return await self._run(claim)
+
+    def _heartbeat_sync(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO telegram_update_owners (owner, heartbeat) VALUES (?, ?)",
+                (self.owner, time.time()),
+            )
+
+    async def heartbeat(self) -> None:
+        """Renew this owner's lease on its pending updates."""
+        await asyncio.to_thread(self._heartbeat_sync)
+
+    async def prune(self) -> int:
+        """Forget finished updates older than ``dedup_ttl`` and stale owners."""
+        now = time.time()
+
+        def delete() -> int:
+            cursor = self._conn.execute(
+                "DELETE FROM telegram_updates WHERE status != 'pending' AND completed_at < ?",
+                (now - self.dedup_ttl,),
+            )
+            self._conn.execute(
+                "DELETE FROM telegram_update_owners WHERE heartbeat < ?",
+                (now - self.dedup_ttl,),
+            )
+            return cursor.rowcount
+
+        return await self._run(delete)
+
+    async def close(self) -> None:
+        def close() -> None:
+            self._conn.execute("DELETE FROM telegram_update_owners WHERE owner = ?", (self.owner,))
+            self._conn.close()
+
+        await self._run(close)
+
+
+UpdateStore = MemoryUpdateStore | SQLiteUpdateStore
+
+
+def create_update_store(path: Path | None, *, dedup_ttl: float = DEFAULT_DEDUP_TTL) -> UpdateStore:
+    """Open the SQLite store at ``path``, falling back to memory if unavailable."""
+    if path is not None:
+        try:
+            return SQLiteUpdateStore(path, dedup_ttl=dedup_ttl)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(
+                "telegram.update_queue.sqlite_unavailable", path=str(path), error=str(exc)
+            )
+    return MemoryUpdateStore(dedup_ttl=dedup_ttl)
+
+
+class TelegramUpdateQueue:
+    """Acknowledge-first update queue with per-chat ordering.
+
+    Ordering holds among the updates this instance schedules; updates of the
+    same chat received by another process are not serialized against them.
+
+    Example:
+        >>> queue = TelegramUpdateQueue(process, create_update_store(Path("tmp/updates.db")))
+        >>> await queue.start()
+        >>> await queue.enqueue({"update_id": 1, "message": {...}})
+        True
+        >>> await queue.enqueue({"update_id": 1, "message": {...}})  # redelivery
+        False
+    """
+
+    def __init__(
+        self,
+        process: UpdateProcessor,
+        store: UpdateStore | None = None,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        prune_every: int = 1000,
+    ) -> None:
+        """
+        Args:
+            process: Coroutine handling one raw update payload
+            store: Update store (in-memory if omitted)
+            workers: Chats processed concurrently
+            prune_every: Completed updates between dedup-table prunes
+        """
+        self.process = process
+        self.store = store or MemoryUpdateStore()
+        self.workers = max(1, workers)
+        self.prune_every = prune_every
+
+        self._chats: dict[str, deque[tuple[int, dict[str, Any]]]] = {}
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._started = False
+        self._stats = {"accepted": 0, "duplicates": 0, "processed": 0, "failed": 0, "recovered": 0}
+
+    @property
+    def pending(self) -> int:
+        """Updates accepted but not yet processed."""
+        return self._unfinished
+
+    async def start(self) -> None:
+        """Recover pending updates from the store and start the workers."""
+        if self._started:
+            return
+        self._started = True
+        recovered = await self.store.claim_pending()
+        for update_id, chat_key, payload in recovered:
+            self._schedule(update_id, chat_key, payload)
+        self._stats["recovered"] += len(recovered)
+        await self.store.prune()
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"telegram-update-worker-{i}")
+            for i in range(self.workers)
+        ]
+        if self.store.durable:
+            self._tasks.append(asyncio.create_task(self._maintain(), name="telegram-update-lease"))
+        logger.info(
+            "telegram.update_queue.started",
+            workers=self.workers,
+            durable=self.store.durable,
+            recovered=len(recovered),
+        )
+
+    async def enqueue(self, payload: dict[str, Any]) -> bool:
+        """Persist an update for processing.
+
+        Returns:
+            False if the update was a duplicate delivery
+
+        Raises:
+            ValueError: If the payload has no ``update_id``
+        """
+        if not self._started:
+            raise RuntimeError("TelegramUpdateQueue.start() has not been called")
+        try:
+            update_id = int(payload["update_id"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Telegram update has no update_id") from exc
+
+        chat_key = update_chat_key(payload)
+        if not await self.store.add(update_id, chat_key, payload):
+            self._stats["duplicates"] += 1
+            logger.debug("telegram.update_queue.duplicate", update_id=update_id)
+            return False
+
+        self._stats["accepted"] += 1
+        self._schedule(update_id, chat_key, payload)
+        return True
+
+    def _schedule(self, update_id: int, chat_key: str, payload: dict[str, Any]) -> None:
+        chat = self._chats.get(chat_key)
+        if chat is None:
+            chat = self._chats[chat_key] = deque()
+            # A chat sits in the ready queue at most once, so one worker owns it
+            self._ready.put_nowait(chat_key)
+        chat.append((update_id, payload))
+        self._unfinished += 1
+        self._idle.clear()
+
+    async def _worker(self) -> None:
+        while True:
+            chat_key = await self._ready.get()
+            chat = self._chats[chat_key]
+            update_id, payload = chat.popleft()
+
+            ok = True
+            try:
+                await self.process(payload)
+            except asyncio.CancelledError:
+                chat.appendleft((update_id, payload))
+                raise
+            except Exception:
+                ok = False
+                logger.exception(
+                    "telegram.update_queue.process_failed", update_id=update_id, chat=chat_key
+                )
+
+            try:
+                await self.store.complete(update_id, ok)
+            except Exception:
+                logger.exception("telegram.update_queue.complete_failed", update_id=update_id)
+
+            self._stats["processed" if ok else "failed"] += 1
+            self._unfinished -= 1
+            if chat:
+                self._ready.put_nowait(chat_key)
+            else:
+                del self._chats[chat_key]
+            if not self._unfinished:
+                self._idle.set()
+
+            finished = self._stats["processed"] + self._stats["failed"]
+            if self.prune_every and finished % self.prune_every == 0:
+                try:
+                    await self.store.prune()
+                except Exception:
+                    # e.g. "database is locked": retried at the next interval
+                    logger.exception("telegram.update_queue.prune_failed")
+
+    async def _maintain(self) -> None:
+        """Renew our lease and adopt pending updates of workers that died."""
+        interval = getattr(self.store, "lease_seconds", DEFAULT_LEASE_SECONDS) / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.store.heartbeat()
+                orphans = await self.store.claim_pending(orphans_only=True)
+            except Exception:
+                logger.exception("telegram.update_queue.lease_failed")
+                continue
+            for update_id, chat_key, payload in orphans:
+                self._schedule(update_id, chat_key, payload)
+            if orphans:
+                self._stats["recovered"] += len(orphans)
+                logger.warning("telegram.update_queue.orphans_recovered", count=len(orphans))
+
+    async def join(self) -> None:
+        """Wait until every accepted update has been processed."""
+        await self._idle.wait()
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain for up to ``timeout`` seconds, then stop the workers.
+
+        Updates still pending stay in a durable store for the next start.
+        """
+        if not self._started:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except TimeoutError:
+            logger.warning("telegram.update_queue.stop_timeout", pending=self._unfinished)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._started = False
+        await self.store.close()
+        logger.info("telegram.update_queue.stopped", **self._stats)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue counters."""
+        return {
+            **self._stats,
+            "pending": self._unfinished,
+            "active_chats": len(self._chats),
+            "durable": self.store.durable,
+        }
+
+
+__all__ = [
+    "MemoryUpdateStore",
+    "SQLiteUpdateStore",
+    "TelegramUpdateQueue",
+    "create_update_store",
+    "update_chat_key",
+]
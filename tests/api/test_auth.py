@@ -0,0 +1,105 @@
+"""Tests for API authentication hot paths."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from fastapi import HTTPException
+import jwt
+import pytest
+
+from api import auth
+from core.config.production_settings import get_settings
+from core.exceptions import TokenExpiredError
+from core.security.api_keys import APIKeyManager, InMemoryAPIKeyStore, configure_api_key_manager
+
+
+@pytest.fixture(autouse=True)
+def _fresh_auth_state():
+    configure_api_key_manager(APIKeyManager(InMemoryAPIKeyStore()))
+    auth.clear_token_cache()
+    yield
+    configure_api_key_manager(None)
+    auth.clear_token_cache()
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_does_not_block_event_loop():
+    hashed = auth.hash_password("correct horse")
+    gaps: list[float] = []
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    tick = asyncio.create_task(ticker())
+    results = await asyncio.gather(
+        *(auth.averify_password("correct horse", hashed) for _ in range(4)),
+        auth.averify_password("wrong", hashed),
+    )
+    tick.cancel()
+
+    assert results == [True, True, True, True, False]
+    assert max(gaps) < 0.1, f"event loop stalled for {max(gaps) * 1000:.0f} ms"
+    assert auth.verify_password("correct horse", await auth.ahash_password("correct horse"))
+
+
+def test_token_claims_are_cached_until_expiry(monkeypatch):
+    settings = get_settings()
+    token = auth.create_access_token("u1", "u1@example.com", "user", settings)
+    decodes = 0
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        nonlocal decodes
+        decodes += 1
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    for _ in range(50):
+        assert auth.verify_token(token, settings).user_id == "u1"
+    assert decodes == 1
+
+
+def test_cached_token_expires(monkeypatch):
+    settings = get_settings()
+    token = jwt.encode(
+        {
+            "user_id": "u1",
+            "email": "u1@example.com",
+            "role": "user",
+            "type": "access",
+            "exp": int(time.time()) + 60,
+        },
+        settings.security.jwt_secret_key.get_secret_value(),
+        algorithm=settings.security.jwt_algorithm,
+    )
+    auth.verify_token(token, settings)
+
+    monkeypatch.setattr(auth.time, "time", lambda: time.monotonic() + 10**10)
+    with pytest.raises(TokenExpiredError):
+        auth.verify_token(token, settings)
+
+
+@pytest.mark.asyncio
+async def test_api_key_dependency_uses_issued_keys():
+    api_key, record = await auth.issue_api_key("svc-7", "svc7@example.com", role="service")
+
+    user = await auth.get_current_user_from_api_key(api_key)
+    assert (user.user_id, user.role) == ("svc-7", "service")
+
+    assert await auth.revoke_api_key(record.key_id)
+    with pytest.raises(HTTPException) as exc:
+        await auth.get_current_user_from_api_key(api_key)
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_well_formed_but_unknown_api_key_is_rejected():
+    with pytest.raises(HTTPException):
+        await auth.get_current_user_from_api_key(auth.generate_api_key())
@@ -0,0 +1,157 @@
+"""Tests for negotiated response compression."""
+
+from __future__ import annotations
+
+import json
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from api.middleware_production import CompressionMiddleware, available_encodings, negotiate_encoding
+
+PAYLOAD = {"sections": [{"id": f"s{i}", "content_html": "<p>evidence</p>" * 20} for i in range(50)]}
+CHUNKS = [json.dumps({"chunk": i, "text": "lorem ipsum " * 50}).encode() for i in range(5)]
+
+
+def _decoder(encoding: str):
+    if encoding == "gzip":
+        d = zlib.decompressobj(31)
+        return d.decompress
+    if encoding == "zstd":
+        import zstandard
+
+        d = zstandard.ZstdDecompressor().decompressobj()
+        return d.decompress
+    import brotli
+
+    d = brotli.Decompressor()
+    return d.process
+
+
+def _app(**kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **kwargs)
+
+    @app.get("/state")
+    async def state() -> JSONResponse:
+        return JSONResponse(PAYLOAD)
+
+    @app.get("/small")
+    async def small() -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    @app.get("/image")
+    async def image() -> Response:
+        return Response(b"\x89PNG" + b"\0" * 5000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for chunk in CHUNKS:
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=_app(minimum_size=500))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def test_negotiation_follows_q_values_and_server_preference():
+    offered = ("zstd", "br", "gzip")
+
+    assert negotiate_encoding("gzip, br", offered) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert negotiate_encoding("*", offered) == "zstd"
+    assert negotiate_encoding("*, zstd;q=0", offered) == "br"
+    assert negotiate_encoding("identity", offered) is None
+    assert negotiate_encoding("", offered) is None
+
+
+@pytest.mark.parametrize("encoding", available_encodings())
+@pytest.mark.asyncio
+async def test_large_json_is_compressed_with_negotiated_encoding(client, encoding):
+    async with client.stream("GET", "/state", headers={"Accept-Encoding": encoding}) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert json.loads(_decoder(encoding)(raw)) == PAYLOAD
+    assert len(raw) < len(json.dumps(PAYLOAD)) / 5
+
+
+@pytest.mark.asyncio
+async def test_small_and_incompressible_responses_pass_through(client):
+    small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+    image = await client.get("/image", headers={"Accept-Encoding": "gzip"})
+    plain = await client.get("/state", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in image.headers
+    assert "vary" not in image.headers
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == PAYLOAD
+
+
+@pytest.mark.parametrize("encoding", available_encodings())
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_chunk_by_chunk(encoding):
+    app = _app(minimum_size=10_000)
+    sent: list[dict] = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"accept-encoding", encoding.encode())],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+    start, *bodies = sent
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == encoding.encode()
+    assert b"content-length" not in headers
+
+    # Each chunk is flushed as it is produced and decodes on its own
+    decode = _decoder(encoding)
+    decoded = [decode(message["body"]) for message in bodies]
+    assert decoded[: len(CHUNKS)] == CHUNKS
+    assert b"".join(decoded) == b"".join(CHUNKS)
+    assert bodies[-1].get("more_body", False) is False
+
+
+@pytest.mark.asyncio
+async def test_per_encoding_levels_are_applied():
+    sizes = {}
+    for level in (1, 9):
+        transport = ASGITransport(app=_app(minimum_size=0, levels={"gzip": level}))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/state", headers={"Accept-Encoding": "gzip"})
+            sizes[level] = int(response.headers["content-length"])
+            assert response.json() == PAYLOAD
+
+    assert sizes[9] < sizes[1]
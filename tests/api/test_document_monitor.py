@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from uuid import uuid4
+
 import pytest
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from api.routes import document_monitor
 from api.routes.document_monitor import router
+from core.rendering import PDFRenderer
+from core.storage.blob_store import LocalBlobStore
 from core.storage.document_workflow_store import get_document_workflow_store
 
 
@@ -105,6 +114,69 @@ async def test_upload_exhibit_not_found(client):
     assert response.status_code == 404
 
 
+@pytest.fixture
+def blob_store(tmp_path, monkeypatch):
+    """Isolated content-addressed store for exhibit uploads."""
+    store = LocalBlobStore(tmp_path / "blobs", chunk_size=4)
+    monkeypatch.setattr(document_monitor, "blob_store", store)
+    monkeypatch.setattr(document_monitor, "EXHIBIT_UPLOAD_CHUNK_SIZE", 4)
+    return store
+
+
+async def _start_thread(client, case_id: str) -> str:
+    response = await client.post(
+        "/api/generate-petition",
+        json={"case_id": case_id, "document_type": "petition", "user_id": "test-user"},
+    )
+    return response.json()["thread_id"]
+
+
+@pytest.mark.asyncio
+async def test_upload_exhibit_deduplicates_content(client, blob_store):
+    """Identical uploads in different threads share one stored blob."""
+    content = b"%PDF-1.4 same exhibit bytes"
+    results = []
+    for case_id in ("test-case-dedup-1", "test-case-dedup-2"):
+        thread_id = await _start_thread(client, case_id)
+        response = await client.post(
+            f"/api/upload-exhibit/{thread_id}",
+            files={"file": ("passport.pdf", content, "application/pdf")},
+            data={"exhibit_id": "1.1.A"},
+        )
+        assert response.status_code == 200
+        results.append((thread_id, response.json()))
+
+    (_, first), (thread_id, second) = results
+    assert first["sha256"] == second["sha256"]
+    assert first["file_size"] == len(content)
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert len([p for p in blob_store.root.rglob("*") if p.is_file()]) == 1
+
+    download = await client.get(second["file_path"])
+    assert download.status_code == 200
+    assert download.content == content
+
+    preview = await client.get(f"/api/document/preview/{thread_id}")
+    assert preview.json()["exhibits"][0]["sha256"] == second["sha256"]
+
+
+@pytest.mark.asyncio
+async def test_upload_exhibit_too_large(client, blob_store, monkeypatch):
+    """Uploads over the size limit are rejected without leaving temp files."""
+    monkeypatch.setattr(document_monitor, "MAX_EXHIBIT_BYTES", 10)
+    thread_id = await _start_thread(client, "test-case-too-large")
+
+    response = await client.post(
+        f"/api/upload-exhibit/{thread_id}",
+        files={"file": ("big.pdf", b"x" * 64, "application/pdf")},
+        data={"exhibit_id": "1.1.B"},
+    )
+
+    assert response.status_code == 413
+    assert not [p for p in blob_store.root.rglob("*") if p.is_file()]
+
+
 @pytest.mark.asyncio
 async def test_pause_generation(client, workflow_store):
     """Test pausing document generation."""
@@ -201,3 +273,102 @@ async def test_download_pdf_not_completed(client, workflow_store):
 
     assert response.status_code == 400
     assert "not completed" in response.json()["detail"].lower()
+
+
+def _slow_render(html: str, stylesheet: str) -> bytes:
+    """CPU-bound fake renderer; runs in the renderer's worker process."""
+    deadline = time.perf_counter() + 1.5
+    while time.perf_counter() < deadline:
+        pass
+    return b"%PDF-1.4 " + html.encode()
+
+
+@pytest.mark.asyncio
+async def test_api_stays_responsive_while_pdf_renders(
+    client, workflow_store, monkeypatch, tmp_path
+):
+    """Other requests are served while a petition PDF renders in the pool."""
+    renderer = PDFRenderer(tmp_path, max_workers=1, max_queue=1, render_fn=_slow_render)
+    monkeypatch.setattr(document_monitor, "get_pdf_renderer", lambda: renderer)
+
+    thread_id = f"pdf-{uuid4()}"
+    await workflow_store.save_state(
+        thread_id,
+        {
+            "thread_id": thread_id,
+            "status": "completed",
+            "sections": [{"id": "intro", "status": "completed", "content_html": "<h2>Intro</h2>"}],
+            "logs": [],
+        },
+    )
+
+    try:
+        download = asyncio.create_task(client.get(f"/api/download-petition-pdf/{thread_id}"))
+        while renderer.queue_depth == 0:
+            await asyncio.sleep(0.005)
+
+        # Queue is full: a second document is rejected with backpressure, not queued
+        other = f"pdf-{uuid4()}"
+        await workflow_store.save_state(other, {"status": "completed", "sections": []})
+        busy = await client.get(f"/api/download-petition-pdf/{other}")
+        assert busy.status_code == 503
+        assert busy.headers["Retry-After"]
+
+        latencies = []
+        while not download.done():
+            started = time.perf_counter()
+            preview = await client.get(f"/api/document/preview/{thread_id}")
+            latencies.append(time.perf_counter() - started)
+            assert preview.status_code == 200
+            await asyncio.sleep(0.02)
+
+        response = await download
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+        # An inline render would stall one of these for the full 1.5s
+        assert len(latencies) >= 10
+        assert max(latencies) < 0.5
+        assert sorted(latencies)[len(latencies) // 2] < 0.05
+
+        # Unchanged document: served from the render cache immediately
+        started = time.perf_counter()
+        cached = await client.get(f"/api/download-petition-pdf/{thread_id}")
+        assert cached.content == response.content
+        assert time.perf_counter() - started < 0.25
+        assert renderer.get_stats()["cache_hits"] == 1
+    finally:
+        await renderer.shutdown()
+
+
+def test_websocket_resume_sends_only_missing_deltas():
+    """Reconnecting with ?since=N replays deltas; an unknown version gets full state."""
+    store = get_document_workflow_store()
+    thread_id = f"ws-{uuid4()}"
+
+    async def seed() -> None:
+        await store.save_state(
+            thread_id,
+            {"status": "generating", "sections": [{"id": "s0", "status": "pending"}]},
+        )
+        await store.update_section(thread_id, "s0", {"status": "completed"})
+        await store.add_log(thread_id, {"level": "info", "message": "done"})
+
+    asyncio.run(seed())
+
+    app = FastAPI(on_shutdown=[document_monitor.delta_streamer.stop])
+    app.include_router(router)
+    with (
+        TestClient(app) as test_client,
+        test_client.websocket_connect(f"/api/ws/document/{thread_id}?since=1") as ws,
+    ):
+        assert ws.receive_json()["type"] == "connected"
+        frame = ws.receive_json()
+        assert frame["type"] == "delta"
+        assert (frame["from_version"], frame["version"]) == (1, 3)
+        assert frame["deltas"][1]["ops"][0]["path"] == "/logs/-"
+
+        ws.send_text(json.dumps({"type": "resume", "since": 0}))
+        snapshot = ws.receive_json()
+        assert snapshot["type"] == "initial_state"
+        assert snapshot["version"] == 3
+        assert snapshot["state"]["sections"][0]["status"] == "completed"
@@ -0,0 +1,171 @@
+"""Tests for cached dependency health probes."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from api.routes import health_production
+from api.routes.health_production import (
+    HealthMonitor,
+    HealthStatus,
+    check_database_health,
+    check_redis_health,
+    router,
+)
+
+
+class _FailingDatabase:
+    """Database manager whose pool cannot hand out connections."""
+
+    @asynccontextmanager
+    async def session(self):
+        raise ConnectionRefusedError("connection pool exhausted")
+        yield  # pragma: no cover
+
+
+class _FakeRedis:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.pings = 0
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        if self.fail:
+            raise ConnectionError("Connection reset by peer")
+        return True
+
+
+def _redis_probe(redis: _FakeRedis, delay: float = 0.0):
+    async def probe():
+        await asyncio.sleep(delay)
+        return await check_redis_health(redis)
+
+    return probe
+
+
+@pytest.fixture
+async def client():
+    monitors: list[HealthMonitor] = []
+
+    @asynccontextmanager
+    async def make(monitor: HealthMonitor):
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[health_production.get_health_monitor] = lambda: monitor
+        monitors.append(monitor)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+
+    yield make
+    for monitor in monitors:
+        await monitor.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_database_is_reported_unhealthy():
+    result = await check_database_health(_FailingDatabase())
+
+    assert result.status == HealthStatus.UNHEALTHY
+    assert "connection pool exhausted" in result.message
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_while_liveness_stays_up(client):
+    redis = _FakeRedis(fail=True)
+    monitor = HealthMonitor({"redis": _redis_probe(redis)}, interval=60)
+    await monitor.start()
+
+    async with client(monitor) as c:
+        ready = await c.get("/readiness")
+        alive = await c.get("/liveness")
+        health = await c.get("/health")
+
+    assert ready.status_code == 503
+    assert "redis" in ready.json()["detail"]
+    assert alive.status_code == 200
+    assert alive.json()["health_monitor"] == "running"
+    assert health.json()["status"] == HealthStatus.UNHEALTHY.value
+
+
+@pytest.mark.asyncio
+async def test_probe_storm_is_served_from_cache(client):
+    redis = _FakeRedis()
+    monitor = HealthMonitor({"redis": _redis_probe(redis)}, interval=60)
+    await monitor.start()
+
+    async with client(monitor) as c:
+        responses = await asyncio.gather(*(c.get("/readiness") for _ in range(200)))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert redis.pings == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_requests_share_one_refresh(client):
+    redis = _FakeRedis()
+    monitor = HealthMonitor({"redis": _redis_probe(redis, delay=0.05)}, interval=60)
+
+    async with client(monitor) as c:
+        responses = await asyncio.gather(*(c.get("/readiness") for _ in range(50)))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert redis.pings == 1
+
+
+@pytest.mark.asyncio
+async def test_hung_probe_times_out_without_blocking_others():
+    redis = _FakeRedis()
+    monitor = HealthMonitor(
+        {"redis": _redis_probe(redis), "database": _redis_probe(_FakeRedis(), delay=10)},
+        timeout=5,
+        timeouts={"database": 0.05},
+    )
+
+    results = {r.name: r for r in await monitor.refresh()}
+
+    assert results["database"].status == HealthStatus.UNHEALTHY
+    assert "timed out" in results["database"].message
+    assert results["database"].critical
+    assert results["redis"].status == HealthStatus.HEALTHY
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_picks_up_recovery(client):
+    redis = _FakeRedis(fail=True)
+    monitor = HealthMonitor({"redis": _redis_probe(redis)}, interval=0.05)
+    await monitor.start()
+
+    async with client(monitor) as c:
+        assert (await c.get("/readiness")).status_code == 503
+        redis.fail = False
+        await asyncio.sleep(0.15)
+        assert (await c.get("/readiness")).status_code == 200
+
+    assert redis.pings >= 2
+
+
+@pytest.mark.asyncio
+async def test_production_app_serves_the_cached_health_endpoint():
+    main_production = pytest.importorskip(
+        "api.main_production", reason="production app routes are not all available"
+    )
+    app = main_production.create_app()
+    redis = _FakeRedis()
+    monitor = HealthMonitor({"redis": _redis_probe(redis)}, interval=60)
+    app.dependency_overrides[health_production.get_health_monitor] = lambda: monitor
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        response = await c.get("/health")
+    await monitor.stop()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == HealthStatus.HEALTHY.value
+    assert [d["name"] for d in body["dependencies"]] == ["redis"]
+    assert "checked_seconds_ago" in body["details"]
+    assert redis.pings == 1
@@ -0,0 +1,147 @@
+"""Integration tests for DAG-parallel section generation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from core.exceptions import WorkflowError
+from core.orchestration import document_generation_workflow as wf
+from core.storage.document_workflow_store import get_document_workflow_store
+
+LATENCY = 0.1
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace section generation with a fixed-latency fake and record timings."""
+    timings: dict[str, tuple[float, float]] = {}
+
+    async def generate(section_name, prompt, context, writer):
+        started = time.perf_counter()
+        await asyncio.sleep(LATENCY)
+        timings[section_name] = (started, time.perf_counter())
+        return f"<h2>{section_name}</h2>"
+
+    async def validate(state):
+        return state
+
+    monkeypatch.setattr(wf, "_generate_section_content", generate)
+    monkeypatch.setattr(wf, "node_validate_section", validate)
+    monkeypatch.setattr(wf, "_compiled_section_workflow", None)
+    return timings
+
+
+async def _start(sections: list[dict]) -> str:
+    thread_id = f"dag-{uuid4()}"
+    await get_document_workflow_store().save_state(
+        thread_id,
+        {
+            "thread_id": thread_id,
+            "status": "generating",
+            "sections": [{**s, "status": "pending"} for s in sections],
+            "exhibits": [],
+            "logs": [],
+        },
+    )
+    return thread_id
+
+
+def _sections(n: int) -> list[dict]:
+    return [
+        {"id": f"s{i}", "name": f"Section {i}", "order": i, "prompt": f"Write {i}"}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_independent_sections_run_in_parallel_and_dependents_wait(fake_llm):
+    sections = [
+        *_sections(9),
+        {"id": "conclusion", "name": "Conclusion", "order": 9, "depends_on": ["s0", "s8"]},
+    ]
+    thread_id = await _start(sections)
+
+    started = time.perf_counter()
+    await wf.run_document_generation(
+        thread_id, "case-1", "petition", "user-1", sections, max_concurrency=10
+    )
+    elapsed = time.perf_counter() - started
+
+    # 9 independent sections in one wave + the dependent one: ~2x latency, not 10x
+    assert elapsed < LATENCY * 5
+    assert fake_llm["Conclusion"][0] >= max(fake_llm["Section 0"][1], fake_llm["Section 8"][1])
+
+    state = await get_document_workflow_store().load_state(thread_id)
+    assert state["status"] == "completed"
+    assert all(s["status"] == "completed" for s in state["sections"])
+    assert wf.get_section_workflow() is wf.get_section_workflow()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected(fake_llm):
+    sections = _sections(6)
+    thread_id = await _start(sections)
+
+    await wf.run_document_generation(
+        thread_id, "case-1", "petition", "user-1", sections, max_concurrency=2
+    )
+
+    intervals = sorted(fake_llm.values())
+    peak = max(sum(1 for s, e in intervals if s <= t < e) for t, _ in intervals)
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_pause_stops_scheduling_new_sections(fake_llm):
+    sections = _sections(6)
+    thread_id = await _start(sections)
+
+    run = asyncio.create_task(
+        wf.run_document_generation(
+            thread_id, "case-1", "petition", "user-1", sections, max_concurrency=2
+        )
+    )
+    await asyncio.sleep(LATENCY / 2)
+    assert wf.request_pause(thread_id)
+    await run
+
+    state = await get_document_workflow_store().load_state(thread_id)
+    statuses = [s["status"] for s in state["sections"]]
+    # The two in-flight sections finish, nothing else starts, no finalize
+    assert statuses.count("completed") == 2
+    assert statuses.count("pending") == 4
+    assert state["status"] == "generating"
+    assert not wf.request_pause(thread_id)
+
+
+@pytest.mark.asyncio
+async def test_cancel_abandons_in_flight_sections(fake_llm):
+    sections = _sections(3)
+    thread_id = await _start(sections)
+
+    run = asyncio.create_task(
+        wf.run_document_generation(
+            thread_id, "case-1", "petition", "user-1", sections, max_concurrency=3
+        )
+    )
+    await asyncio.sleep(LATENCY / 2)
+    assert wf.request_cancel(thread_id)
+    await run
+
+    state = await get_document_workflow_store().load_state(thread_id)
+    assert [s["status"] for s in state["sections"]] == ["pending"] * 3
+    assert fake_llm == {}
+
+
+def test_dependency_cycle_is_rejected():
+    sections = [
+        {"id": "a", "depends_on": ["b"]},
+        {"id": "b", "depends_on": ["a"]},
+        {"id": "c", "depends_on": ["missing"]},
+    ]
+    with pytest.raises(WorkflowError, match="a, b"):
+        wf._section_dependencies(sections)
@@ -0,0 +1,118 @@
+"""In-process load test: fan out workflow events to 1,000 WebSocket clients.
+
+Five percent of the clients are deliberately slow readers and a handful never
+read at all. Fast clients must receive every event promptly, slow readers must
+end up with the latest section states (coalesced, possibly with a resync
+notice) and stuck clients must be disconnected instead of growing memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from core.websocket_backplane import InMemoryBackplane
+from core.websocket_manager import ConnectionManager
+
+N_CLIENTS = 1_000
+N_SLOW = 50
+N_STUCK = 5
+N_SECTIONS = 10
+UPDATES_PER_SECTION = 20
+MAX_QUEUE = 32
+
+
+class LoadWebSocket:
+    def __init__(self, delay: float = 0.0, stuck: bool = False) -> None:
+        self.delay = delay
+        self.stuck = stuck
+        self.sent: list[dict] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, message: dict) -> None:
+        if self.stuck:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_fanout_to_1000_clients_with_slow_readers():
+    backplane = InMemoryBackplane()
+    workers = [
+        ConnectionManager(max_queue=MAX_QUEUE, send_timeout=0.5),
+        ConnectionManager(max_queue=MAX_QUEUE, send_timeout=0.5),
+    ]
+    for worker in workers:
+        await worker.start(backplane)
+
+    clients: list[LoadWebSocket] = []
+    for i in range(N_CLIENTS):
+        if i < N_STUCK:
+            ws = LoadWebSocket(stuck=True)
+        elif i < N_STUCK + N_SLOW:
+            ws = LoadWebSocket(delay=0.01)
+        else:
+            ws = LoadWebSocket()
+        clients.append(ws)
+        await workers[i % 2].connect(ws, "load-thread")
+
+    started = time.perf_counter()
+    publisher = workers[0]
+    for update in range(UPDATES_PER_SECTION):
+        for section in range(N_SECTIONS):
+            await publisher.broadcast(
+                "load-thread",
+                {
+                    "type": "workflow_update",
+                    "data": {"section_id": f"s{section}", "progress": update},
+                },
+            )
+    await publisher.broadcast("load-thread", {"type": "status_change", "status": "completed"})
+    publish_elapsed = time.perf_counter() - started
+
+    fast = clients[N_STUCK + N_SLOW :]
+    slow = clients[N_STUCK : N_STUCK + N_SLOW]
+    stuck = clients[:N_STUCK]
+
+    # Publishing never waits on clients: 201 events x 1,000 clients is just enqueueing
+    assert publish_elapsed < 2.0
+
+    deadline = time.perf_counter() + 10
+    while time.perf_counter() < deadline:
+        if all(ws.sent and ws.sent[-1].get("status") == "completed" for ws in fast + slow):
+            break
+        await asyncio.sleep(0.05)
+
+    for ws in fast + slow:
+        latest: dict[str, int] = {}
+        for message in ws.sent:
+            if message["type"] == "workflow_update":
+                latest[message["data"]["section_id"]] = message["data"]["progress"]
+        assert ws.sent[-1] == {"type": "status_change", "status": "completed"}
+        assert latest == {f"s{i}": UPDATES_PER_SECTION - 1 for i in range(N_SECTIONS)}
+
+    # Slow readers were coalesced rather than sent every intermediate update
+    assert max(len(ws.sent) for ws in slow) < N_SECTIONS * UPDATES_PER_SECTION
+
+    await asyncio.sleep(0.6)
+    assert all(ws.closed for ws in stuck)
+    stats = [worker.get_stats() for worker in workers]
+    assert sum(s["connections"] for s in stats) == N_CLIENTS - N_STUCK
+    assert sum(s["slow_disconnects"] for s in stats) == N_STUCK
+    assert sum(s["coalesced"] for s in stats) > 0
+
+    for worker in workers:
+        for thread_id, sockets in worker.active_connections.items():
+            for ws in sockets:
+                worker.disconnect(ws, thread_id)
+        await worker.stop()
@@ -40,3 +40,33 @@ async def test_build_index(tmp_path: Path) -> None:
     assert index.items[0].page_end == 2
     assert index.items[1].page_start == 3
     assert index.items[1].page_end == 5
+
+
+@pytest.mark.asyncio
+async def test_build_index_in_worker_pool_keeps_path_order(tmp_path: Path) -> None:
+    page_counts = [1 + (i * 7) % 4 for i in range(24)]
+    paths = []
+    for i, pages in enumerate(page_counts):
+        path = tmp_path / f"Exhibit_{i:02d}.pdf"
+        _make_pdf(path, pages)
+        path.with_suffix(".json").write_text(json.dumps({"summary": f"S{i}"}), encoding="utf-8")
+        paths.append(path)
+
+    index = await build_index(list(reversed(paths)), tmp_path / "index.json", max_workers=3)
+
+    assert [item.title for item in index.items] == [f"S{i}" for i in range(24)]
+    assert [item.exhibit_id for item in index.items] == [p.stem for p in paths]
+    assert index.total_pages == sum(page_counts)
+    assert index.items[-1].page_end == index.total_pages
+    assert all(
+        a.page_end + 1 == b.page_start for a, b in zip(index.items, index.items[1:], strict=False)
+    )
+
+
+@pytest.mark.asyncio
+async def test_build_index_missing_metadata(tmp_path: Path) -> None:
+    exhibit = tmp_path / "Exhibit_1.pdf"
+    _make_pdf(exhibit, 1)
+
+    with pytest.raises(FileNotFoundError, match="Metadata JSON not found"):
+        await build_index([exhibit], tmp_path / "index.json")
@@ -52,3 +52,65 @@ async def test_assemble_master_pdf(tmp_path: Path) -> None:
     reader = PdfReader(str(out_pdf))
     assert len(reader.pages) == 3
     assert reader.outline
+
+
+def _index(page_counts: list[int], text_pages: int) -> ExhibitsIndex:
+    items = []
+    start = text_pages + 1
+    for i, pages in enumerate(page_counts):
+        items.append(
+            ExhibitMeta(
+                exhibit_id=f"E{i}",
+                title=f"Exhibit {i}",
+                date=None,
+                issuer=None,
+                doc_type=None,
+                keywords=[],
+                page_start=start,
+                page_end=start + pages - 1,
+            )
+        )
+        start += pages
+    return ExhibitsIndex(items=items, total_pages=start - 1)
+
+
+@pytest.mark.asyncio
+async def test_assembly_is_deterministic_and_ordered(tmp_path: Path) -> None:
+    text_pdf = tmp_path / "text.pdf"
+    _write_pdf(text_pdf, 2)
+    page_counts = [1 + i % 3 for i in range(40)]
+    exhibits = []
+    for i, pages in enumerate(page_counts):
+        exhibit = tmp_path / f"exhibit_{i:03d}.pdf"
+        _write_pdf(exhibit, pages)
+        exhibits.append(exhibit)
+    index = _index(page_counts, text_pages=2)
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps(index.model_dump()), encoding="utf-8")
+
+    first = await assemble_master_pdf(text_pdf, exhibits, index_path, tmp_path / "a.pdf")
+    second = await assemble_master_pdf(text_pdf, exhibits, index_path, tmp_path / "b.pdf")
+
+    assert first.read_bytes() == second.read_bytes()
+    reader = PdfReader(str(first))
+    assert len(reader.pages) == index.total_pages
+    bookmarks = [(item.title, reader.get_destination_page_number(item)) for item in reader.outline]
+    assert bookmarks == [(meta.title, meta.page_start - 1) for meta in index.items]
+    assert list(tmp_path.glob("*.part")) == []
+
+
+@pytest.mark.asyncio
+async def test_short_merge_leaves_no_output(tmp_path: Path) -> None:
+    text_pdf = tmp_path / "text.pdf"
+    exhibit_pdf = tmp_path / "exhibit.pdf"
+    _write_pdf(text_pdf, 1)
+    _write_pdf(exhibit_pdf, 1)
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps(_index([5], text_pages=1).model_dump()), encoding="utf-8")
+
+    out_pdf = tmp_path / "master.pdf"
+    with pytest.raises(ValueError, match="fewer pages"):
+        await assemble_master_pdf(text_pdf, [exhibit_pdf], index_path, out_pdf)
+
+    assert not out_pdf.exists()
+    assert list(tmp_path.glob("*.part")) == []
@@ -0,0 +1,209 @@
+"""Tests for outbound Telegram notifications."""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import pairwise
+import time
+
+import fakeredis
+import pytest
+from telegram.error import Forbidden, RetryAfter, TimedOut
+
+from telegram_interface import notification_service
+from telegram_interface.notification_service import (
+    MemoryOutbox,
+    NotificationService,
+    RedisOutbox,
+    split_message,
+)
+
+
+class _FakeBot:
+    """Records sends; ``failures`` maps a text to errors raised on its next sends."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sent: list[tuple[int | str, str, float]] = []
+        self.failures: dict[str, list[Exception]] = {}
+
+    async def send_message(self, chat_id, text, **kwargs) -> None:
+        errors = self.failures.get(text)
+        if errors:
+            raise errors.pop(0)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append((chat_id, text, time.monotonic()))
+
+    def texts(self, chat_id) -> list[str]:
+        return [text for chat, text, _ in self.sent if chat == chat_id]
+
+
+def _service(bot, outbox=None, **kwargs) -> NotificationService:
+    kwargs.setdefault("per_chat_interval", 0.0)
+    kwargs.setdefault("group_interval", 0.0)
+    kwargs.setdefault("global_rate", 10_000)
+    kwargs.setdefault("backoff_base", 0.01)
+    return NotificationService(bot, outbox, **kwargs)
+
+
+def test_split_message_uses_fixed_chunks():
+    assert split_message("abcdefg", 3) == ["abc", "def", "g"]
+    assert split_message("", 3) == [""]
+
+
+@pytest.mark.asyncio
+async def test_long_messages_are_split_and_kept_in_order():
+    bot = _FakeBot(delay=0.001)
+    service = _service(bot, chunk_size=4)
+    await service.start()
+    await service.notify(1, "aaaabbbbcc")
+    await service.notify(1, "second")
+    await service.notify(2, "other chat")
+    await service.join()
+    await service.stop()
+
+    assert bot.texts(1) == ["aaaa", "bbbb", "cc", "seco", "nd"]
+    assert bot.texts(2) == ["othe", "r ch", "at"]
+    assert service.get_stats()["delivered"] == 3
+
+
+@pytest.mark.asyncio
+async def test_per_chat_interval_and_global_rate_are_respected():
+    bot = _FakeBot()
+    service = _service(bot, per_chat_interval=0.05, group_interval=0.1, global_rate=100)
+    for _ in range(3):
+        await service.notify(1, "private")
+        await service.notify(-100, "group")
+    for chat in range(2, 12):
+        await service.notify(chat, "burst")
+    await service.join()
+
+    def gaps(chat_id) -> list[float]:
+        times = [at for chat, _, at in bot.sent if chat == chat_id]
+        return [b - a for a, b in pairwise(times)]
+
+    assert min(gaps(1)) >= 0.045
+    assert min(gaps(-100)) >= 0.095
+    overall = [at for _, _, at in bot.sent]
+    assert overall[-1] - overall[0] >= (len(overall) - 1) / 100 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_global_rate_is_shared_by_workers_on_one_redis():
+    pytest.importorskip("lupa", reason="fakeredis needs lupa to run Lua scripts")
+    redis = fakeredis.FakeAsyncRedis()
+    bot = _FakeBot()
+    workers = [_service(bot, RedisOutbox(redis), global_rate=50) for _ in range(2)]
+    for chat in range(20):
+        await workers[chat % 2].notify(chat, "burst")
+    await asyncio.gather(*(worker.join() for worker in workers))
+
+    # Two per-process pacers would each allow 50/s and finish in half the time
+    overall = sorted(at for _, _, at in bot.sent)
+    assert len(overall) == 20
+    assert overall[-1] - overall[0] >= 19 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_outbox_delete_failure_keeps_the_chat_draining(monkeypatch):
+    bot = _FakeBot()
+    outbox = MemoryOutbox()
+    service = _service(bot, outbox)
+
+    async def unavailable(notification_id: str) -> None:
+        raise ConnectionError("outbox unavailable")
+
+    monkeypatch.setattr(outbox, "delete", unavailable)
+    await service.notify(1, "first")
+    await service.notify(1, "second")
+    await service.join()
+
+    assert bot.texts(1) == ["first", "second"]
+    assert service.get_stats()["delivered"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_chat_without_counting_an_attempt():
+    bot = _FakeBot()
+    bot.failures["hello"] = [RetryAfter(1)] + [TimedOut()] * 2
+    service = _service(bot, max_attempts=3)
+    started = time.monotonic()
+    await service.notify(1, "hello")
+    await service.notify(2, "unaffected")
+    await asyncio.sleep(0.1)
+    assert bot.texts(2) == ["unaffected"]
+
+    await service.join()
+    assert time.monotonic() - started >= 1.0
+    assert bot.texts(1) == ["hello"]
+    assert service.get_stats()["retry_after"] == 1
+    assert service.get_stats()["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_permanent_and_exhausted_failures_are_dropped():
+    bot = _FakeBot()
+    bot.failures["blocked"] = [Forbidden("bot was blocked by the user")]
+    bot.failures["flaky"] = [TimedOut()] * 5
+    outbox = MemoryOutbox()
+    service = _service(bot, outbox, max_attempts=3)
+    await service.notify(1, "blocked")
+    await service.notify(1, "after")
+    await service.notify(2, "flaky")
+    await service.join()
+
+    assert bot.texts(1) == ["after"]
+    assert bot.texts(2) == []
+    assert service.get_stats()["dropped"] == 2
+    assert await outbox.claim("anyone", 60) == []
+
+
+@pytest.mark.asyncio
+async def test_undelivered_chunks_resume_after_restart():
+    redis = fakeredis.FakeAsyncRedis()
+    bot = _FakeBot()
+    bot.failures["bbbb"] = [TimedOut()] * 10  # stuck on the second chunk
+    service = _service(bot, RedisOutbox(redis), chunk_size=4, backoff_base=0.5, lease_seconds=0.2)
+    await service.start()
+    await service.notify(1, "aaaabbbbcc")
+    await asyncio.sleep(0.05)
+    await service.stop(timeout=0.05)
+    assert bot.texts(1) == ["aaaa"]
+
+    bot.failures.clear()
+    await asyncio.sleep(0.8)  # lease (extended by the backoff) runs out
+    restarted = _service(bot, RedisOutbox(redis), chunk_size=4)
+    await restarted.start()
+    await restarted.join()
+    await restarted.stop()
+
+    assert bot.texts(1) == ["aaaa", "bbbb", "cc"]
+    assert await redis.hlen("telegram:outbox") == 0
+
+
+@pytest.mark.asyncio
+async def test_live_lease_keeps_other_workers_away():
+    redis = fakeredis.FakeAsyncRedis()
+    outbox = RedisOutbox(redis)
+    first = _service(_FakeBot(), outbox, lease_seconds=60)
+    first.bot.failures["hi"] = [RetryAfter(5)]
+    await first.notify(1, "hi")
+
+    assert await RedisOutbox(redis).claim("second-worker", 60) == []
+    await first.stop(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_module_notify_uses_configured_service():
+    assert await notification_service.notify("1", "dropped") is None
+
+    bot = _FakeBot()
+    service = _service(bot)
+    notification_service.configure_notifications(service)
+    try:
+        assert await notification_service.notify("1", "hello")
+        await service.join()
+    finally:
+        notification_service.configure_notifications(None)
+    assert bot.texts("1") == ["hello"]
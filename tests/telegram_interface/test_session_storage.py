@@ -0,0 +1,97 @@
+"""Tests for shared Telegram session storage."""
+
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from telegram_interface.session_storage import MemorySessionStore, RedisSessionStore
+
+
+@pytest.mark.asyncio
+async def test_memory_store_expires_and_evicts_lru():
+    store = MemorySessionStore(ttl=0.05, max_sessions=2)
+    await store.set("a", {"n": 1})
+    await store.set("b", {"n": 2})
+    await store.get("a")
+    await store.set("c", {"n": 3})
+
+    assert await store.get("b") is None  # least recently used
+    assert await store.get("a") == {"n": 1}
+    await asyncio.sleep(0.06)
+    assert await store.get("a") is None
+    assert await store.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_store_returns_copies():
+    store = MemorySessionStore()
+    session = await store.update("chat:1", lambda s: s.setdefault("history", []).append("hi"))
+    session["history"].append("not stored")
+
+    assert await store.get("chat:1") == {"history": ["hi"]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_from_many_workers_lose_nothing():
+    server = fakeredis.FakeServer()
+    workers = [
+        RedisSessionStore(fakeredis.FakeAsyncRedis(server=server), max_update_attempts=1000)
+        for _ in range(4)
+    ]
+
+    def increment(session: dict) -> None:
+        session["count"] = session.get("count", 0) + 1
+
+    async def bump(store: RedisSessionStore) -> None:
+        for _ in range(25):
+            await store.update("chat:7", increment)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(bump(store) for store in workers))
+
+    assert (await workers[0].get("chat:7"))["count"] == 100
+    assert not any(store.degraded for store in workers)
+
+
+@pytest.mark.asyncio
+async def test_sessions_expire_in_redis():
+    store = RedisSessionStore(fakeredis.FakeAsyncRedis(), ttl=60)
+    await store.set("chat:1", {"step": "intake"}, ttl=0.05)
+    assert await store.get("chat:1") == {"step": "intake"}
+
+    await asyncio.sleep(0.1)
+    assert await store.get("chat:1") is None
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_memory_when_redis_is_down():
+    class _DownRedis:
+        async def get(self, key):
+            raise RedisConnectionError("down")
+
+        async def set(self, *args, **kwargs):
+            raise RedisConnectionError("down")
+
+    store = RedisSessionStore(_DownRedis(), retry_interval=60)
+    await store.set("chat:1", {"step": "intake"})
+
+    assert store.degraded
+    assert await store.get("chat:1") == {"step": "intake"}
+    assert await store.update("chat:1", lambda s: {**s, "step": "review"}) == {"step": "review"}
+
+
+@pytest.mark.asyncio
+async def test_mutator_errors_propagate_without_degrading():
+    store = RedisSessionStore(fakeredis.FakeAsyncRedis())
+
+    def broken(session: dict) -> None:
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        await store.update("chat:1", broken)
+    assert not store.degraded
+    assert await store.get("chat:1") is None
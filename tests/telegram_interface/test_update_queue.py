@@ -0,0 +1,251 @@
+"""Tests for the Telegram webhook ingest queue."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import AppSettings
+from telegram_interface.bot import build_update_queue
+from telegram_interface.update_queue import (
+    MemoryUpdateStore,
+    SQLiteUpdateStore,
+    TelegramUpdateQueue,
+    update_chat_key,
+)
+
+
+def _update(update_id: int, chat_id: int, seq: int = 0) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": seq,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "u"},
+            "text": f"msg {seq}",
+        },
+    }
+
+
+def _burst(chats: int, per_chat: int) -> list[dict]:
+    """Updates from many chats, interleaved the way webhooks arrive."""
+    updates = [(chat, seq) for seq in range(per_chat) for chat in range(chats)]
+    return [_update(i + 1, chat, seq) for i, (chat, seq) in enumerate(updates)]
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.seen: dict[int, list[int]] = {}
+        self.running = 0
+        self.max_running = 0
+        self.running_chats: set[int] = set()
+
+    async def __call__(self, payload: dict) -> None:
+        chat = payload["message"]["chat"]["id"]
+        assert chat not in self.running_chats, "two updates of one chat ran concurrently"
+        self.running_chats.add(chat)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay * random.random())
+            self.seen.setdefault(chat, []).append(payload["message"]["message_id"])
+        finally:
+            self.running -= 1
+            self.running_chats.discard(chat)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryUpdateStore()
+    return SQLiteUpdateStore(tmp_path / "updates.sqlite3")
+
+
+@pytest.mark.asyncio
+async def test_burst_keeps_per_chat_order_and_runs_chats_concurrently(store):
+    recorder = _Recorder(delay=0.005)
+    queue = TelegramUpdateQueue(recorder, store, workers=8)
+    await queue.start()
+
+    for payload in _burst(chats=20, per_chat=15):
+        assert await queue.enqueue(payload)
+    await queue.join()
+    await queue.stop()
+
+    assert set(recorder.seen) == set(range(20))
+    assert all(seqs == list(range(15)) for seqs in recorder.seen.values())
+    assert 1 < recorder.max_running <= 8
+    assert queue.get_stats()["processed"] == 300
+
+
+@pytest.mark.asyncio
+async def test_redelivered_updates_are_processed_once(store):
+    recorder = _Recorder()
+    queue = TelegramUpdateQueue(recorder, store, workers=4)
+    await queue.start()
+    burst = _burst(chats=5, per_chat=10)
+
+    first = await asyncio.gather(*(queue.enqueue(p) for p in burst))
+    in_flight = await asyncio.gather(*(queue.enqueue(p) for p in burst))
+    await queue.join()
+    after = [await queue.enqueue(p) for p in burst[:5]]
+    await queue.stop()
+
+    assert all(first) and not any(in_flight) and not any(after)
+    assert sum(len(seqs) for seqs in recorder.seen.values()) == 50
+    assert queue.get_stats()["duplicates"] == 55
+
+
+@pytest.mark.asyncio
+async def test_slow_chat_neither_blocks_acks_nor_other_chats(store):
+    release = asyncio.Event()
+    done: list[int] = []
+
+    async def process(payload: dict) -> None:
+        chat = payload["message"]["chat"]["id"]
+        if chat == 0:
+            await release.wait()
+        done.append(chat)
+
+    queue = TelegramUpdateQueue(process, store, workers=4)
+    await queue.start()
+
+    started = time.perf_counter()
+    for payload in _burst(chats=4, per_chat=5):
+        await queue.enqueue(payload)
+    ack_time = time.perf_counter() - started
+
+    for _ in range(100):
+        if len(done) == 15:
+            break
+        await asyncio.sleep(0.01)
+    assert sorted(done) == sorted([1, 2, 3] * 5)
+    assert ack_time < 0.5
+
+    release.set()
+    await queue.join()
+    await queue.stop()
+    assert done.count(0) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_prune_does_not_stop_the_worker(monkeypatch):
+    store = MemoryUpdateStore()
+    recorder = _Recorder()
+    queue = TelegramUpdateQueue(recorder, store, workers=1, prune_every=1)
+    await queue.start()
+
+    async def locked() -> int:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "prune", locked)
+    for payload in _burst(chats=1, per_chat=3):
+        await queue.enqueue(payload)
+    await asyncio.wait_for(queue.join(), 1.0)
+    await queue.stop()
+
+    assert recorder.seen == {0: [0, 1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_throughput_scales_with_workers(tmp_path):
+    async def process(payload: dict) -> None:
+        await asyncio.sleep(0.01)
+
+    burst = _burst(chats=40, per_chat=10)
+    queue = TelegramUpdateQueue(process, SQLiteUpdateStore(tmp_path / "u.sqlite3"), workers=32)
+    await queue.start()
+
+    started = time.perf_counter()
+    for payload in burst:
+        await queue.enqueue(payload)
+    await queue.join()
+    elapsed = time.perf_counter() - started
+    await queue.stop()
+
+    serial = len(burst) * 0.01
+    assert elapsed < serial / 4, f"{len(burst) / elapsed:.0f} updates/s"
+
+
+@pytest.mark.asyncio
+async def test_pending_updates_survive_restart(tmp_path):
+    path = tmp_path / "updates.sqlite3"
+    blocked = asyncio.Event()
+
+    async def stuck(payload: dict) -> None:
+        await blocked.wait()
+
+    queue = TelegramUpdateQueue(stuck, SQLiteUpdateStore(path), workers=2)
+    await queue.start()
+    burst = _burst(chats=3, per_chat=4)
+    for payload in burst:
+        await queue.enqueue(payload)
+    await queue.stop(timeout=0.05)
+
+    recorder = _Recorder()
+    restarted = TelegramUpdateQueue(recorder, SQLiteUpdateStore(path), workers=2)
+    await restarted.start()
+    assert not await restarted.enqueue(burst[0])
+    await restarted.join()
+    await restarted.stop()
+
+    assert restarted.get_stats()["recovered"] == 12
+    assert all(seqs == [0, 1, 2, 3] for seqs in recorder.seen.values())
+
+
+@pytest.mark.asyncio
+async def test_orphaned_updates_are_reclaimed_by_live_worker(tmp_path):
+    path = tmp_path / "updates.sqlite3"
+    dead = SQLiteUpdateStore(path, lease_seconds=0.1)
+    for payload in _burst(chats=2, per_chat=3):
+        await dead.add(payload["update_id"], update_chat_key(payload), payload)
+
+    live = SQLiteUpdateStore(path, lease_seconds=0.1)
+    assert await live.claim_pending(orphans_only=True) == []  # owner still heartbeating
+    await asyncio.sleep(0.15)
+    await live.heartbeat()
+
+    claimed = await live.claim_pending(orphans_only=True)
+    assert [update_id for update_id, _, _ in claimed] == list(range(1, 7))
+    assert await dead.claim_pending(orphans_only=True) == []
+    await live.close()
+    await dead.close()
+
+
+def test_chat_key_prefers_chat_then_sender():
+    assert update_chat_key(_update(1, 42)) == "chat:42"
+    callback = {
+        "update_id": 2,
+        "callback_query": {"from": {"id": 7}, "message": _update(0, 9)["message"]},
+    }
+    assert update_chat_key(callback) == "chat:9"
+    inline = {"update_id": 3, "inline_query": {"id": "q", "from": {"id": 7}, "query": ""}}
+    assert update_chat_key(inline) == "user:7"
+    assert update_chat_key({"update_id": 4, "poll": {"id": "p"}}) == "update:4"
+
+
+@pytest.mark.asyncio
+async def test_build_update_queue_dispatches_into_application(tmp_path):
+    received = []
+
+    async def process_update(update) -> None:
+        received.append(update)
+
+    application = SimpleNamespace(bot=None, process_update=process_update)
+    settings = AppSettings(TELEGRAM_UPDATE_QUEUE_PATH=str(tmp_path / "q.sqlite3"))
+    queue = build_update_queue(application, settings=settings)
+    await queue.start()
+    await queue.enqueue(_update(10, 5, 1))
+    await queue.join()
+    await queue.stop()
+
+    assert queue.store.durable
+    assert received[0].update_id == 10
+    assert received[0].effective_chat.id == 5
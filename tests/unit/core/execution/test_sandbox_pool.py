@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+import socket
+import time
+
+import pytest
+
+from core.execution.sandbox_pool import SandboxPool
+from core.execution.secure_sandbox import SandboxPolicy, SandboxRunner, SandboxViolation
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _spin() -> None:
+    while True:
+        pass
+
+
+def _allocate(mb: int) -> int:
+    return len(bytearray(mb * 1024 * 1024))
+
+
+def _connect() -> None:
+    socket.create_connection(("127.0.0.1", 9), timeout=0.1)
+
+
+def _read(path: str) -> str:
+    with open(path) as fh:
+        return fh.read()
+
+
+def _write_and_read() -> tuple[str, str]:
+    with open("scratch.txt", "w") as fh:
+        fh.write("ok")
+    return str(Path.cwd()), _read("scratch.txt")
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _async_double(value: int) -> int:
+    await asyncio.sleep(0)
+    return value * 2
+
+
+@pytest.fixture
+async def pool():
+    pool = SandboxPool(size=1)
+    yield pool
+    await pool.close()
+
+
+def _policy(**overrides) -> SandboxPolicy:
+    return SandboxPolicy(name="test", description="", **overrides)
+
+
+@pytest.mark.asyncio
+async def test_warm_worker_is_reused(pool):
+    first = await pool.run(_pid, policy=_policy())
+    second = await pool.run(_pid, policy=_policy())
+
+    assert first == second != os.getpid()
+    assert await pool.run(_async_double, 21, policy=_policy()) == 42
+
+
+@pytest.mark.asyncio
+async def test_cpu_limit_kills_runaway_worker(pool):
+    with pytest.raises(SandboxViolation, match="CPU limit"):
+        await pool.run(_spin, policy=_policy(max_cpu_seconds=0.5), timeout=10)
+
+    assert await pool.run(_async_double, 1, policy=_policy()) == 2
+    assert pool.get_stats()["crashes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_limit_is_enforced(pool):
+    with pytest.raises(SandboxViolation, match="Memory limit"):
+        await pool.run(_allocate, 512, policy=_policy(max_memory_mb=64))
+
+    assert await pool.run(_allocate, 16, policy=_policy(max_memory_mb=64)) == 16 * 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_network_is_denied_unless_allowed(pool):
+    with pytest.raises(SandboxViolation, match="Network access denied"):
+        await pool.run(_connect, policy=_policy())
+
+    with pytest.raises(OSError) as exc:
+        await pool.run(_connect, policy=_policy(network_access=True))
+    assert not isinstance(exc.value, PermissionError)
+
+
+@pytest.mark.asyncio
+async def test_filesystem_is_confined_to_temporary_workdir(pool, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+
+    with pytest.raises(SandboxViolation, match="Filesystem access denied"):
+        await pool.run(_read, str(secret), policy=_policy())
+
+    workdir, content = await pool.run(_write_and_read, policy=_policy())
+    assert content == "ok"
+    assert not Path(workdir).exists()
+    assert await pool.run(_read, str(secret), policy=_policy(filesystem_access=True)) == "top secret"
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_worker_and_pool_recovers(pool):
+    before = await pool.run(_pid, policy=_policy())
+    runner = SandboxRunner(_policy(), pool)
+
+    started = time.perf_counter()
+    with pytest.raises(SandboxViolation, match="time limit"):
+        await runner.run_async(_sleep, timeout=0.2, seconds=30)
+    assert time.perf_counter() - started < 5
+
+    after = await pool.run(_pid, policy=_policy())
+    assert after != before
+    stats = pool.get_stats()
+    assert (stats["timeouts"], stats["workers"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_worker_replacement_does_not_block_event_loop(pool, monkeypatch):
+    from core.execution import sandbox_pool
+
+    kill = sandbox_pool._Worker.kill
+
+    def slow_kill(worker):  # a worker that takes a while to die
+        kill(worker)
+        time.sleep(0.3)
+
+    monkeypatch.setattr(sandbox_pool._Worker, "kill", slow_kill)
+    await pool.start()
+    gaps = []
+
+    async def tick():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    with pytest.raises(SandboxViolation, match="time limit"):
+        await pool.run(_sleep, 30, policy=_policy(), timeout=0.1)
+    assert await pool.run(_async_double, 2, policy=_policy()) == 4
+    ticker.cancel()
+
+    assert max(gaps) < 0.2
+
+
+@pytest.mark.asyncio
+async def test_close_does_not_block_event_loop(monkeypatch):
+    from core.execution import sandbox_pool
+
+    kill = sandbox_pool._Worker.kill
+
+    def slow_kill(worker):
+        kill(worker)
+        time.sleep(0.3)
+
+    monkeypatch.setattr(sandbox_pool._Worker, "kill", slow_kill)
+    pool = SandboxPool(size=2)
+    await pool.start()
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    started = time.perf_counter()
+    await pool.close()
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+
+    # Both workers were retired concurrently while the loop kept ticking
+    assert pool.get_stats()["workers"] == 0
+    assert elapsed < 0.55
+    assert ticks >= 10
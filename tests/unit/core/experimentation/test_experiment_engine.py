@@ -0,0 +1,203 @@
+"""Tests for the experiment engine with simulated outcomes."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import fakeredis
+import numpy as np
+import pytest
+
+from core.experimentation import (
+    Allocation,
+    ExperimentEngine,
+    InMemoryExperimentStore,
+    PromptABTester,
+    RedisExperimentStore,
+)
+
+VARIANTS = {"control": "Answer briefly.", "treatment": "Answer step by step."}
+
+
+def _engine(store=None, seed: int = 7) -> ExperimentEngine:
+    return ExperimentEngine(store or InMemoryExperimentStore(), rng=np.random.default_rng(seed))
+
+
+async def _simulate(engine, name, rates, users, seed=11):
+    outcome_rng = random.Random(seed)
+    for i in range(users):
+        user = f"user-{i}"
+        assignment = await engine.assign(name, user)
+        if outcome_rng.random() < rates[assignment.variant]:
+            await engine.record_outcome(name, user, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_exposures_are_sticky_and_counted_once():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS)
+
+    assignments = [await engine.assign("exp", "user-1") for _ in range(5)]
+
+    assert len({a.variant for a in assignments}) == 1
+    assert [a.new for a in assignments] == [True, False, False, False, False]
+    summary = await engine.summarize("exp")
+    assert sum(v["exposures"] for v in summary["variants"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_weights_finer_than_one_percent():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS, weights=[0.995, 0.005])
+
+    variants = [(await engine.assign("exp", f"user-{i}")).variant for i in range(20_000)]
+
+    assert 60 <= variants.count("treatment") <= 140
+
+
+@pytest.mark.asyncio
+async def test_salts_make_experiments_independent():
+    engine = _engine()
+    await engine.create_experiment("one", VARIANTS, salt="a")
+    await engine.create_experiment("two", VARIANTS, salt="b")
+
+    same = 0
+    for i in range(2_000):
+        one = await engine.assign("one", f"user-{i}")
+        two = await engine.assign("two", f"user-{i}")
+        same += one.variant == two.variant
+
+    assert 0.45 < same / 2_000 < 0.55
+
+
+@pytest.mark.asyncio
+async def test_only_first_outcome_of_exposed_users_counts():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS)
+    await engine.assign("exp", "user-1")
+
+    assert await engine.record_outcome("exp", "user-1", 1.0)
+    assert not await engine.record_outcome("exp", "user-1", 1.0)
+    assert not await engine.record_outcome("exp", "never-exposed", 1.0)
+    with pytest.raises(ValueError):
+        await engine.record_outcome("exp", "user-1", 3.0)
+    with pytest.raises(ValueError, match="already exists"):
+        await engine.create_experiment("exp", VARIANTS)
+
+
+@pytest.mark.asyncio
+async def test_posterior_summary_finds_better_variant():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS, salt="fixed")
+    await _simulate(engine, "exp", {"control": 0.10, "treatment": 0.16}, users=6_000)
+
+    summary = await engine.summarize("exp")
+    treatment = summary["variants"][1]
+
+    assert treatment["prob_best"] > 0.99
+    assert treatment["prob_beats_control"] == treatment["prob_best"]
+    low, high = treatment["credible_interval"]
+    assert low < 0.16 < high
+    assert summary["recommended"] == "treatment"
+
+
+@pytest.mark.asyncio
+async def test_no_recommendation_without_evidence():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS, salt="fixed")
+    await _simulate(engine, "exp", {"control": 0.1, "treatment": 0.1}, users=200)
+
+    assert (await engine.summarize("exp"))["recommended"] is None
+
+
+@pytest.mark.asyncio
+async def test_thompson_sampling_shifts_traffic_to_winner():
+    engine = _engine()
+    await engine.create_experiment("exp", VARIANTS, allocation=Allocation.THOMPSON)
+    await _simulate(engine, "exp", {"control": 0.05, "treatment": 0.25}, users=2_000)
+
+    exposures = {v["variant"]: v["exposures"] for v in (await engine.summarize("exp"))["variants"]}
+    assert exposures["treatment"] > 0.8 * sum(exposures.values())
+
+
+@pytest.mark.asyncio
+async def test_redis_store_is_shared_and_atomic():
+    server = fakeredis.FakeServer()
+    workers = [
+        _engine(RedisExperimentStore(fakeredis.FakeAsyncRedis(server=server)), seed=i)
+        for i in range(3)
+    ]
+    await workers[0].create_experiment("exp", VARIANTS, allocation=Allocation.THOMPSON)
+
+    assignments = await asyncio.gather(
+        *(worker.assign("exp", "user-1") for worker in workers for _ in range(10))
+    )
+    assert len({a.variant for a in assignments}) == 1
+    assert sum(a.new for a in assignments) == 1
+
+    recorded = await asyncio.gather(*(w.record_outcome("exp", "user-1", 0.5) for w in workers))
+    assert sorted(recorded) == [False, False, True]
+
+    summary = await workers[2].summarize("exp")
+    stats = {v["variant"]: (v["exposures"], v["outcomes"], v["reward"]) for v in summary["variants"]}
+    assert stats[assignments[0].variant] == (1, 1, 0.5)
+
+
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+@pytest.mark.asyncio
+async def test_feedback_credits_only_open_or_named_exposures(backend, monkeypatch):
+    store = (
+        InMemoryExperimentStore()
+        if backend == "memory"
+        else RedisExperimentStore(fakeredis.FakeAsyncRedis())
+    )
+    engine = _engine(store)
+    for name in ("rated", "open", "named", "unseen"):
+        await engine.create_experiment(name, VARIANTS)
+    for name in ("rated", "open", "named"):
+        await engine.assign(name, "user-1")
+    await engine.record_outcome("rated", "user-1", 1.0)
+
+    async def no_scan() -> list[str]:
+        raise AssertionError("feedback must not scan every experiment")
+
+    monkeypatch.setattr(store, "list_experiments", no_scan)
+
+    assert await engine.record_feedback("user-1", 0.0, ["named"]) == ["named"]
+    assert await store.active_experiments("user-1") == ["open"]
+    assert await engine.record_feedback("user-1", 0.5) == ["open"]
+    assert await engine.record_feedback("user-1", 0.5) == []
+
+
+@pytest.mark.asyncio
+async def test_mega_agent_uses_experiment_for_cot_template():
+    from core.groupagents.mega_agent import CommandType, MegaAgent, MegaAgentCommand
+    from core.prompts import CoTTemplate, get_cot_prompt
+
+    engine = _engine()
+    await engine.create_experiment("cot.ask", {"legal": CoTTemplate.LEGAL.value})
+    agent = MegaAgent(experiments=engine)
+    command = MegaAgentCommand(
+        user_id="user-1", command_type=CommandType.ASK, action="query", payload={}
+    )
+
+    template = await agent._experiment_cot_template(command)
+
+    assert template is CoTTemplate.LEGAL
+    assert agent._enhance_with_cot("Q", command, template=template) == get_cot_prompt(
+        CoTTemplate.LEGAL, "Q"
+    )
+    assert await engine.record_feedback("user-1", 1.0) == ["cot.ask"]
+
+
+def test_prompt_ab_tester_counts_each_user_once():
+    tester = PromptABTester()
+    tester.create_experiment("exp", ["a", "b"], distribution=[0.5, 0.5])
+
+    for _ in range(3):
+        for i in range(100):
+            tester.get_prompt_variant("exp", f"user-{i}")
+
+    results = tester.get_experiment_results("exp")["results"]
+    assert sum(r["trials"] for r in results) == 100
@@ -55,3 +55,74 @@ async def test_timeline_and_snapshot():
 
     snapshot = await hierarchy.get_thread_snapshot("thread-2")
     assert "step 2" in snapshot
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        return [[float(len(text))] for text in texts]
+
+
+class _BulkOnlyEpisodicStore:
+    def __init__(self) -> None:
+        self.batches: list[list[AuditEvent]] = []
+
+    async def aappend(self, event: AuditEvent) -> None:  # pragma: no cover - must not be used
+        raise AssertionError("record_events should use the bulk append path")
+
+    async def aappend_many(self, events: list[AuditEvent]) -> int:
+        self.batches.append(list(events))
+        return len(events)
+
+
+@pytest.mark.asyncio
+async def test_record_events_uses_bulk_paths():
+    from core.memory.memory_manager_v2 import MemoryManager
+
+    embedder = _CountingEmbedder()
+    episodic = _BulkOnlyEpisodicStore()
+    hierarchy = MemoryHierarchy(memory_manager=MemoryManager(embedder=embedder, episodic=episodic))
+
+    events = [
+        AuditEvent(
+            event_id=f"evt-bulk-{i}",
+            user_id="user-3",
+            thread_id="thread-3",
+            source="unit-test",
+            action="step",
+            payload={"summary": f"bulk step {i}"},
+        )
+        for i in range(12)
+    ]
+    reflected = await hierarchy.record_events(events, reflect=True)
+
+    assert [len(batch) for batch in episodic.batches] == [12]
+    assert embedder.calls == 1
+    assert len(reflected) == 12
+    assert all(rec.embedding for rec in reflected)
+    assert "bulk step 11" in reflected[-1].text
+
+
+@pytest.mark.asyncio
+async def test_record_events_without_reflection_and_empty_batch():
+    hierarchy = MemoryHierarchy()
+
+    assert await hierarchy.record_events([], reflect=True) == []
+
+    events = [
+        AuditEvent(
+            event_id=f"evt-nr-{i}",
+            user_id="user-4",
+            thread_id="thread-4",
+            source="unit-test",
+            action="step",
+            payload={"summary": f"quiet {i}"},
+        )
+        for i in range(3)
+    ]
+    assert await hierarchy.record_events(events, reflect=False) == []
+    snapshot = await hierarchy.get_thread_snapshot("thread-4")
+    assert snapshot.count("quiet") == 3
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from core.memory.memory_manager import MemoryManager
+from core.memory.models import AuditEvent
+from core.memory.write_behind import WriteBehindAuditBuffer
+
+
+def _event(i: int, thread_id: str = "thread-wb") -> AuditEvent:
+    return AuditEvent(
+        event_id=f"evt-wb-{i}",
+        user_id="user-wb",
+        thread_id=thread_id,
+        source="unit-test",
+        action="step",
+        payload={"i": i},
+    )
+
+
+class _SlowMemory(MemoryManager):
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.batches: list[int] = []
+
+    async def alog_audit_many(self, events):  # type: ignore[override]
+        await asyncio.sleep(self.delay)
+        self.batches.append(len(events))
+        return await super().alog_audit_many(events)
+
+
+class _FlakyMemory(MemoryManager):
+    def __init__(self) -> None:
+        super().__init__()
+        self.available = False
+
+    async def alog_audit_many(self, events):  # type: ignore[override]
+        if not self.available:
+            raise ConnectionError("database unavailable")
+        return await super().alog_audit_many(events)
+
+
+@pytest.mark.asyncio
+async def test_submit_does_not_wait_for_store(tmp_path):
+    memory = _SlowMemory(delay=0.2)
+    buffer = WriteBehindAuditBuffer(
+        memory, max_batch_size=10, flush_interval=0.05, spill_dir=tmp_path
+    )
+    await buffer.start()
+
+    started = time.perf_counter()
+    for i in range(25):
+        await buffer.submit(_event(i))
+    elapsed = time.perf_counter() - started
+    assert elapsed < 0.1
+
+    await buffer.stop()
+
+    events = await memory.episodic.aget_thread_events("thread-wb")
+    assert [e.event_id for e in events] == [f"evt-wb-{i}" for i in range(25)]
+    assert max(memory.batches) <= 10
+    assert buffer.get_stats()["flushed"] == 25
+
+
+@pytest.mark.asyncio
+async def test_unavailable_store_spills_then_replays(tmp_path):
+    memory = _FlakyMemory()
+    buffer = WriteBehindAuditBuffer(memory, max_batch_size=5, flush_interval=0.01, spill_dir=tmp_path)
+    spill = buffer.spill_path
+    assert spill == tmp_path / f"audit_write_behind.{os.getpid()}.spill.jsonl"
+    await buffer.start()
+    for i in range(7):
+        await buffer.submit(_event(i))
+    await buffer.stop()
+
+    assert len(spill.read_text().splitlines()) == 7
+    assert await memory.episodic.aget_thread_events("thread-wb") == []
+
+    memory.available = True
+    await buffer.start()
+    await buffer.stop()
+
+    assert not spill.exists()
+    events = await memory.episodic.aget_thread_events("thread-wb")
+    assert len(events) == 7
+    assert buffer.get_stats()["replayed"] == 7
+
+
+@pytest.mark.asyncio
+async def test_stop_timeout_spills_in_flight_and_queued_events(tmp_path):
+    memory = _SlowMemory(delay=5.0)
+    buffer = WriteBehindAuditBuffer(memory, max_batch_size=4, flush_interval=0.01, spill_dir=tmp_path)
+    await buffer.start()
+    for i in range(10):
+        await buffer.submit(_event(i))
+    await asyncio.sleep(0.05)  # first batch is now stuck in the store
+
+    await buffer.stop(timeout=0.1)
+
+    assert len(buffer.spill_path.read_text().splitlines()) == 10
+    assert buffer.get_stats()["spilled"] == 10
+
+
+@pytest.mark.asyncio
+async def test_replaying_committed_events_does_not_block_the_spill(tmp_path):
+    memory = MemoryManager()
+    await memory.alog_audit_many([_event(i) for i in range(3)])
+    buffer = WriteBehindAuditBuffer(memory, spill_dir=tmp_path)
+    # A cut-off flush spilled events the store had already committed
+    buffer.spill_path.write_text("".join(_event(i).model_dump_json() + "\n" for i in range(5)))
+
+    await buffer.start()
+    await buffer.stop()
+
+    assert not buffer.spill_path.exists()
+    events = await memory.episodic.aget_thread_events("thread-wb")
+    assert [e.event_id for e in events] == [f"evt-wb-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_spill_files_of_exited_workers_are_adopted(tmp_path):
+    gone = tmp_path / "audit_write_behind.999999999.spill.jsonl"
+    gone.write_text(_event(1).model_dump_json() + "\n")
+    alive = tmp_path / f"audit_write_behind.{os.getppid()}.spill.jsonl"
+    alive.write_text(_event(2).model_dump_json() + "\n")
+    memory = MemoryManager()
+    buffer = WriteBehindAuditBuffer(memory, spill_dir=tmp_path)
+
+    await buffer.start()
+    await buffer.stop()
+
+    assert not gone.exists()
+    assert alive.exists()  # still owned by a running worker
+    events = await memory.episodic.aget_thread_events("thread-wb")
+    assert [e.event_id for e in events] == ["evt-wb-1"]
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_with_backpressure(tmp_path):
+    memory = _SlowMemory(delay=0.05)
+    buffer = WriteBehindAuditBuffer(
+        memory,
+        max_batch_size=2,
+        flush_interval=0.01,
+        max_queue_size=4,
+        spill_dir=tmp_path,
+    )
+    await buffer.start()
+
+    depths = []
+    for i in range(20):
+        await buffer.submit(_event(i))
+        depths.append(buffer.get_stats()["queue_depth"])
+    await buffer.stop()
+
+    assert max(depths) <= 4
+    assert len(await memory.episodic.aget_thread_events("thread-wb")) == 20
+
+
+@pytest.mark.asyncio
+async def test_not_started_buffer_writes_directly():
+    memory = MemoryManager()
+    buffer = WriteBehindAuditBuffer(memory, spill=False)
+
+    await buffer.submit(_event(1))
+
+    assert len(await memory.episodic.aget_thread_events("thread-wb")) == 1
@@ -0,0 +1,140 @@
+"""Tests for streaming drift detectors and the model monitor."""
+
+from __future__ import annotations
+
+import numpy as np
+from prometheus_client import CollectorRegistry
+import pytest
+
+from core.monitoring import ADWIN, DriftMetrics, ModelMonitor, PageHinkley, PSIDetector
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+def _first_detection(detector, values) -> int | None:
+    for i, value in enumerate(values):
+        if detector.update(float(value)):
+            return i
+    return None
+
+
+def test_psi_tracks_the_sliding_window(rng):
+    psi = PSIDetector(rng.normal(0, 1, 10_000), window=1_000)
+
+    for value in rng.normal(0, 1, 2_000):
+        psi.update(value)
+    assert psi.value < 0.05 and not psi.drift_detected
+
+    for value in rng.normal(1.5, 1, 1_000):
+        psi.update(value)
+    assert psi.drift_detected
+
+    for value in rng.normal(0, 1, 1_000):
+        psi.update(value)
+    assert not psi.drift_detected
+    assert psi.size == 1_000
+
+
+def test_adwin_detects_shift_and_shrinks_window(rng):
+    adwin = ADWIN()
+
+    assert _first_detection(adwin, rng.normal(0, 1, 20_000)) is None
+    assert adwin.n_buckets < 100
+
+    shifted = rng.normal(1, 1, 2_000)
+    delay = _first_detection(adwin, shifted)
+    assert delay is not None and delay < 200
+
+    for value in shifted[delay + 1 :]:
+        adwin.update(value)
+    assert adwin.width < 5_000
+    assert adwin.estimation > 0.8
+
+
+@pytest.mark.parametrize("shift", [1.0, -1.0])
+def test_page_hinkley_detects_shifts_in_both_directions(rng, shift):
+    ph = PageHinkley(delta=0.5, threshold=10)
+
+    assert _first_detection(ph, rng.normal(0, 1, 2_000)) is None
+    delay = _first_detection(ph, rng.normal(shift, 1, 500))
+    assert delay is not None and delay < 100
+
+
+def test_monitor_flags_only_the_drifted_feature(rng):
+    monitor = ModelMonitor(window_size=500, export_metrics=False)
+    monitor.set_reference_data(
+        "model", {"age": rng.normal(40, 10, 5_000), "income": rng.lognormal(10, 1, 5_000)}
+    )
+
+    for _ in range(1_000):
+        monitor.track_features(
+            "model", {"age": rng.normal(40, 10), "income": rng.lognormal(10.8, 1)}
+        )
+    result = monitor.detect_drift("model")
+
+    assert result["drift_detected"]
+    assert result["drifted_features"] == ["income"]
+    assert result["features"]["income"]["detectors"]["psi"]
+
+
+def test_monitor_waits_for_enough_data(rng):
+    monitor = ModelMonitor(window_size=1_000, export_metrics=False)
+    monitor.set_reference_data("model", rng.uniform(0, 1, 1_000).tolist())
+    for value in rng.uniform(0, 1, 100):
+        monitor.track_prediction("model", value)
+
+    result = monitor.detect_drift("model")
+    assert result["drift_detected"] is False
+    assert result["message"] == "Not enough live data to detect drift."
+
+    with pytest.raises(ValueError):
+        monitor.track_prediction("unknown", 0.5)
+
+
+def test_monitor_exports_gauges_and_bounds_streams(rng):
+    registry = CollectorRegistry()
+    monitor = ModelMonitor(
+        window_size=100, max_streams=50, publish_every=10, metrics=DriftMetrics(registry)
+    )
+    for m in range(100):
+        monitor.set_reference_data(f"model-{m}", rng.uniform(0, 1, 200))
+        for value in rng.uniform(0, 1, 100) + (0.5 if m == 99 else 0.0):
+            monitor.track_prediction(f"model-{m}", value)
+
+    assert monitor.get_stats()["streams"] == 50
+    assert monitor.get_stats()["evicted_streams"] == 50
+    assert registry.get_sample_value("model_feature_psi", {"model": "model-0", "feature": "prediction"}) is None
+    assert (
+        registry.get_sample_value(
+            "model_feature_drift", {"model": "model-99", "feature": "prediction", "detector": "psi"}
+        )
+        == 1.0
+    )
+
+
+def test_detect_drift_reads_only_the_models_own_streams(rng, monkeypatch):
+    monitor = ModelMonitor(window_size=100, max_streams=30, export_metrics=False)
+    for m in range(20):
+        monitor.set_reference_data(f"model-{m}", {"a": rng.normal(0, 1, 200), "b": rng.normal(0, 1, 200)})
+        for _ in range(60):
+            monitor.track_features(f"model-{m}", {"a": rng.normal(), "b": rng.normal()})
+
+    # Scanning every stream would iterate the LRU itself
+    monkeypatch.setattr(monitor, "_streams", _NoIteration(monitor._streams))
+    assert set(monitor.detect_drift("model-19")["features"]) == {"a", "b"}
+    assert monitor.detect_drift("model-0")["features"] == {}  # evicted
+
+    monitor.set_reference_data("model-19", {"a": rng.normal(0, 1, 200)})
+    assert monitor.detect_drift("model-19")["features"] == {}
+    assert monitor.get_stats()["streams"] == 28
+
+
+class _NoIteration(dict):
+    def __iter__(self):
+        raise AssertionError("iterated over every stream")
+
+    def items(self):
+        raise AssertionError("iterated over every stream")
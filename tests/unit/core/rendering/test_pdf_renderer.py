@@ -0,0 +1,160 @@
+"""Tests for the sandboxed worker-pool PDF renderer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from core.rendering import PDFRenderer, RenderQueueFullError, render_cache_key
+from core.rendering.pdf_renderer import weasyprint_available
+
+
+def _fake_render(html: str, stylesheet: str) -> bytes:
+    """Stand-in for WeasyPrint: burns CPU in the worker for ``slow``/``stuck`` documents."""
+    if "slow" in html or "stuck" in html:
+        deadline = time.perf_counter() + (60 if "stuck" in html else 0.5)
+        while time.perf_counter() < deadline:
+            pass
+    return b"%PDF-1.4\n" + render_cache_key(html, stylesheet).encode()
+
+
+class _Metrics:
+    def __init__(self) -> None:
+        self.renders: list[tuple[str, float | None]] = []
+        self.depths: list[int] = []
+
+    def record_pdf_render(self, status: str, duration_seconds: float | None = None) -> None:
+        self.renders.append((status, duration_seconds))
+
+    def set_pdf_render_queue_depth(self, depth: int) -> None:
+        self.depths.append(depth)
+
+
+@pytest.fixture
+def metrics():
+    return _Metrics()
+
+
+@pytest.fixture
+async def renderer(tmp_path, metrics):
+    renderer = PDFRenderer(
+        tmp_path / "cache",
+        max_workers=2,
+        max_queue=3,
+        render_fn=_fake_render,
+        metrics=metrics,
+    )
+    yield renderer
+    await renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_is_served_from_cache(renderer, metrics):
+    first = await renderer.render("<h1>Petition</h1>", "body {}")
+    again = await renderer.render("<h1>Petition</h1>", "body {}")
+    restyled = await renderer.render("<h1>Petition</h1>", "body { margin: 0 }")
+
+    assert first == again
+    assert first.read_bytes().startswith(b"%PDF")
+    assert restyled != first
+    assert [status for status, _ in metrics.renders] == ["rendered", "cache_hit", "rendered"]
+    assert renderer.get_stats()["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_render(renderer):
+    paths = await asyncio.gather(*(renderer.render("<p>slow shared</p>") for _ in range(5)))
+
+    assert len(set(paths)) == 1
+    assert renderer.get_stats()["rendered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_shared_render(renderer):
+    owner = asyncio.create_task(renderer.render("<p>slow shared</p>"))
+    while renderer.queue_depth == 0:
+        await asyncio.sleep(0.005)
+    waiter = asyncio.create_task(renderer.render("<p>slow shared</p>"))
+    await asyncio.sleep(0.05)
+
+    owner.cancel()
+    path = await waiter
+
+    assert owner.cancelled()
+    assert path.read_bytes().startswith(b"%PDF")
+    assert renderer.get_stats()["rendered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_render_over_timeout_is_killed(tmp_path, metrics):
+    renderer = PDFRenderer(
+        tmp_path, max_workers=1, max_queue=1, timeout=3, render_fn=_fake_render, metrics=metrics
+    )
+    try:
+        started = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await renderer.render("<p>stuck</p>")
+        assert time.perf_counter() - started < 10
+        # The stuck worker was replaced, not left burning CPU in the pool
+        assert (await renderer.render("<p>quick</p>")).exists()
+        assert renderer.get_stats()["failed"] == 1
+    finally:
+        await renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_eviction_keeps_recently_returned_pdfs(tmp_path, metrics):
+    renderer = PDFRenderer(tmp_path, max_cache_files=1, render_fn=_fake_render, metrics=metrics)
+    try:
+        served = await renderer.render("<p>a</p>")
+        await renderer.render("<p>b</p>")
+        # Still within the grace period: a response may be about to open it
+        assert served.exists()
+
+        renderer.eviction_grace = 0
+        await renderer.render("<p>c</p>")
+        assert not served.exists()
+    finally:
+        await renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_with_retry_after(renderer, metrics):
+    jobs = [asyncio.create_task(renderer.render(f"<p>slow {i}</p>")) for i in range(4)]
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+
+    rejected = [r for r in results if isinstance(r, RenderQueueFullError)]
+    assert len(rejected) == 1
+    assert rejected[0].retry_after > 0
+    assert max(metrics.depths) == 3
+    assert metrics.depths[-1] == 0
+    assert renderer.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_render(renderer, metrics):
+    await renderer.render("<p>warm up the pool</p>")
+
+    render = asyncio.create_task(renderer.render("<p>slow render</p>"))
+    worst_lag = 0.0
+    while not render.done():
+        tick = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst_lag = max(worst_lag, time.perf_counter() - tick - 0.01)
+    await render
+
+    assert worst_lag < 0.1
+    rendered = [duration for status, duration in metrics.renders if status == "rendered"]
+    assert rendered[-1] >= 0.5
+
+
+@pytest.mark.skipif(weasyprint_available(), reason="weasyprint is installed")
+@pytest.mark.asyncio
+async def test_default_renderer_fails_fast_without_weasyprint(tmp_path, metrics):
+    renderer = PDFRenderer(tmp_path, metrics=metrics)
+
+    with pytest.raises(ImportError):
+        await renderer.render("<p>x</p>")
+    assert renderer.get_stats()["queue_depth"] == 0
@@ -0,0 +1,107 @@
+"""Tests for hashed API keys and their verification cache."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from core.security.api_keys import APIKeyManager, InMemoryAPIKeyStore
+
+
+class _CountingStore(InMemoryAPIKeyStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def aget(self, key_id: str):
+        self.lookups += 1
+        return await super().aget(key_id)
+
+
+@pytest.fixture
+def store():
+    return _CountingStore()
+
+
+@pytest.mark.asyncio
+async def test_issued_key_verifies_and_only_hash_is_stored(store):
+    manager = APIKeyManager(store)
+    api_key, record = await manager.create_key("svc-1", "svc@example.com", "service")
+
+    assert api_key.startswith("sk_")
+    stored = await store.aget(record.key_id)
+    assert api_key not in repr(stored)
+    assert (await manager.verify(api_key)).user_id == "svc-1"
+
+
+@pytest.mark.asyncio
+async def test_wrong_or_malformed_keys_are_rejected(store):
+    manager = APIKeyManager(store)
+    api_key, _ = await manager.create_key("svc-1", "svc@example.com")
+
+    assert await manager.verify(api_key[:-1] + ("A" if api_key[-1] != "A" else "B")) is None
+    assert await manager.verify("sk_" + "0" * 40) is None
+    assert await manager.verify("sk_short") is None
+    assert await manager.verify("pk_" + api_key[3:]) is None
+    assert manager.get_stats()["rejected"] == 4
+
+
+@pytest.mark.asyncio
+async def test_repeated_verification_is_served_from_cache(store):
+    manager = APIKeyManager(store)
+    api_key, _ = await manager.create_key("svc-1", "svc@example.com")
+
+    for _ in range(100):
+        assert await manager.verify(api_key) is not None
+
+    assert store.lookups == 1
+    assert manager.get_stats()["cache_hits"] == 99
+
+
+@pytest.mark.asyncio
+async def test_revocation_evicts_local_cache(store):
+    manager = APIKeyManager(store)
+    api_key, record = await manager.create_key("svc-1", "svc@example.com")
+    await manager.verify(api_key)
+
+    assert await manager.revoke(record.key_id)
+    assert await manager.verify(api_key) is None
+    assert not await manager.revoke(record.key_id)
+
+
+@pytest.mark.asyncio
+async def test_revocation_by_another_worker_applies_after_ttl(store):
+    issuer = APIKeyManager(store)
+    worker = APIKeyManager(store, cache_ttl=0.05)
+    api_key, record = await issuer.create_key("svc-1", "svc@example.com")
+    assert await worker.verify(api_key) is not None
+
+    await issuer.revoke(record.key_id)
+    assert await worker.verify(api_key) is not None  # still cached
+    await asyncio.sleep(0.06)
+    assert await worker.verify(api_key) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_keys_are_rejected_even_when_cached(store):
+    manager = APIKeyManager(store)
+    api_key, _ = await manager.create_key(
+        "svc-1", "svc@example.com", expires_in=timedelta(milliseconds=50)
+    )
+    assert await manager.verify(api_key) is not None
+
+    await asyncio.sleep(0.06)
+    assert await manager.verify(api_key) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(store):
+    manager = APIKeyManager(store, cache_size=3)
+    keys = [(await manager.create_key(f"svc-{i}", "svc@example.com"))[0] for i in range(5)]
+    for api_key in keys:
+        await manager.verify(api_key)
+
+    assert manager.get_stats()["cached"] == 3
+    assert [r.user_id for r in await manager.list_keys("svc-4")] == ["svc-4"]
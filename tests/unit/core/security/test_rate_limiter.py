@@ -0,0 +1,184 @@
+"""Tests for the Redis-backed rate limiter and its middleware."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from api.middleware_production import EnhancedRateLimitMiddleware
+from core.security.rate_limiter import (
+    LocalRateLimiter,
+    RateLimitRule,
+    RedisRateLimiter,
+    RouteTier,
+    resolve_tier,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa", reason="fakeredis needs lupa to run Lua scripts")
+
+WORKERS = 4
+# Frozen wall clock for the scripts: a real one lets the token bucket refill
+# between hits, making exact counts flaky
+FROZEN_NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _worker_limiters(server, n: int = WORKERS, clock=None) -> list[RedisRateLimiter]:
+    """One limiter per simulated API worker, each with its own connection."""
+    return [
+        RedisRateLimiter(
+            fakeredis.aioredis.FakeRedis(server=server, decode_responses=True), clock=clock
+        )
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ["token_bucket", "sliding_window"])
+@pytest.mark.asyncio
+async def test_limit_is_shared_across_workers(server, algorithm):
+    rule = RateLimitRule(10, 60.0, algorithm=algorithm)
+    limiters = _worker_limiters(server, clock=lambda: FROZEN_NOW)
+
+    results = await asyncio.gather(
+        *(limiters[i % WORKERS].hit("ip:10.0.0.1", rule) for i in range(40))
+    )
+
+    assert sum(r.allowed for r in results) == 10
+    assert all(r.backend == "redis" for r in results)
+    denied = [r for r in results if not r.allowed]
+    assert all(r.retry_after > 0 and r.remaining == 0 for r in denied)
+    assert sorted(r.remaining for r in results if r.allowed) == list(range(10))
+
+
+@pytest.mark.parametrize("backend", ["redis", "local"])
+@pytest.mark.asyncio
+async def test_rejected_request_charges_no_rule(server, backend):
+    per_minute = RateLimitRule(5, 60.0)
+    per_hour = RateLimitRule(2, 3600.0, algorithm="sliding_window")
+    if backend == "redis":
+        limiter = _worker_limiters(server, 1, clock=lambda: FROZEN_NOW)[0]
+    else:
+        limiter = LocalRateLimiter()
+
+    outcomes = [await limiter.hit_all("ip:10.0.0.3", (per_minute, per_hour)) for _ in range(4)]
+
+    assert [[r.allowed for r in results] for results in outcomes] == [
+        [True, True],
+        [True, True],
+        [True, False],
+        [True, False],
+    ]
+    # Only the two admitted requests spent per-minute tokens
+    assert (await limiter.hit("ip:10.0.0.3", per_minute)).remaining == 2
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_and_keys_expire(server):
+    rule = RateLimitRule(5, 0.5)
+    limiter = _worker_limiters(server, 1)[0]
+
+    for _ in range(5):
+        assert (await limiter.hit("user:1", rule)).allowed
+    denied = await limiter.hit("user:1", rule)
+    assert not denied.allowed
+    assert 0 < denied.retry_after <= 0.1 + 1e-3
+
+    [key] = await limiter.redis.keys("ratelimit:*")
+    assert 0 < await limiter.redis.pttl(key) <= 500
+
+    await asyncio.sleep(denied.retry_after + 0.02)
+    assert (await limiter.hit("user:1", rule)).allowed
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_keys_expire(server):
+    rule = RateLimitRule(3, 1.0, algorithm="sliding_window")
+    limiter = _worker_limiters(server, 1)[0]
+
+    await limiter.hit("user:1", rule)
+
+    [key] = await limiter.redis.keys("ratelimit:*")
+    assert 0 < await limiter.redis.pttl(key) <= 2000
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limits_when_redis_is_down():
+    import redis.asyncio as aioredis
+
+    unreachable = aioredis.Redis(port=1, socket_connect_timeout=0.05)
+    limiter = RedisRateLimiter(unreachable, retry_interval=60)
+    rule = RateLimitRule(3, 60.0)
+
+    results = [await limiter.hit("ip:10.0.0.2", rule) for _ in range(5)]
+
+    assert limiter.degraded
+    assert [r.allowed for r in results] == [True, True, True, False, False]
+    assert {r.backend for r in results} == {"local"}
+    await unreachable.aclose()
+
+
+@pytest.mark.parametrize("algorithm", ["token_bucket", "sliding_window"])
+@pytest.mark.asyncio
+async def test_local_limiter_enforces_limit_and_bounds_keys(algorithm):
+    limiter = LocalRateLimiter(max_keys=100)
+    rule = RateLimitRule(2, 60.0, algorithm=algorithm)
+
+    assert [(await limiter.hit("a", rule)).allowed for _ in range(3)] == [True, True, False]
+    for i in range(1000):
+        await limiter.hit(f"ip:{i}", rule)
+    assert len(limiter) == 100
+
+
+def test_resolve_tier_uses_longest_prefix():
+    default = RouteTier("default", (), (RateLimitRule(60, 60),))
+    api = RouteTier("api", ("/api",), (RateLimitRule(30, 60),))
+    auth = RouteTier("auth", ("/api/v1/auth",), (RateLimitRule(5, 60),))
+
+    assert resolve_tier("/api/v1/auth/login", [api, auth], default) is auth
+    assert resolve_tier("/api/v1/memory", [api, auth], default) is api
+    assert resolve_tier("/docs", [api, auth], default) is default
+
+
+@pytest.mark.asyncio
+async def test_middleware_limits_are_global_across_worker_apps(server):
+    tiers = [RouteTier("auth", ("/auth",), (RateLimitRule(3, 60.0, algorithm="sliding_window"),))]
+    clients = []
+    for limiter in _worker_limiters(server, 3):
+        app = FastAPI()
+        app.add_middleware(
+            EnhancedRateLimitMiddleware,
+            requests_per_minute=6,
+            route_tiers=tiers,
+            limiter=limiter,
+        )
+
+        @app.get("/auth/login")
+        async def login() -> dict[str, str]:
+            return {"ok": "yes"}
+
+        @app.get("/items")
+        async def items() -> dict[str, str]:
+            return {"ok": "yes"}
+
+        clients.append(AsyncClient(transport=ASGITransport(app=app), base_url="http://test"))
+
+    try:
+        logins = [(await clients[i % 3].get("/auth/login")).status_code for i in range(6)]
+        items = [await clients[i % 3].get("/items") for i in range(9)]
+    finally:
+        for client in clients:
+            await client.aclose()
+
+    assert logins == [200, 200, 200, 429, 429, 429]
+    assert [r.status_code for r in items] == [200] * 6 + [429] * 3
+    assert items[0].headers["X-RateLimit-Tier"] == "default"
+    assert items[0].headers["X-RateLimit-Remaining"] == "5"
+    assert int(items[-1].headers["Retry-After"]) >= 1
@@ -0,0 +1,193 @@
+"""Tests for the delta-writing LangGraph checkpointer."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from itertools import pairwise
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+import pytest
+
+from core.memory.models import MemoryRecord
+from core.orchestration.workflow_graph import WorkflowState
+from core.storage.checkpointer import (
+    DeltaCheckpointSaver,
+    MemoryCheckpointBackend,
+    RedisCheckpointBackend,
+    RetentionPolicy,
+)
+
+STEPS = ["research", "case_agent", "writer", "validator", "finalize"]
+
+
+def _graph():
+    """Five-step graph whose nodes return the whole state, like the EB-1A nodes."""
+    graph = StateGraph(WorkflowState)
+
+    def make_node(name: str):
+        async def node(state: WorkflowState) -> WorkflowState:
+            if name == "research":
+                state.retrieved = [
+                    MemoryRecord(
+                        text=f"precedent {i} " * 40, user_id="u1", created_at=datetime(2025, 1, 1)
+                    )
+                    for i in range(30)
+                ]
+            state.agent_results = {**state.agent_results, name: {"status": "ok", "step": name}}
+            state.workflow_step = name
+            return state
+
+        return node
+
+    for name in STEPS:
+        graph.add_node(name, make_node(name))
+    graph.set_entry_point(STEPS[0])
+    for a, b in pairwise(STEPS):
+        graph.add_edge(a, b)
+    graph.set_finish_point(STEPS[-1])
+    return graph
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def backend(request):
+    if request.param == "memory":
+        yield MemoryCheckpointBackend()
+        return
+
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.aioredis.FakeRedis()
+    yield RedisCheckpointBackend(client)
+    await client.aclose()
+
+
+def _config(thread_id: str = "case-1") -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.mark.asyncio
+async def test_graph_state_round_trips_like_memory_saver(backend):
+    saver = DeltaCheckpointSaver(backend)
+    app = _graph().compile(checkpointer=saver)
+    reference = _graph().compile(checkpointer=MemorySaver())
+
+    result = await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+    expected = await reference.ainvoke(WorkflowState(thread_id="case-1"), _config())
+    assert result == expected
+    assert (await app.aget_state(_config())).values == (
+        await reference.aget_state(_config())
+    ).values
+
+    state = await app.aget_state(_config())
+    assert state.values["workflow_step"] == "finalize"
+    assert len(state.values["retrieved"]) == 30
+    assert set(state.values["agent_results"]) == set(STEPS)
+
+    history = [s async for s in app.aget_state_history(_config())]
+    assert len(history) == len(STEPS) + 2
+    # Time travel: an earlier checkpoint still resolves its own channel values
+    after_research = next(s for s in history if s.values.get("workflow_step") == "research")
+    assert list(after_research.values["agent_results"]) == ["research"]
+
+
+class _FullSnapshotSaver(DeltaCheckpointSaver):
+    """Baseline that forgets parent digests, i.e. rewrites every channel version."""
+
+    def _remember(self, key, digests) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_channels_are_not_rewritten_and_large_blobs_compressed(backend):
+    saver = DeltaCheckpointSaver(backend)
+    app = _graph().compile(checkpointer=saver)
+    await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+
+    # `retrieved` is returned by every node after research but stored once
+    assert saver.stats.blobs_deduplicated >= len(STEPS) - 1
+    assert saver.stats.blobs_compressed >= 1
+
+    full = _FullSnapshotSaver(MemoryCheckpointBackend(), compress_threshold=1 << 30)
+    await _graph().compile(checkpointer=full).ainvoke(WorkflowState(thread_id="case-1"), _config())
+    assert saver.stats.bytes_written * 5 < full.stats.bytes_written
+
+
+@pytest.mark.asyncio
+async def test_retention_prunes_old_checkpoints_and_orphaned_blobs(backend):
+    saver = DeltaCheckpointSaver(backend, retention=RetentionPolicy(keep_last=2, prune_every=1))
+    app = _graph().compile(checkpointer=saver)
+
+    await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+    await app.ainvoke(WorkflowState(thread_id="case-1", query="second run"), _config())
+
+    history = [s async for s in app.aget_state_history(_config())]
+    assert len(history) == 2
+    assert saver.stats.pruned > 0
+    latest = await app.aget_state(_config())
+    assert latest.values["query"] == "second run"
+    assert len(latest.values["retrieved"]) == 30
+
+    if isinstance(backend, MemoryCheckpointBackend):
+        ns = backend._threads["case-1"][""]
+        referenced = {
+            (ch, ver) for cp in ns.checkpoints.values() for ch, ver in cp.channel_versions.items()
+        }
+        assert set(ns.channels) <= referenced
+        assert set(ns.blobs) == set(ns.channels.values())
+
+
+@pytest.mark.asyncio
+async def test_pending_writes_and_delete_thread(backend):
+    saver = DeltaCheckpointSaver(backend)
+    app = _graph().compile(checkpointer=saver)
+    await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+    await app.ainvoke(WorkflowState(thread_id="case-2"), _config("case-2"))
+
+    latest = await saver.aget_tuple(_config())
+    config = latest.config
+    await saver.aput_writes(config, [("query", "a"), ("error", "x")], task_id="t1")
+    await saver.aput_writes(config, [("query", "b")], task_id="t1")  # regular: kept
+    await saver.aput_writes(config, [("__error__", "boom")], task_id="t1")
+    await saver.aput_writes(config, [("__error__", "boom 2")], task_id="t1")  # special: replaced
+
+    writes = (await saver.aget_tuple(config)).pending_writes
+    assert ("t1", "query", "a") in writes
+    assert ("t1", "__error__", "boom 2") in writes
+    assert len(writes) == 3
+
+    listed = [t async for t in saver.alist(None)]
+    assert {t.config["configurable"]["thread_id"] for t in listed} == {"case-1", "case-2"}
+    assert len([t async for t in saver.alist(_config(), limit=3)]) == 3
+
+    await saver.adelete_thread("case-1")
+    assert await saver.aget_tuple(_config()) is None
+    assert await saver.aget_tuple(_config("case-2")) is not None
+
+
+@pytest.mark.asyncio
+async def test_blob_pruned_by_another_replica_is_rewritten(backend):
+    saver = DeltaCheckpointSaver(backend)
+    app = _graph().compile(checkpointer=saver)
+    await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+
+    # Another replica drops the thread while this one still caches its digests
+    await DeltaCheckpointSaver(backend).adelete_thread("case-1")
+    written = saver.stats.blobs_written
+    result = await app.ainvoke(WorkflowState(thread_id="case-1"), _config())
+
+    assert saver.stats.blobs_written > written
+    state = await app.aget_state(_config())
+    assert state.values == result
+    assert len(state.values["retrieved"]) == 30
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_raises_instead_of_dropping_the_channel():
+    backend = MemoryCheckpointBackend()
+    saver = DeltaCheckpointSaver(backend)
+    await _graph().compile(checkpointer=saver).ainvoke(WorkflowState(thread_id="case-1"), _config())
+
+    backend._threads["case-1"][""].blobs.clear()
+
+    with pytest.raises(LookupError, match="no stored value for channels"):
+        await saver.aget_tuple(_config())
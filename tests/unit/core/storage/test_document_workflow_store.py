@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.storage.document_workflow_store import (
+    MAX_LOGS,
+    DocumentWorkflowStore,
+    WorkflowContentionError,
+    WorkflowVersionConflict,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def store(request):
+    if request.param == "memory":
+        yield DocumentWorkflowStore()
+        return
+
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield DocumentWorkflowStore(use_redis=True, redis_client=client)
+    await client.aclose()
+
+
+def _state(n_sections: int = 3) -> dict:
+    return {
+        "thread_id": "t1",
+        "status": "generating",
+        "sections": [
+            {"id": f"s{i}", "name": f"Section {i}", "order": i, "status": "pending"}
+            for i in range(n_sections)
+        ],
+        "exhibits": [],
+        "logs": [{"level": "info", "message": "start"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_state_is_assembled_from_deltas(store):
+    assert await store.save_state("t1", _state()) == 1
+
+    assert await store.update_section("t1", "s1", {"status": "completed", "tokens_used": 7})
+    assert await store.add_exhibit("t1", {"exhibit_id": "1.1.A", "filename": "a.pdf"})
+    assert await store.add_log("t1", {"level": "info", "message": "next"})
+    assert await store.update_workflow_status("t1", "completed")
+
+    state = await store.load_state("t1")
+    assert state["_version"] == 5
+    assert state["status"] == "completed"
+    assert [s["id"] for s in state["sections"]] == ["s0", "s1", "s2"]
+    assert state["sections"][1]["status"] == "completed"
+    assert state["sections"][1]["tokens_used"] == 7
+    assert "updated_at" in state["sections"][1]
+    assert state["exhibits"][0]["exhibit_id"] == "1.1.A"
+    assert [log["message"] for log in state["logs"]] == ["start", "next"]
+
+    # Loaded state is a snapshot, not a live reference
+    state["sections"][0]["status"] = "mutated"
+    assert (await store.load_state("t1"))["sections"][0]["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_section_updates_are_not_lost(store):
+    await store.save_state("t1", _state(n_sections=10))
+
+    await asyncio.gather(
+        *(
+            store.update_section(
+                "t1", f"s{i}", {"status": "completed", "content_html": f"<p>{i}</p>"}
+            )
+            for i in range(10)
+        ),
+        *(store.add_log("t1", {"level": "info", "message": f"log {i}"}) for i in range(10)),
+    )
+
+    state = await store.load_state("t1")
+    assert all(s["status"] == "completed" for s in state["sections"])
+    assert len(state["logs"]) == 11
+    assert state["_version"] == 21
+
+
+@pytest.mark.asyncio
+async def test_logs_are_trimmed_and_readable_without_full_state(store):
+    await store.save_state("t1", _state())
+    for i in range(MAX_LOGS + 20):
+        await store.add_log("t1", {"level": "info", "message": f"log {i}"})
+
+    logs = await store.get_logs("t1")
+    assert len(logs) == MAX_LOGS
+    assert logs[-1]["message"] == f"log {MAX_LOGS + 19}"
+    assert [log["message"] for log in await store.get_logs("t1", limit=2)] == [
+        f"log {MAX_LOGS + 18}",
+        f"log {MAX_LOGS + 19}",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_optimistic_versioning(store):
+    await store.save_state("t1", _state(), expected_version=0)
+    with pytest.raises(WorkflowVersionConflict):
+        await store.save_state("t1", _state(), expected_version=0)
+
+    version = await store.get_version("t1")
+    await store.add_log("t1", {"level": "info", "message": "concurrent writer"})
+    with pytest.raises(WorkflowVersionConflict):
+        await store.update_fields("t1", {"status": "paused"}, expected_version=version)
+
+    assert await store.update_fields("t1", {"status": "paused"}, expected_version=version + 1)
+    assert (await store.load_state("t1"))["status"] == "paused"
+
+    with pytest.raises(ValueError):
+        await store.update_fields("t1", {"sections": []})
+
+
+@pytest.mark.asyncio
+async def test_section_update_contention_is_not_reported_as_missing(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    from redis.asyncio.client import Pipeline
+    from redis.exceptions import WatchError
+
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    store = DocumentWorkflowStore(use_redis=True, redis_client=client)
+    await store.save_state("t1", _state())
+
+    async def always_raced(self, *args, **kwargs):
+        raise WatchError("watched key changed")
+
+    monkeypatch.setattr(Pipeline, "execute", always_raced)
+    with pytest.raises(WorkflowContentionError):
+        await store.update_section("t1", "s1", {"status": "completed"})
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_missing_thread_and_delete(store):
+    assert await store.load_state("missing") is None
+    assert await store.update_section("missing", "s0", {"status": "x"}) is False
+    assert await store.add_log("missing", {"message": "x"}) is False
+    assert await store.update_workflow_status("missing", "paused") is False
+
+    await store.save_state("t1", _state())
+    assert await store.update_section("t1", "nope", {"status": "x"}) is False
+    assert await store.list_active_workflows() == ["t1"]
+
+    assert await store.delete_state("t1")
+    assert await store.load_state("t1") is None
+    assert await store.list_active_workflows() == []
+
+
+def _apply(state: dict, ops: list[dict]) -> None:
+    """Minimal client-side patcher for the store's JSON-patch style ops."""
+    for op in ops:
+        parts = op["path"].strip("/").split("/")
+        if op["op"] == "add" and parts[-1] == "-":
+            state[parts[0]].append(op["value"])
+        elif parts[0] == "sections":
+            section = next(s for s in state["sections"] if s["id"] == parts[1])
+            section[parts[2]] = op["value"]
+        else:
+            state[parts[0]] = op["value"]
+
+
+@pytest.mark.asyncio
+async def test_deltas_replay_to_the_current_state(store):
+    await store.save_state("t1", _state())
+    client_state = await store.load_state("t1")
+
+    await store.update_section("t1", "s2", {"status": "completed", "content_html": "<p>x</p>"})
+    await store.add_log("t1", {"level": "info", "message": "next"})
+    await store.add_exhibit("t1", {"exhibit_id": "1.1.A"})
+    await store.update_workflow_status("t1", "paused")
+
+    version, deltas = await store.get_deltas("t1", client_state["_version"])
+    assert version == 5
+    assert [d["v"] for d in deltas] == [2, 3, 4, 5]
+    assert deltas[3]["ops"] == [{"op": "replace", "path": "/status", "value": "paused"}]
+
+    for delta in deltas:
+        _apply(client_state, delta["ops"])
+    current = await store.load_state("t1")
+    for key in ("status", "sections", "logs", "exhibits"):
+        assert client_state[key] == current[key]
+
+    assert await store.get_deltas("t1", 5) == (5, [])
+    assert [d["v"] for d in (await store.get_deltas("t1", 3))[1]] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_deltas_outside_the_journal_require_full_reload(store, monkeypatch):
+    await store.save_state("t1", _state())
+    for i in range(40):
+        await store.add_log("t1", {"level": "info", "message": f"log {i}"})
+
+    # Resume from before the last full save cannot be served from the journal
+    assert await store.get_deltas("t1", 0) is None
+    assert await store.get_deltas("t1", 99) is None
+    assert await store.get_deltas("missing", 0) is None
+    version, deltas = await store.get_deltas("t1", 1)
+    assert version == 41 and len(deltas) == 40
+
+    await store.save_state("t1", _state())
+    assert await store.get_deltas("t1", 41) is None
+    assert await store.get_deltas("t1", 42) == (42, [])
@@ -0,0 +1,119 @@
+"""Tests for per-tick delta pushes and client resume."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.storage.document_workflow_store import DocumentWorkflowStore
+from core.websocket_deltas import DeltaStreamer
+from core.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, message: dict) -> None:
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        return None
+
+
+@pytest.fixture
+async def setup():
+    store = DocumentWorkflowStore()
+    await store.save_state(
+        "t1",
+        {
+            "status": "generating",
+            "sections": [{"id": f"s{i}", "status": "pending"} for i in range(5)],
+            "logs": [],
+            "exhibits": [],
+        },
+    )
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    await manager.connect(ws, "t1")
+    streamer = DeltaStreamer(manager, store, tick_seconds=0.05)
+    yield store, manager, streamer, ws
+    await streamer.stop()
+    manager.disconnect(ws, "t1")
+
+
+async def _settle() -> None:
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_burst_of_updates_becomes_one_frame(setup):
+    store, _, streamer, ws = setup
+    streamer.track("t1", 1)
+
+    for i in range(5):
+        await store.update_section("t1", f"s{i}", {"status": "completed"})
+        await store.add_log("t1", {"level": "info", "message": f"s{i} done"})
+
+    assert await streamer.flush() == 1
+    assert await streamer.flush() == 0
+    await _settle()
+
+    [frame] = ws.sent
+    assert frame["type"] == "delta"
+    assert (frame["from_version"], frame["version"]) == (1, 11)
+    assert [d["v"] for d in frame["deltas"]] == list(range(2, 12))
+    # Only the changed fields travel, never the whole state
+    assert "sections" not in frame and "state" not in frame
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_is_covered_by_next_tick(setup):
+    store, _, streamer, ws = setup
+    streamer.track("t1", 1)
+    await store.add_log("t1", {"message": "a"})
+    await streamer.flush()
+
+    # A client that received initial_state at an older version lowers the baseline
+    streamer.track("t1", 1)
+    await store.add_log("t1", {"message": "b"})
+    await streamer.flush()
+    await _settle()
+
+    assert [[d["v"] for d in f["deltas"]] for f in ws.sent] == [[2], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_catch_up_and_resync(setup):
+    store, _, streamer, ws = setup
+    for i in range(3):
+        await store.add_log("t1", {"message": str(i)})
+
+    frame = await streamer.catch_up("t1", 2)
+    assert [d["v"] for d in frame["deltas"]] == [3, 4]
+    assert await streamer.catch_up("t1", 0) is None
+
+    # State replaced under the streamer: clients are told to resync
+    streamer.track("t1", 4)
+    await store.save_state("t1", {"status": "idle", "sections": [], "logs": [], "exhibits": []})
+    await streamer.flush()
+    await _settle()
+    assert ws.sent[-1] == {"type": "resync_required", "thread_id": "t1", "version": 5}
+
+
+@pytest.mark.asyncio
+async def test_tick_loop_pushes_without_explicit_flush(setup):
+    store, _, streamer, ws = setup
+    streamer.ensure_started()
+    await asyncio.sleep(0.06)  # first tick records the baseline
+
+    await store.update_workflow_status("t1", "paused")
+    await asyncio.sleep(0.12)
+
+    assert ws.sent[-1]["deltas"][-1]["ops"] == [
+        {"op": "replace", "path": "/status", "value": "paused"}
+    ]
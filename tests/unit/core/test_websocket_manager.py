@@ -0,0 +1,165 @@
+"""Tests for WebSocket fan-out: per-client queues, coalescing and the backplane."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.websocket_backplane import InMemoryBackplane, RedisStreamsBackplane
+from core.websocket_manager import ClientConnection, ConnectionManager
+
+
+class FakeWebSocket:
+    """Records frames; ``delay`` simulates a slow reader, ``block`` a stuck one."""
+
+    def __init__(self, delay: float = 0.0, block: bool = False) -> None:
+        self.delay = delay
+        self.block = block
+        self.sent: list[dict] = []
+        self.closed_code: int | None = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, message: dict) -> None:
+        if self.block:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_code = code
+
+
+async def _drain(manager: ConnectionManager, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while manager.get_stats()["queued"] and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+
+def _section(section_id: str, status: str) -> dict:
+    return {"type": "workflow_update", "data": {"section_id": section_id, "status": status}}
+
+
+def test_state_messages_coalesce_and_logs_do_not():
+    client = ClientConnection(FakeWebSocket(), "t1", max_queue=10)
+
+    client.enqueue(_section("s1", "in_progress"))
+    client.enqueue({"type": "log_entry", "log": {"message": "a"}})
+    client.enqueue({"type": "log_entry", "log": {"message": "a"}})
+    client.enqueue(_section("s1", "completed"))
+
+    assert client.queued == 3
+    assert client.coalesced == 1
+    queued = list(client._pending.values())
+    # Latest section state wins and keeps its place after the earlier logs
+    assert queued[-1]["data"]["status"] == "completed"
+
+
+def test_full_queue_drops_oldest_and_requests_resync():
+    client = ClientConnection(FakeWebSocket(), "t1", max_queue=5)
+
+    for i in range(20):
+        client.enqueue({"type": "log_entry", "log": {"message": str(i)}})
+
+    queued = list(client._pending.values())
+    assert len(queued) == 5
+    assert client.dropped == 16
+    assert queued[-1] == {"type": "resync_required", "thread_id": "t1", "dropped": 16}
+    assert [m["log"]["message"] for m in queued[:-1]] == ["16", "17", "18", "19"]
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_others_and_stuck_client_is_closed():
+    manager = ConnectionManager(max_queue=8, send_timeout=0.2)
+    fast, slow, stuck = FakeWebSocket(), FakeWebSocket(delay=0.05), FakeWebSocket(block=True)
+    for ws in (fast, slow, stuck):
+        await manager.connect(ws, "t1")
+
+    for i in range(5):
+        await manager.broadcast("t1", {"type": "log_entry", "log": {"message": str(i)}})
+    await asyncio.sleep(0.02)
+
+    # Fast client already has everything while the slow one is still catching up
+    assert len(fast.sent) == 5
+    assert len(slow.sent) < 5
+
+    await asyncio.sleep(0.4)
+    assert len(slow.sent) == 5
+    assert stuck.closed_code == 1013
+    assert manager.get_connection_count("t1") == 2
+    assert manager.get_stats()["slow_disconnects"] == 1
+
+    for ws in (fast, slow):
+        manager.disconnect(ws, "t1")
+    assert manager.get_connection_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_personal_messages_are_ordered_with_broadcasts():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    await manager.connect(ws, "t1")
+
+    await manager.send_personal_message({"type": "connected"}, ws)
+    await manager.broadcast("t1", {"type": "log_entry", "log": {}})
+    await manager.send_personal_message({"type": "pong"}, ws)
+    await _drain(manager)
+
+    assert [m["type"] for m in ws.sent] == ["connected", "log_entry", "pong"]
+    manager.disconnect(ws, "t1")
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_a_backplane_see_each_others_events():
+    backplane = InMemoryBackplane()
+    worker_a, worker_b = ConnectionManager(), ConnectionManager()
+    await worker_a.start(backplane)
+    await worker_b.start(backplane)
+
+    ws_a, ws_b, other = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    await worker_a.connect(ws_a, "t1")
+    await worker_b.connect(ws_b, "t1")
+    await worker_b.connect(other, "t2")
+
+    await worker_a.broadcast("t1", _section("s1", "completed"))
+    await worker_b.broadcast_to_all({"type": "status_change", "status": "maintenance"})
+    await _drain(worker_a)
+    await _drain(worker_b)
+
+    assert [m["type"] for m in ws_a.sent] == ["workflow_update", "status_change"]
+    assert [m["type"] for m in ws_b.sent] == ["workflow_update", "status_change"]
+    assert [m["type"] for m in other.sent] == ["status_change"]
+    await worker_a.stop()
+    await worker_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_backplane_delivers_across_managers():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    # An event published before the workers start must not be replayed
+    await redis.xadd("ws:test", {"thread_id": "t1", "payload": '{"type": "stale"}'})
+
+    worker_a, worker_b = ConnectionManager(), ConnectionManager()
+    await worker_a.start(RedisStreamsBackplane(redis, "ws:test", block_ms=20))
+    await worker_b.start(RedisStreamsBackplane(redis, "ws:test", block_ms=20))
+    ws_b = FakeWebSocket()
+    await worker_b.connect(ws_b, "t1")
+
+    for i in range(3):
+        await worker_a.broadcast("t1", {"type": "log_entry", "log": {"message": str(i)}})
+
+    for _ in range(100):
+        if len(ws_b.sent) == 3:
+            break
+        await asyncio.sleep(0.02)
+
+    assert [m["log"]["message"] for m in ws_b.sent] == ["0", "1", "2"]
+    await worker_a.stop()
+    await worker_b.stop()
+    await redis.aclose()
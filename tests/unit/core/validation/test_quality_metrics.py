@@ -0,0 +1,237 @@
+"""Tests for the streaming QualityTracker aggregates."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import fakeredis
+import numpy as np
+from prometheus_client import CollectorRegistry
+import pytest
+
+from core.validation import (
+    InMemoryQualityStore,
+    QualityExporter,
+    QualityTracker,
+    RedisQualityStore,
+    RunningStats,
+    TDigest,
+    configure_quality_tracker,
+    get_quality_tracker,
+    start_quality_flush,
+    stop_quality_flush,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _tracker(**kwargs) -> QualityTracker:
+    return QualityTracker(export_metrics=False, **kwargs)
+
+
+def _record(tracker, agent="agent", confidence=0.8, retries=1, duration=2.0, success=True):
+    tracker.record_operation(
+        agent_name=agent,
+        confidence_score=confidence,
+        retry_count=retries,
+        duration_seconds=duration,
+        success=success,
+    )
+
+
+def test_running_stats_and_digest_merge_match_full_data():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=20_000)
+    parts = np.array_split(values, 4)
+
+    stats, digest = RunningStats(), TDigest()
+    for part in parts:
+        partial_stats, partial_digest = RunningStats(), TDigest()
+        for value in part:
+            partial_stats.add(value)
+            partial_digest.update(value)
+        stats.merge(RunningStats.from_dict(partial_stats.to_dict()))
+        digest.merge(TDigest.from_dict(partial_digest.to_dict()))
+
+    assert stats.count == digest.count == 20_000
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.variance == pytest.approx(values.var())
+    assert digest.centroids < 150
+    for q in (0.01, 0.5, 0.9, 0.99):
+        assert digest.quantile(q) == pytest.approx(np.quantile(values, q), rel=0.03)
+
+
+def test_stats_keep_legacy_keys_and_add_quantiles():
+    tracker = _tracker()
+    for i in range(100):
+        _record(tracker, confidence=0.5 + i / 200, retries=i % 3, duration=1.0 + i / 10, success=i % 4 > 0)
+
+    stats = tracker.get_agent_stats("agent")
+
+    assert stats["total_operations"] == 100
+    assert (stats["successful_operations"], stats["failed_operations"]) == (75, 25)
+    assert stats["total_retries"] == 99
+    assert stats["avg_confidence"] == pytest.approx(0.7475)
+    assert stats["duration_p50"] == pytest.approx(5.95, abs=0.1)
+    assert stats["ewma_confidence"] > stats["avg_confidence"]
+    assert tracker.agent_stats == {"agent": stats}
+    assert tracker.get_summary()["overall_success_rate"] == 0.75
+
+
+def test_trend_is_stable_for_noise_and_detects_shifts():
+    rng = random.Random(0)
+    tracker = _tracker()
+    for _ in range(200):
+        _record(tracker, "noisy", confidence=rng.gauss(0.8, 0.05), duration=rng.gauss(2, 0.3))
+    for i in range(200):
+        _record(tracker, "drifting", confidence=rng.gauss(0.9 if i >= 150 else 0.8, 0.05), duration=2.0)
+
+    noisy = tracker.get_quality_trend("noisy", window_size=100)
+    drifting = tracker.get_quality_trend("drifting", window_size=100)
+
+    assert noisy["operations_count"] == 100
+    assert (noisy["confidence_trend"], noisy["duration_trend"]) == ("stable", "stable")
+    assert drifting["confidence_trend"] == "improving"
+    assert drifting["confidence_t"] > 2
+    assert tracker.get_quality_trend("missing")["status"] == "insufficient_data"
+
+
+def test_anomalies_use_a_robust_baseline_scored_at_record_time():
+    rng = random.Random(2)
+    tracker = _tracker()
+    for i in range(300):
+        # Occasional slow outliers must not mask each other or the confidence drop
+        _record(tracker, duration=40.0 if i % 50 == 49 else rng.gauss(2.0, 0.2), confidence=rng.gauss(0.8, 0.03))
+    _record(tracker, confidence=0.3, retries=5)
+
+    anomalies = tracker.detect_anomalies("agent")
+
+    slow = [a for a in anomalies if a["duration_seconds"] == 40.0]
+    assert len(slow) == 6
+    assert all(a["reasons"] == ["unusual_duration"] and a["scores"]["duration"] > 50 for a in slow)
+    assert len(anomalies) < 10  # few false positives from Gaussian noise
+    assert anomalies[-1]["reasons"] == ["unusual_confidence", "excessive_retries"]
+    assert anomalies[-1]["scores"]["confidence"] < -10
+    assert tracker.detect_anomalies("agent", threshold=1000.0)[-1]["reasons"] == ["excessive_retries"]
+
+
+def test_window_stats_use_time_buckets():
+    clock = FakeClock()
+    tracker = _tracker(clock=clock, bucket_seconds=60, max_buckets=10)
+    for minute in range(15):
+        for _ in range(minute + 1):
+            _record(tracker, duration=float(minute))
+        clock.now += 60
+
+    clock.now -= 60
+    last_five = tracker.get_window_stats("agent", seconds=300)
+
+    assert last_five["total_operations"] == 11 + 12 + 13 + 14 + 15
+    assert last_five["avg_duration"] == pytest.approx(
+        sum(m * (m + 1) for m in range(10, 15)) / last_five["total_operations"]
+    )
+    # Only max_buckets of history are kept; totals remain all-time
+    assert tracker.get_window_stats(seconds=3600)["total_operations"] == sum(range(6, 16))
+    assert tracker.get_agent_stats("agent")["total_operations"] == sum(range(1, 16))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+async def test_shared_store_merges_workers(backend):
+    server = fakeredis.FakeServer()
+    shared = InMemoryQualityStore()
+
+    def store():
+        if backend == "memory":
+            return shared
+        return RedisQualityStore(fakeredis.FakeAsyncRedis(server=server))
+
+    clock = FakeClock()
+    workers = [_tracker(store=store(), worker_id=f"w{i}", clock=clock) for i in range(3)]
+    for i, worker in enumerate(workers):
+        for _ in range(10 * (i + 1)):
+            _record(worker, confidence=0.5 + i / 10)
+        assert await worker.flush() == 2
+        assert await worker.flush() == 0  # nothing changed since
+    # Flushing again after more work overwrites rather than double counts
+    _record(workers[0], confidence=0.5)
+    await workers[0].flush()
+
+    stats = await workers[1].get_shared_stats("agent")
+    window = await workers[2].get_shared_stats("agent", seconds=60)
+
+    assert stats["workers"] == 3
+    assert stats["total_operations"] == window["total_operations"] == 61
+    assert stats["avg_confidence"] == pytest.approx((11 * 0.5 + 20 * 0.6 + 30 * 0.7) / 61)
+    assert await workers[0].store.list_agents() == ["agent"]
+
+
+@pytest.mark.asyncio
+async def test_startup_wires_store_and_flushes_the_global_tracker(monkeypatch):
+    from core.validation import quality_metrics
+
+    store = InMemoryQualityStore()
+
+    async def create_store():
+        return store
+
+    monkeypatch.setattr(quality_metrics, "create_quality_store", create_store)
+    configure_quality_tracker(_tracker(worker_id="w0"))
+    try:
+        await start_quality_flush(interval=0.01)
+        _record(get_quality_tracker())
+        for _ in range(100):
+            if await store.load("agent", ["total"]):
+                break
+            await asyncio.sleep(0.01)
+        assert get_quality_tracker().store is store
+
+        # Whatever is recorded after the last tick is pushed on shutdown
+        _record(get_quality_tracker())
+        await stop_quality_flush()
+        stats = await get_quality_tracker().get_shared_stats("agent")
+        assert stats["total_operations"] == 2
+    finally:
+        await stop_quality_flush()
+        configure_quality_tracker(None)
+
+
+def test_prometheus_exporter_publishes_gauges():
+    registry = CollectorRegistry()
+    tracker = QualityTracker(exporter=QualityExporter(registry), publish_every=10)
+    for i in range(20):
+        _record(tracker, success=i != 0)
+    for _ in range(5):
+        _record(tracker, retries=6)
+
+    def sample(name, **labels):
+        return registry.get_sample_value(name, {"agent": "agent", **labels})
+
+    assert sample("agent_quality_operations", outcome="failure") == 1
+    assert sample("agent_quality_operations", outcome="success") == 19
+    assert sample("agent_quality_confidence", stat="p50") == pytest.approx(0.8)
+    assert sample("agent_quality_anomalies_total", reason="excessive_retries") == 5
+
+
+def test_reads_do_not_scan_history():
+    def read_time(operations: int) -> float:
+        tracker = _tracker(history_size=1000)
+        for i in range(operations):
+            _record(tracker, confidence=0.8 + (i % 7) / 100)
+        start = time.perf_counter()
+        for _ in range(50):
+            tracker.get_agent_stats("agent")
+            tracker.get_quality_trend("agent")
+            tracker.detect_anomalies("agent")
+        return time.perf_counter() - start
+
+    read_time(1_000)  # warm-up
+    assert read_time(50_000) < 3 * read_time(1_000)
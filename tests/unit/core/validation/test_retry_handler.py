@@ -0,0 +1,217 @@
+"""Tests for concurrent candidate sampling in RetryHandler."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import time
+
+import pytest
+
+from core.optimization import CostTracker
+from core.validation import (
+    ConfidenceMetrics,
+    ConfidenceScorer,
+    RetryConfig,
+    RetryHandler,
+    RetryStrategy,
+)
+
+
+@dataclass
+class Plan:
+    latency: float
+    score: float
+    cost: float = 0.0
+    tokens: int = 0
+    error: bool = False
+
+
+class FakeAgent:
+    """Agent whose n-th call sleeps and answers as its plan says."""
+
+    def __init__(self, *plans: Plan) -> None:
+        self.plans = list(plans)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, query: str) -> dict:
+        plan = self.plans[self.calls % len(self.plans)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(plan.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if plan.error:
+            raise RuntimeError("provider unavailable")
+        return {"output": f"{plan.score}", "cost": plan.cost, "tokens_used": plan.tokens}
+
+
+class FakeScorer(ConfidenceScorer):
+    """Reads the confidence back from the fake agent's output."""
+
+    def score_output(self, output, context=None, expected_length=None, expected_format=None):
+        score = float(output)
+        return ConfidenceMetrics(overall_confidence=score, threshold=self._determine_threshold(score))
+
+
+def _handler(tracker: CostTracker | None = None) -> RetryHandler:
+    return RetryHandler(confidence_scorer=FakeScorer(), cost_tracker=tracker or CostTracker())
+
+
+def _config(**kwargs) -> RetryConfig:
+    return RetryConfig(strategy=RetryStrategy.CONCURRENT_CANDIDATES, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_candidates_run_concurrently_and_best_wins():
+    agent = FakeAgent(Plan(0.2, 0.75), Plan(0.2, 0.95), Plan(0.2, 0.8), Plan(0.2, 0.72))
+
+    start = time.perf_counter()
+    result, metrics, info = await _handler().retry_with_validation(
+        agent, _config(candidates=4, early_stop=False), query="q"
+    )
+
+    assert time.perf_counter() - start < 0.4  # one round trip, not four
+    assert result["output"] == "0.95"
+    assert metrics.overall_confidence == info["final_confidence"] == 0.95
+    assert (info["attempts"], info["rounds"], info["cancelled"]) == (4, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_early_stop_cancels_slower_candidates():
+    agent = FakeAgent(Plan(1.0, 0.99), Plan(0.05, 0.9), Plan(1.0, 0.99))
+
+    start = time.perf_counter()
+    result, _metrics, info = await _handler().retry_with_validation(agent, _config(), query="q")
+
+    assert time.perf_counter() - start < 0.5
+    assert result["output"] == "0.9"
+    assert agent.cancelled == info["cancelled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rounds_repeat_until_a_candidate_passes_validation():
+    agent = FakeAgent(Plan(0.01, 0.3), Plan(0.01, 0.4), Plan(0.01, 0.95), Plan(0.01, 0.85))
+
+    result, _metrics, info = await _handler().retry_with_validation(
+        agent,
+        _config(candidates=2, early_stop=False, max_retries=3),
+        query="q",
+        validation_func=lambda r: r["output"] != "0.95",
+    )
+
+    assert result["output"] == "0.85"
+    assert info["rounds"] == 2
+    assert [r["valid"] for r in info["retries"] if r["round"] == 2].count(False) == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_sizes_rounds_from_cost_history():
+    tracker = CostTracker()
+    tracker.record_operation("unpriced-model", input_tokens=500, output_tokens=500, latency_ms=1)
+    assert tracker.average_operation_cost() == (pytest.approx(0.002), 1000)
+    agent = FakeAgent(Plan(0.01, 0.5, cost=0.002, tokens=1000))
+
+    with pytest.raises(ValueError, match="budget exhausted after 2 candidates"):
+        await _handler(tracker).retry_with_validation(
+            agent, _config(candidates=4, max_retries=5, max_cost_usd=0.005), query="q"
+        )
+    assert agent.calls == 2
+
+    with pytest.raises(ValueError, match="budget exhausted after 3 candidates"):
+        await _handler(tracker).retry_with_validation(
+            agent, _config(candidates=2, max_retries=5, max_tokens=3_500), query="q"
+        )
+
+    # The remaining daily budget caps the per-call budget
+    tracker.daily_budget = tracker.get_daily_cost() + 0.001
+    with pytest.raises(ValueError, match="budget exhausted after 0 candidates"):
+        await _handler(tracker).retry_with_validation(agent, _config(), query="q")
+
+
+@pytest.mark.asyncio
+async def test_overspending_candidate_cancels_the_rest_of_the_round():
+    tracker = CostTracker()
+    tracker.record_operation("unpriced-model", input_tokens=500, output_tokens=500, latency_ms=1)
+    agent = FakeAgent(Plan(0.01, 0.5, cost=0.02), Plan(1.0, 0.9), Plan(1.0, 0.9))
+
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="budget exhausted"):
+        await _handler(tracker).retry_with_validation(
+            agent, _config(max_cost_usd=0.01), query="q"
+        )
+
+    assert time.perf_counter() - start < 0.5
+    assert agent.cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_limited_call_without_history_probes_one_candidate_first():
+    agent = FakeAgent(Plan(0.01, 0.5, cost=0.01))
+
+    with pytest.raises(ValueError, match="budget exhausted after 1 candidates") as excinfo:
+        await _handler().retry_with_validation(
+            agent, _config(candidates=5, max_cost_usd=0.01), query="q"
+        )
+    assert agent.calls == 1
+    assert "$0.0100" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_failed_candidates_count_in_the_mean_usage():
+    tracker = CostTracker()
+    tracker.record_operation("unpriced-model", input_tokens=500, output_tokens=500, latency_ms=1)
+    agent = FakeAgent(
+        Plan(0.01, 0, error=True),
+        Plan(0.02, 0.5, cost=0.002),
+        Plan(0.02, 0.5, cost=0.002),
+    )
+
+    # Three charged candidates spent $0.006, so $0.0045 left fits two more at $0.002
+    with pytest.raises(ValueError, match="budget exhausted after 5 candidates"):
+        await _handler(tracker).retry_with_validation(
+            agent, _config(max_retries=5, max_cost_usd=0.0105), query="q"
+        )
+    assert agent.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_candidate_errors_and_timeout():
+    handler = _handler()
+    flaky = FakeAgent(Plan(0.01, 0, error=True), Plan(0.05, 0.9))
+    result, _metrics, info = await handler.retry_with_validation(flaky, _config(candidates=2), query="q")
+    assert result["output"] == "0.9"
+    assert info["retries"][0]["error"] == "provider unavailable"
+
+    with pytest.raises(RuntimeError, match="provider unavailable"):
+        await handler.retry_with_validation(
+            FakeAgent(Plan(0.01, 0, error=True)), _config(max_retries=2), query="q"
+        )
+
+    slow = FakeAgent(Plan(1.0, 0.9))
+    with pytest.raises(TimeoutError):
+        await handler.retry_with_validation(slow, _config(timeout=0.1), query="q")
+    assert slow.cancelled == 3
+    assert handler.get_stats()["failed_retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_and_failed_candidates_keep_their_reservation():
+    tracker = CostTracker()
+    tracker.record_operation("unpriced-model", input_tokens=500, output_tokens=500, latency_ms=1)
+    agent = FakeAgent(
+        Plan(0.05, 0.9, cost=0.002, tokens=1000),
+        Plan(0.01, 0, error=True),
+        Plan(1.0, 0.99),
+    )
+
+    _result, _metrics, info = await _handler(tracker).retry_with_validation(
+        agent, _config(), query="q"
+    )
+
+    # The failed and the cancelled call were both billed by the provider
+    assert agent.cancelled == 1
+    assert info["budget"]["spent_usd"] == pytest.approx(0.006)
+    assert info["budget"]["spent_tokens"] == 3000
@@ -0,0 +1,227 @@
+"""Tests for the streaming training pipeline and the SQLite model registry."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+import json
+
+import numpy as np
+import pytest
+
+from mlops.model_registry import ModelRegistry, ModelRegistryEntry
+from mlops.training_pipelines import (
+    DatasetLoader,
+    FeatureScaler,
+    LogisticRegressionModel,
+    MetricsAccumulator,
+    TrainingConfig,
+    TrainingPipeline,
+    _compute_auc,
+)
+
+TRUE_WEIGHTS = np.array([1.5, -2.0, 0.5, 0.0])
+
+
+def _synthetic(n: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n, len(TRUE_WEIGHTS)))
+    labels = rng.random(n) < 1 / (1 + np.exp(-(features @ TRUE_WEIGHTS + 0.3)))
+    return features, labels.astype(float)
+
+
+def _write_csv(path, n: int, seed: int = 0):
+    features, labels = _synthetic(n, seed)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("a,b,c,d,label\n")
+        np.savetxt(handle, np.column_stack([features, labels]), fmt="%.5f,%.5f,%.5f,%.5f,%d")
+    return path
+
+
+@pytest.fixture
+def config(tmp_path) -> TrainingConfig:
+    return TrainingConfig(
+        model_dir=tmp_path / "models",
+        registry_path=tmp_path / "registry.sqlite3",
+        chunk_size=1_000,
+    )
+
+
+def _entry(tmp_path, name: str = "model") -> ModelRegistryEntry:
+    artifact = tmp_path / f"{name}.pkl"
+    artifact.write_bytes(b"weights")
+    return ModelRegistryEntry(
+        model_name=name,
+        version=None,
+        created_at="2026-01-01T00:00:00",
+        artifact_path=str(artifact),
+        metrics={},
+        data_summary={},
+        feature_scaler={},
+        label_mapping={},
+        training_params={},
+    )
+
+
+def test_loader_streams_csv_and_jsonl_in_chunks(tmp_path, config):
+    csv_path = _write_csv(tmp_path / "data.csv", 20)
+    features, labels = _synthetic(20)
+    jsonl_path = tmp_path / "data.jsonl"
+    jsonl_path.write_text(
+        "\n".join(
+            json.dumps({**dict(zip("abcd", row.round(5).tolist(), strict=True)), "label": label})
+            for row, label in zip(features, labels, strict=True)
+        )
+    )
+    loader = DatasetLoader(config)
+
+    for path in (csv_path, jsonl_path):
+        chunks = list(loader.iter_chunks(str(path), chunk_size=7))
+        assert [len(c.labels) for c in chunks] == [7, 7, 6]
+        assert [c.offset for c in chunks] == [0, 7, 14]
+        np.testing.assert_allclose(np.concatenate([c.features for c in chunks]), features, atol=1e-5)
+
+    lines = csv_path.read_text().splitlines()
+    lines[16] = "1.0,oops,0.0,0.0,1"
+    csv_path.write_text("\n".join(lines))
+    with pytest.raises(ValueError, match="Non-numeric value in row 15"):
+        list(loader.iter_chunks(str(csv_path), chunk_size=7))
+
+
+def test_scaler_partial_fit_matches_fit():
+    features, _ = _synthetic(1_000)
+    streamed = FeatureScaler()
+    for chunk in np.array_split(features * 10 + 3, 7):
+        streamed.partial_fit(chunk)
+
+    full = FeatureScaler()
+    full.fit(features * 10 + 3)
+    np.testing.assert_allclose(streamed.mean_, full.mean_)
+    np.testing.assert_allclose(streamed.std_, full.std_)
+
+
+def test_sgd_recovers_weights_and_stops_early():
+    features, labels = _synthetic(20_000)
+    model = LogisticRegressionModel(learning_rate=0.1, epochs=200, batch_size=128)
+
+    losses = model.fit(
+        features[:16_000], labels[:16_000], validation=(features[16_000:], labels[16_000:])
+    )
+
+    assert len(losses) < 50
+    assert model.best_epoch is not None and model.best_epoch < len(losses)
+    np.testing.assert_allclose(model.weights[:-1], TRUE_WEIGHTS, atol=0.15)
+
+
+def test_streaming_auc_matches_exact_auc():
+    rng = np.random.default_rng(3)
+    labels = (rng.random(5_000) < 0.4).astype(float)
+    scores = np.clip(rng.normal(0.4 + 0.2 * labels, 0.2), 0, 1).round(3)  # many ties
+
+    positive, negative = scores[labels == 1], scores[labels == 0]
+    pairwise = (positive[:, None] > negative).mean() + 0.5 * (positive[:, None] == negative).mean()
+    assert _compute_auc(labels, scores) == pytest.approx(pairwise)
+
+    accumulator = MetricsAccumulator()
+    for part in np.array_split(np.arange(5_000), 9):
+        accumulator.update(labels[part], scores[part])
+    assert accumulator.result().auc == pytest.approx(pairwise, abs=1e-3)
+
+
+def test_pipeline_trains_registers_and_checksums(tmp_path, config):
+    data = str(_write_csv(tmp_path / "data.csv", 5_000))
+    pipeline = TrainingPipeline(config)
+
+    first = pipeline.run("churn", data)
+    second = pipeline.run("churn", data)
+
+    assert (first["model_version"], second["model_version"]) == (1, 2)
+    assert first["metrics"]["auc"] > 0.85
+    assert first["training_history"]["epochs_run"] < config.epochs
+    assert sum(first["registry_entry"]["data_summary"]["split_counts"].values()) == 5_000
+    assert pipeline.registry.verify_artifact("churn", 1)
+
+    with open(first["model_artifact"], "ab") as handle:
+        handle.write(b"tampered")
+    assert not pipeline.registry.verify_artifact("churn", 1)
+
+
+def test_cross_validation_runs_folds_in_worker_processes(tmp_path, config):
+    data = str(_write_csv(tmp_path / "data.csv", 3_000))
+
+    parallel = TrainingPipeline(replace(config, cv_folds=3, cv_workers=3)).run("cv", data)
+    serial = TrainingPipeline(replace(config, cv_folds=3)).run("cv", data)
+
+    folds = parallel["cross_validation"]["fold_metrics"]
+    assert [fold["fold"] for fold in folds] == [0, 1, 2]
+    assert parallel["cross_validation"]["auc"]["mean"] > 0.85
+    assert folds == serial["cross_validation"]["fold_metrics"]
+
+
+def test_registry_allocates_unique_versions_concurrently(tmp_path):
+    path = tmp_path / "registry.sqlite3"
+    ModelRegistry(path)
+
+    def register_many(_: int) -> list[int]:
+        registry = ModelRegistry(path)
+        return [registry.register(_entry(tmp_path))["version"] for _ in range(10)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        versions = [v for batch in pool.map(register_many, range(4)) for v in batch]
+
+    assert sorted(versions) == list(range(1, 41))
+
+
+def test_stage_transitions_archive_previous_production(tmp_path):
+    registry = ModelRegistry(tmp_path / "registry.sqlite3")
+    for _ in range(3):
+        registry.register(_entry(tmp_path))
+
+    registry.transition_stage("model", 1, "production")
+    registry.transition_stage("model", 2, "staging")
+    registry.transition_stage("model", 2, "production", comment="better auc")
+
+    assert [e.stage for e in registry.list_versions("model")] == ["archived", "production", "none"]
+    assert registry.get_stage("model", "production").version == 2
+    archived = registry.get_transitions("model")[-1]
+    assert (archived["version"], archived["to_stage"], archived["comment"]) == (
+        1,
+        "archived",
+        "better auc",
+    )
+    with pytest.raises(ValueError, match="Unknown stage"):
+        registry.transition_stage("model", 3, "shadow")
+    with pytest.raises(ValueError, match="not found"):
+        registry.transition_stage("model", 9, "staging")
+
+
+def test_legacy_json_registry_is_imported_once(tmp_path):
+    legacy = tmp_path / "model_registry.json"
+    legacy.write_text(
+        json.dumps([{**_entry(tmp_path).to_dict(), "version": "20250101T000000-abc"}])
+    )
+
+    ModelRegistry(legacy)
+    registry = ModelRegistry(legacy)
+
+    assert registry.registry_path.suffix == ".sqlite3"
+    assert [e.version for e in registry.list_versions("model")] == [1]
+    assert registry.verify_artifact("model", 1)
+
+
+def test_sibling_json_registry_is_imported_into_new_sqlite_once(tmp_path):
+    legacy = tmp_path / "model_registry.json"
+    legacy.write_text(
+        json.dumps([{**_entry(tmp_path).to_dict(), "version": "20250101T000000-abc"}])
+    )
+    path = tmp_path / "model_registry.sqlite3"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: ModelRegistry(path), range(4)))
+    assert [e.version for e in ModelRegistry(path).list_versions("model")] == [1]
+
+    # The marker row, not a re-scan of the JSON, keeps later opens from importing
+    legacy.write_text(
+        json.dumps([{**_entry(tmp_path).to_dict(), "created_at": "2026-01-01T00:00:00"}])
+    )
+    assert [e.version for e in ModelRegistry(path).list_versions("model")] == [1]
@@ -0,0 +1,157 @@
+"""Tests for concurrent EB-1A section generation and evidence research."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from structlog.testing import capture_logs
+
+from core.memory.memory_manager import MemoryManager
+from core.workflows.eb1a.eb1a_coordinator import EB1ACoordinator, EB1ACriterion, EB1APetitionRequest
+from core.workflows.eb1a.eb1a_workflow.evidence_researcher import EvidenceResearcher
+from core.workflows.eb1a.section_executor import SectionExecutor
+
+CRITERIA = [
+    EB1ACriterion.AWARDS,
+    EB1ACriterion.JUDGING,
+    EB1ACriterion.SCHOLARLY_ARTICLES,
+    EB1ACriterion.LEADING_ROLE,
+    EB1ACriterion.HIGH_SALARY,
+]
+
+
+def _request(criteria: list[EB1ACriterion] = CRITERIA) -> EB1APetitionRequest:
+    return EB1APetitionRequest(
+        beneficiary_name="Dr. Jane Smith",
+        field_of_expertise="Artificial Intelligence",
+        country_of_birth="India",
+        current_position="Senior AI Researcher",
+        current_employer="Tech Corp",
+        primary_criteria=criteria,
+    )
+
+
+class _SlowCoordinator(EB1ACoordinator):
+    """Writers with per-criterion latency; some fail or hang."""
+
+    def __init__(self, delays: dict[EB1ACriterion, float], **kwargs) -> None:
+        super().__init__(MemoryManager(), **kwargs)
+        self.delays = delays
+        self.failing: set[EB1ACriterion] = set()
+
+    async def _generate_section(self, criterion, request):
+        await asyncio.sleep(self.delays.get(criterion, 0.0))
+        if criterion in self.failing:
+            raise RuntimeError("writer crashed")
+        return await super()._generate_section(criterion, request)
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_in_deterministic_order():
+    # Later criteria finish first; output must still follow primary_criteria
+    delays = {c: 0.1 - i * 0.02 for i, c in enumerate(CRITERIA)}
+    coordinator = _SlowCoordinator(delays, max_concurrency=5)
+
+    started = time.perf_counter()
+    result = await coordinator.generate_petition(_request())
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < sum(delays.values())
+    assert list(result.sections) == CRITERIA
+    assert result.degraded_sections == []
+    assert set(result.section_latencies) == {c.value for c in CRITERIA}
+    assert result.section_latencies[EB1ACriterion.AWARDS.value] >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_failing_and_slow_sections_are_degraded_not_fatal():
+    coordinator = _SlowCoordinator(
+        {EB1ACriterion.JUDGING: 5.0}, max_concurrency=2, section_timeout=0.1
+    )
+    coordinator.failing = {EB1ACriterion.HIGH_SALARY}
+
+    result = await coordinator.generate_petition(_request())
+
+    assert list(result.sections) == CRITERIA
+    assert result.degraded_sections == [EB1ACriterion.JUDGING, EB1ACriterion.HIGH_SALARY]
+    judging = result.sections[EB1ACriterion.JUDGING]
+    assert judging.confidence_score == 0.0
+    assert "timed out" in judging.content
+    assert "writer crashed" in result.sections[EB1ACriterion.HIGH_SALARY].content
+    assert result.sections[EB1ACriterion.AWARDS].confidence_score > 0
+    assert any("Weak evidence" in w for w in result.weaknesses)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_petitions_report_their_own_latencies():
+    class _SlowSummaryCoordinator(_SlowCoordinator):
+        async def _generate_executive_summary(self, request):
+            if request.beneficiary_name == "Slow Summary":
+                await asyncio.sleep(0.2)
+            return await super()._generate_executive_summary(request)
+
+    others = [EB1ACriterion.MEMBERSHIP, EB1ACriterion.PRESS, EB1ACriterion.ORIGINAL_CONTRIBUTION]
+    coordinator = _SlowSummaryCoordinator({EB1ACriterion.MEMBERSHIP: 0.1})
+    first = _request(CRITERIA[:3]).model_copy(update={"beneficiary_name": "Slow Summary"})
+
+    # The second petition's sections finish last, while the first is still summarizing
+    slow, fast = await asyncio.gather(
+        coordinator.generate_petition(first),
+        coordinator.generate_petition(_request(others)),
+    )
+
+    assert set(slow.section_latencies) == {c.value for c in CRITERIA[:3]}
+    assert set(fast.section_latencies) == {c.value for c in others}
+
+
+@pytest.mark.asyncio
+async def test_executor_respects_concurrency_limit():
+    running = 0
+    peak = 0
+
+    async def job() -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return peak
+
+    executor = SectionExecutor(max_concurrency=3, timeout=1.0)
+    runs = await executor.run([(f"job-{i}", job) for i in range(10)])
+
+    assert peak == 3
+    assert [run.key for run in runs] == [f"job-{i}" for i in range(10)]
+    assert all(run.ok for run in runs)
+
+
+class _FlakyMemory(MemoryManager):
+    async def aretrieve(self, query, **kwargs):  # type: ignore[override]
+        if "judging" in query:
+            await asyncio.sleep(5)
+        await asyncio.sleep(0.05)
+        return []
+
+
+@pytest.mark.asyncio
+async def test_evidence_research_isolates_slow_criteria():
+    researcher = EvidenceResearcher(_FlakyMemory(), max_concurrency=8, timeout=0.2)
+    request = _request()
+
+    started = time.perf_counter()
+    with capture_logs() as logs:
+        evidence = await researcher.research(request)
+    elapsed = time.perf_counter() - started
+
+    # Precedents for awards/judging/scholarly are still found, in criteria order
+    assert [e.criterion for e in evidence if e.source == "Legal Database"] == [
+        EB1ACriterion.AWARDS,
+        EB1ACriterion.JUDGING,
+        EB1ACriterion.SCHOLARLY_ARTICLES,
+    ]
+    assert elapsed < 1.0
+    [judging] = [log for log in logs if log.get("key") == EB1ACriterion.JUDGING.value]
+    assert judging["event"] == "eb1a_research.section_failed"
+    assert judging["timed_out"] and judging["latency_s"] >= 0.2